@@ -0,0 +1,215 @@
+from IcaoMessageParser.SplitMessages import SplitMessages
+
+
+class AftnFramer:
+    """This class frames the raw byte stream received on an AFTN channel into individual messages that
+    can be passed to the ICAO message parser. Two framing conventions are supported and can be mixed
+    in the same stream:
+        - IA-5 framing; a message starts with the control character SOH (start of heading), the heading
+          is followed by STX (start of text) and the message ends with ETX (end of text);
+        - ITA-2 framing; a message starts with the start of message signal 'ZCZC' and ends with the
+          end of message signal 'NNNN'. ITA-2 traffic is expected to have been converted to IA-5
+          (ASCII) characters by the channel equipment, 5 bit Baudot codes are not decoded.
+
+    Data is passed to 'feed()' as it is received, (e.g. the result of a socket read), frames split
+    over several reads are assembled. Each message is returned without its framing characters and
+    without the STX character, stripped of leading and trailing whitespace; empty frames are not
+    returned. A frame interrupted by the start of another frame, (SOH, or 'ZCZC' within an ITA-2
+    frame), is returned as it is; the parser reports the missing parts. Data outside a frame, (e.g.
+    idle characters), is discarded, as is a frame that exceeds the maximum frame length; the rest of a
+    discarded frame is skipped up to its end, so the messages returned do not depend on how the data
+    was split into reads.
+
+    The data is held in a single byte buffer searched for the framing characters with bytearray.find(),
+    the message text is decoded directly from the buffer through a memoryview; no Python code is run
+    per byte received. This class is not thread safe, an instance is used per
+    channel."""
+
+    DEFAULT_MAXIMUM_FRAME_LENGTH: int = 65536
+    """The default maximum number of bytes in a frame, an ICAO message is limited to 1800 characters"""
+
+    SOH: bytes = b"\x01"
+    """The IA-5 start of heading control character, marks the start of a message"""
+
+    ETX: bytes = b"\x03"
+    """The IA-5 end of text control character, marks the end of a message"""
+
+    ZCZC: bytes = b"ZCZC"
+    """The ITA-2 start of message signal"""
+
+    NNNN: bytes = b"NNNN"
+    """The ITA-2 end of message signal"""
+
+    SIGNALS: (bytes, ...) = (SOH, ETX, ZCZC, NNNN)
+    """The framing characters and signals"""
+
+    buffer: bytearray = None
+    """The data received and not yet returned as a message; starts with the frame being assembled,
+    if any, otherwise with the last characters received that may be the start of a framing signal"""
+
+    frame_start: bytes = b""
+    """The framing character or signal that started the frame being assembled, empty outside a frame"""
+
+    discarding: bool = False
+    """True while skipping the rest of a frame that exceeds the maximum frame length; the buffer then only
+    holds the last characters received that may be the start of a framing signal"""
+
+    scan_index: int = 0
+    """The index in the buffer from which to continue searching for framing characters"""
+
+    signal_indices: [int] = []
+    """The index in the buffer of the next occurrence of each of the SIGNALS found while framing the
+    data passed to 'feed()', the length of the buffer if there is none"""
+
+    maximum_frame_length: int = DEFAULT_MAXIMUM_FRAME_LENGTH
+    """The maximum number of bytes in a frame"""
+
+    frames: int = 0
+    """The number of messages returned"""
+
+    frames_discarded: int = 0
+    """The number of frames discarded for exceeding the maximum frame length"""
+
+    def __init__(self, maximum_frame_length=DEFAULT_MAXIMUM_FRAME_LENGTH):
+        # type: (int) -> None
+        """Creates a framer waiting for the start of a frame.
+
+        :param maximum_frame_length: The maximum number of bytes in a frame, longer frames are discarded;
+        """
+        self.buffer = bytearray()
+        self.frame_start = b""
+        self.discarding = False
+        self.scan_index = 0
+        self.signal_indices = [-1] * len(self.SIGNALS)
+        self.maximum_frame_length = maximum_frame_length
+        self.frames = 0
+        self.frames_discarded = 0
+
+    def feed(self, data):
+        # type: (bytes | bytearray | memoryview) -> [str]
+        """Adds data received from the channel and returns the messages completed by it.
+
+        :param data: The bytes received;
+        :return: A list of the messages completed, in the order received;
+        """
+        self.buffer += data
+        self.signal_indices = [-1] * len(self.SIGNALS)
+        messages = []
+        frame_start = self.frame_start
+        discarding = self.discarding
+        # The index in the buffer of the first character of the frame text, the buffer starts with the
+        # framing character or signal of the frame being assembled unless the frame is being discarded
+        text_index = 0 if discarding else len(frame_start)
+        index = self.scan_index
+        with memoryview(self.buffer) as view:
+            while True:
+                match frame_start:
+                    case self.SOH:
+                        # An IA-5 frame ends with ETX or is interrupted by the next SOH
+                        end_index, signal = self.find_signals(index, (self.ETX, self.SOH))
+                    case self.ZCZC:
+                        # An ITA-2 frame ends with 'NNNN' or is interrupted by the next 'ZCZC' or SOH
+                        end_index, signal = self.find_signals(index, (self.NNNN, self.ZCZC, self.SOH))
+                    case _:
+                        # Anything outside a frame is discarded up to the start of the next frame
+                        end_index, signal = self.find_signals(index, (self.SOH, self.ZCZC))
+                if signal is None:
+                    break
+                if discarding:
+                    # The end of a frame discarded in an earlier read, it has already been counted
+                    discarding = False
+                elif len(frame_start) > 0:
+                    # The same limit as for a frame still being assembled at the end of a read, so that a
+                    # frame is discarded however the data was split into reads
+                    if end_index - text_index + len(frame_start) > self.maximum_frame_length:
+                        self.frames_discarded += 1
+                    else:
+                        self.add_message(messages, view[text_index:end_index])
+                frame_start = b"" if signal == self.ETX or signal == self.NNNN else signal
+                text_index = end_index + len(signal)
+                index = text_index
+
+        # Keep the frame being assembled, or the characters that may be the start of a signal split
+        # over two reads, and continue searching from where this search ended. A frame exceeding the
+        # maximum length is discarded, the rest of it is skipped up to the end of the frame
+        if len(frame_start) > 0 and not discarding:
+            keep_index = text_index - len(frame_start)
+            if len(self.buffer) - keep_index > self.maximum_frame_length:
+                self.frames_discarded += 1
+                discarding = True
+        if len(frame_start) == 0 or discarding:
+            keep_index = max(text_index, len(self.buffer) - len(self.ZCZC) + 1)
+        del self.buffer[:keep_index]
+        self.frame_start = frame_start
+        self.discarding = discarding
+        self.scan_index = max(0 if discarding else len(frame_start), len(self.buffer) - len(self.ZCZC) + 1)
+        return messages
+
+    def find_signals(self, index, signals):
+        # type: (int, (bytes, ...)) -> (int, bytes | None)
+        """Finds the first of a number of framing characters or signals in the buffer. The index of the
+        next occurrence of each signal is kept for the duration of a call to 'feed()', so the buffer is
+        searched at most once for each signal regardless of the number of frames it contains.
+
+        :param index: The index in the buffer the search starts at;
+        :param signals: The framing characters or signals searched for;
+        :return: A tuple containing the index of the first signal found and the signal, or the length of
+                 the buffer and None if none of the signals is found;
+        """
+        first_index = len(self.buffer)
+        first_signal = None
+        for signal in signals:
+            signal_number = self.SIGNALS.index(signal)
+            signal_index = self.signal_indices[signal_number]
+            if signal_index < index:
+                signal_index = self.buffer.find(signal, index)
+                if signal_index < 0:
+                    signal_index = len(self.buffer)
+                self.signal_indices[signal_number] = signal_index
+            if signal_index < first_index:
+                first_index = signal_index
+                first_signal = signal
+        return first_index, first_signal
+
+    def add_message(self, messages, text):
+        # type: ([str], memoryview) -> None
+        """Decodes the text of a frame and adds it to the list of messages if it is not empty.
+
+        :param messages: The list of messages the message is added to;
+        :param text: The frame text, without the framing characters;
+        :return: None
+        """
+        for message in SplitMessages.assemble([str(text, "ascii", "replace")]):
+            messages.append(message)
+            self.frames += 1
+
+    def get_frames(self):
+        # type: () -> int
+        """Gets the number of messages returned since this framer was created.
+
+        :return: The number of messages returned;
+        """
+        return self.frames
+
+    def get_frames_discarded(self):
+        # type: () -> int
+        """Gets the number of frames discarded for exceeding the maximum frame length.
+
+        :return: The number of frames discarded;
+        """
+        return self.frames_discarded
+
+    def read_messages(self, stream, read_size=65536):
+        # type: (BinaryIO, int) -> Iterator[str]
+        """This method is a generator that frames the messages read from a binary stream, e.g. a captured
+        channel log opened in binary mode. A frame not terminated at the end of the stream is not returned.
+
+        :param stream: The stream read;
+        :param read_size: The number of bytes read from the stream in one go;
+        :return: A generator yielding each message as a string;
+        """
+        while True:
+            data = stream.read(read_size)
+            if not data:
+                return
+            yield from self.feed(data)
@@ -0,0 +1,571 @@
+import asyncio
+import sqlite3
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+
+from AFTN_Interface.AftnFramer import AftnFramer
+from AFTN_Interface.SequenceTracker import SequenceTracker
+from AFTN_Terminal.MessageSearch import MessageSearch
+from AFTN_Terminal.SegmentStore import SegmentStore
+from AFTN_Terminal.WriteXml import WriteXml, WriteBatch
+from Configuration.EnumerationConstants import FieldIdentifiers
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class CircuitStatistics:
+    """This class holds the throughput statistics of an AFTN circuit connected to the ChannelServer.
+    The statistics are updated on the event loop and can be read at any time."""
+
+    name: str = ""
+    """The name of the circuit, the address and port of the peer"""
+
+    connected_time: float = 0.0
+    """The time the circuit connected, (time.monotonic())"""
+
+    disconnected_time: float | None = None
+    """The time the circuit disconnected, (time.monotonic()), None while connected"""
+
+    bytes_received: int = 0
+    """The number of bytes received"""
+
+    messages_received: int = 0
+    """The number of messages framed from the data received"""
+
+    messages_stored: int = 0
+    """The number of messages parsed and stored in the working directory"""
+
+    messages_rejected: int = 0
+    """The number of messages that could not be parsed and were therefore not stored"""
+
+    frames_discarded: int = 0
+    """The number of frames discarded by the framer for exceeding the maximum frame length"""
+
+    back_pressure_time: float = 0.0
+    """The time in seconds reading from the circuit was suspended because the parse queue was full"""
+
+    def __init__(self, name):
+        # type: (str) -> None
+        """Creates the statistics for a circuit that has just connected.
+
+        :param name: The name of the circuit;
+        """
+        self.name = name
+        self.connected_time = time.monotonic()
+        self.disconnected_time = None
+        self.bytes_received = 0
+        self.messages_received = 0
+        self.messages_stored = 0
+        self.messages_rejected = 0
+        self.frames_discarded = 0
+        self.back_pressure_time = 0.0
+
+    def get_name(self):
+        # type: () -> str
+        """Gets the name of the circuit, the address and port of the peer.
+
+        :return: The name of the circuit;
+        """
+        return self.name
+
+    def get_bytes_received(self):
+        # type: () -> int
+        """Gets the number of bytes received on the circuit.
+
+        :return: The number of bytes received;
+        """
+        return self.bytes_received
+
+    def get_messages_received(self):
+        # type: () -> int
+        """Gets the number of messages framed from the data received on the circuit.
+
+        :return: The number of messages received;
+        """
+        return self.messages_received
+
+    def get_messages_stored(self):
+        # type: () -> int
+        """Gets the number of messages received on the circuit that have been parsed and stored.
+
+        :return: The number of messages stored;
+        """
+        return self.messages_stored
+
+    def get_messages_rejected(self):
+        # type: () -> int
+        """Gets the number of messages received on the circuit that could not be parsed.
+
+        :return: The number of messages rejected;
+        """
+        return self.messages_rejected
+
+    def get_frames_discarded(self):
+        # type: () -> int
+        """Gets the number of frames discarded for exceeding the maximum frame length.
+
+        :return: The number of frames discarded;
+        """
+        return self.frames_discarded
+
+    def get_back_pressure_time(self):
+        # type: () -> float
+        """Gets the time reading from the circuit was suspended because the parse queue was full.
+
+        :return: The time in seconds;
+        """
+        return self.back_pressure_time
+
+    def get_connected_duration(self):
+        # type: () -> float
+        """Gets the time the circuit has been, or was, connected.
+
+        :return: The time in seconds;
+        """
+        end_time = time.monotonic() if self.disconnected_time is None else self.disconnected_time
+        return end_time - self.connected_time
+
+    def is_connected(self):
+        # type: () -> bool
+        """Checks if the circuit is connected.
+
+        :return: True if connected, False otherwise;
+        """
+        return self.disconnected_time is None
+
+    def get_throughput(self):
+        # type: () -> (float, float)
+        """Gets the average throughput of the circuit while connected.
+
+        :return: A tuple containing the bytes per second and messages per second received;
+        """
+        duration = max(self.get_connected_duration(), 1e-9)
+        return self.bytes_received / duration, self.messages_received / duration
+
+
+class ChannelServer:
+    """This class is an AFTN over TCP/IP channel server; it accepts any number of concurrent AFTN
+    circuits, frames the traffic received on each circuit (see AftnFramer), parses the messages and
+    stores them in the 'Inbox' directory of the applications working directory, (or the subdirectory
+    for the message priority indicator).
+
+    The server runs on an asyncio event loop; nothing that can block is run on the event loop:
+        - Messages framed on all circuits are placed in a single bounded queue. When the queue is full
+          reading from a circuit is suspended until there is room, TCP flow control then stops the
+          peer from sending; this is the back-pressure that stops a fast circuit from exhausting memory;
+        - The messages are taken from the queue in chunks and parsed by a pool of worker processes,
+          or a single worker thread if one worker is requested. The function parsing a chunk is
+          ParseMessage.parse_chunk() unless another function is passed to the constructor;
+        - The parsed messages are written to the working directory on a thread by 'store_messages()';
+          a subclass can override this method to store the messages elsewhere. If a segment store
+          directory is given the messages are appended to a SegmentStore instead of being written
+          to the 'Inbox' one file per message. If a search index is requested the message files
+          written are added to the MessageSearch index of the working directory as they are stored;
+    Several chunks are parsed at the same time, messages may therefore be stored in a different order
+    to the order they were received in. Each circuit has its own CircuitStatistics holding its
+    throughput metrics. The channel sequence numbers of the transmission identifications are checked
+    by a SequenceTracker as the messages are framed, i.e. in the order they were received.
+
+    The server does not transmit anything on the circuits; acknowledgement and channel check procedures
+    are outside the scope of this class, the sequence tracker only reports the problems detected."""
+
+    DEFAULT_QUEUE_SIZE: int = 1000
+    """The default maximum number of messages waiting to be parsed"""
+
+    DEFAULT_CHUNK_SIZE: int = 64
+    """The default maximum number of messages parsed by a worker in one go"""
+
+    CHUNKS_IN_FLIGHT_PER_WORKER: int = 2
+    """The number of chunks being parsed or stored per worker; keeps the workers busy"""
+
+    READ_SIZE: int = 65536
+    """The maximum number of bytes read from a circuit in one go"""
+
+    working_directory_path: str = ""
+    """The absolute path to the applications working directory the messages are stored in"""
+
+    host: str = ""
+    """The address the server listens on"""
+
+    port: int = 0
+    """The port the server listens on, zero to have one allocated when the server is started"""
+
+    workers: int = 1
+    """The number of worker processes parsing messages, one to parse messages on a thread"""
+
+    chunksize: int = DEFAULT_CHUNK_SIZE
+    """The maximum number of messages parsed by a worker in one go"""
+
+    parse_chunk: callable = None
+    """The function run by the workers to parse a chunk of messages; it takes a list of messages and
+    returns a list of FlightPlanRecord in the same order. It must be a module level function or static
+    method if there is more than one worker so that it can be passed to a worker process."""
+
+    queue: asyncio.Queue = None
+    """The messages framed and waiting to be parsed, each entry is a tuple containing the circuit
+    statistics of the circuit the message was received on and the message"""
+
+    maximum_queue_depth: int = 0
+    """The largest number of messages waiting to be parsed at any one time"""
+
+    circuits: [CircuitStatistics] = []
+    """The statistics of all the circuits that have connected, in the order they connected"""
+
+    server: asyncio.Server | None = None
+    """The asyncio server accepting connections, None if not started"""
+
+    parse_executor: Executor = None
+    """The pool of workers parsing the messages"""
+
+    store_executor: ThreadPoolExecutor = None
+    """The thread storing the messages in the working directory"""
+
+    consumers: [asyncio.Task] = []
+    """The tasks taking messages from the queue and passing them to the workers"""
+
+    connections: {asyncio.Task} = set()
+    """The tasks handling a connected circuit"""
+
+    message_sequence_number: int = 0
+    """The number of messages parsed since the server was created, used to name the message files"""
+
+    sequence_tracker: SequenceTracker = None
+    """Tracks the channel sequence numbers of the messages received on each channel"""
+
+    segment_store: SegmentStore | None = None
+    """The store the messages are appended to, None to write the messages to the 'Inbox'"""
+
+    message_search: MessageSearch | None = None
+    """The search index the message files are added to, None if the message files are not indexed"""
+
+    def __init__(self, working_directory_path, host="127.0.0.1", port=0, workers=1, queue_size=DEFAULT_QUEUE_SIZE,
+                 chunksize=DEFAULT_CHUNK_SIZE, parse_chunk=ParseMessage.parse_chunk, sequence_state_path=None,
+                 segment_store_path=None, search_index=False):
+        # type: (str, str, int, int, int, int, callable, str | None, str | None, bool) -> None
+        """Sets up a channel server; the server has to be started by calling 'start()'.
+
+        :param working_directory_path: The absolute path to the applications working directory, the
+               directory must contain an 'Inbox' directory;
+        :param host: The address the server listens on;
+        :param port: The port the server listens on, zero to have one allocated;
+        :param workers: The number of worker processes parsing messages, one to parse on a thread;
+        :param queue_size: The maximum number of messages waiting to be parsed;
+        :param chunksize: The maximum number of messages parsed by a worker in one go;
+        :param parse_chunk: The function run by the workers to parse a chunk of messages;
+        :param sequence_state_path: The file the channel sequence state is saved to when the server stops
+               and read from when the server is created, None not to save the state;
+        :param segment_store_path: The directory of a SegmentStore the messages are appended to, None
+               to write the messages to the 'Inbox' one file per message;
+        :param search_index: True to add the message files written to the 'Inbox' to the search index of
+               the working directory;
+        :raises OSError: If the channel sequence state or the segment store cannot be read;
+        :raises ValueError: If the channel sequence state file is invalid;
+        """
+        self.working_directory_path = working_directory_path
+        self.host = host
+        self.port = port
+        self.workers = max(1, workers)
+        self.chunksize = max(1, chunksize)
+        self.parse_chunk = parse_chunk
+        self.queue = asyncio.Queue(max(1, queue_size))
+        self.maximum_queue_depth = 0
+        self.circuits = []
+        self.server = None
+        self.parse_executor = None
+        self.store_executor = None
+        self.consumers = []
+        self.connections = set()
+        self.message_sequence_number = 0
+        self.sequence_tracker = SequenceTracker(sequence_state_path)
+        self.segment_store = None if segment_store_path is None else SegmentStore(segment_store_path)
+        self.message_search = MessageSearch(working_directory_path) if search_index else None
+
+    async def start(self):
+        # type: () -> None
+        """Starts the workers and starts listening for circuits connecting.
+
+        :return: None
+        """
+        if self.workers > 1:
+            self.parse_executor = ProcessPoolExecutor(max_workers=self.workers)
+        else:
+            self.parse_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AFTN Parser")
+        self.store_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AFTN Store")
+        self.consumers = [asyncio.create_task(self.process_messages())
+                          for _ in range(self.workers * self.CHUNKS_IN_FLIGHT_PER_WORKER)]
+        self.server = await asyncio.start_server(self.handle_circuit, self.host, self.port, limit=self.READ_SIZE)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        # type: () -> None
+        """Stops accepting circuits, disconnects the connected circuits, waits until the messages received
+        have been stored and stops the workers.
+
+        :return: None
+        """
+        if self.server is None:
+            return
+        self.server.close()
+        for connection in list(self.connections):
+            connection.cancel()
+        await asyncio.gather(*self.connections, return_exceptions=True)
+        await self.server.wait_closed()
+        await self.queue.join()
+        for consumer in self.consumers:
+            consumer.cancel()
+        await asyncio.gather(*self.consumers, return_exceptions=True)
+        await self.checkpoint_sequence_state()
+        self.parse_executor.shutdown()
+        self.store_executor.shutdown()
+        self.server = None
+        if self.segment_store is not None:
+            self.segment_store.close()
+            self.segment_store = None
+        if self.message_search is not None:
+            self.message_search.close()
+            self.message_search = None
+
+    async def wait_until_stored(self):
+        # type: () -> None
+        """Waits until all the messages received so far have been stored.
+
+        :return: None
+        """
+        await self.queue.join()
+
+    async def handle_circuit(self, reader, writer):
+        # type: (asyncio.StreamReader, asyncio.StreamWriter) -> None
+        """This method is called by the asyncio server for each circuit that connects; the data received
+        is framed and the messages are queued for parsing until the circuit disconnects.
+
+        :param reader: The stream the circuit data is read from;
+        :param writer: The stream to the circuit, only used to close the connection;
+        :return: None
+        """
+        self.connections.add(asyncio.current_task())
+        peer = writer.get_extra_info("peername")
+        circuit = CircuitStatistics(str(peer[0]) + ":" + str(peer[1]) if isinstance(peer, tuple) else str(peer))
+        self.circuits.append(circuit)
+        framer = AftnFramer()
+        try:
+            while True:
+                data = await reader.read(self.READ_SIZE)
+                if not data:
+                    break
+                circuit.bytes_received += len(data)
+                for message in framer.feed(data):
+                    circuit.messages_received += 1
+                    transmission_id = ParseMessage.TRANSMISSION_ID_LINE.match(message)
+                    if transmission_id is not None:
+                        self.sequence_tracker.track(transmission_id.group(1)[:3], int(transmission_id.group(1)[3:]))
+                    if self.queue.full():
+                        # Stop reading from the circuit until there is room in the queue
+                        wait_start = time.monotonic()
+                        await self.queue.put((circuit, message))
+                        circuit.back_pressure_time += time.monotonic() - wait_start
+                    else:
+                        self.queue.put_nowait((circuit, message))
+                    self.maximum_queue_depth = max(self.maximum_queue_depth, self.queue.qsize())
+                circuit.frames_discarded = framer.get_frames_discarded()
+        except ConnectionError:
+            pass
+        finally:
+            circuit.disconnected_time = time.monotonic()
+            writer.close()
+            self.connections.discard(asyncio.current_task())
+
+    async def process_messages(self):
+        # type: () -> None
+        """This method runs as a task taking chunks of messages from the queue, parsing them on the workers
+        and storing them, until cancelled. A message that cannot be parsed is reported on standard error
+        and counted as rejected; it does not stop the other messages from being stored.
+
+        :return: None
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            entries = [await self.queue.get()]
+            while len(entries) < self.chunksize and not self.queue.empty():
+                entries.append(self.queue.get_nowait())
+            try:
+                circuits, flight_plan_records = await self.parse_entries(loop, entries)
+                message_names = []
+                for _ in flight_plan_records:
+                    self.message_sequence_number += 1
+                    message_names.append(datetime.now().strftime('%Y%m%d-%H%M%S-%f') + "-" +
+                                         str(self.message_sequence_number))
+                try:
+                    stored = await loop.run_in_executor(self.store_executor, self.store_messages,
+                                                        flight_plan_records, message_names)
+                except Exception as e:
+                    print("Unable to store received messages: " + repr(e), file=sys.stderr)
+                    stored = 0
+                for circuit in circuits[:stored]:
+                    circuit.messages_stored += 1
+            finally:
+                for _ in entries:
+                    self.queue.task_done()
+
+    async def parse_entries(self, loop, entries):
+        # type: (asyncio.AbstractEventLoop, [(CircuitStatistics, str)]) -> ([CircuitStatistics], [FlightPlanRecord])
+        """Parses a chunk of messages taken from the queue on the workers. The messages the parser failed on,
+        (see ParseMessage.is_parser_failure()), are reported on standard error and counted as rejected on
+        their circuit. If the chunk cannot be parsed at all, (e.g. the parse function passed to the
+        constructor raises an exception), the messages are parsed again one at a time, so that only the
+        messages that cannot be parsed are rejected.
+
+        :param loop: The running event loop;
+        :param entries: The queue entries, each a tuple containing the circuit statistics and the message;
+        :return: A tuple containing the circuit statistics and the parsed message of each message parsed,
+                 in the order of the entries;
+        """
+        try:
+            parsed = list(zip(entries, await loop.run_in_executor(
+                self.parse_executor, self.parse_chunk, [message for _, message in entries])))
+        except Exception as e:
+            if len(entries) == 1:
+                self.reject_message(entries[0], repr(e))
+                return [], []
+            parsed = []
+            for entry in entries:
+                try:
+                    parsed.extend(zip([entry], await loop.run_in_executor(self.parse_executor, self.parse_chunk,
+                                                                          [entry[1]])))
+                except Exception as e:
+                    self.reject_message(entry, repr(e))
+
+        circuits = []
+        flight_plan_records = []
+        for entry, flight_plan_record in parsed:
+            if ParseMessage.is_parser_failure(flight_plan_record):
+                self.reject_message(entry, flight_plan_record.get_erroneous_fields()[0].get_error_message()[
+                    len(ParseMessage.PARSER_FAILURE):])
+            else:
+                circuits.append(entry[0])
+                flight_plan_records.append(flight_plan_record)
+        return circuits, flight_plan_records
+
+    @staticmethod
+    def reject_message(entry, reason):
+        # type: ((CircuitStatistics, str), str) -> None
+        """Reports a message that cannot be parsed on standard error and counts it as rejected.
+
+        :param entry: The queue entry, a tuple containing the circuit statistics and the message;
+        :param reason: The reason the message cannot be parsed, e.g. the exception raised by the parser;
+        :return: None
+        """
+        entry[0].messages_rejected += 1
+        print("Unable to parse a message received on circuit " + entry[0].get_name() + ": " + reason +
+              "\n" + repr(entry[1][:200]), file=sys.stderr)
+
+    def store_messages(self, flight_plan_records, message_names):
+        # type: ([FlightPlanRecord], [str]) -> int
+        """Writes parsed messages to the 'Inbox' directory, or the subdirectory for the message priority
+        indicator, or appends them to the segment store if there is one; called on the store thread. The
+        message files are written as a WriteBatch so the chunk is made durable with one commit cycle and
+        are then added to the search index if there is one. If a message cannot be written the error is
+        reported on standard error and the remaining messages are not written.
+
+        :param flight_plan_records: The parsed messages;
+        :param message_names: A unique name for each message from which the file name is formed;
+        :return: The number of messages written;
+        """
+        if self.segment_store is not None:
+            stored = 0
+            try:
+                for flight_plan_record in flight_plan_records:
+                    self.segment_store.append(flight_plan_record)
+                    stored += 1
+                self.segment_store.sync()
+            except OSError as e:
+                print("Unable to store received messages in the segment store: " + str(e), file=sys.stderr)
+            return stored
+
+        batch = WriteBatch()
+        try:
+            for flight_plan_record, message_name in zip(flight_plan_records, message_names):
+                priority_indicator = flight_plan_record.get_icao_field(FieldIdentifiers.PRIORITY_INDICATOR)
+                WriteXml.write_received_message(
+                    flight_plan_record.as_xml(), self.working_directory_path,
+                    "" if priority_indicator is None else priority_indicator.get_field_text(), message_name, batch)
+        except OSError as e:
+            print("Unable to store received message '" + message_names[batch.get_pending_count()] + "': " + str(e),
+                  file=sys.stderr)
+        try:
+            batch.commit()
+        except OSError as e:
+            print("Unable to store received message '" + message_names[len(batch.get_committed())] + "': " +
+                  str(e), file=sys.stderr)
+        if self.message_search is not None:
+            try:
+                self.message_search.add_records(batch.get_committed(), flight_plan_records)
+            except sqlite3.Error as e:
+                print("Unable to add received messages to the search index: " + str(e), file=sys.stderr)
+        return len(batch.get_committed())
+
+    async def checkpoint_sequence_state(self):
+        # type: () -> None
+        """Saves the channel sequence state, if a file was given to save it to, without blocking the event
+        loop; the state is taken on the event loop and written on the store thread.
+
+        :return: None
+        """
+        await asyncio.get_running_loop().run_in_executor(self.store_executor, self.save_sequence_state,
+                                                         self.sequence_tracker.get_state())
+
+    def save_sequence_state(self, state=None):
+        # type: (dict | None) -> None
+        """Saves the channel sequence state, if a file was given to save it to; an error is reported on
+        standard error. The state is written on the calling thread, (see 'checkpoint_sequence_state()').
+
+        :param state: The state to save, as returned by 'SequenceTracker.get_state()', None to save the
+               current state;
+        :return: None
+        """
+        try:
+            self.sequence_tracker.save(state)
+        except OSError as e:
+            print("Unable to save the channel sequence state: " + str(e), file=sys.stderr)
+
+    def get_circuits(self):
+        # type: () -> [CircuitStatistics]
+        """Gets the statistics of all the circuits that have connected since the server was created.
+
+        :return: The statistics of each circuit in the order the circuits connected;
+        """
+        return self.circuits
+
+    def get_maximum_queue_depth(self):
+        # type: () -> int
+        """Gets the largest number of messages waiting to be parsed at any one time.
+
+        :return: The maximum queue depth;
+        """
+        return self.maximum_queue_depth
+
+    def get_sequence_tracker(self):
+        # type: () -> SequenceTracker
+        """Gets the tracker checking the channel sequence numbers of the messages received.
+
+        :return: The sequence tracker;
+        """
+        return self.sequence_tracker
+
+    def get_port(self):
+        # type: () -> int
+        """Gets the port the server listens on; if the server was created with port zero, the port is
+        only known once the server has been started.
+
+        :return: The port number;
+        """
+        return self.port
+
+    def get_queue_depth(self):
+        # type: () -> int
+        """Gets the number of messages waiting to be parsed.
+
+        :return: The queue depth;
+        """
+        return self.queue.qsize()
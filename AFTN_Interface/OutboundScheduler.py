@@ -0,0 +1,632 @@
+import asyncio
+import heapq
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from AFTN_Interface.AftnFramer import AftnFramer
+from AFTN_Terminal.ReadXml import ReadXml
+
+
+class StreamSink:
+    """An outbound channel to an AFTN peer over TCP/IP; the data is written to an asyncio stream and the
+    write waits while the peer is not reading, (TCP flow control)."""
+
+    writer: asyncio.StreamWriter = None
+    """The stream connected to the peer"""
+
+    def __init__(self, writer):
+        # type: (asyncio.StreamWriter) -> None
+        """Creates a sink writing to a connected stream.
+
+        :param writer: The stream connected to the peer;
+        """
+        self.writer = writer
+
+    async def write(self, data):
+        # type: (bytes) -> None
+        """Writes data to the peer.
+
+        :param data: The data to write;
+        :return: None
+        """
+        self.writer.write(data)
+        await self.writer.drain()
+
+
+class FileSink:
+    """A local stand-in for an outbound channel; the data is written to a binary file, e.g. to capture
+    the traffic that would be sent, the file can be read back with 'RunAftnParser.py --channel'."""
+
+    file = None
+    """The binary file written to"""
+
+    def __init__(self, file):
+        # type: (BinaryIO) -> None
+        """Creates a sink writing to a binary file.
+
+        :param file: The file, opened in binary mode;
+        """
+        self.file = file
+
+    async def write(self, data):
+        # type: (bytes) -> None
+        """Writes data to the file.
+
+        :param data: The data to write;
+        :return: None
+        """
+        self.file.write(data)
+        self.file.flush()
+
+
+class OutboundMessage:
+    """A message queued for transmission by the OutboundScheduler."""
+
+    text: str = ""
+    """The message text, heading and message body"""
+
+    priority_indicator: str = ""
+    """The priority indicator, SS, DD, FF, GG or KK; empty if the message has no heading"""
+
+    filing_time: datetime = None
+    """The filing time of the message in UTC, the time the message was queued if it has no filing time"""
+
+    file_path: str | None = None
+    """The message file in the Outbox the message was read from, None if not read from a file"""
+
+    queued_time: float = 0.0
+    """The time the message was queued, from the clock of the scheduler, (time.monotonic() by default)"""
+
+    preempted: int = 0
+    """The number of times the transmission of the message was cancelled to transmit an SS message"""
+
+    def __init__(self, text, priority_indicator, filing_time, file_path=None, queued_time=None):
+        # type: (str, str, datetime, str | None, float | None) -> None
+        """Creates a message to queue for transmission.
+
+        :param text: The message text, heading and message body;
+        :param priority_indicator: The priority indicator, empty if the message has no heading;
+        :param filing_time: The filing time of the message in UTC;
+        :param file_path: The message file in the Outbox the message was read from, None if none;
+        :param queued_time: The time the message was queued, None for the current time.monotonic();
+        """
+        self.text = text
+        self.priority_indicator = priority_indicator
+        self.filing_time = filing_time
+        self.file_path = file_path
+        self.queued_time = time.monotonic() if queued_time is None else queued_time
+        self.preempted = 0
+
+    def get_text(self):
+        # type: () -> str
+        """Gets the message text.
+
+        :return: The message text;
+        """
+        return self.text
+
+    def get_priority_indicator(self):
+        # type: () -> str
+        """Gets the priority indicator.
+
+        :return: The priority indicator, empty if the message has no heading;
+        """
+        return self.priority_indicator
+
+    def get_filing_time(self):
+        # type: () -> datetime
+        """Gets the filing time of the message.
+
+        :return: The filing time in UTC;
+        """
+        return self.filing_time
+
+    def get_file_path(self):
+        # type: () -> str | None
+        """Gets the message file in the Outbox the message was read from.
+
+        :return: The path to the message file, None if the message was not read from a file;
+        """
+        return self.file_path
+
+    def get_preempted(self):
+        # type: () -> int
+        """Gets the number of times the transmission of this message was cancelled to transmit an SS message.
+
+        :return: The number of times the transmission was pre-empted;
+        """
+        return self.preempted
+
+    def as_frame(self):
+        # type: () -> bytes
+        """Gets the message framed for transmission as IA-5 characters; SOH, the heading, STX, the message
+        text and ETX. Line ends are transmitted as carriage return, line feed.
+
+        :return: The framed message;
+        """
+        text = "\r\n".join(self.text.splitlines())
+        body_index = text.find("(")
+        if body_index < 0:
+            body_index = 0
+        return AftnFramer.SOH + text[:body_index].encode("ascii", "replace") + b"\x02" + \
+            text[body_index:].encode("ascii", "replace") + AftnFramer.ETX
+
+
+class PriorityStatistics:
+    """The transmission metrics of the messages with one priority indicator; the latency of a message
+    is the time from it being queued until its transmission completes."""
+
+    priority_indicator: str = ""
+    """The priority indicator"""
+
+    messages_transmitted: int = 0
+    """The number of messages transmitted"""
+
+    characters_transmitted: int = 0
+    """The number of characters transmitted, including cancelled transmissions"""
+
+    preemptions: int = 0
+    """The number of transmissions cancelled to transmit an SS message"""
+
+    total_latency: float = 0.0
+    """The sum of the latencies of the messages transmitted, in seconds"""
+
+    maximum_latency: float = 0.0
+    """The largest latency of a message transmitted, in seconds"""
+
+    def __init__(self, priority_indicator):
+        # type: (str) -> None
+        """Creates the statistics of a priority indicator with nothing transmitted.
+
+        :param priority_indicator: The priority indicator;
+        """
+        self.priority_indicator = priority_indicator
+        self.messages_transmitted = 0
+        self.characters_transmitted = 0
+        self.preemptions = 0
+        self.total_latency = 0.0
+        self.maximum_latency = 0.0
+
+    def get_priority_indicator(self):
+        # type: () -> str
+        """Gets the priority indicator.
+
+        :return: The priority indicator;
+        """
+        return self.priority_indicator
+
+    def get_messages_transmitted(self):
+        # type: () -> int
+        """Gets the number of messages transmitted.
+
+        :return: The number of messages transmitted;
+        """
+        return self.messages_transmitted
+
+    def get_characters_transmitted(self):
+        # type: () -> int
+        """Gets the number of characters transmitted, including cancelled transmissions.
+
+        :return: The number of characters transmitted;
+        """
+        return self.characters_transmitted
+
+    def get_preemptions(self):
+        # type: () -> int
+        """Gets the number of transmissions cancelled to transmit an SS message.
+
+        :return: The number of pre-emptions;
+        """
+        return self.preemptions
+
+    def get_average_latency(self):
+        # type: () -> float
+        """Gets the average latency of the messages transmitted.
+
+        :return: The average latency in seconds, zero if nothing has been transmitted;
+        """
+        if self.messages_transmitted == 0:
+            return 0.0
+        return self.total_latency / self.messages_transmitted
+
+    def get_maximum_latency(self):
+        # type: () -> float
+        """Gets the largest latency of a message transmitted.
+
+        :return: The maximum latency in seconds;
+        """
+        return self.maximum_latency
+
+
+class OutboundScheduler:
+    """This class transmits the messages queued for transmission on an outbound AFTN channel in priority
+    order. The queued messages are held in a heap ordered by:
+        - The priority indicator, SS before DD before FF before GG before KK; messages without a
+          heading are transmitted last;
+        - The filing time, oldest first;
+        - The order the messages were queued in.
+    Queueing a message and taking the next message to transmit take O(log n) time in the number of
+    messages queued.
+
+    Messages are framed (see OutboundMessage.as_frame()) and written to a sink, either a StreamSink
+    connected to an AFTN peer or a local stand-in such as a FileSink. Any object with an asynchronous
+    'write(bytes)' method can be used as a sink. The transmission rate is limited to a number of
+    characters per second, messages are written in blocks of WRITE_SIZE characters paced to that rate.
+
+    SS (distress) messages pre-empt bulk traffic; if an SS message is queued while a GG or KK message is
+    being transmitted, the transmission is cancelled before its next block by sending 'QTA QTA' and the
+    end of message, the cancelled message is queued again and transmitted in full after the SS message.
+    Higher priority messages otherwise wait until the message being transmitted is complete.
+
+    Messages created by the AFTN Terminal Application are read from the 'Outbox' with 'load_outbox()',
+    once transmitted a message file is moved to the 'Sent' subdirectory of the 'Outbox'. This class runs
+    on an asyncio event loop and is not thread safe; messages must be queued on the loop's thread."""
+
+    PRIORITY_INDICATORS: (str, ...) = ("SS", "DD", "FF", "GG", "KK")
+    """The priority indicators in order of transmission priority"""
+
+    PREEMPTED_PRIORITIES: {str} = {"GG", "KK"}
+    """The priority indicators of the bulk traffic that is pre-empted by SS messages"""
+
+    DEFAULT_CHARACTERS_PER_SECOND: int = 1200
+    """The default transmission rate, the character rate of a 9600 bit/s channel"""
+
+    WRITE_SIZE: int = 64
+    """The number of characters written to the sink in one go; pre-emption is checked between writes"""
+
+    CANCELLATION: bytes = b"\r\nQTA QTA\r\n" + AftnFramer.ETX
+    """Sent to cancel a message being transmitted"""
+
+    SENT_DIRECTORY: str = "Sent"
+    """The subdirectory of the Outbox transmitted message files are moved to"""
+
+    sink = None
+    """The channel, or local stand-in, the messages are transmitted to"""
+
+    characters_per_second: float = DEFAULT_CHARACTERS_PER_SECOND
+    """The maximum transmission rate, zero for no limit"""
+
+    queue: [(int, datetime, int, OutboundMessage)] = []
+    """The heap of messages waiting to be transmitted; each entry is a tuple of the priority rank, the
+    filing time, the queue sequence number and the message"""
+
+    queue_sequence_number: int = 0
+    """The number of messages queued, orders messages with the same priority and filing time"""
+
+    queued_files: {str} = set()
+    """The paths of the message files queued or being transmitted, so a file is only queued once"""
+
+    rejected_files: {str: (int, int)} = {}
+    """The paths of the message files that are not valid message files, with their modification time and
+    size when read; a file is only read again once it has changed"""
+
+    message_queued: asyncio.Event = None
+    """Set when a message is queued, the transmitter waits on it while the queue is empty"""
+
+    transmitter: asyncio.Task | None = None
+    """The task transmitting the messages, None if not started"""
+
+    transmitting: OutboundMessage | None = None
+    """The message being transmitted, None if none"""
+
+    next_write_time: float = 0.0
+    """The time, from the clock, at which the rate limit allows the next write"""
+
+    clock: callable = None
+    """The function giving the current time in seconds, time.monotonic() unless another function is passed
+    to the constructor; used to pace the transmission and measure the latencies"""
+
+    sleep: callable = None
+    """The coroutine function waiting for a number of seconds while the rate limit does not allow a write,
+    asyncio.sleep() unless another function is passed to the constructor"""
+
+    statistics: {str: PriorityStatistics} = {}
+    """The transmission metrics for each priority indicator, an empty indicator for messages without a
+    heading"""
+
+    def __init__(self, sink, characters_per_second=DEFAULT_CHARACTERS_PER_SECOND, clock=time.monotonic,
+                 sleep=asyncio.sleep):
+        # type: (object, float, callable, callable) -> None
+        """Creates a scheduler; the transmission has to be started by calling 'start()'.
+
+        :param sink: The channel, or local stand-in, the messages are transmitted to;
+        :param characters_per_second: The maximum transmission rate, zero for no limit;
+        :param clock: The function giving the current time in seconds;
+        :param sleep: The coroutine function waiting for a number of seconds;
+        """
+        self.sink = sink
+        self.characters_per_second = characters_per_second
+        self.clock = clock
+        self.sleep = sleep
+        self.queue = []
+        self.queue_sequence_number = 0
+        self.queued_files = set()
+        self.rejected_files = {}
+        self.message_queued = asyncio.Event()
+        self.transmitter = None
+        self.transmitting = None
+        self.next_write_time = 0.0
+        self.statistics = {priority_indicator: PriorityStatistics(priority_indicator)
+                           for priority_indicator in self.PRIORITY_INDICATORS + ("",)}
+
+    @staticmethod
+    def get_filing_time(ddhhmm, now):
+        # type: (str, datetime) -> datetime | None
+        """Converts a filing time given as DDHHMM to the most recent matching date and time that is not
+        more than a day after the current time, so messages filed at the end of a month sort before those
+        filed at the start of the next month.
+
+        :param ddhhmm: The filing time, day of the month, hours and minutes;
+        :param now: The current time in UTC;
+        :return: The filing time in UTC, None if the filing time is not valid;
+        """
+        if len(ddhhmm) != 6 or not ddhhmm.isdigit():
+            return None
+        year = now.year
+        month = now.month
+        for _ in range(3):
+            try:
+                filing_time = datetime(year, month, int(ddhhmm[0:2]), int(ddhhmm[2:4]), int(ddhhmm[4:6]),
+                                       tzinfo=timezone.utc)
+                if filing_time <= now + timedelta(days=1):
+                    return filing_time
+            except ValueError:
+                pass
+            month -= 1
+            if month == 0:
+                month = 12
+                year -= 1
+        return None
+
+    def queue_message(self, text, priority_indicator, filing_time="", file_path=None):
+        # type: (str, str, str, str | None) -> OutboundMessage
+        """Queues a message for transmission.
+
+        :param text: The message text, heading and message body;
+        :param priority_indicator: The priority indicator, empty if the message has no heading;
+        :param filing_time: The filing time as DDHHMM, the current time is used if empty or invalid;
+        :param file_path: The message file in the Outbox the message was read from, None if none;
+        :return: The message queued;
+        """
+        now = datetime.now(timezone.utc)
+        filing_datetime = self.get_filing_time(filing_time, now)
+        message = OutboundMessage(text, priority_indicator, now if filing_datetime is None else filing_datetime,
+                                  file_path, self.clock())
+        self.requeue(message)
+        if file_path is not None:
+            self.queued_files.add(file_path)
+        return message
+
+    def requeue(self, message):
+        # type: (OutboundMessage) -> None
+        """Adds a message to the heap of messages waiting to be transmitted.
+
+        :param message: The message;
+        :return: None
+        """
+        self.queue_sequence_number += 1
+        heapq.heappush(self.queue, (self.get_priority_rank(message.get_priority_indicator()),
+                                    message.get_filing_time(), self.queue_sequence_number, message))
+        self.message_queued.set()
+
+    def get_priority_rank(self, priority_indicator):
+        # type: (str) -> int
+        """Gets the position of a priority indicator in the transmission order.
+
+        :param priority_indicator: The priority indicator;
+        :return: The rank, zero for SS; messages without a known priority indicator are ranked last;
+        """
+        if priority_indicator in self.PRIORITY_INDICATORS:
+            return self.PRIORITY_INDICATORS.index(priority_indicator)
+        return len(self.PRIORITY_INDICATORS)
+
+    def queue_file(self, file_path):
+        # type: (str) -> OutboundMessage | None
+        """Queues a message file for transmission; the message is built from the file content by ReadXml.
+        A file that is not a valid message file is reported on standard error and is not read again
+        until it changes.
+
+        :param file_path: The path to the message file;
+        :return: The message queued, None if the file is already queued or is not a valid message file;
+        """
+        if file_path in self.queued_files:
+            return None
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return None
+        if self.rejected_files.get(file_path) == (file_stat.st_mtime_ns, file_stat.st_size):
+            return None
+        read_xml = ReadXml(file_path, show_errors=False)
+        if not read_xml.is_message_ok():
+            if file_path not in self.rejected_files:
+                print("Not a valid message file, not transmitted: '" + file_path + "'", file=sys.stderr)
+            self.rejected_files[file_path] = (file_stat.st_mtime_ns, file_stat.st_size)
+            return None
+        self.rejected_files.pop(file_path, None)
+        return self.queue_message(read_xml.build_message(), read_xml.get_priority_indicator(),
+                                  read_xml.get_filing_time(), file_path)
+
+    def load_outbox(self, working_directory_path):
+        # type: (str) -> int
+        """Queues the message files in the 'Outbox' of the applications working directory that have not
+        already been queued, oldest first.
+
+        :param working_directory_path: The absolute path to the applications working directory;
+        :return: The number of messages queued;
+        """
+        outbox_path = os.path.join(working_directory_path, "Outbox")
+        with os.scandir(outbox_path) as entries:
+            file_paths = [entry.path for entry in entries if entry.is_file() and entry.name.endswith(".xml")]
+        file_paths.sort(key=os.path.getmtime)
+        queued = 0
+        for file_path in file_paths:
+            if self.queue_file(file_path) is not None:
+                queued += 1
+        return queued
+
+    def start(self):
+        # type: () -> None
+        """Starts transmitting the queued messages.
+
+        :return: None
+        """
+        self.next_write_time = self.clock()
+        self.transmitter = asyncio.create_task(self.transmit_messages())
+
+    async def stop(self):
+        # type: () -> None
+        """Stops transmitting; a message being transmitted is abandoned and remains queued.
+
+        :return: None
+        """
+        if self.transmitter is None:
+            return
+        self.transmitter.cancel()
+        await asyncio.gather(self.transmitter, return_exceptions=True)
+        self.transmitter = None
+
+    async def wait_until_transmitted(self):
+        # type: () -> None
+        """Waits until all the messages queued have been transmitted.
+
+        :return: None
+        """
+        while len(self.queue) > 0 or self.transmitting is not None:
+            self.check_transmitter()
+            await asyncio.sleep(0.01)
+
+    def check_transmitter(self):
+        # type: () -> None
+        """Raises the error that ended the transmission, if any.
+
+        :return: None
+        """
+        if self.transmitter is not None and self.transmitter.done() and not self.transmitter.cancelled():
+            self.transmitter.result()
+
+    async def transmit_messages(self):
+        # type: () -> None
+        """This method runs as a task transmitting the queued messages in priority order until cancelled.
+        An error writing to the sink, (e.g. the peer closing the connection), ends the task with the error;
+        the message being transmitted remains queued.
+
+        :return: None
+        """
+        while True:
+            while len(self.queue) == 0:
+                self.message_queued.clear()
+                await self.message_queued.wait()
+            message = heapq.heappop(self.queue)[3]
+            self.transmitting = message
+            try:
+                completed = await self.transmit(message)
+            except BaseException:
+                # Cancelled, or the sink failed; the message is transmitted again in full once restarted
+                self.requeue(message)
+                raise
+            finally:
+                self.transmitting = None
+            if completed:
+                self.transmitted(message)
+            else:
+                self.requeue(message)
+
+    async def transmit(self, message):
+        # type: (OutboundMessage) -> bool
+        """Transmits a message, unless it is cancelled to transmit an SS message.
+
+        :param message: The message;
+        :return: True if the message was transmitted, False if its transmission was cancelled;
+        """
+        statistics = self.get_statistics(message.get_priority_indicator())
+        frame = message.as_frame()
+        preemptible = message.get_priority_indicator() in self.PREEMPTED_PRIORITIES
+        for index in range(0, len(frame), self.WRITE_SIZE):
+            if preemptible and index > 0 and len(self.queue) > 0 and self.queue[0][0] == 0:
+                await self.write(self.CANCELLATION)
+                statistics.characters_transmitted += len(self.CANCELLATION)
+                statistics.preemptions += 1
+                message.preempted += 1
+                return False
+            block = frame[index:index + self.WRITE_SIZE]
+            await self.write(block)
+            statistics.characters_transmitted += len(block)
+        latency = self.clock() - message.queued_time
+        statistics.messages_transmitted += 1
+        statistics.total_latency += latency
+        statistics.maximum_latency = max(statistics.maximum_latency, latency)
+        return True
+
+    async def write(self, data):
+        # type: (bytes) -> None
+        """Writes data to the sink, waiting first if the rate limit does not yet allow it.
+
+        :param data: The data;
+        :return: None
+        """
+        if self.characters_per_second > 0:
+            delay = self.next_write_time - self.clock()
+            if delay > 0:
+                await self.sleep(delay)
+            self.next_write_time = max(self.next_write_time, self.clock()) + \
+                len(data) / self.characters_per_second
+        await self.sink.write(data)
+
+    def transmitted(self, message):
+        # type: (OutboundMessage) -> None
+        """Moves the message file of a message transmitted to the 'Sent' subdirectory of the 'Outbox'; an
+        error is reported on standard error.
+
+        :param message: The message transmitted;
+        :return: None
+        """
+        file_path = message.get_file_path()
+        if file_path is None:
+            return
+        self.queued_files.discard(file_path)
+        sent_path = os.path.join(os.path.dirname(file_path), self.SENT_DIRECTORY)
+        try:
+            os.makedirs(sent_path, exist_ok=True)
+            os.replace(file_path, os.path.join(sent_path, os.path.basename(file_path)))
+        except OSError as e:
+            print("Unable to move transmitted message '" + file_path + "': " + str(e), file=sys.stderr)
+
+    def get_queue_depth(self, priority_indicator=None):
+        # type: (str | None) -> int
+        """Gets the number of messages waiting to be transmitted.
+
+        :param priority_indicator: Only count messages with this priority indicator, None to count all;
+        :return: The queue depth;
+        """
+        if priority_indicator is None:
+            return len(self.queue)
+        return sum(1 for entry in self.queue if entry[3].get_priority_indicator() == priority_indicator)
+
+    def get_statistics(self, priority_indicator):
+        # type: (str) -> PriorityStatistics
+        """Gets the transmission metrics of a priority indicator; messages without a known priority
+        indicator are counted under the empty priority indicator.
+
+        :param priority_indicator: The priority indicator;
+        :return: The transmission metrics;
+        """
+        return self.statistics.get(priority_indicator, self.statistics[""])
+
+    def get_all_statistics(self):
+        # type: () -> [PriorityStatistics]
+        """Gets the transmission metrics of all the priority indicators.
+
+        :return: The metrics in transmission priority order, messages without a heading last;
+        """
+        return list(self.statistics.values())
+
+    def get_transmitting(self):
+        # type: () -> OutboundMessage | None
+        """Gets the message being transmitted.
+
+        :return: The message being transmitted, None if none;
+        """
+        return self.transmitting
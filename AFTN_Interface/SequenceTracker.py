@@ -0,0 +1,370 @@
+import json
+import os
+
+from Configuration.EnumerationConstants import SequenceStatus
+
+
+class ChannelSequence:
+    """This class holds the sequence number state and counters of a single AFTN channel. The channel
+    sequence numbers of the messages received are expected to run from 001 to 999 and then 000, after
+    which numbering restarts at 001; the numbers are therefore handled modulo 1000.
+
+    Numbers skipped are marked in a fixed size array indexed by sequence number, so the cost of tracking a
+    message does not depend on the number of messages received or the number of messages outstanding.
+    Only the numbers within a window behind the next number expected are remembered; a missing number
+    that falls out of the window is counted as lost and a late arrival is then treated as a duplicate."""
+
+    SEQUENCE_MODULUS: int = 1000
+    """The number of distinct channel sequence numbers, 001 to 999 and 000"""
+
+    channel: str = ""
+    """The channel designator"""
+
+    window: int = 0
+    """The number of sequence numbers behind the next number expected for which missing numbers are
+    remembered; also the largest jump in sequence numbers treated as a gap rather than a duplicate"""
+
+    next_expected: int = -1
+    """The sequence number expected next, -1 until the first message has been received"""
+
+    missing: bytearray = None
+    """A flag for each sequence number, set if the number is missing and within the window"""
+
+    received: int = 0
+    """The number of messages received on the channel"""
+
+    gaps: int = 0
+    """The number of times one or more sequence numbers were skipped"""
+
+    missing_outstanding: int = 0
+    """The number of sequence numbers currently missing within the window"""
+
+    lost: int = 0
+    """The number of missing sequence numbers that fell out of the window without being received"""
+
+    late: int = 0
+    """The number of messages received out of order, i.e. after a later sequence number"""
+
+    duplicates: int = 0
+    """The number of messages received with a sequence number already received"""
+
+    def __init__(self, channel, window):
+        # type: (str, int) -> None
+        """Creates the state of a channel on which nothing has been received.
+
+        :param channel: The channel designator;
+        :param window: The number of sequence numbers behind the next number expected for which missing
+               numbers are remembered, between 1 and half the sequence modulus;
+        """
+        self.channel = channel
+        self.window = min(max(1, window), self.SEQUENCE_MODULUS // 2)
+        self.next_expected = -1
+        self.missing = bytearray(self.SEQUENCE_MODULUS)
+        self.received = 0
+        self.gaps = 0
+        self.missing_outstanding = 0
+        self.lost = 0
+        self.late = 0
+        self.duplicates = 0
+
+    def track(self, sequence_number):
+        # type: (int) -> SequenceStatus
+        """Records the receipt of a sequence number.
+
+        :param sequence_number: The channel sequence number received;
+        :return: How the sequence number relates to the numbers already received;
+        """
+        sequence_number %= self.SEQUENCE_MODULUS
+        self.received += 1
+        if self.next_expected < 0:
+            self.next_expected = (sequence_number + 1) % self.SEQUENCE_MODULUS
+            return SequenceStatus.FIRST
+
+        skipped = (sequence_number - self.next_expected) % self.SEQUENCE_MODULUS
+        if skipped == 0:
+            self.advance(1)
+            return SequenceStatus.IN_ORDER
+        if skipped < self.window:
+            first_missing = self.next_expected
+            self.advance(skipped + 1)
+            self.set_range(first_missing, skipped, 1)
+            self.missing_outstanding += skipped
+            self.gaps += 1
+            return SequenceStatus.GAP
+        if self.missing[sequence_number]:
+            self.missing[sequence_number] = 0
+            self.missing_outstanding -= 1
+            self.late += 1
+            return SequenceStatus.LATE
+        self.duplicates += 1
+        return SequenceStatus.DUPLICATE
+
+    def advance(self, count):
+        # type: (int) -> None
+        """Moves the next number expected forward, the missing numbers that fall out of the window are
+        counted as lost.
+
+        :param count: The number of sequence numbers to move forward by, at most the window;
+        :return: None
+        """
+        expired = self.set_range(self.next_expected - self.window, count, 0)
+        self.missing_outstanding -= expired
+        self.lost += expired
+        self.next_expected = (self.next_expected + count) % self.SEQUENCE_MODULUS
+
+    def set_range(self, start, count, value):
+        # type: (int, int, int) -> int
+        """Sets the missing flags of a range of sequence numbers, the range may wrap around.
+
+        :param start: The first sequence number in the range, may be negative;
+        :param count: The number of sequence numbers in the range;
+        :param value: 1 to mark the numbers missing, 0 to clear them;
+        :return: The number of flags that were set before the range was updated;
+        """
+        start %= self.SEQUENCE_MODULUS
+        end = min(start + count, self.SEQUENCE_MODULUS)
+        flags_set = self.missing.count(1, start, end)
+        self.missing[start:end] = bytes([value]) * (end - start)
+        if start + count > self.SEQUENCE_MODULUS:
+            flags_set += self.set_range(0, start + count - self.SEQUENCE_MODULUS, value)
+        return flags_set
+
+    def get_missing_numbers(self):
+        # type: () -> [int]
+        """Gets the sequence numbers currently missing within the window, oldest first.
+
+        :return: A list of the missing sequence numbers;
+        """
+        if self.next_expected < 0:
+            return []
+        numbers = [(self.next_expected - self.window + offset) % self.SEQUENCE_MODULUS
+                   for offset in range(self.window)]
+        return [number for number in numbers if self.missing[number]]
+
+    def get_channel(self):
+        # type: () -> str
+        """Gets the channel designator.
+
+        :return: The channel designator;
+        """
+        return self.channel
+
+    def get_next_expected(self):
+        # type: () -> int
+        """Gets the sequence number expected next.
+
+        :return: The sequence number expected next, -1 if nothing has been received;
+        """
+        return self.next_expected
+
+    def get_received(self):
+        # type: () -> int
+        """Gets the number of messages received on the channel.
+
+        :return: The number of messages received;
+        """
+        return self.received
+
+    def get_gaps(self):
+        # type: () -> int
+        """Gets the number of times one or more sequence numbers were skipped.
+
+        :return: The number of gaps detected;
+        """
+        return self.gaps
+
+    def get_missing_outstanding(self):
+        # type: () -> int
+        """Gets the number of sequence numbers currently missing within the window.
+
+        :return: The number of sequence numbers missing;
+        """
+        return self.missing_outstanding
+
+    def get_lost(self):
+        # type: () -> int
+        """Gets the number of missing sequence numbers that fell out of the window without being received.
+
+        :return: The number of sequence numbers lost;
+        """
+        return self.lost
+
+    def get_late(self):
+        # type: () -> int
+        """Gets the number of messages received after a later sequence number.
+
+        :return: The number of messages received out of order;
+        """
+        return self.late
+
+    def get_duplicates(self):
+        # type: () -> int
+        """Gets the number of messages received with a sequence number already received.
+
+        :return: The number of duplicates;
+        """
+        return self.duplicates
+
+    def as_dict(self):
+        # type: () -> dict
+        """Gets the state of the channel as a dictionary that can be saved as JSON.
+
+        :return: The channel state;
+        """
+        return {"next_expected": self.next_expected, "missing": self.get_missing_numbers(),
+                "received": self.received, "gaps": self.gaps, "lost": self.lost, "late": self.late,
+                "duplicates": self.duplicates}
+
+    def from_dict(self, state):
+        # type: (dict) -> None
+        """Restores the state of the channel saved by 'as_dict()'.
+
+        :param state: The channel state;
+        :return: None
+        """
+        self.next_expected = int(state["next_expected"])
+        self.received = int(state["received"])
+        self.gaps = int(state["gaps"])
+        self.lost = int(state["lost"])
+        self.late = int(state["late"])
+        self.duplicates = int(state["duplicates"])
+        self.missing = bytearray(self.SEQUENCE_MODULUS)
+        for number in state["missing"]:
+            self.missing[int(number) % self.SEQUENCE_MODULUS] = 1
+        self.missing_outstanding = len(self.get_missing_numbers())
+
+
+class SequenceTracker:
+    """This class tracks the channel sequence numbers of the transmission identifications received on any
+    number of AFTN channels, see ChannelSequence. Gaps, duplicates and messages received out of order are
+    detected in constant time per message, the memory used is bounded by the number of channels.
+
+    The state of all the channels can be saved to a JSON file and is read back when a tracker is created
+    with the same file, so the sequence checking continues across restarts. The file is replaced
+    atomically, an interrupted save leaves the previous state in place. This class is not thread safe."""
+
+    DEFAULT_WINDOW: int = 500
+    """The default number of sequence numbers behind the next number expected for which missing numbers
+    are remembered"""
+
+    state_path: str | None = None
+    """The path to the file the state is saved to, None if the state is not saved"""
+
+    window: int = DEFAULT_WINDOW
+    """The window of each channel"""
+
+    channels: {str: ChannelSequence} = {}
+    """The state of each channel, indexed by the channel designator"""
+
+    def __init__(self, state_path=None, window=DEFAULT_WINDOW):
+        # type: (str | None, int) -> None
+        """Creates a tracker, the state saved to the state file is read if the file exists.
+
+        :param state_path: The path to the file the state is saved to, None not to save the state;
+        :param window: The number of sequence numbers behind the next number expected for which missing
+               numbers are remembered;
+        :raises OSError: If the state file exists and cannot be read;
+        :raises ValueError: If the state file does not contain a valid state;
+        """
+        self.state_path = state_path
+        self.window = window
+        self.channels = {}
+        if state_path is not None and os.path.exists(state_path):
+            self.load()
+
+    def track(self, channel, sequence_number):
+        # type: (str, int) -> SequenceStatus
+        """Records the receipt of a transmission identification.
+
+        :param channel: The channel designator;
+        :param sequence_number: The channel sequence number;
+        :return: How the sequence number relates to the numbers already received on the channel;
+        """
+        channel_sequence = self.channels.get(channel)
+        if channel_sequence is None:
+            channel_sequence = ChannelSequence(channel, self.window)
+            self.channels[channel] = channel_sequence
+        return channel_sequence.track(sequence_number)
+
+    def reset_channel(self, channel):
+        # type: (str) -> None
+        """Forgets the state of a channel, e.g. after the sequence numbering of the channel was reset by
+        the operators; the next number received on the channel is accepted as the first.
+
+        :param channel: The channel designator;
+        :return: None
+        """
+        self.channels.pop(channel, None)
+
+    def get_channel(self, channel):
+        # type: (str) -> ChannelSequence | None
+        """Gets the state of a channel.
+
+        :param channel: The channel designator;
+        :return: The state of the channel, None if nothing has been received on the channel;
+        """
+        return self.channels.get(channel)
+
+    def get_channels(self):
+        # type: () -> [ChannelSequence]
+        """Gets the state of all the channels.
+
+        :return: The state of each channel, ordered by channel designator;
+        """
+        return [self.channels[channel] for channel in sorted(self.channels)]
+
+    def get_missing_outstanding(self):
+        # type: () -> int
+        """Gets the number of sequence numbers currently missing on all the channels.
+
+        :return: The number of sequence numbers missing;
+        """
+        return sum(channel.get_missing_outstanding() for channel in self.channels.values())
+
+    def load(self):
+        # type: () -> None
+        """Reads the state of all the channels from the state file.
+
+        :return: None
+        :raises OSError: If the state file cannot be read;
+        :raises ValueError: If the state file does not contain a valid state;
+        """
+        with open(self.state_path, "r") as state_file:
+            state = json.load(state_file)
+        try:
+            channels = {}
+            for channel, channel_state in state["channels"].items():
+                channels[channel] = ChannelSequence(channel, self.window)
+                channels[channel].from_dict(channel_state)
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError("Invalid sequence state in '" + self.state_path + "': " + str(e)) from e
+        self.channels = channels
+
+    def get_state(self):
+        # type: () -> dict
+        """Gets the state of all the channels as a dictionary that can be saved as JSON; the dictionary is
+        a copy, (e.g. to be saved on another thread while messages continue to be tracked).
+
+        :return: The state of all the channels;
+        """
+        return {"channels": {channel: self.channels[channel].as_dict() for channel in sorted(self.channels)}}
+
+    def save(self, state=None):
+        # type: (dict | None) -> None
+        """Writes the state of all the channels to the state file; the state is written to a temporary
+        file that then replaces the state file. Does nothing if there is no state file.
+
+        :param state: The state to write, as returned by 'get_state()', None to write the current state;
+        :return: None
+        :raises OSError: If the state cannot be written;
+        """
+        if self.state_path is None:
+            return
+        if state is None:
+            state = self.get_state()
+        temporary_path = self.state_path + ".tmp"
+        with open(temporary_path, "w") as state_file:
+            json.dump(state, state_file, indent=1)
+            state_file.flush()
+            os.fsync(state_file.fileno())
+        os.replace(temporary_path, self.state_path)
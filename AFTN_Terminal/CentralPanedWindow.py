@@ -3,7 +3,9 @@ from tkinter import PanedWindow
 
 from Configuration.EnumerationConstants import MessageTitles
 from AFTN_Terminal.MessageDisplayFrame import MessageDisplayFrame
+from AFTN_Terminal.MessageIndex import MessageIndex
 from AFTN_Terminal.MessageListFrame import MessageListFrame
+from AFTN_Terminal.MessageSearch import MessageSearch
 from AFTN_Terminal.MessageTree import MessageTree
 from AFTN_Terminal.MenuBar import MenuBar
 from AFTN_Terminal.ToolBar import ToolBar
@@ -47,4 +49,8 @@ class CentralPanedWindow(PanedWindow):
         # Pass handles for the following frames to classes requiring access to them
         message_tree.set_message_list_frame(message_list_frame)
         message_list_frame.set_message_display_frame(message_display_frame)
+        message_list_frame.set_message_index(MessageIndex(working_directory_path))
         tool_bar.set_tree_view(message_list_frame)
+        message_search = MessageSearch(working_directory_path)
+        message_tree.set_message_search(message_search)
+        tool_bar.set_message_search(message_search)
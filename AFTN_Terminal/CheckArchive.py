@@ -0,0 +1,222 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from AFTN_Terminal.ValidateXml import ValidateXml
+
+
+class CheckArchive:
+    """This class checks that all the message XML files in the applications working directory (and all
+    its subdirectories) conform to the flight plan record XML schema. The files are validated in
+    parallel by a pool of worker processes, each worker compiles the schema once and validates the
+    files incrementally (see ValidateXml) so the memory used does not depend on the number or size of
+    the files.
+
+    The result for every file is appended to a report file as it becomes available, one line per file
+    in the order the files are found:
+        - 'OK<tab>path' for a file that conforms to the schema;
+        - 'INVALID<tab>path<tab>reasons' for a file that does not conform, the reasons are separated by ' | '.
+    The directories are traversed in sorted order, hence, if a check is interrupted it can be resumed;
+    the files up to and including the last file in the report are skipped.
+    """
+
+    DEFAULT_CHUNK_SIZE: int = 256
+    """The default number of files sent to a worker process in one go"""
+
+    CHUNKS_IN_FLIGHT_PER_WORKER: int = 4
+    """The number of chunks queued per worker process; keeps the workers busy while limiting memory use"""
+
+    STATUS_OK: str = "OK"
+    """The status written to the report for a file that conforms to the schema"""
+
+    STATUS_INVALID: str = "INVALID"
+    """The status written to the report for a file that does not conform to the schema"""
+
+    validator: ValidateXml = None
+    """The compiled schema used by a worker process, set once per process by 'initialise_worker()'"""
+
+    working_directory_path: str = ""
+    """The absolute path to the directory being checked"""
+
+    report_file_path: str = ""
+    """The path to the report file"""
+
+    schema_file_path: str = ""
+    """The path to the XML schema file the files are validated against"""
+
+    files_checked: int = 0
+    """The number of files in the report, including any from a previous (interrupted) check"""
+
+    files_invalid: int = 0
+    """The number of files in the report that do not conform to the schema"""
+
+    resume_after: tuple | None = None
+    """The path of the last file in the report relative to the working directory as a tuple of path
+    components, None if the report is empty"""
+
+    def __init__(self, working_directory_path, report_file_path, schema_file_path=ValidateXml.DEFAULT_SCHEMA_PATH):
+        # type: (str, str, str) -> None
+        """Sets up a check of a working directory; if the report file exists, the check resumes after the
+        last file in the report.
+
+        :param working_directory_path: The directory to check;
+        :param report_file_path: The path to the report file;
+        :param schema_file_path: The path to the XML schema file, defaults to the flight plan record schema;
+        """
+        self.working_directory_path = os.path.abspath(working_directory_path)
+        self.report_file_path = report_file_path
+        self.schema_file_path = schema_file_path
+        self.files_checked = 0
+        self.files_invalid = 0
+        self.resume_after = None
+        self.read_report()
+
+    def check(self, workers=None, chunksize=DEFAULT_CHUNK_SIZE):
+        # type: (int | None, int) -> Iterator[(str, [str])]
+        """Checks the files in the working directory that are not already in the report, the result for
+        each file is appended to the report as it becomes available.
+
+        :param workers: The number of worker processes, defaults to the number of CPUs; if one (or less)
+               the files are validated in the calling process;
+        :param chunksize: The number of files sent to a worker process in one go;
+        :return: A generator yielding a tuple with the path and a list of reasons the file does not conform
+                 to the schema (an empty list if the file conforms) for each file checked;
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        chunks = self.split_into_chunks(self.walk(self.working_directory_path, ()), max(1, chunksize))
+
+        with open(self.report_file_path, "a", encoding="utf-8") as report:
+            if workers <= 1:
+                self.initialise_worker(self.schema_file_path)
+                for chunk in chunks:
+                    yield from self.write_results(report, chunk, self.validate_chunk(chunk))
+                return
+
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=CheckArchive.initialise_worker,
+                                           initargs=(self.schema_file_path,))
+            try:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append((chunk, executor.submit(CheckArchive.validate_chunk, chunk)))
+                    if len(pending) >= workers * self.CHUNKS_IN_FLIGHT_PER_WORKER:
+                        chunk, future = pending.popleft()
+                        yield from self.write_results(report, chunk, future.result())
+                while pending:
+                    chunk, future = pending.popleft()
+                    yield from self.write_results(report, chunk, future.result())
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def initialise_worker(schema_file_path):
+        # type: (str) -> None
+        """Compiles the XML schema for use by the calling process.
+
+        :param schema_file_path: The path to the XML schema file;
+        :return: None
+        """
+        CheckArchive.validator = ValidateXml(schema_file_path)
+
+    def read_report(self):
+        # type: () -> None
+        """Reads an existing report file to count the files already checked and find the file to resume
+        after; an incomplete last line (from an interrupted check) is removed from the report.
+
+        :return: None
+        """
+        if not os.path.exists(self.report_file_path):
+            return
+        last_path = None
+        complete_length = 0
+        with open(self.report_file_path, "r", encoding="utf-8", newline="\n") as report:
+            for line in report:
+                if not line.endswith("\n"):
+                    break
+                complete_length += len(line.encode("utf-8"))
+                columns = line.rstrip("\n").split("\t")
+                if len(columns) < 2:
+                    continue
+                self.files_checked += 1
+                if columns[0] == self.STATUS_INVALID:
+                    self.files_invalid += 1
+                last_path = columns[1]
+        if os.path.getsize(self.report_file_path) != complete_length:
+            os.truncate(self.report_file_path, complete_length)
+        if last_path is not None:
+            self.resume_after = tuple(os.path.relpath(last_path, self.working_directory_path).split(os.sep))
+
+    @staticmethod
+    def split_into_chunks(paths, chunksize):
+        # type: (Iterable[str], int) -> Iterator[[str]]
+        """Splits an iterable of paths into lists of at most 'chunksize' paths.
+
+        :param paths: An iterable of file paths;
+        :param chunksize: The maximum number of paths in a chunk;
+        :return: A generator yielding the chunks;
+        """
+        chunk = []
+        for path in paths:
+            chunk.append(path)
+            if len(chunk) == chunksize:
+                yield chunk
+                chunk = []
+        if len(chunk) > 0:
+            yield chunk
+
+    @staticmethod
+    def validate_chunk(paths):
+        # type: ([str]) -> [[str]]
+        """Validates a list of XML files, this is the unit of work executed by the worker processes.
+
+        :param paths: A list of XML file paths;
+        :return: A list containing a list of reasons the file does not conform to the schema for each file;
+        """
+        return [CheckArchive.validator.validate(path) for path in paths]
+
+    def walk(self, path, components):
+        # type: (str, tuple) -> Iterator[str]
+        """Traverses a directory depth first with the directory entries in sorted order and yields the
+        XML files found; files up to and including the file to resume after are skipped.
+
+        :param path: The directory to traverse;
+        :param components: The path of the directory relative to the working directory as a tuple of
+               path components;
+        :return: A generator yielding the absolute paths of the XML files;
+        """
+        try:
+            with os.scandir(path) as entries:
+                entries = sorted(entries, key=lambda e: e.name)
+        except OSError:
+            return
+        for entry in entries:
+            entry_components = components + (entry.name,)
+            if self.resume_after is not None and entry_components < self.resume_after[0:len(entry_components)]:
+                # Everything in or below this entry was checked previously
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from self.walk(entry.path, entry_components)
+            elif entry.name.lower().endswith(".xml") and \
+                    (self.resume_after is None or entry_components > self.resume_after):
+                yield entry.path
+
+    def write_results(self, report, paths, results):
+        # type: (TextIO, [str], [[str]]) -> Iterator[(str, [str])]
+        """Writes the results for a chunk of files to the report and yields them.
+
+        :param report: The open report file;
+        :param paths: A list of XML file paths;
+        :param results: A list containing a list of reasons the file does not conform to the schema for each file;
+        :return: A generator yielding a tuple with the path and a list of reasons for each file;
+        """
+        for path, reasons in zip(paths, results):
+            self.files_checked += 1
+            if len(reasons) == 0:
+                report.write(self.STATUS_OK + "\t" + path + "\n")
+            else:
+                self.files_invalid += 1
+                report.write(self.STATUS_INVALID + "\t" + path + "\t" +
+                             " | ".join(reasons).replace("\t", " ").replace("\n", " ") + "\n")
+        # Make the results durable so that an interrupted check can be resumed
+        report.flush()
+        yield from zip(paths, results)
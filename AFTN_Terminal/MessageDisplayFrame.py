@@ -4,12 +4,13 @@ from tkinter import N, S, W, E, END, BOTTOM, RIGHT, Text, LEFT, BOTH, SINGLE, X,
 from tkinter import Listbox, Scrollbar, LabelFrame, Frame, PanedWindow, Event, Button, Toplevel
 from tkinter.ttk import Style
 
+from AFTN_Terminal.MessageValidationThread import MessageValidationThread
 from AFTN_Terminal.ReadXml import ReadXml
 from AFTN_Terminal.WriteXml import WriteXml
 from Configuration.EnumerationConstants import MessageTitles, MessageTypes, AdjacentUnits
 from Configuration.FieldsInMessage import FieldsInMessage
 from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
-from IcaoMessageParser.ParseMessage import ParseMessage
+from IcaoMessageParser.ParseMessageIncremental import ParseMessageIncremental
 
 
 class MessageDisplayFrame(Frame):
@@ -44,6 +45,43 @@ class MessageDisplayFrame(Frame):
     the 'xml_message_file_path' member in so far it is the path derived from a message selected
     in either the tree view or the message list."""
 
+    message_parser: ParseMessageIncremental = None
+    """The parser used to validate the message, only the fields edited since the message was last
+    validated are parsed again"""
+
+    LIVE_VALIDATION_DELAY: int = 500
+    """The default time in milliseconds the editor must be idle after an edit before the message is
+    validated when validating as you type"""
+
+    LIVE_VALIDATION_POLL_INTERVAL: int = 50
+    """The interval in milliseconds at which the results of validating as you type are checked for"""
+
+    live_validation_delay: int = LIVE_VALIDATION_DELAY
+    """The time in milliseconds the editor must be idle after an edit before the message is validated
+    when validating as you type"""
+
+    live_validation_enabled: bool = False
+    """A flag indicating if the message is validated as it is typed, (True), or only when the
+    'Validate' button is pressed, (False)"""
+
+    live_validation_buttons: (Button, Button) = (None, None)
+    """Handles to the 'Apply' and 'Save' buttons enabled/disabled when validating as you type"""
+
+    validation_thread: MessageValidationThread = None
+    """The thread validating the message when validating as you type, started when first enabled"""
+
+    validation_generation: int = 0
+    """Incremented on every edit; results of validating an earlier generation of the message are stale"""
+
+    validation_requested: int = 0
+    """The generation of the message last passed to the validation thread"""
+
+    validation_delay_id: str = None
+    """The Tk 'after' identifier of the pending idle delay, None if no delay is pending"""
+
+    validation_poll_id: str = None
+    """The Tk 'after' identifier of the pending check for validation results, None if not polling"""
+
     def __init__(self, parent, enabled, is_new, message_title):
         # type: (Toplevel | PanedWindow, bool, bool, MessageTitles) -> None
         """This constructor builds a Frame containing two frames (MessageTextFrame & ErrorMessageFrame)
@@ -67,6 +105,15 @@ class MessageDisplayFrame(Frame):
         super().__init__(parent)
 
         self.is_new = is_new
+        self.message_parser = ParseMessageIncremental()
+        self.live_validation_delay = self.LIVE_VALIDATION_DELAY
+        self.live_validation_enabled = False
+        self.live_validation_buttons = (None, None)
+        self.validation_thread = None
+        self.validation_generation = 0
+        self.validation_requested = 0
+        self.validation_delay_id = None
+        self.validation_poll_id = None
 
         # Set up a single column, two row grid on the parent
         self.columnconfigure(0, weight=1)
@@ -82,6 +129,10 @@ class MessageDisplayFrame(Frame):
         self.error_message_frame = ErrorMessageFrame(self)
         self.error_message_frame.grid(column=0, row=1, sticky=N + E + W + S)
 
+        # Edits are tracked for validating as you type; the validation thread is stopped with the frame
+        self.message_text_frame.text.bind("<<Modified>>", self.on_text_modified)
+        self.bind("<Destroy>", self.on_destroy)
+
         # Set the message template if this editor is opened as a 'new' message
         if self.is_new:
             self.set_template(message_title)
@@ -207,7 +258,7 @@ class MessageDisplayFrame(Frame):
         # type: (Button, Button) -> None
         """This method validates a message by parsing a message displayed in the message text editor.
         The 'Validate' and 'Save' buttons are enabled/disabled such that a message with errors
-        cannot be saved.
+        cannot be saved. Only the fields edited since the message was last validated are parsed again.
 
         :param apply_button: Handle to the 'Apply' button;
         :param save_button: Handle to the 'Save' button;
@@ -215,11 +266,21 @@ class MessageDisplayFrame(Frame):
         """
         # Parse the message displayed in the editor
         self.fpr = FlightPlanRecord()
-        pm = ParseMessage()
-        pm.parse_message(self.fpr, self.message_text_frame.get_text())
+        self.message_parser.parse_message(self.fpr, self.message_text_frame.get_text())
+        self.set_validation_results(apply_button, save_button)
 
+    def set_validation_results(self, apply_button, save_button):
+        # type: (Button, Button) -> None
+        """This method displays the results of validating the message held in 'fpr'; the errors are
+        listed in the error frame and highlighted in the message text.
+
+        :param apply_button: Handle to the 'Apply' button;
+        :param save_button: Handle to the 'Save' button;
+        :return: None
+        """
         # Set any associated errors in the message display error frame
         self.error_message_frame.set_errors(self.fpr.get_all_errors())
+        self.message_text_frame.set_error_highlights(self.fpr.get_all_errors())
 
         # Enable / disable the Save or Apply buttons
         # Can only save or apply a change if no errors exist
@@ -234,6 +295,122 @@ class MessageDisplayFrame(Frame):
             if apply_button is not None:
                 apply_button.config(state=NORMAL)
 
+    def enable_live_validation(self, enabled, apply_button, save_button):
+        # type: (bool, Button, Button) -> None
+        """This method enables or disables validating the message as it is typed. When enabled the
+        message is validated on a background thread once the editor has been idle for the live
+        validation delay after an edit; the errors are displayed and the 'Apply' and 'Save' buttons
+        enabled/disabled as for the 'Validate' button.
+
+        :param enabled: True to validate as you type, False to validate only with the 'Validate' button;
+        :param apply_button: Handle to the 'Apply' button;
+        :param save_button: Handle to the 'Save' button;
+        :return: None
+        """
+        self.live_validation_enabled = enabled
+        self.live_validation_buttons = (apply_button, save_button)
+        # Any validation in progress is stale
+        self.validation_generation += 1
+        if self.validation_delay_id is not None:
+            self.after_cancel(self.validation_delay_id)
+            self.validation_delay_id = None
+        if enabled:
+            if self.validation_thread is None:
+                self.validation_thread = MessageValidationThread()
+                self.validation_thread.start()
+            self.request_live_validation()
+
+    def set_live_validation_delay(self, delay):
+        # type: (int) -> None
+        """Sets the time the editor must be idle after an edit before the message is validated
+        when validating as you type.
+
+        :param delay: The idle time in milliseconds;
+        :return: None
+        """
+        self.live_validation_delay = delay
+
+    def get_live_validation_delay(self):
+        # type: () -> int
+        """Gets the time the editor must be idle after an edit before the message is validated
+        when validating as you type.
+
+        :return: The idle time in milliseconds;
+        """
+        return self.live_validation_delay
+
+    def on_text_modified(self, event):
+        # type: (Event) -> None
+        """This is a callback method bound to the text widget invoked when the message text is modified.
+        When validating as you type the idle delay is restarted; results of validating the previous
+        text are stale and will be discarded.
+
+        :param event: Unused by this callback;
+        :return: None
+        """
+        # Resetting the modified flag generates this event again, ignore it
+        if not self.message_text_frame.text.edit_modified():
+            return
+        # Reset the modified flag so the next edit generates another event
+        self.message_text_frame.text.edit_modified(False)
+        self.validation_generation += 1
+        if not self.live_validation_enabled:
+            return
+        if self.validation_delay_id is not None:
+            self.after_cancel(self.validation_delay_id)
+        self.validation_delay_id = self.after(self.live_validation_delay, self.request_live_validation)
+
+    def request_live_validation(self):
+        # type: () -> None
+        """This method passes the message text to the validation thread and starts checking for
+        the results; it never waits for the message to be parsed.
+
+        :return: None
+        """
+        self.validation_delay_id = None
+        self.validation_requested = self.validation_generation
+        self.validation_thread.request_validation(self.validation_requested, self.message_text_frame.get_text())
+        if self.validation_poll_id is None:
+            self.validation_poll_id = self.after(self.LIVE_VALIDATION_POLL_INTERVAL, self.poll_validation_results)
+
+    def poll_validation_results(self):
+        # type: () -> None
+        """This method displays the results of validating the current message text, if available;
+        results for an earlier version of the text are discarded. Polling continues while the results
+        for the last request are outstanding.
+
+        :return: None
+        """
+        self.validation_poll_id = None
+        result = self.validation_thread.get_result()
+        while result is not None:
+            generation, flight_plan_record = result
+            if generation == self.validation_generation and self.live_validation_enabled:
+                self.fpr = flight_plan_record
+                self.set_validation_results(*self.live_validation_buttons)
+            if generation == self.validation_requested:
+                return
+            result = self.validation_thread.get_result()
+        self.validation_poll_id = self.after(self.LIVE_VALIDATION_POLL_INTERVAL, self.poll_validation_results)
+
+    def on_destroy(self, event):
+        # type: (Event) -> None
+        """This is a callback method bound to this frame invoked when the frame is destroyed;
+        pending validation callbacks are cancelled and the validation thread, if started, is stopped.
+
+        :param event: The event containing the handle of the widget destroyed;
+        :return: None
+        """
+        if event.widget is not self:
+            return
+        for after_id in [self.validation_delay_id, self.validation_poll_id]:
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self.validation_delay_id = None
+        self.validation_poll_id = None
+        if self.validation_thread is not None:
+            self.validation_thread.stop()
+
 
 class ErrorMessageFrame(LabelFrame):
     """This class builds a frame containing the list widget that displays errors associated with
@@ -361,6 +538,7 @@ class MessageTextFrame(LabelFrame):
         style = Style()
         def_color = style.map('Treeview')['background'][1][1]
         self.text.tag_configure("highlight", background=def_color, foreground="white")
+        self.text.tag_configure("error", underline=True, foreground="red")
         self.text.bind("<ButtonRelease-1>", self.clear_highlight)
         self.text.config(spacing1=4)
 
@@ -439,6 +617,21 @@ class MessageTextFrame(LabelFrame):
                           self.get_row_column_index(start_index),
                           self.get_row_column_index(end_index))
 
+    def set_error_highlights(self, errors):
+        # type: ([[str, int, int]]) -> None
+        """This method marks the erroneous fields of a message in the text widget, removing the marks
+        and highlighting set for a previous version of the message;
+
+        :param errors: A list of errors, each entry is itself a list with index 0 = the error message,
+               index 1 = the zero based index of the first character of an erroneous field and
+               index 2 = the zero based index of the last character + 1 of an erroneous field.
+        :return: None
+        """
+        self.text.tag_remove("highlight", 0.0, END)
+        self.text.tag_remove("error", 0.0, END)
+        for error in errors:
+            self.text.tag_add("error", self.get_row_column_index(error[1]), self.get_row_column_index(error[2]))
+
     @staticmethod
     def clear_highlight(event):
         # type: (Event) -> None
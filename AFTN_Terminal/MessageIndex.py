@@ -0,0 +1,228 @@
+import os
+import sqlite3
+import stat
+import threading
+
+from AFTN_Terminal.MessageSearch import MessageSearch
+from AFTN_Terminal.ReadXml import ReadXml
+from AFTN_Terminal.WriteXml import WriteXml
+
+
+class MessageIndex:
+    """This class maintains a persistent index of the message XML files in the applications working
+    directory. The index stores the summary information displayed in the message list (priority, filing
+    time, F3a, F7a, F9b, F9c, F13a, F13b, F16a and F15) for each message file, keyed by the absolute path
+    of the file along with its modification time and size.
+
+    When the messages in a folder are displayed, the summary information is read from the index; only
+    files that are new or have changed since they were indexed are read and parsed (using ReadXml, reading
+    the header and ICAO fields only) and the index updated. Index entries for files that no longer exist are removed.
+    The summaries last stored for a folder can also be read without checking the files at all, so that a
+    folder is displayed at once and checked, (revalidated), on a background thread; the index can be used
+    from any thread.
+
+    The index is an SQLite database stored in the working directory; it is a cache only and can be
+    deleted at any time, it is rebuilt as the folders are displayed. If the database cannot be opened
+    the index is held in memory for the duration of the application.
+    """
+
+    INDEX_FILE_NAME: str = ".message_index.sqlite"
+    """The name of the index database file in the working directory; SQLite may create additional files
+    with this name as a prefix, (e.g. the write ahead log)"""
+
+    SCHEMA_VERSION: int = 1
+    """The version of the index table layout, the index is rebuilt if the database has a different version"""
+
+    SUMMARY_COLUMNS: [str] = ["priority", "filing_time", "f3a", "f7a", "f9b", "f9c", "f13a", "f13b", "f16a", "f15"]
+    """The summary columns stored for each message, in the order they are displayed in the message list"""
+
+    connection: sqlite3.Connection = None
+    """The connection to the index database"""
+
+    lock: threading.Lock = None
+    """Serialises the use of the connection by the Tk thread and background threads"""
+
+    def __init__(self, working_directory_path):
+        # type: (str | None) -> None
+        """Opens (or creates) the index database in the working directory.
+
+        :param working_directory_path: The working directory used by this application to store messages in;
+               if None, the index is held in memory only;
+        """
+        self.lock = threading.Lock()
+        if working_directory_path is None:
+            self.connection = self.open_index(":memory:")
+            return
+        try:
+            self.connection = self.open_index(self.get_index_file_path(working_directory_path))
+        except sqlite3.Error as e:
+            print("Unable to open the message index in '" + working_directory_path + "': " + str(e))
+            self.connection = self.open_index(":memory:")
+
+    def close(self):
+        # type: () -> None
+        """Closes the index database.
+
+        :return: None
+        """
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    @staticmethod
+    def get_index_file_path(working_directory_path):
+        # type: (str) -> str
+        """Gets the absolute path of the index database file for a working directory.
+
+        :param working_directory_path: The working directory used by this application to store messages in;
+        :return: The absolute path of the index database file;
+        """
+        return os.path.join(os.path.abspath(working_directory_path), MessageIndex.INDEX_FILE_NAME)
+
+    def get_summaries(self, file_paths):
+        # type: ([str]) -> [[str]]
+        """Gets the summary information for the message files given in 'file_paths', the information is
+        returned for valid message files only and in the same order as 'file_paths'. Directories and files
+        that are not valid message XML files are skipped. Files that have not been indexed before or have
+        changed since they were indexed are read and the index is updated.
+
+        :param file_paths: A list of absolute file paths, (typically the content of a directory);
+        :return: A list with an entry for each valid message file; each entry is a list containing the
+                 summary columns in the order given in SUMMARY_COLUMNS followed by the file path;
+        """
+        # Read the index entries for all the folders concerned in one go, the files are read and checked
+        # without holding the lock
+        indexed = {}
+        with self.lock:
+            for folder in {os.path.dirname(file_path) for file_path in file_paths}:
+                for row in self.connection.execute(
+                        "SELECT path, mtime_ns, size, message_ok, " + ", ".join(self.SUMMARY_COLUMNS) +
+                        " FROM messages WHERE folder = ?", (folder,)):
+                    indexed[row[0]] = row
+
+        summaries = []
+        updates = []
+        for file_path in file_paths:
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                continue
+            if stat.S_ISDIR(file_stat.st_mode):
+                continue
+
+            row = indexed.pop(file_path, None)
+            if row is None or row[1] != file_stat.st_mtime_ns or row[2] != file_stat.st_size:
+                # New or changed file, read it and update the index
+                row = (file_path, file_stat.st_mtime_ns, file_stat.st_size) + self.read_summary(file_path)
+                updates.append((os.path.dirname(file_path),) + row)
+
+            if row[3]:
+                summaries.append(list(row[4:]) + [file_path])
+
+        # Remove any index entries for files that no longer exist
+        removed = [(file_path,) for file_path in indexed if not os.path.exists(file_path)]
+
+        if len(updates) > 0 or len(removed) > 0:
+            with self.lock, self.connection:
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO messages (folder, path, mtime_ns, size, message_ok, " +
+                    ", ".join(self.SUMMARY_COLUMNS) + ") VALUES (" +
+                    ", ".join("?" * (len(self.SUMMARY_COLUMNS) + 5)) + ")", updates)
+                self.connection.executemany("DELETE FROM messages WHERE path = ?", removed)
+
+        return summaries
+
+    def get_indexed_summaries(self, folder_path):
+        # type: (str) -> [[str]]
+        """Gets the summary information stored in the index for the message files in a folder, without
+        reading or checking the files; the information may be out of date or missing for files that have
+        been created, changed or deleted since the folder was last checked with 'get_summaries()'.
+
+        :param folder_path: The absolute path of the folder;
+        :return: A list with an entry for each valid message file indexed in the folder, ordered by file
+                 path; each entry is a list containing the summary columns in the order given in
+                 SUMMARY_COLUMNS followed by the file path;
+        """
+        with self.lock:
+            return [list(row) for row in self.connection.execute(
+                "SELECT " + ", ".join(self.SUMMARY_COLUMNS) + ", path FROM messages "
+                "WHERE folder = ? AND message_ok ORDER BY path", (folder_path,))]
+
+    @staticmethod
+    def list_folder(folder_path):
+        # type: (str) -> [str]
+        """Lists the files in a folder that may be message files; directories, the index database files
+        and messages being written, (see WriteXml), are skipped.
+
+        :param folder_path: The absolute path of the folder;
+        :return: The absolute paths of the files, sorted; empty if the folder cannot be read;
+        """
+        file_paths = []
+        try:
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if not entry.is_dir() and not MessageIndex.is_index_file(entry.path) and \
+                            not WriteXml.is_temporary_file(entry.path):
+                        file_paths.append(entry.path)
+        except OSError:
+            pass
+        file_paths.sort()
+        return file_paths
+
+    @staticmethod
+    def is_index_file(path):
+        # type: (str) -> bool
+        """Checks if a path is the index database file, the search database file, (see MessageSearch), or one
+        of the additional files created by SQLite.
+
+        :param path: A file path;
+        :return: True if the path is an index database file, False otherwise;
+        """
+        return os.path.basename(path).startswith((MessageIndex.INDEX_FILE_NAME, MessageSearch.SEARCH_FILE_NAME))
+
+    def open_index(self, index_file_path):
+        # type: (str) -> sqlite3.Connection
+        """Opens the index database and creates the index table if it does not already exist; an index
+        with a different schema version is discarded.
+
+        :param index_file_path: The path of the index database file or ':memory:';
+        :return: A connection to the index database;
+        """
+        connection = sqlite3.connect(index_file_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode = WAL")
+        if connection.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            with connection:
+                connection.execute("DROP TABLE IF EXISTS messages")
+                connection.execute("CREATE TABLE messages (path TEXT PRIMARY KEY, folder TEXT NOT NULL, "
+                                   "mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, "
+                                   "message_ok INTEGER NOT NULL, " +
+                                   ", ".join(column + " TEXT" for column in self.SUMMARY_COLUMNS) + ")")
+                connection.execute("CREATE INDEX messages_folder ON messages (folder)")
+                connection.execute("PRAGMA user_version = " + str(self.SCHEMA_VERSION))
+        return connection
+
+    @staticmethod
+    def read_summary(file_path):
+        # type: (str) -> tuple
+        """Reads a message XML file and extracts the summary information stored in the index.
+
+        :param file_path: The absolute path of a message XML file;
+        :return: A tuple containing a flag, True if the file is a valid message XML file, followed by the
+                 summary columns in the order given in SUMMARY_COLUMNS;
+        """
+        # Called on a background thread, errors are not displayed in a message box
+        rx = ReadXml(file_path, summary_only=True, show_errors=False)
+        if not rx.is_message_ok():
+            return (False,) + ("",) * len(MessageIndex.SUMMARY_COLUMNS)
+        return (True,
+                rx.get_priority_indicator(),
+                rx.get_filing_time(),
+                rx.get_f3a(),
+                rx.get_f7a(),
+                rx.get_f9b(),
+                rx.get_f9c(),
+                rx.get_f13a(),
+                rx.get_f13b(),
+                rx.get_f16a(),
+                rx.get_f15())
@@ -1,9 +1,13 @@
 import os
+import queue
+import threading
 from tkinter import PanedWindow, END, VERTICAL, Scrollbar, RIGHT, Y, CENTER, Menu, Event
 from tkinter.messagebox import askyesno
 from tkinter.ttk import Treeview
 
 from AFTN_Terminal.ErsListFrame import ErsListFrame
+from AFTN_Terminal.MessageIndex import MessageIndex
+from AFTN_Terminal.MessageSummaryTable import MessageSummaryTable
 from AFTN_Terminal.ReadXml import ReadXml
 from AFTN_Terminal.MenuBar import MenuBar
 from AFTN_Terminal.ToolBar import ToolBar
@@ -17,7 +21,29 @@ class MessageListFrame(Treeview):
     """This class builds a tree view as a list to display messages in. All methods for selecting and
     double-clicking a list entry are also implemented by this class. Right-clicking a list entry
     displays a popup menu that is also implemented by this class.
+
+    The summary information for all the messages in the displayed folder is held in a MessageSummaryTable;
+    only the rows visible in the list (plus a small margin) are inserted in the tree view. Scrolling
+    re-uses the tree view entries to display a different window of rows and clicking a column heading
+    sorts the table, so folders containing any number of messages are displayed and scrolled quickly.
+
+    When a folder is opened the summaries last stored in the message index are displayed at once, without
+    reading the folder; the folder is then listed and the files checked against the index on a background
+    thread, (new and changed files are read), and the list is updated with the result.
     """
+    ROW_MARGIN: int = 2
+    """The number of rows inserted in the tree view in addition to the visible rows; covers a partially
+    visible last row and the list being enlarged before the number of visible rows is updated;"""
+
+    WHEEL_ROWS: int = 3
+    """The number of rows scrolled by one step of the mouse wheel;"""
+
+    DEFAULT_ROW_HEIGHT: int = 20
+    """The height of a list row in pixels used until the height can be measured;"""
+
+    REFRESH_POLL_INTERVAL: int = 50
+    """The interval in milliseconds at which the result of checking the folder on display is polled for;"""
+
     selected_item: str = None
     """A tree view item that identifiers a message selected in the list;"""
 
@@ -39,6 +65,32 @@ class MessageListFrame(Treeview):
     """Handle to a MessageDisplayFrame that displays a message when selected in the list. The
     MessageDisplayFrame instance in this case is the one displayed in the main application window."""
 
+    message_index: MessageIndex = None
+    """Handle to the index of the messages in the working directory; the list entries are read from
+    the index rather than the message XML files."""
+
+    summary_table: MessageSummaryTable = None
+    """The summary information for all the messages in the folder on display;"""
+
+    folder_path: str = ""
+    """The absolute path of the folder on display, empty if none;"""
+
+    refresh_results: queue.SimpleQueue = None
+    """The results of checking folders on a background thread, each entry is a tuple containing the folder
+    path and the summaries of the messages in the folder;"""
+
+    refresh_poll_id: str | None = None
+    """The identifier of the scheduled poll for the results of checking folders, None if not scheduled;"""
+
+    first_row: int = 0
+    """The index in the summary table of the first row on display;"""
+
+    visible_rows: int = 10
+    """The number of rows that fit in the list, updated when the list is resized;"""
+
+    scrollbar: Scrollbar = None
+    """The list scrollbar; its position reflects the window of rows on display in the summary table;"""
+
     icon_root_path = os.path.split(os.getcwd())[0] + os.sep + "Icons" + os.sep + "Icon24" + os.sep
     """Absolute path to the Icons needed for the tree view message list"""
 
@@ -94,6 +146,15 @@ class MessageListFrame(Treeview):
         # NOTE: Column 10 (which is not displayed) is used to store the path and filename
         # of the message displayed in the list.
 
+        # Clicking a heading sorts the list by that column
+        for idx, column in enumerate(columns):
+            self.heading(column, command=lambda c=idx: self.on_sort(c))
+
+        self.summary_table = MessageSummaryTable()
+        self.folder_path = ""
+        self.refresh_results = queue.SimpleQueue()
+        self.refresh_poll_id = None
+
         # Create the list popup
         self.popup_create()
 
@@ -103,10 +164,10 @@ class MessageListFrame(Treeview):
         # Save a handle to the toolbar
         self.tool_bar = tool_bar
 
-        # Add a scrollbar
-        vertical = Scrollbar(self, orient=VERTICAL, command=self.yview)
-        vertical.pack(side=RIGHT, fill=Y)
-        self.configure(yscrollcommand=vertical.set)
+        # Add a scrollbar; the scrollbar scrolls the summary table rather than the tree view
+        self.scrollbar = Scrollbar(self, orient=VERTICAL, command=self.on_scroll)
+        self.scrollbar.pack(side=RIGHT, fill=Y)
+        self.scrollbar.set(0.0, 1.0)
 
         # Bind the callbacks for single and double clicks
         self.bind('<Button-1>', self.on_single_click)
@@ -114,6 +175,68 @@ class MessageListFrame(Treeview):
         self.bind('<Double-1>', self.on_double_click)
         self.bind('<Button-3>', self.on_right_click)
 
+        # Bind the callbacks for resizing and the mouse wheel, (Button-4/5 on X11)
+        self.bind('<Configure>', self.on_configure)
+        self.bind('<MouseWheel>', self.on_mouse_wheel)
+        self.bind('<Button-4>', self.on_mouse_wheel)
+        self.bind('<Button-5>', self.on_mouse_wheel)
+
+    def delete_list_entry(self, path):
+        # type: (str) -> None
+        """This method removes a message from the list.
+
+        :param path: The full absolute path to the XML file representing the message;
+        :return: None
+        """
+        if self.summary_table.remove_path(path):
+            self.display_rows(self.first_row)
+
+    def display_rows(self, first_row):
+        # type: (int) -> None
+        """This method displays a window of rows from the summary table starting at a given row; the
+        existing tree view entries are re-used, entries are only inserted or deleted if the number of
+        rows on display changes. The selection follows the selected message, (if it is on display).
+
+        :param first_row: The index in the summary table of the first row to display;
+        :return: None
+        """
+        self.first_row = self.summary_table.get_first_row(first_row, self.visible_rows)
+        rows = self.summary_table.get_rows(self.first_row, self.visible_rows + self.ROW_MARGIN)
+        items = self.get_children()
+        for item, row in zip(items, rows):
+            self.item(item, values=row)
+        for row in rows[len(items):]:
+            self.insert('', END, values=row)
+        if len(items) > len(rows):
+            self.delete(*items[len(rows):])
+        # The tree view may have scrolled its entries, (e.g. to show a partially visible row when clicked)
+        self.yview_moveto(0)
+
+        self.selection_set([item for item, row in zip(self.get_children(), rows) if row[-1] == self.selected_path])
+        self.scrollbar.set(*self.summary_table.get_fractions(self.first_row, self.visible_rows))
+
+    def on_configure(self, event):
+        # type: (Event) -> None
+        """This method is a callback bound to the list being resized; the number of rows that fit in
+        the list is updated and the rows on display updated accordingly.
+
+        :param event: Provides the new height of the list;
+        :return: None
+        """
+        # Measure the heading and row heights from the first row if possible
+        heading_height = row_height = self.DEFAULT_ROW_HEIGHT
+        items = self.get_children()
+        if len(items) > 0:
+            bbox = self.bbox(items[0])
+            if bbox:
+                heading_height = bbox[1]
+                row_height = max(1, bbox[3])
+
+        visible_rows = max(1, (event.height - heading_height) // row_height)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.display_rows(self.first_row)
+
     def on_delete(self):
         # type: () -> None
         """This method is a callback bound to the popup menu 'delete message' menu item; when invoked
@@ -129,8 +252,8 @@ class MessageListFrame(Treeview):
                               "Are you sure you want to delete the Message:" + os.linesep
                               + self.selected_path, parent=self)
             if answer:
-                # Delete the node from the tree
-                self.delete(self.selection()[0])
+                # Delete the entry from the list
+                self.delete_list_entry(self.selected_path)
 
     def on_double_click(self, event):
         # type: (Event) -> None
@@ -175,6 +298,24 @@ class MessageListFrame(Treeview):
         """
         ErsListFrame(self, self.selected_path)
 
+    def on_mouse_wheel(self, event):
+        # type: (Event) -> str
+        """This method is a callback bound to the mouse wheel, the list is scrolled by WHEEL_ROWS rows
+        per wheel step.
+
+        :param event: Provides the wheel direction, (event.num on X11, event.delta otherwise);
+        :return: 'break' to stop the tree view scrolling its own entries;
+        """
+        match event.num:
+            case 4:
+                direction = -1
+            case 5:
+                direction = 1
+            case _:
+                direction = -1 if event.delta > 0 else 1
+        self.display_rows(self.first_row + direction * self.WHEEL_ROWS)
+        return "break"
+
     def on_open_file(self):
         # type: () -> None
         """This method is a callback bound to the popup menu 'open message' menu item; when invoked
@@ -245,6 +386,21 @@ class MessageListFrame(Treeview):
             # Make sure to release the grab (Tk 8.0a1 only)
             self.popup_menu.grab_release()
 
+    def on_scroll(self, *args):
+        # type: (str) -> None
+        """This method is a callback bound to the scrollbar; the list is scrolled to the position of the
+        scrollbar slider or by a number of rows or pages.
+
+        :param args: Either 'moveto' and the slider position or 'scroll', a number and 'units' or 'pages';
+        :return: None
+        """
+        match args[0]:
+            case "moveto":
+                self.display_rows(self.summary_table.get_first_row_at(float(args[1]), self.visible_rows))
+            case "scroll":
+                rows = int(args[1]) * (self.visible_rows if args[2] == "pages" else 1)
+                self.display_rows(self.first_row + rows)
+
     def on_single_click(self, event):
         # type: (Event) -> None
         """This method highlights a selected item in the list, saves the absolute path to the XML
@@ -271,6 +427,17 @@ class MessageListFrame(Treeview):
         self.menu_bar.set_selected_path(self.selected_path)
         self.tool_bar.set_selected_path(self.selected_path)
 
+    def on_sort(self, column):
+        # type: (int) -> None
+        """This method is a callback bound to the column headings; the list is sorted by the column,
+        clicking the same heading again reverses the sort order.
+
+        :param column: The index of the column to sort by;
+        :return: None
+        """
+        self.summary_table.sort(column)
+        self.display_rows(0)
+
     def popup_create(self):
         # type: () -> None
         """This method builds the popup menu displayed when a list entry is right-clicked.
@@ -326,43 +493,104 @@ class MessageListFrame(Treeview):
         """
         self.message_display_frame = message_display_frame
 
+    def set_message_index(self, message_index):
+        # type: (MessageIndex) -> None
+        """This method saves the instance handle to the index of the messages in the working directory.
+
+        :param message_index: Handle to an instance of MessageIndex for the applications working directory;
+        :return: None
+        """
+        self.message_index = message_index
+
+    def poll_refresh_results(self):
+        # type: () -> None
+        """This method updates the list with the result of checking the folder on display, if available;
+        results for other folders, (the folder on display has changed since), are discarded. Polling
+        continues while folders are being checked.
+
+        :return: None
+        """
+        self.refresh_poll_id = None
+        while True:
+            try:
+                folder_path, summaries = self.refresh_results.get_nowait()
+            except queue.Empty:
+                break
+            if folder_path == self.folder_path:
+                self.summary_table.set_rows(summaries)
+                self.display_rows(self.first_row)
+                if len(self.summary_table) == 0:
+                    self.clear_message_display()
+                return
+        self.refresh_poll_id = self.after(self.REFRESH_POLL_INTERVAL, self.poll_refresh_results)
+
+    def refresh_folder(self, folder_path):
+        # type: (str) -> None
+        """This method lists a folder and gets the summaries of its messages from the index, reading only
+        new or changed files; it runs on a background thread and passes the result to the Tk thread.
+
+        :param folder_path: The absolute path of the folder;
+        :return: None
+        """
+        self.refresh_results.put((folder_path, self.message_index.get_summaries(MessageIndex.list_folder(folder_path))))
+
+    def clear_message_display(self):
+        # type: () -> None
+        """This method clears the message display and disables the message menu item and buttons.
+
+        :return: None
+        """
+        self.message_display_frame.set_message("")
+        self.menu_bar.set_open_message_menu_state(False)
+        self.tool_bar.set_message_buttons_state(False)
+
+    def display_folder(self, folder_path):
+        # type: (str) -> None
+        """This method replaces the messages displayed in the message list with the messages in a
+        directory that has been selected in the tree view displayed in the main application window. The
+        messages last indexed for the directory are displayed at once, without reading the directory; the
+        directory is then listed and checked on a background thread, (only new or modified files are read),
+        and the list updated. Only the first rows that fit in the list are inserted in the tree view, the
+        remaining rows are displayed when scrolled to.
+
+        :param folder_path: The absolute path of the directory selected in the tree view displayed in the
+               main window;
+        :return: None
+        """
+        # Display the message summaries stored in the index, the file path is stored in the last column
+        self.folder_path = folder_path
+        self.summary_table = MessageSummaryTable(self.message_index.get_indexed_summaries(folder_path))
+        self.display_rows(0)
+        if len(self.summary_table) == 0:
+            self.clear_message_display()
+
+        # Check the directory without blocking the GUI
+        threading.Thread(target=self.refresh_folder, args=(folder_path,), name="Message List Refresh",
+                         daemon=True).start()
+        if self.refresh_poll_id is None:
+            self.refresh_poll_id = self.after(self.REFRESH_POLL_INTERVAL, self.poll_refresh_results)
+
     def update_list_entries(self, file_paths):
         # type: ([str]) -> None
-        """This method updates the messages displayed in the message list; The 'old' list is deleted,
-        the new list is built from the XML files contained in a specified directory that has been
-        selected in the tree view displayed in the main application window.
+        """This method updates the messages displayed in the message list; The 'old' list is replaced,
+        the new list is built from a list of XML files, (e.g. the messages found by a search). Only the
+        first rows that fit in the list are inserted in the tree view, the remaining rows are displayed
+        when scrolled to.
 
-        :param file_paths: A list of absolute file paths provided by the tree view displayed in
-               the main window when a directory containing XML files representing message is selected;
+        :param file_paths: A list of absolute file paths of XML files representing messages;
         :return: None
         """
-        # Delete all the list entries currently on display
-        for row in self.get_children():
-            self.delete(row)
+        # The list no longer displays a directory, the result of checking a directory is discarded
+        self.folder_path = ""
 
         # Clear the editor if there are no messages to display
         if len(file_paths) == 0:
-            self.message_display_frame.set_message("")
-            self.menu_bar.set_open_message_menu_state(False)
-            self.tool_bar.set_message_buttons_state(False)
+            self.summary_table = MessageSummaryTable()
+            self.display_rows(0)
+            self.clear_message_display()
             return
 
-        # Loop over the list of tree child nodes and add the message
-        # files to the list of messages
-        for file_path in file_paths:
-            isdir = os.path.isdir(file_path)
-            if not isdir:
-                rx = ReadXml(file_path)
-                if rx.is_message_ok():
-                    self.insert('', END,
-                                values=(rx.get_priority_indicator(),
-                                        rx.get_filing_time(),
-                                        rx.get_f3a(),
-                                        rx.get_f7a(),
-                                        rx.get_f9b(),
-                                        rx.get_f9c(),
-                                        rx.get_f13a(),
-                                        rx.get_f13b(),
-                                        rx.get_f16a(),
-                                        rx.get_f15(),
-                                        file_path))
+        # Get the message summaries from the index, (only new or modified files are read) and display
+        # the first rows; the file path is stored in the last column
+        self.summary_table = MessageSummaryTable(self.message_index.get_summaries(file_paths))
+        self.display_rows(0)
@@ -0,0 +1,434 @@
+import os
+import re
+import sqlite3
+import threading
+
+from AFTN_Terminal.ReadXml import ReadXml
+from Configuration.EnumerationConstants import FieldIdentifiers, SubFieldIdentifiers, MessageTitles
+from F15_Parser.F15TokenSyntaxDescriptions import TokenBaseType
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+
+
+class MessageSearch:
+    """This class maintains a search index over the message XML files in the applications working
+    directory so that messages can be found without browsing the folders, e.g. all the FPL messages for
+    DLH4AB with a DOF of 221117, or all the messages with a route through BIBAX.
+
+    For each message file the index holds the message title (F3a), callsign (F7a), ADEP (F13a), EOBT
+    (F13b), ADES (F16a), the DOF and REG from field 18, the significant points of the extracted route
+    and the text of the errors reported by the parser. The fields are held in an SQLite table with an
+    index on each searchable column, the route points in a table keyed by point and the error text in an
+    SQLite FTS5 full text table, (or a plain table searched with LIKE if SQLite was built without FTS5),
+    so a query reads the matching entries only regardless of the number of messages indexed.
+
+    The index is kept up to date incrementally; messages are added as they are written, (see
+    'add_records()' and 'add_file()'), and 'update()' brings the index up to date with the message
+    files, reading only the files that are new or have changed since they were indexed. The index is an
+    SQLite database stored in the working directory; like the MessageIndex it is a cache and can be
+    deleted at any time. The methods can be called from any thread, the database is used by one thread
+    at a time."""
+
+    SEARCH_FILE_NAME: str = ".message_search.sqlite"
+    """The name of the search database file in the working directory; SQLite may create additional files
+    with this name as a prefix, (e.g. the write ahead log)"""
+
+    SCHEMA_VERSION: int = 1
+    """The version of the search table layout, the index is rebuilt if the database has a different version"""
+
+    SEARCH_COLUMNS: [str] = ["title", "callsign", "adep", "ades", "eobt", "dof", "registration"]
+    """The message fields stored for each message, each can be searched for"""
+
+    CRITERIA: [str] = SEARCH_COLUMNS + ["point", "error_text"]
+    """The criteria a search can be made on, see 'search()'"""
+
+    QUERY_KEYWORDS: {str: str} = {
+        "TITLE": "title", "ARCID": "callsign", "ADEP": "adep", "ADES": "ades", "EOBT": "eobt",
+        "DOF": "dof", "REG": "registration", "PT": "point", "ERROR": "error_text"
+    }
+    """The keywords of a search query, (see 'parse_query()'), and the criterion each keyword gives"""
+
+    ADES_FIELDS: [FieldIdentifiers] = [FieldIdentifiers.F16, FieldIdentifiers.F16a, FieldIdentifiers.F16ab,
+                                       FieldIdentifiers.F16abc]
+    """The fields containing the ADES subfield F16a, depending on the message title"""
+
+    DOF_FIELDS: [FieldIdentifiers] = [FieldIdentifiers.F18, FieldIdentifiers.F18_DOF]
+    """The fields containing the DOF subfield, depending on the message title"""
+
+    DEFAULT_LIMIT: int = 1000
+    """The default maximum number of messages returned by a search"""
+
+    connection: sqlite3.Connection = None
+    """The connection to the search database"""
+
+    working_directory_path: str | None = None
+    """The absolute path to the working directory indexed, None if the index is held in memory only"""
+
+    full_text: bool = True
+    """True if the error text is held in an FTS5 full text table"""
+
+    lock: threading.Lock = None
+    """Serialises the use of the database connection by several threads"""
+
+    def __init__(self, working_directory_path):
+        # type: (str | None) -> None
+        """Opens (or creates) the search database in the working directory.
+
+        :param working_directory_path: The working directory used by this application to store messages in;
+               if None, the index is held in memory only;
+        """
+        self.lock = threading.Lock()
+        if working_directory_path is None:
+            self.connection = self.open_index(":memory:")
+            return
+        self.working_directory_path = os.path.abspath(working_directory_path)
+        try:
+            self.connection = self.open_index(os.path.join(self.working_directory_path, self.SEARCH_FILE_NAME))
+        except sqlite3.Error as e:
+            print("Unable to open the message search index in '" + working_directory_path + "': " + str(e))
+            self.connection = self.open_index(":memory:")
+
+    def close(self):
+        # type: () -> None
+        """Closes the search database.
+
+        :return: None
+        """
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    def open_index(self, index_file_path):
+        # type: (str) -> sqlite3.Connection
+        """Opens the search database and creates the search tables if they do not already exist; an index
+        with a different schema version is discarded.
+
+        :param index_file_path: The path of the search database file or ':memory:';
+        :return: A connection to the search database;
+        """
+        connection = sqlite3.connect(index_file_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode = WAL")
+        tables = [row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE name = 'errors' AND "
+                                                       "sql LIKE 'CREATE VIRTUAL TABLE%'")]
+        self.full_text = len(tables) > 0
+        if connection.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            with connection:
+                for table in ["messages", "points", "errors"]:
+                    connection.execute("DROP TABLE IF EXISTS " + table)
+                connection.execute("CREATE TABLE messages (id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE, "
+                                   "folder TEXT NOT NULL, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, " +
+                                   ", ".join(column + " TEXT NOT NULL" for column in self.SEARCH_COLUMNS) + ")")
+                connection.execute("CREATE INDEX messages_folder ON messages (folder)")
+                for column in ["callsign", "adep", "ades", "registration"]:
+                    connection.execute("CREATE INDEX messages_" + column + " ON messages (" + column + ", dof)")
+                connection.execute("CREATE INDEX messages_dof ON messages (dof)")
+                connection.execute("CREATE TABLE points (point TEXT NOT NULL, message_id INTEGER NOT NULL, "
+                                   "PRIMARY KEY (point, message_id)) WITHOUT ROWID")
+                connection.execute("CREATE INDEX points_message ON points (message_id)")
+                try:
+                    connection.execute("CREATE VIRTUAL TABLE errors USING fts5 (error_text)")
+                    self.full_text = True
+                except sqlite3.OperationalError:
+                    connection.execute("CREATE TABLE errors (rowid INTEGER PRIMARY KEY, error_text TEXT NOT NULL)")
+                    self.full_text = False
+                connection.execute("PRAGMA user_version = " + str(self.SCHEMA_VERSION))
+        return connection
+
+    @staticmethod
+    def get_entry(get_subfield, points, errors):
+        # type: (callable, [str], [str]) -> tuple
+        """Forms the search entry of a message.
+
+        :param get_subfield: A function taking a field and subfield identifier and returning the text of
+               the subfield, an empty string if the message does not contain the subfield;
+        :param points: The significant points of the extracted route;
+        :param errors: The text of the errors reported by the parser;
+        :return: A tuple containing the search columns in the order given in SEARCH_COLUMNS followed by
+                 a list of the route points and the error text;
+        """
+        ades = ""
+        for field_id in MessageSearch.ADES_FIELDS:
+            ades = ades or get_subfield(field_id, SubFieldIdentifiers.F16a)
+        dof = ""
+        for field_id in MessageSearch.DOF_FIELDS:
+            dof = dof or get_subfield(field_id, SubFieldIdentifiers.F18dof).removeprefix("DOF/")
+        return (get_subfield(FieldIdentifiers.F3, SubFieldIdentifiers.F3a),
+                get_subfield(FieldIdentifiers.F7, SubFieldIdentifiers.F7a),
+                get_subfield(FieldIdentifiers.F13, SubFieldIdentifiers.F13a),
+                ades,
+                get_subfield(FieldIdentifiers.F13, SubFieldIdentifiers.F13b),
+                "" if dof == "0" else dof,
+                get_subfield(FieldIdentifiers.F18, SubFieldIdentifiers.F18reg),
+                sorted(set(points)),
+                "\n".join(errors))
+
+    @staticmethod
+    def get_record_entry(flight_plan_record):
+        # type: (FlightPlanRecord) -> tuple
+        """Forms the search entry of a parsed message.
+
+        :param flight_plan_record: The parsed message;
+        :return: The search entry, see 'get_entry()';
+        """
+        def get_subfield(field_id, subfield_id):
+            subfield = flight_plan_record.get_icao_subfield(field_id, subfield_id)
+            return "" if subfield is None else subfield.get_field_text()
+
+        points = []
+        if flight_plan_record.get_extracted_route() is not None:
+            for element in flight_plan_record.get_extracted_route().get_all_elements():
+                # The ADEP and ADES added to the extracted route are not part of the route text
+                if element.get_base_type() == TokenBaseType.F15_POINT and \
+                        element.get_start_index() != element.get_end_index():
+                    points.append(element.get_name())
+        return MessageSearch.get_entry(get_subfield, points,
+                                       [error[0] for error in flight_plan_record.get_all_errors()])
+
+    @staticmethod
+    def read_entry(file_path):
+        # type: (str) -> tuple
+        """Reads a message XML file and forms its search entry; the file is read without displaying any
+        message boxes.
+
+        :param file_path: The absolute path of a message XML file;
+        :return: The search entry, see 'get_entry()', with empty columns if the file is not a valid message
+                 XML file;
+        """
+        rx = ReadXml(file_path, show_errors=False)
+        if not rx.is_message_ok():
+            return MessageSearch.get_entry(lambda field_id, subfield_id: "", [], [])
+        points = []
+        ers_node = rx.get_ers_node()
+        for ers_record in [] if ers_node is None else ers_node:
+            if ers_record.tag == "ers_record" and ers_record.attrib["base_type"] == str(TokenBaseType.F15_POINT.value) \
+                    and ers_record.attrib["start_index"] != ers_record.attrib["end_index"]:
+                points.append((ers_record.text or "").strip())
+        return MessageSearch.get_entry(rx.get_subfield_fx, points, [error[0] for error in rx.get_all_errors()])
+
+    def add_records(self, file_paths, flight_plan_records):
+        # type: ([str], [FlightPlanRecord]) -> None
+        """Adds message files that have just been written to the index, the entries are formed from the
+        parsed messages so the files are not read.
+
+        :param file_paths: The paths of the message files;
+        :param flight_plan_records: The parsed message written to each file;
+        :return: None
+        """
+        entries = []
+        for file_path, flight_plan_record in zip(file_paths, flight_plan_records):
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                continue
+            entries.append((os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size,
+                            self.get_record_entry(flight_plan_record)))
+        self.store_entries(entries)
+
+    def add_file(self, file_path):
+        # type: (str) -> None
+        """Adds a message file to the index, or updates its entry if it has changed since it was indexed.
+
+        :param file_path: The path of the message file;
+        :return: None
+        """
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return
+        self.store_entries([(os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size,
+                             self.read_entry(file_path))])
+
+    def remove_file(self, file_path):
+        # type: (str) -> None
+        """Removes a message file from the index.
+
+        :param file_path: The path of the message file;
+        :return: None
+        """
+        with self.lock, self.connection:
+            self.remove_entries([os.path.abspath(file_path)])
+
+    def store_entries(self, entries):
+        # type: ([tuple]) -> None
+        """Stores the search entries of message files, replacing any entries the files already have.
+
+        :param entries: A list of tuples, each containing the absolute path of a message file, its
+               modification time in nanoseconds, its size and its search entry;
+        :return: None
+        """
+        if len(entries) == 0:
+            return
+        with self.lock, self.connection:
+            self.remove_entries([entry[0] for entry in entries])
+            for file_path, mtime_ns, size, entry in entries:
+                message_id = self.connection.execute(
+                    "INSERT INTO messages (path, folder, mtime_ns, size, " + ", ".join(self.SEARCH_COLUMNS) +
+                    ") VALUES (" + ", ".join("?" * (len(self.SEARCH_COLUMNS) + 4)) + ")",
+                    (file_path, os.path.dirname(file_path), mtime_ns, size) + entry[:-2]).lastrowid
+                self.connection.executemany("INSERT INTO points (point, message_id) VALUES (?, ?)",
+                                            [(point, message_id) for point in entry[-2]])
+                if len(entry[-1]) > 0:
+                    self.connection.execute("INSERT INTO errors (rowid, error_text) VALUES (?, ?)",
+                                            (message_id, entry[-1]))
+
+    def remove_entries(self, file_paths):
+        # type: ([str]) -> None
+        """Removes the search entries of message files; called with the lock held inside a transaction.
+
+        :param file_paths: The absolute paths of the message files;
+        :return: None
+        """
+        for file_path in file_paths:
+            row = self.connection.execute("SELECT id FROM messages WHERE path = ?", (file_path,)).fetchone()
+            if row is not None:
+                self.connection.execute("DELETE FROM points WHERE message_id = ?", row)
+                self.connection.execute("DELETE FROM errors WHERE rowid = ?", row)
+                self.connection.execute("DELETE FROM messages WHERE id = ?", row)
+
+    def update(self, directory_path=None):
+        # type: (str | None) -> int
+        """Brings the index up to date with the message files in a directory and its subdirectories; files
+        that are new or have changed since they were indexed are read, the entries of files that no longer
+        exist are removed. The database is only locked while the entries of a directory are read and
+        stored, searches can be made while the index is being updated.
+
+        :param directory_path: The directory to update the index for, None for the whole working directory;
+        :return: The number of message files read;
+        """
+        if directory_path is None:
+            if self.working_directory_path is None:
+                return 0
+            directory_path = self.working_directory_path
+        files_read = 0
+        folders = [os.path.abspath(directory_path)]
+        while len(folders) > 0:
+            folder = folders.pop()
+            files = {}
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            folders.append(entry.path)
+                        elif entry.name.endswith(".xml"):
+                            file_stat = entry.stat()
+                            files[entry.path] = (file_stat.st_mtime_ns, file_stat.st_size)
+            except OSError:
+                continue
+            with self.lock:
+                indexed = {row[0]: (row[1], row[2]) for row in self.connection.execute(
+                    "SELECT path, mtime_ns, size FROM messages WHERE folder = ?", (folder,))}
+            changed = [file_path for file_path, file_stat in files.items() if indexed.get(file_path) != file_stat]
+            self.store_entries([(file_path,) + files[file_path] + (self.read_entry(file_path),)
+                                for file_path in changed])
+            removed = [file_path for file_path in indexed if file_path not in files]
+            if len(removed) > 0:
+                with self.lock, self.connection:
+                    self.remove_entries(removed)
+            files_read += len(changed)
+        return files_read
+
+    def search(self, criteria, limit=DEFAULT_LIMIT):
+        # type: ({str: str}, int) -> [str]
+        """Finds the messages matching all the criteria given. The criteria are given in a dictionary
+        indexed by the criterion name:
+
+            - title, callsign, adep, ades, eobt, dof, registration: The message field is equal to the value;
+            - point: The extracted route contains the significant point;
+            - error_text: The parser reported an error containing all the words in the value;
+
+        :param criteria: The criteria, at least one must be given; the values are not case-sensitive;
+        :param limit: The maximum number of messages returned;
+        :return: The paths of the matching message files, the most recently modified first;
+        :raises ValueError: If no criteria, an unknown criterion or an empty value is given;
+        """
+        query, parameters = self.get_query(criteria, limit)
+        with self.lock:
+            return [row[0] for row in self.connection.execute(query, parameters)]
+
+    def get_query(self, criteria, limit=DEFAULT_LIMIT):
+        # type: ({str: str}, int) -> (str, [str | int])
+        """Builds the SQL query finding the messages matching all the criteria given, (see 'search()').
+
+        :param criteria: The criteria, at least one must be given; the values are not case-sensitive;
+        :param limit: The maximum number of messages returned;
+        :return: A tuple containing the SQL query and its parameters;
+        :raises ValueError: If no criteria, an unknown criterion or an empty value is given;
+        """
+        if len(criteria) == 0:
+            raise ValueError("No search criteria given")
+        conditions = []
+        parameters = []
+        for criterion, value in criteria.items():
+            value = value.strip().upper()
+            if len(value) == 0:
+                raise ValueError("No value given for the search criterion '" + criterion + "'")
+            match criterion:
+                case _ if criterion in self.SEARCH_COLUMNS:
+                    conditions.append("messages." + criterion + " = ?")
+                case "point":
+                    conditions.append("messages.id IN (SELECT message_id FROM points WHERE point = ?)")
+                case "error_text" if self.full_text:
+                    conditions.append("messages.id IN (SELECT rowid FROM errors WHERE errors MATCH ?)")
+                    value = " ".join('"' + word.replace('"', '""') + '"' for word in value.split())
+                case "error_text":
+                    conditions.append("messages.id IN (SELECT rowid FROM errors WHERE error_text LIKE ?)")
+                    value = "%" + value + "%"
+                case _:
+                    raise ValueError("Unknown search criterion '" + criterion + "'")
+            parameters.append(value)
+        return "SELECT messages.path FROM messages WHERE " + " AND ".join(conditions) + \
+            " ORDER BY messages.mtime_ns DESC LIMIT ?", parameters + [limit]
+
+    @staticmethod
+    def parse_query(query):
+        # type: (str) -> {str: str}
+        """Converts a search query typed by the user into the search criteria, (see 'search()'). A query
+        is a list of words, each word is either a keyword and value in the style of field 18, (e.g.
+        'DOF/221117', 'PT/BIBAX'), or a value on its own:
+
+            - A message title, (e.g. 'FPL'), gives the message title;
+            - Six digits give the DOF, four digits give the EOBT;
+            - Any other value gives the callsign.
+
+        The keywords are TITLE, ARCID, ADEP, ADES, EOBT, DOF, REG, PT and ERROR; the value of the ERROR
+        keyword is the remainder of the query, (e.g. 'FPL ERROR/unknown aerodrome'). For example 'FPL
+        DLH4AB 221117' finds all the FPL messages for DLH4AB with a DOF of 221117 and 'PT/BIBAX' finds all
+        the messages with a route through BIBAX.
+
+        :param query: The search query;
+        :return: The search criteria;
+        :raises ValueError: If the query contains an unknown keyword or a keyword without a value;
+        """
+        criteria = {}
+        words = query.split()
+        for index, word in enumerate(words):
+            keyword, separator, value = word.partition("/")
+            if separator == "/":
+                criterion = MessageSearch.QUERY_KEYWORDS.get(keyword.upper())
+                if criterion is None:
+                    raise ValueError("Unknown search keyword '" + keyword + "'")
+                if criterion == "error_text":
+                    value = " ".join([value] + words[index + 1:]).strip()
+                if len(value) == 0:
+                    raise ValueError("No value given for the search keyword '" + keyword + "'")
+                criteria[criterion] = value
+                if criterion == "error_text":
+                    break
+            elif word.upper() in MessageTitles.__members__:
+                criteria["title"] = word
+            elif re.fullmatch("[0-9]{6}", word):
+                criteria["dof"] = word
+            elif re.fullmatch("[0-9]{4}", word):
+                criteria["eobt"] = word
+            else:
+                criteria["callsign"] = word
+        return criteria
+
+    def get_message_count(self):
+        # type: () -> int
+        """Gets the number of message files in the index.
+
+        :return: The number of message files indexed;
+        """
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
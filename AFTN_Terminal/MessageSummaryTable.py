@@ -0,0 +1,125 @@
+from operator import itemgetter
+
+
+class MessageSummaryTable:
+    """This class holds the summary information for all the messages in a folder displayed in the
+    message list. Each row is a tuple containing the summary columns (see MessageIndex.SUMMARY_COLUMNS)
+    followed by the absolute path of the message file.
+
+    The message list only displays the rows visible in the list widget, (plus a small margin); this
+    class holds all the rows, sorts them and provides the 'window' of rows on display. Folders containing
+    any number of messages can therefore be displayed and scrolled without the cost of creating a list
+    widget entry for every message.
+    """
+
+    rows: [tuple] = []
+    """The summary rows for the messages in the folder, in the order they are displayed"""
+
+    sort_column: int | None = None
+    """The index of the column the rows are sorted by, None if the rows are in the order they were given"""
+
+    sort_descending: bool = False
+    """True if the rows are sorted in descending order, False for ascending order"""
+
+    def __init__(self, summaries=()):
+        # type: (Iterable[list | tuple]) -> None
+        """Builds the table from message summaries.
+
+        :param summaries: The summary information for the messages as returned by MessageIndex.get_summaries();
+        """
+        self.rows = [tuple(summary) for summary in summaries]
+        self.sort_column = None
+        self.sort_descending = False
+
+    def __len__(self):
+        # type: () -> int
+        """Gets the number of rows in the table.
+
+        :return: The number of rows;
+        """
+        return len(self.rows)
+
+    def get_first_row(self, first_row, visible_rows):
+        # type: (int, int) -> int
+        """Limits the index of the first row on display so that the list is filled with rows where possible.
+
+        :param first_row: The requested index of the first row on display;
+        :param visible_rows: The number of rows visible in the list widget;
+        :return: The index of the first row on display, between 0 and the number of rows less 'visible_rows';
+        """
+        return max(0, min(first_row, len(self.rows) - visible_rows))
+
+    def get_first_row_at(self, fraction, visible_rows):
+        # type: (float, int) -> int
+        """Gets the index of the first row on display for a scrollbar position.
+
+        :param fraction: The position of the top of the scrollbar slider, between 0.0 and 1.0;
+        :param visible_rows: The number of rows visible in the list widget;
+        :return: The index of the first row on display;
+        """
+        return self.get_first_row(int(round(fraction * len(self.rows))), visible_rows)
+
+    def get_fractions(self, first_row, visible_rows):
+        # type: (int, int) -> (float, float)
+        """Gets the scrollbar slider position for the rows on display.
+
+        :param first_row: The index of the first row on display;
+        :param visible_rows: The number of rows visible in the list widget;
+        :return: A tuple with the top and bottom positions of the scrollbar slider, between 0.0 and 1.0;
+        """
+        if len(self.rows) <= visible_rows:
+            return 0.0, 1.0
+        return first_row / len(self.rows), min(1.0, (first_row + visible_rows) / len(self.rows))
+
+    def get_rows(self, first_row, number_of_rows):
+        # type: (int, int) -> [tuple]
+        """Gets the rows for display in the list widget.
+
+        :param first_row: The index of the first row;
+        :param number_of_rows: The maximum number of rows;
+        :return: A list of at most 'number_of_rows' rows;
+        """
+        return self.rows[first_row:first_row + number_of_rows]
+
+    def remove_path(self, path):
+        # type: (str) -> bool
+        """Removes the row for a message file from the table.
+
+        :param path: The absolute path of the message file;
+        :return: True if the row was removed, False if there is no row for the path;
+        """
+        for index, row in enumerate(self.rows):
+            if row[-1] == path:
+                del self.rows[index]
+                return True
+        return False
+
+    def set_rows(self, summaries):
+        # type: (Iterable[list | tuple]) -> None
+        """Replaces the rows of the table, (e.g. when the messages in the folder have been checked); the
+        rows are sorted as the previous rows were.
+
+        :param summaries: The summary information for the messages as returned by MessageIndex.get_summaries();
+        :return: None
+        """
+        self.rows = [tuple(summary) for summary in summaries]
+        if self.sort_column is not None:
+            # Sorting by the same column again reverses the order, keep the current order instead
+            self.sort_descending = not self.sort_descending
+            self.sort(self.sort_column)
+
+    def sort(self, column):
+        # type: (int) -> None
+        """Sorts the rows by a column; sorting by the same column again reverses the order. The sort is
+        stable, rows with the same value in the column remain in the order of the previous sort.
+
+        :param column: The index of the column to sort by;
+        :return: None
+        """
+        self.sort_descending = not self.sort_descending if column == self.sort_column else False
+        self.sort_column = column
+        if any(row[column] is None for row in self.rows):
+            # Missing values sort as empty strings
+            self.rows.sort(key=lambda row: "" if row[column] is None else row[column], reverse=self.sort_descending)
+        else:
+            self.rows.sort(key=itemgetter(column), reverse=self.sort_descending)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from tkinter import Tk, N, S, W, E, Toplevel, Frame, Button, DISABLED, Label, Y
+from tkinter import Tk, N, S, W, E, Toplevel, Frame, Button, DISABLED, Label, Y, Checkbutton, BooleanVar
 from tkinter.ttk import Treeview, Separator
 
 from AFTN_Terminal.MessageDisplayFrame import MessageDisplayFrame
@@ -16,8 +16,9 @@ class MessageTextEditorFrame(MessageDisplayFrame):
     """A flag indicating if this editor is being opened to create a new message, (True) or 
     an existing message (False)."""
 
-    def __init__(self, parent, is_new, message_title, creation_date, modification_date, app_root_message_path):
-        # type: (Tk | Treeview | Frame, bool, MessageTitles, str, str, str) -> None
+    def __init__(self, parent, is_new, message_title, creation_date, modification_date, app_root_message_path,
+                 live_validation_delay=MessageDisplayFrame.LIVE_VALIDATION_DELAY):
+        # type: (Tk | Treeview | Frame, bool, MessageTitles, str, str, str, int) -> None
         """This constructor builds a message text editor with the text editor and error messages provided
         by the base class MessageDisplayFrame; this constructor adds a status and button bar that displays
         either a 'Apply' or 'Save' button depending on if an existing message is being edited or
@@ -36,6 +37,8 @@ class MessageTextEditorFrame(MessageDisplayFrame):
                or the current date and time if a new message is being created;
         :param app_root_message_path: The full absolute working directory path; used to store new messages
                in the Outbox;
+        :param live_validation_delay: The time in milliseconds the editor must be idle after an edit before
+               the message is validated when 'Validate As You Type' is selected;
         """
         # Get a handle to the top level widget
         top_level = Toplevel(parent)
@@ -45,6 +48,7 @@ class MessageTextEditorFrame(MessageDisplayFrame):
 
         self.is_new = is_new
         self.set_message_path(app_root_message_path)
+        self.set_live_validation_delay(live_validation_delay)
 
         # Set the dialogue title
         if self.is_new:
@@ -76,6 +80,7 @@ class ButtonFrame(Frame):
         - 'Close'
         - 'Save' or 'Apply': (depends on if a new or existing message is being created/edited)
         - 'Validate'
+        - 'Validate As You Type': a check button enabling validation after each edit
     """
     message_text_editor_frame: MessageTextEditorFrame = None
     """Handle to a the MessageTextEditorFrame that this button frame is displayed in;"""
@@ -90,9 +95,13 @@ class ButtonFrame(Frame):
     the type of message being edited, new or existing. The 'Apply' button is enabled when an
     existing message is being edited."""
 
+    live_validation: BooleanVar = None
+    """The state of the 'Validate As You Type' check button"""
+
     def __init__(self, parent, message_text_editor_frame):
         # type: (Toplevel, MessageTextEditorFrame) -> None
-        """This constructor builds a frame containing four buttons, 'Close', 'Save' or 'Apply' and 'Validate';
+        """This constructor builds a frame containing four buttons, 'Close', 'Save' or 'Apply' and 'Validate'
+        and the 'Validate As You Type' check button;
 
         :param parent: Handle to the parent window, will the top level of the MessageTextEditorFrame;
         :param message_text_editor_frame: Handle to an instance of MessageTextEditorFrame;
@@ -121,6 +130,12 @@ class ButtonFrame(Frame):
                                      self.apply_button, self.save_button))
         validate_button.pack(side="right", pady=3, padx=3)
 
+        self.live_validation = BooleanVar(self, value=False)
+        live_validation_button = Checkbutton(self, text="Validate As You Type", variable=self.live_validation,
+                                             command=lambda: self.message_text_editor_frame.enable_live_validation(
+                                                 self.live_validation.get(), self.apply_button, self.save_button))
+        live_validation_button.pack(side="right", pady=3, padx=3)
+
 
 class MessageStatusBar(Frame):
     """This class builds a frame containing label widgets to display some status information
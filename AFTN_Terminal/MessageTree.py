@@ -9,7 +9,10 @@ from tkinter.ttk import Treeview
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+from AFTN_Terminal.MessageIndex import MessageIndex
+from AFTN_Terminal.MessageSearch import MessageSearch
 from AFTN_Terminal.ReadXml import ReadXml
+from AFTN_Terminal.WriteXml import WriteXml
 from Configuration.EnumerationConstants import MessageTitles
 from AFTN_Terminal.MessageTextEditorFrame import MessageTextEditorFrame
 from AFTN_Terminal.MessageListFrame import MessageListFrame
@@ -28,7 +31,26 @@ class MessageTree(Treeview):
           tree.
     This class adds scrollbars and button event bindings to support display of a tree popup menu
     and drag and drop operations.
+
+    The tree is populated lazily; each directory node is created with a placeholder child node and the
+    directory is only listed when the node is first opened. Directories containing more than
+    MAXIMUM_FILE_NODES files do not show the files as tree nodes, the messages are displayed in the message
+    list only. The time to start the application therefore does not depend on the number of messages.
     """
+    MAXIMUM_FILE_NODES: int = 500
+    """The maximum number of files shown as tree nodes in a directory, the files in directories containing
+    more files than this are only displayed in the message list"""
+
+    PLACEHOLDER_TAG: str = "placeholder"
+    """The tag of the placeholder child node added to directory nodes that have not yet been listed"""
+
+    FILES_HIDDEN_TAG: str = "files_hidden"
+    """The tag of directory nodes that do not show the files in the directory as tree nodes"""
+
+    tree_nodes: {str: str} = {}
+    """The tree nodes indexed by the absolute path of the file or directory they represent; maintained
+    as nodes are added and deleted so that the node for a path is found without searching the tree"""
+
     file_change_listener_thread = None
     root_tree_node: str = None
     app_root_message_path: str = ""
@@ -36,6 +58,7 @@ class MessageTree(Treeview):
     selected_path: str = ""
     selected_item: str = None
     message_list_frame: MessageListFrame = None
+    message_search: MessageSearch = None
     dnd_source_item: str = ""
     dnd_source_item_parent: str = ""
     dnd_state: int = 0
@@ -65,6 +88,7 @@ class MessageTree(Treeview):
         """
         super().__init__(parent, selectmode='browse')
         self.app_root_message_path = app_root_message_path
+        self.tree_nodes = {}
 
         # Create the icon images
         self.folder_icon16 = PhotoImage(file=self.icon_root_path16 + 'folder.png')
@@ -89,7 +113,8 @@ class MessageTree(Treeview):
         abspath = os.path.abspath(self.app_root_message_path)
         self.root_tree_node = self.insert('', END, text=abspath,
                                           image=self.folder_icon16, values=[abspath], open=True)
-        self.add_all_tree_nodes(self.root_tree_node, abspath)
+        self.tree_nodes[abspath] = self.root_tree_node
+        self.add_tree_nodes(self.root_tree_node, abspath)
 
         # Bind the callbacks for single and double clicks
         self.bind('<Button-1>', self.on_single_click)
@@ -99,44 +124,88 @@ class MessageTree(Treeview):
         self.bind("<ButtonRelease-1>", self.on_button_up, add='+')
         self.bind("<B1-Motion>", self.on_cursor_move, add='+')
 
+        # Bind the callback listing a directory when its node is first opened
+        self.bind("<<TreeviewOpen>>", self.on_open_node)
+
         # Start the file system change thread and listener...
         self.file_system_listener()
         self.popup_create()
 
-    def add_all_tree_nodes(self, tree_node, path):
+    def add_file_node(self, tree_node, name, path):
+        # type: (str, str, str) -> str
+        """This method adds a node representing a file to the tree.
+
+        :param tree_node: The tree node to which the file node is added;
+        :param name: The file name displayed in the tree;
+        :param path: The absolute path of the file;
+        :return: The tree node added;
+        """
+        oid = self.insert(tree_node, END, text=name, image=self.open_doc_icon16, values=[path], open=False)
+        self.tree_nodes[path] = oid
+        return oid
+
+    def add_folder_node(self, tree_node, name, path, listed=False):
+        # type: (str, str, str, bool) -> str
+        """This method adds a node representing a directory to the tree; unless the directory is known to
+        be empty, the node is given a placeholder child node so that it can be opened, the directory is
+        listed when the node is first opened.
+
+        :param tree_node: The tree node to which the directory node is added;
+        :param name: The directory name displayed in the tree;
+        :param path: The absolute path of the directory;
+        :param listed: True if the directory is empty, (e.g. has just been created), no placeholder is added;
+        :return: The tree node added;
+        """
+        if re.fullmatch('Trash', name):
+            image = self.trash_icon16
+        elif re.fullmatch('Inbox', name):
+            image = self.inbox_icon16
+        elif re.fullmatch('Outbox', name):
+            image = self.outbox_icon16
+        else:
+            image = self.folder_icon16
+        oid = self.insert(tree_node, END, text=name, image=image, values=[path], open=False)
+        self.tree_nodes[path] = oid
+        if not listed:
+            self.insert(oid, END, text="", values=[""], tags=(self.PLACEHOLDER_TAG,))
+        return oid
+
+    def add_tree_nodes(self, tree_node, path):
         # type: (str, str) -> None
-        """This method adds a node to the tree for each file and directory found in the root absolute path
-        working directory for this application. The root absolute path is specified at application start and
-        contains all the files and directories created and manipulated by this application.
+        """This method adds a node to the tree for each directory and file found in a directory; only the
+        directory itself is listed, the subdirectory nodes are listed when they are opened. If the
+        directory contains more than MAXIMUM_FILE_NODES files, the files are not added to the tree.
         The tree hierarchy is constructed to map the underlying OS File System hierarchy.
 
         :param tree_node: The tree node to which child nodes representing directories or file
                           will be added to;
-        :param path: The root absolute path that recursion is performed on;
-        :return: None
-        """
-        # Loop over the default path and display the OS file system in this tree view
-        for item in os.listdir(path):
-            abspath = os.path.join(path, item)
-            isdir = os.path.isdir(abspath)
-            if isdir:
-                if re.fullmatch('Trash', item):
-                    oid = self.insert(tree_node, END, text=item, image=self.trash_icon16,
-                                      values=[abspath], open=False)
-                elif re.fullmatch('Inbox', item):
-                    oid = self.insert(tree_node, END, text=item, image=self.inbox_icon16,
-                                      values=[abspath], open=False)
-                elif re.fullmatch('Outbox', item):
-                    oid = self.insert(tree_node, END, text=item, image=self.outbox_icon16,
-                                      values=[abspath], open=False)
-                else:
-                    oid = self.insert(tree_node, END, text=item, image=self.folder_icon16,
-                                      values=[abspath], open=False)
+        :param path: The absolute path of the directory represented by 'tree_node';
+        :return: None
+        """
+        try:
+            with os.scandir(path) as entries:
+                entries = sorted(entries, key=lambda e: e.name)
+        except OSError:
+            return
+
+        # Split the directories from the files, the directory entries cache the file type so
+        # no additional system call is needed for each entry
+        files = []
+        for entry in entries:
+            # The message index files and messages being written are not messages, don't show them in the tree
+            if MessageIndex.is_index_file(entry.path) or WriteXml.is_temporary_file(entry.path):
+                continue
+            if entry.is_dir():
+                self.add_folder_node(tree_node, entry.name, entry.path)
             else:
-                oid = self.insert(tree_node, END, text=item, image=self.open_doc_icon16,
-                                  values=[abspath], open=False)
-            if isdir:
-                self.add_all_tree_nodes(oid, abspath)
+                files.append(entry)
+
+        if len(files) > self.MAXIMUM_FILE_NODES:
+            self.item(tree_node, tags=(self.FILES_HIDDEN_TAG,))
+            return
+        self.item(tree_node, tags=())
+        for entry in files:
+            self.add_file_node(tree_node, entry.name, entry.path)
 
     def add_tree_node(self, new_item_path):
         # type: (str) -> None
@@ -155,11 +224,9 @@ class MessageTree(Treeview):
         :param new_item_path: The full absolute path for the newly created file / directory;
         :return: None
         """
-        # Get the root tree node
-        tree_root_node = self.root_tree_node
-
-        # Recurse through the tree nodes searching for the new item
-        node_found = self.item_in_tree(tree_root_node, new_item_path)
+        # Look up the new item
+        new_item_path = os.path.abspath(new_item_path)
+        node_found = self.get_tree_node(new_item_path)
         if len(node_found) == 0:
             # The new item is not in the tree, implies the file / directory was not created
             # by this application and has to be added to the tree. The new item path minus the
@@ -172,20 +239,18 @@ class MessageTree(Treeview):
             # new_item will contain Test08
             new_item = os.path.split(new_item_path)[1]
 
-            # Recurse over the tree again looking for an existing path that the new item was placed
-            # in the file system
-            node_found = self.item_in_tree(tree_root_node, existing_path)
+            # Look up the existing path that the new item was placed in the file system
+            node_found = self.get_tree_node(existing_path)
 
             # If the tree contains this path (and it really ought to as it reflects the file system),
-            # The new item has to inserted to this node
-            if len(node_found) > 0:
+            # The new item has to inserted to this node; unless the directory has not been listed yet or
+            # does not show its files, the new item is then added when the directory node is opened
+            if len(node_found) > 0 and self.is_listed(node_found):
                 # Add new leaf node to the treeview
-                if os.path.isdir(existing_path):
-                    self.insert(node_found, 'end', image=self.folder_icon16,
-                                text=new_item, values=[new_item_path], open=False)
-                else:
-                    self.insert(node_found, 'end', image=self.open_doc_icon16,
-                                text=new_item, values=[new_item_path], open=False)
+                if os.path.isdir(new_item_path):
+                    self.add_folder_node(node_found, new_item, new_item_path)
+                elif not self.tag_has(self.FILES_HIDDEN_TAG, node_found):
+                    self.add_file_node(node_found, new_item, new_item_path)
             # else:
             # There should not be an else here, if this happens, things have got really messed up;
             # It implies the file system structure changed between the file system creation event
@@ -194,6 +259,15 @@ class MessageTree(Treeview):
         # Nothing to be done as the new item is already in the tree, implies it was manually created
         # using the application GUI.
 
+    def get_tree_node(self, path):
+        # type: (str) -> str
+        """This method gets the tree node representing a file or directory.
+
+        :param path: An absolute path to a file or directory;
+        :return: The tree node item as a string or an empty string if there is no tree node for the path;
+        """
+        return self.tree_nodes.get(os.path.abspath(path), "")
+
     def is_compulsory_directory(self):
         # type: () -> bool
         """This method checks if the currently selected tree node represents a directory name
@@ -236,20 +310,34 @@ class MessageTree(Treeview):
         :param deleted_item_path: The full absolute path for the file / directory that has been deleted;
         :return: None
         """
-        # Get the root tree node
-        tree_root_node = self.root_tree_node
-
-        # Recurse through the tree nodes searching for the tree node associated with the deleted file/directory
-        node_found = self.item_in_tree(tree_root_node, deleted_item_path)
+        # Look up the tree node associated with the deleted file/directory
+        node_found = self.get_tree_node(deleted_item_path)
         if len(node_found) > 0:
             # The tree node associated with the deleted file / directory has been found in the tree,
             # implies the file / directory was deleted outside this application and the associated
             # tree node has to be deleted.
-            self.delete(node_found)
+            self.delete_tree_nodes(node_found)
         # else:
         # Nothing to be done as the tree node does not exist in the tree, implies it was manually deleted
         # from the application GUI.
 
+    def delete_tree_nodes(self, *tree_nodes):
+        # type: (str) -> None
+        """This method deletes nodes, and all their descendants, from the tree and removes them from
+        the index of the tree nodes by path.
+
+        :param tree_nodes: The tree nodes to delete;
+        :return: None
+        """
+        nodes = list(tree_nodes)
+        while len(nodes) > 0:
+            node = nodes.pop()
+            path = self.item(node)['values'][0]
+            if self.tree_nodes.get(path) == node:
+                del self.tree_nodes[path]
+            nodes.extend(self.get_children(node))
+        self.delete(*tree_nodes)
+
     def file_system_listener(self):
         # type: () -> None
         """This method starts the system file listener thread
@@ -262,61 +350,31 @@ class MessageTree(Treeview):
         # Start new Thread and start listening for changes...
         self.file_change_listener_thread.start()
 
-    def item_in_tree(self, tree_node, path_to_find):
-        # type: (str, str) -> str
-        """This method performs a recursive search over the tree hierarchy searching for
-        a tree node item containing the 'values' content matching that in the parameter 'path_to_find'.
-        The tree node 'values' content contains the full file system path for the file / directory
-        represented by each node in the tree.
-
-        :param tree_node: A node in the tree hierarchy;
-        :param path_to_find: An absolute path to a file or directory that this method is searching for;
-        :return: The tree node item as a string or an empty string if the absolute path contained
-                 in 'path_to_find' could not be found;"""
-        # This first check is required to ensure the tree root node is checked
-        # Compare the root with the path to find
-        if re.fullmatch(path_to_find, self.item(tree_node)['values'][0]):
-            return tree_node
-
-        # Get any child nodes
-        children = self.get_children(tree_node)
+    @staticmethod
+    def is_folder_empty(path):
+        # type: (str) -> bool | None
+        """This method checks if a directory is empty without listing all its content.
 
-        # Loop over the child nodes
-        for child in children:
-            # Check if this node matches what we are looking for
-            if re.fullmatch(path_to_find, self.item(child)['values'][0]):
-                return child
-            # Not found, recurse down the tree
-            retval = self.item_in_tree(child, path_to_find)
-            # Return the tree node if one was found further down the tree
-            if len(retval) > 0:
-                return retval
-        # Nothing found, return an empty string
-        return ""
-
-    def move_file_os(self, modified_path):
-        # type: (str) -> None
-        """This method handles the case when a file is moved using the underlying OS instead of
-        the application GUI. In Linux, when the 'mv' command is used, a directory 'modified' event is
-        generated twice, once when a file is moved out of a directory and once when a file is added to a
-        directory. The only way to deal with this is to rebuild the complete tree node from the path
-        provided by the parameter 'modified_path'. This is not optimal, but is a simple way to
-        do this, it is not envisaged that files will be moved very often.
+        :param path: The absolute path of a directory;
+        :return: True if the directory is empty, False if not, None if the directory cannot be read;
+        """
+        try:
+            with os.scandir(path) as entries:
+                return next(entries, None) is None
+        except OSError:
+            return None
 
-        :param modified_path: The path for the directory being modified by the movement of files
-                              into or out of this directory;
-        :return: None
+    def is_listed(self, tree_node):
+        # type: (str) -> bool
+        """This method checks if the directory represented by a tree node has been listed, i.e. the
+        node's child nodes have been added to the tree.
+
+        :param tree_node: A tree node representing a directory;
+        :return: True if the directory has been listed, False if the first child node is the placeholder;
         """
-        # Recurse through the tree nodes searching for the new item
-        node_found = self.item_in_tree(self.root_tree_node, modified_path)
-        if len(node_found) > 0:
-            # Found the tree node that needs to be updated, delete all the child nodes
-            children = self.get_children(node_found)
-            # Loop over the child nodes and delete them
-            for child in children:
-                self.delete(child)
-            # Rebuild the node
-            self.add_all_tree_nodes(node_found, modified_path)
+        # The placeholder is always the first child node, nodes may have been added after it, (e.g. a new folder)
+        children = self.get_children(tree_node)
+        return len(children) == 0 or not self.tag_has(self.PLACEHOLDER_TAG, children[0])
 
     def move_tree_node(self):
         pass
@@ -406,17 +464,16 @@ class MessageTree(Treeview):
             destination_file_path = \
                 self.item(target_drop_item)['values'][0] + os.sep + self.item(self.dnd_source_item)['text']
 
-            # Insert the source item into the drop target
-            if os.path.isdir(self.dnd_source_item):
-                self.insert(target_drop_item, END, image=self.folder_icon16,
-                            text=self.item(self.dnd_source_item)['text'],
-                            values=self.item(self.dnd_source_item)['values'], open=True)
+            # Insert the source item into the drop target with its new path; a directory is
+            # listed again from its new location when opened
+            if os.path.isdir(source_file_path):
+                self.add_folder_node(target_drop_item, self.item(self.dnd_source_item)['text'],
+                                     destination_file_path)
             else:
-                self.insert(target_drop_item, END, image=self.open_doc_icon16,
-                            text=self.item(self.dnd_source_item)['text'],
-                            values=self.item(self.dnd_source_item)['values'], open=True)
+                self.add_file_node(target_drop_item, self.item(self.dnd_source_item)['text'],
+                                   destination_file_path)
             # Delete the source item
-            self.delete(self.dnd_source_item)
+            self.delete_tree_nodes(self.dnd_source_item)
             # Rename/move the file being dragged and dropped
             try:
                 os.rename(source_file_path, destination_file_path)
@@ -505,8 +562,7 @@ class MessageTree(Treeview):
         if dir_name is not None:
             try:
                 # Add new leaf node to the tree the treeview
-                self.insert(self.selected_item, 'end', text=dir_name, image=self.folder_icon16,
-                            values=[self.selected_path + os.sep + dir_name], open=False)
+                self.add_folder_node(self.selected_item, dir_name, self.selected_path + os.sep + dir_name, True)
                 # Create the new folder
                 os.mkdir(self.selected_path + os.sep + dir_name)
             except FileExistsError:
@@ -533,8 +589,9 @@ class MessageTree(Treeview):
         # Delete a file or folder, check if its a folder...
         isdir = os.path.isdir(self.selected_path)
         if isdir:
-            # If the folder contains anything, bail out
-            if len(self.get_children(self.selected_item)) > 0:
+            # If the folder contains anything, bail out; the file system is checked as the folder
+            # may not have been listed or may not show its files in the tree
+            if self.is_folder_empty(self.selected_path) is False:
                 # Cannot delete because directory is not empty
                 self.show_info_box(self, "Delete Directory Error - 1",
                                    "Cannot delete a Folder containing Messages;")
@@ -549,7 +606,7 @@ class MessageTree(Treeview):
                     # Remove the directory from the file system
                     os.rmdir(self.selected_path)
                     # Delete the node from the tree
-                    self.delete(self.selected_item)
+                    self.delete_tree_nodes(self.selected_item)
                 except OSError:
                     self.show_error_box(
                         "Delete Directory Error - 2",
@@ -563,7 +620,7 @@ class MessageTree(Treeview):
             if answer:
                 try:
                     # Delete the node from the tree
-                    self.delete(self.selected_item)
+                    self.delete_tree_nodes(self.selected_item)
                     # Remove the file from the file system
                     os.remove(self.selected_path)
                 except OSError:
@@ -621,6 +678,20 @@ class MessageTree(Treeview):
         # Update the list of messages to reflect the content of the selected folder
         self.update_message_list()
 
+    def on_open_node(self, event):
+        # type: (Event) -> None
+        """This method is invoked when a tree node is opened; if the node represents a directory that
+        has not been listed yet, the placeholder child node is replaced by the directory content.
+
+        :param event: Unused in this method;
+        :return: None
+        """
+        tree_node = self.focus()
+        if tree_node == "" or self.is_listed(tree_node):
+            return
+        self.delete_tree_nodes(*self.get_children(tree_node))
+        self.add_tree_nodes(tree_node, self.item(tree_node)['values'][0])
+
     def on_right_click(self, event):
         # type: (Event) -> None
         """ This method displays the tree popup menu that contains menu items to delete a file/message or folder,
@@ -755,6 +826,17 @@ class MessageTree(Treeview):
         # Store a handle to the list frame so this class can send it messages
         self.message_list_frame = message_list_frame
 
+    def set_message_search(self, message_search):
+        # type: (MessageSearch) -> None
+        """This method sets the search index that message files created, deleted or moved in the working
+        directory are added to or removed from. This method is invoked from the constructor building the complete
+        application GUI.
+
+        :param message_search: The search index of the working directory;
+        :return: None
+        """
+        self.message_search = message_search
+
     @staticmethod
     def show_error_box(title, message, path):
         # type: (str, str, str) -> None
@@ -815,20 +897,13 @@ class MessageTree(Treeview):
         # Update the list of messages to reflect the content of the selected folder
         # or the parent folder if a file is selected
         if os.path.isdir(self.selected_path):
-            folder_item_to_display = self.selected_item
+            folder_to_display = self.selected_path
         else:
-            folder_item_to_display = self.parent(self.selected_item)
+            folder_to_display = os.path.dirname(self.selected_path)
 
-        # Get the child nodes of the currently selected node
-        children = self.get_children(folder_item_to_display)
-
-        # Loop over the child nodes and recover the path and filename for each node
-        item_paths = []
-        for child in children:
-            item_paths.append(self.item(child)['values'][0])
-
-        # Pass the list of zero or more path and filenames for the selected tree node to the message list
-        self.message_list_frame.update_list_entries(item_paths)
+        # Pass the folder to the message list, the list displays the messages indexed for the folder and
+        # lists and checks the files in the folder on a background thread
+        self.message_list_frame.display_folder(folder_to_display)
 
     def __del__(self):
         # type: () -> None
@@ -896,12 +971,12 @@ class FileChangeListenerThread(threading.Thread):
 
 class TreeviewFileSystemEventHandler(FileSystemEventHandler):
     """This class subclasses the 'FileSystemEventHandler' which listens for changes made to the
-    OS file system, this includes file deletion, creation, modification and closure.
-    The events of interest are created and deletion. This class is instantiated on a dedicated
+    OS file system, this includes file deletion, creation, modification, moves and closure.
+    The events of interest are creation, deletion and moves. This class is instantiated on a dedicated
     thread to ensure parallel processing while the GUI is running.
 
     If an event is detected the treeview nodes are updated, (new nodes added on file or directory
-    creation and node removal on file or directory deletion).
+    creation, node removal on file or directory deletion and both on a move).
     """
     treeview = None
 
@@ -925,7 +1000,12 @@ class TreeviewFileSystemEventHandler(FileSystemEventHandler):
                       and file name of the created file or directory;
         :return: None
         """
+        if MessageIndex.is_index_file(event.src_path) or WriteXml.is_temporary_file(event.src_path):
+            return
         print("OS Creation: " + event.src_path)
+        # Add a message file to the search index, this handler is not called on the Tk thread
+        if self.treeview.message_search is not None and event.src_path.endswith(".xml"):
+            self.treeview.message_search.add_file(event.src_path)
         # Add a tree node to the treeview for the file / directory being created
         self.treeview.add_tree_node(event.src_path)
 
@@ -948,19 +1028,47 @@ class TreeviewFileSystemEventHandler(FileSystemEventHandler):
                       and file name of the deleted file or directory;
         :return: None
         """
+        if MessageIndex.is_index_file(event.src_path) or WriteXml.is_temporary_file(event.src_path):
+            return
         print("OS Deleted: " + event.src_path)
+        if self.treeview.message_search is not None and event.src_path.endswith(".xml"):
+            self.treeview.message_search.remove_file(event.src_path)
         # Delete the tree node associated with the file / directory being deleted
         self.treeview.delete_tree_node(event.src_path)
 
     def on_modified(self, event):
-        """This method handles the case when a file is moved using the underlying OS instead of
-        the application GUI. In Linux, when the 'mv' command is used, this 'modified' method is
-        called twice, once for the source and once for the target. The filename is not included
-        in event.src_path. Hence, the only way to deal with this is to rebuild the complete tree node
-        from the path provided by this method.
+        """This method does nothing; the OS file system reports a directory as modified each time a file
+        or directory is created, deleted or moved in it. The tree is kept up to date by the creation,
+        deletion and move events, so rebuilding the nodes of the directory on each of these events,
+        which takes time in proportion to the number of files in the directory, is not needed.
 
-        :param event: The data for the directory modification event that contains the path of the
-                      directory being modified;
+        :param event: The data for the file or directory modification event;
         :return: None
         """
-        self.treeview.move_file_os(event.src_path)
+        pass
+
+    def on_moved(self, event):
+        """This method is invoked when the underlying OS file system moves or renames a file or directory
+        within the watched directories, (e.g. using the 'mv' command or a drag and drop in the tree).
+        The tree node of the old path is deleted and a tree node added for the new path; nothing needs
+        to be done if the tree nodes have already been moved by the application GUI. A message file
+        replaced by moving a temporary file over it, (see WriteXml), keeps its tree node. Message files
+        are moved in the search index, if there is one, and a replaced message file is indexed again.
+
+        :param event: The data for the move event that contains the path and file name of the file or
+                      directory before and after the move;
+        :return: None
+        """
+        if MessageIndex.is_index_file(event.dest_path):
+            return
+        print("OS Moved: " + event.src_path + " to " + event.dest_path)
+        # Move a message file in the search index, a replaced message file is read again
+        if self.treeview.message_search is not None:
+            if event.src_path.endswith(".xml") and not WriteXml.is_temporary_file(event.src_path):
+                self.treeview.message_search.remove_file(event.src_path)
+            if event.dest_path.endswith(".xml"):
+                self.treeview.message_search.add_file(event.dest_path)
+        if not WriteXml.is_temporary_file(event.src_path):
+            self.treeview.delete_tree_node(event.src_path)
+        if not WriteXml.is_temporary_file(event.dest_path):
+            self.treeview.add_tree_node(event.dest_path)
@@ -0,0 +1,114 @@
+import queue
+import threading
+
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessageIncremental import ParseMessageIncremental
+
+
+class MessageValidationThread(threading.Thread):
+    """This class subclasses the Python 'threading.Thread' class in order to validate the message being
+    edited in the message text editor in the background, so that the editor never waits for a parse.
+
+    The editor requests the validation of a message with a generation number that is incremented on every
+    edit; only the latest request is kept, a request not yet started is replaced by a newer one. The
+    results are placed in a queue read by the editor on the Tk main loop, (tkinter must not be called from
+    this thread). Results of a request overtaken by a newer request while being parsed are discarded.
+    If the parser fails on a message a result is still returned; its flight plan record holds a single
+    error reporting the failure so that the editor displays it, and the thread carries on validating.
+
+    The thread is a daemon thread so that it cannot prevent the application from exiting."""
+
+    parser: ParseMessageIncremental = None
+    """The parser used to validate messages, only used on this thread. Successive requests are versions
+    of the same message being edited; only the fields edited since the previous request are parsed."""
+
+    condition: threading.Condition = None
+    """Protects the pending request and the stopped flag and wakes this thread when either is set"""
+
+    pending_request: (int, str) = None
+    """The generation number and text of the message waiting to be validated, None if there is none"""
+
+    results: queue.SimpleQueue = None
+    """The results of the requests validated, each entry is a tuple containing the generation number
+    of the request and the flight plan record populated by parsing the message"""
+
+    stopped: bool = False
+    """Set to stop this thread"""
+
+    def __init__(self):
+        # type: () -> None
+        """This constructor creates the validation thread, the thread has to be started by calling start().
+        """
+        super().__init__(daemon=True)
+        self.name = "Message Validation"
+        self.parser = ParseMessageIncremental()
+        self.condition = threading.Condition()
+        self.pending_request = None
+        self.results = queue.SimpleQueue()
+        self.stopped = False
+
+    def get_result(self):
+        # type: () -> (int, FlightPlanRecord) | None
+        """Gets the oldest result not yet read without waiting.
+
+        :return: A tuple containing the generation number of the request and the flight plan record
+                 holding the results of validating the message, None if no result is available;
+        """
+        try:
+            return self.results.get_nowait()
+        except queue.Empty:
+            return None
+
+    def request_validation(self, generation, message):
+        # type: (int, str) -> None
+        """Requests the validation of a message; this method returns immediately, replacing any request
+        that has not yet been started.
+
+        :param generation: A number identifying the version of the message, returned with the results;
+        :param message: The message to validate;
+        :return: None
+        """
+        with self.condition:
+            self.pending_request = (generation, message)
+            self.condition.notify()
+
+    def run(self):
+        # type: () -> None
+        """This method runs the thread, validating the latest message requested until the thread is stopped.
+
+        :return: None
+        """
+        while True:
+            with self.condition:
+                while self.pending_request is None and not self.stopped:
+                    self.condition.wait()
+                if self.stopped:
+                    return
+                generation, message = self.pending_request
+                self.pending_request = None
+
+            # Parse without holding the lock so that new requests are never blocked
+            flight_plan_record = FlightPlanRecord()
+            try:
+                self.parser.parse_message(flight_plan_record, message)
+            except Exception as e:
+                # The fields kept from the previous request may be inconsistent, start afresh
+                self.parser.clear()
+                flight_plan_record = FlightPlanRecord()
+                flight_plan_record.add_erroneous_field(
+                    message, "Unable to validate the message, the parser failed: " + repr(e), 0, 0)
+
+            with self.condition:
+                # A newer request makes these results stale
+                if self.pending_request is None:
+                    self.results.put((generation, flight_plan_record))
+
+    def stop(self):
+        # type: () -> None
+        """This method stops the thread once the message being validated, if any, has been parsed.
+
+        :return: None
+        """
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
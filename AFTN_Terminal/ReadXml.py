@@ -1,7 +1,6 @@
 import os.path
 import re
 from datetime import datetime
-from tkinter import messagebox
 import xml.etree.ElementTree as Et
 
 from Configuration.EnumerationConstants import FieldIdentifiers, SubFieldIdentifiers
@@ -37,20 +36,57 @@ class ReadXml:
     """A flag indicating that file opening, XML parsing and presence of a known message XML structure was
     successful;"""
 
-    def __init__(self, message_file_path):
-        # type: (str) -> None
+    show_errors: bool = True
+    """A flag indicating that a message box is displayed if the file cannot be read;"""
+
+    base_nodes: {str: Et.Element} = {}
+    """The children of the XML document root element indexed by their tag, built once when the file is
+    read; if several children have the same tag the first one is indexed;"""
+
+    icao_field_nodes: {str: Et.Element} = {}
+    """The ICAO field XML elements indexed by their field identifier name, built once when the file is read;"""
+
+    icao_field_text: {str: str} = {}
+    """The text of each ICAO field, stripped of trailing whitespace, indexed by the field identifier name;"""
+
+    SUMMARY_END_TAG: bytes = b"</icao_fields>"
+    """The end tag after which 'read_message_summary()' stops reading a file;"""
+
+    SUMMARY_READ_SIZE: int = 4096
+    """The number of bytes read from a file in one go by 'read_message_summary()';"""
+
+    NEW_LINE_FIELDS: {str: {str}} = {
+        "ALR": {"F7", "F9", "F13", "F15", "F16", "F18", "F19", "F20"},
+        "CPL": {"F9", "F13", "F15", "F16", "F18"},
+        "FPL": {"F9", "F13", "F15", "F16", "F18"},
+        "SPL": {"F16", "F18", "F19"}
+    }
+    """The fields that start on a new line when a message is built, indexed by message title; fields of
+    other titles are built on a single line;"""
+
+    def __init__(self, message_file_path, summary_only=False, show_errors=True):
+        # type: (str, bool, bool) -> None
         """This constructor opens and reads the XML file given in the 'message_file_path'
         parameter. The file creation and modification time is extracted form the file
         and stored in this class instance. The class method 'read_message_file()' is a helper
         method doing the heavy lifting for reading and checking the file content represents
         a valid ATS message XML file.
 
+        If 'summary_only' is True the file is read by 'read_message_summary()' instead; only the
+        elements up to and including the ICAO fields are read, the ICAO field errors and extracted
+        route are not. This is used to populate the message list, the detailed views read the whole file.
+
         :param message_file_path: The full absolute path and file name for an XML file being
                read by this class.
+        :param summary_only: True to read the message header and ICAO fields only;
+        :param show_errors: False to read the file without displaying a message box if it cannot be read,
+               (e.g. when indexing files on a background thread);
         """
+        self.show_errors = show_errors
+
         # Check if the file exists
         if not os.path.exists(message_file_path):
-            messagebox.showerror(
+            self.show_error(
                 title="Read Message Error - 1",
                 message="The Message File located in..." + os.linesep +
                         message_file_path + os.linesep + " does not exist")
@@ -71,7 +107,12 @@ class ReadXml:
             datetime.fromtimestamp(self.modification_time_seconds).strftime('%Y-%m-%d %H:%M:%S')
 
         # Indicate that the message has been successfully read
-        self.message_ok = self.read_message_file()
+        self.base_nodes = {}
+        self.icao_field_nodes = {}
+        self.icao_field_text = {}
+        self.message_ok = self.read_message_summary() if summary_only else self.read_message_file()
+        if self.message_ok:
+            self.index_message()
 
     def build_message(self):
         # type: () -> str
@@ -86,37 +127,32 @@ class ReadXml:
             return ""
         message = ""
         seperator = " "
-        title = ""
+        new_line_fields = set()
         new_line = os.linesep
         for icao_field in icao_fields:
             field_text = icao_field.text.rstrip(" \n\r")
             field_id = icao_field.attrib['id']
-            if re.fullmatch("PRIORITY_INDICATOR", field_id):
-                message = message + field_text + seperator
-            elif re.fullmatch("ADDRESS", field_id):
-                message = message + field_text
-            elif re.fullmatch("FILING_TIME", field_id):
-                message = message + new_line + field_text + seperator
-            elif re.fullmatch("ORIGINATOR", field_id):
-                message = message + field_text
-            elif re.fullmatch("ADADDRESS", field_id):
-                if len(field_text) > 0:
-                    message = message + new_line + field_text
-            elif re.fullmatch("F3", field_id):
-                message = message + new_line + "(" + field_text
-                seperator = "-"
-                title = field_text
-            # elif re.full match("FILING_TIME", field_id):
-            #     message = message + new_line + seperator + field_text
-            elif re.match("ALR", title) and re.fullmatch("F7|F9|F13|F15|F16|F18|F19|F20", field_id):
-                message = message + new_line + seperator + field_text
-            elif re.match("CPL|FPL", title) and re.fullmatch("F9|F13|F15|F16|F18", field_id):
-                message = message + new_line + seperator + field_text
-            elif re.match("SPL", title) and re.fullmatch("F16|F18|F19", field_id):
-                message = message + new_line + seperator + field_text
-            else:
-                if len(field_text) > 0:
-                    message = message + seperator + field_text
+            match field_id:
+                case "TRANSMISSION_ID":
+                    message = message + field_text + new_line
+                case "PRIORITY_INDICATOR":
+                    message = message + field_text + seperator
+                case "ADDRESS" | "ORIGINATOR":
+                    message = message + field_text
+                case "FILING_TIME":
+                    message = message + new_line + field_text + seperator
+                case "ADADDRESS":
+                    if len(field_text) > 0:
+                        message = message + new_line + field_text
+                case "F3":
+                    message = message + new_line + "(" + field_text
+                    seperator = "-"
+                    new_line_fields = self.NEW_LINE_FIELDS.get(field_text[:3], set())
+                case _ if field_id in new_line_fields:
+                    message = message + new_line + seperator + field_text
+                case _:
+                    if len(field_text) > 0:
+                        message = message + seperator + field_text
 
         return (message.rstrip(seperator) + ")").lstrip(new_line)
 
@@ -170,10 +206,7 @@ class ReadXml:
         :return: The XML element with a name matching that given in the parameter 'element_name'
                  or 'None' if the element does not exist.
         """
-        for child in self.root_element:
-            if re.fullmatch(element_name, child.tag):
-                return child
-        return None
+        return self.base_nodes.get(element_name)
 
     def get_creation_time(self):
         # type: () -> str
@@ -453,13 +486,7 @@ class ReadXml:
         :return: A string containing the field being retrieved or an empty string if the
                  field does not exist;
         """
-        icao_fields = self.get_base_node("icao_fields")
-        if icao_fields is None:
-            return ""
-        for icao_field in icao_fields:
-            if re.fullmatch(field_id.name, icao_field.attrib["id"]):
-                return icao_field.text.rstrip(" \n\r")
-        return ""
+        return self.icao_field_text.get(field_id.name, "")
 
     def get_icao_field_errors(self):
         # type: () -> []
@@ -571,6 +598,19 @@ class ReadXml:
         """
         return self.message_ok
 
+    def show_error(self, title, message):
+        # type: (str, str) -> None
+        """This method displays an error message box, if errors are shown; Tkinter is imported when a
+        message box is shown, so that message files can be read on a headless server without Tkinter.
+
+        :param title: The title of the message box;
+        :param message: The error message;
+        :return: None
+        """
+        if self.show_errors:
+            from tkinter import messagebox
+            messagebox.showerror(title=title, message=message)
+
     def read_message_file(self):
         # type: () -> bool
         """This method reads a message XML file and checks for the following:
@@ -578,7 +618,7 @@ class ReadXml:
             - Can the message be opened and read by the 'Et' XML parser;
             - Does the message contain a valid and recognised XML root element (flight_plan_record)
 
-        Message boxes are displayed to the user should any of the checks fail.
+        Message boxes are displayed to the user should any of the checks fail, unless errors are not shown.
 
         :return: True if the XML file is a valid and recognised application message XML file, False
         otherwise.
@@ -586,8 +626,8 @@ class ReadXml:
         # Get the XML tree
         try:
             tree = Et.parse(self.message_file_path)
-        except Et.ParseError:
-            messagebox.showerror(
+        except (Et.ParseError, OSError):
+            self.show_error(
                 title="Read Message Error - 2",
                 message="A valid ATS Message could not be found in the file..." + os.linesep +
                         self.message_file_path + os.linesep +
@@ -599,7 +639,7 @@ class ReadXml:
 
         # Check if there is a valid root element
         if self.root_element is None:
-            messagebox.showerror(
+            self.show_error(
                 title="Read Message Error - 3",
                 message="Cannot fined a valid ATS Message root XML element in the file..." + os.linesep +
                         self.message_file_path + os.linesep +
@@ -608,7 +648,7 @@ class ReadXml:
 
         # Check if the XML file contains a root element with one expected if it's a 'message' XML file
         if self.root_element.tag != "flight_plan_record":
-            messagebox.showerror(
+            self.show_error(
                 title="Read Message Error - 4",
                 message="Cannot fined a valid ATS Message root XML element in the file..." + os.linesep +
                         self.message_file_path + os.linesep +
@@ -616,6 +656,56 @@ class ReadXml:
             return False
         return True
 
+    def index_message(self):
+        # type: () -> None
+        """This method indexes the children of the XML document root element by their tag and the ICAO
+        fields by their field identifier, so that the getters in this class look the elements up rather
+        than searching the XML document on each call. The document is walked once when it is read.
+
+        :return: None
+        """
+        for child in self.root_element:
+            self.base_nodes.setdefault(child.tag, child)
+        icao_fields = self.base_nodes.get("icao_fields")
+        if icao_fields is None:
+            return
+        for icao_field in icao_fields:
+            field_id = icao_field.attrib["id"]
+            if field_id not in self.icao_field_nodes:
+                self.icao_field_nodes[field_id] = icao_field
+                self.icao_field_text[field_id] = (icao_field.text or "").rstrip(" \n\r")
+
+    def read_message_summary(self):
+        # type: () -> bool
+        """This method reads a message XML file up to the end of the ICAO fields only; the ICAO field
+        errors and the extracted route that follow them in the file, (the extracted route is typically
+        the largest part of the file), are never read, parsed or held in memory. The file is read in
+        blocks until the ICAO fields end tag is found, the root element is then closed and the text read
+        is parsed in one go. The end tag cannot occur within the text of an element as the '<' character
+        is always escaped there. Unlike 'read_message_file()' no message boxes are displayed, a file that
+        cannot be read or is not a message XML file is reported as not being a valid message.
+
+        :return: True if the file is a message XML file, False otherwise;
+        """
+        data = bytearray()
+        try:
+            with open(self.message_file_path, "rb") as file:
+                while True:
+                    block = file.read(self.SUMMARY_READ_SIZE)
+                    if not block:
+                        break
+                    search_index = max(0, len(data) - len(self.SUMMARY_END_TAG) + 1)
+                    data += block
+                    end_index = data.find(self.SUMMARY_END_TAG, search_index)
+                    if end_index >= 0:
+                        del data[end_index + len(self.SUMMARY_END_TAG):]
+                        data += b"</flight_plan_record>"
+                        break
+            self.root_element = Et.fromstring(data)
+        except (OSError, Et.ParseError):
+            return False
+        return self.root_element.tag == "flight_plan_record"
+
     def get_subfield_fx(self, field_id, subfield_id):
         # type: (FieldIdentifiers, SubFieldIdentifiers) -> str
         """This is a helper method to retrieve any ICAO subfield specified by the enumeration values
@@ -628,14 +718,12 @@ class ReadXml:
         :return: A string containing the subfield being retrieved or an empty string if the
                  subfield does not exist;
         """
-        icao_fields = self.get_base_node("icao_fields")
-        if icao_fields is None:
+        icao_field = self.icao_field_nodes.get(field_id.name)
+        if icao_field is None:
             return ""
-        for icao_field in icao_fields:
-            if re.fullmatch(field_id.name, icao_field.attrib["id"]):
-                for icao_subfield in icao_field:
-                    if re.fullmatch(subfield_id.name, icao_subfield.attrib["id"]):
-                        return icao_subfield.text.rstrip(" \n\r")
+        for icao_subfield in icao_field:
+            if icao_subfield.attrib["id"] == subfield_id.name:
+                return icao_subfield.text.rstrip(" \n\r")
         return ""
 
     def get_ers_list_items(self):
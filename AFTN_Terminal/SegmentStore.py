@@ -0,0 +1,524 @@
+import bisect
+import io
+import mmap
+import os
+import struct
+import zlib
+
+from AFTN_Terminal.WriteXml import WriteXml
+from Configuration.EnumerationConstants import FieldIdentifiers
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+
+
+class Segment:
+    """A single segment of a SegmentStore; a data file holding the records one after the other and an
+    index file holding the offset of each record in the data file. Both files are only ever appended to
+    and are read through memory maps that are extended as the files grow. Only the last segment of a
+    store is open for appending; the files of the earlier segments are closed once they are complete and
+    are only mapped while records are being read from them."""
+
+    number: int = 0
+    """The segment number, segments are numbered from one in the order they are created"""
+
+    data_path: str = ""
+    """The path to the data file"""
+
+    index_path: str = ""
+    """The path to the index file"""
+
+    data_file: io.BufferedRandom | None = None
+    """The data file, open for appending, None once the segment is closed for appending"""
+
+    index_file: io.BufferedRandom | None = None
+    """The index file, open for appending, None once the segment is closed for appending"""
+
+    data_size: int = 0
+    """The size of the data file, the offset at which the next record is written"""
+
+    record_count: int = 0
+    """The number of records in the segment"""
+
+    unflushed: bool = False
+    """True if records have been appended since the files were last flushed"""
+
+    unsynced: bool = False
+    """True if the files have been changed since they were last forced to the storage device"""
+
+    data_map: mmap.mmap | None = None
+    """The memory map of the data file, None until a record is read; covers the file as it was when mapped"""
+
+    index_map: mmap.mmap | None = None
+    """The memory map of the index file, None until a record is read; covers the file as it was when mapped"""
+
+    def __init__(self, directory_path, number):
+        # type: (str, int) -> None
+        """Opens a segment for appending, creating its files if they do not exist. A segment left
+        incomplete by a crash is repaired; complete records missing from the index are added to it and a
+        partially written record at the end of the data file is removed.
+
+        :param directory_path: The directory containing the segment files;
+        :param number: The segment number;
+        :raises OSError: If the segment files cannot be opened;
+        """
+        self.number = number
+        self.data_path = os.path.join(directory_path, "segment-{0:06d}.dat".format(number))
+        self.index_path = os.path.join(directory_path, "segment-{0:06d}.idx".format(number))
+        self.data_file = open(self.data_path, "a+b")
+        self.index_file = open(self.index_path, "a+b")
+        self.data_map = None
+        self.index_map = None
+        self.unflushed = False
+        self.unsynced = False
+        self.recover()
+
+    def recover(self):
+        # type: () -> None
+        """Checks the end of the index against the data file and repairs the segment after a crash; only
+        the last indexed record and the data following it are read.
+
+        :return: None
+        """
+        data_size = os.fstat(self.data_file.fileno()).st_size
+        index_size = os.fstat(self.index_file.fileno()).st_size
+        self.record_count = index_size // SegmentStore.INDEX_ENTRY.size
+
+        # Drop index entries for records that were not completely written
+        end_offset = 0
+        while self.record_count > 0:
+            offset = SegmentStore.INDEX_ENTRY.unpack(self.read_at(
+                self.index_file, SegmentStore.INDEX_ENTRY.size,
+                (self.record_count - 1) * SegmentStore.INDEX_ENTRY.size))[0]
+            end_offset = self.get_record_end(offset, data_size)
+            if end_offset >= 0:
+                break
+            self.record_count -= 1
+            end_offset = 0
+        if index_size != self.record_count * SegmentStore.INDEX_ENTRY.size:
+            self.index_file.truncate(self.record_count * SegmentStore.INDEX_ENTRY.size)
+            self.unsynced = True
+
+        # Index complete records written after the last index entry
+        while True:
+            record_end = self.get_record_end(end_offset, data_size)
+            if record_end < 0:
+                break
+            self.index_file.write(SegmentStore.INDEX_ENTRY.pack(end_offset))
+            self.unsynced = True
+            self.record_count += 1
+            end_offset = record_end
+        self.index_file.flush()
+        if data_size != end_offset:
+            self.data_file.truncate(end_offset)
+            self.unsynced = True
+        self.data_size = end_offset
+        self.data_file.seek(0, os.SEEK_END)
+        self.index_file.seek(0, os.SEEK_END)
+
+    def get_record_end(self, offset, data_size):
+        # type: (int, int) -> int
+        """Checks that a complete and intact record is present at an offset in the data file.
+
+        :param offset: The offset of the record;
+        :param data_size: The size of the data file;
+        :return: The offset of the end of the record, -1 if the record is incomplete or corrupt;
+        """
+        header_end = offset + SegmentStore.RECORD_HEADER.size
+        if header_end > data_size:
+            return -1
+        length, checksum, _, _ = SegmentStore.RECORD_HEADER.unpack(
+            self.read_at(self.data_file, SegmentStore.RECORD_HEADER.size, offset))
+        if header_end + length > data_size or \
+                zlib.crc32(self.read_at(self.data_file, length, header_end)) != checksum:
+            return -1
+        return header_end + length
+
+    @staticmethod
+    def read_at(file, size, offset):
+        # type: (io.BufferedRandom, int, int) -> bytes
+        """Reads part of a file at an offset; the file position is moved, (os.pread() is not available on
+        all platforms).
+
+        :param file: The file;
+        :param size: The number of bytes to read;
+        :param offset: The offset in the file;
+        :return: The bytes read, fewer than 'size' at the end of the file;
+        """
+        file.seek(offset)
+        return file.read(size)
+
+    def append(self, payload, flags, priority_indicator):
+        # type: (bytes, int, bytes) -> int
+        """Appends a record to the segment. The files are buffered and only flushed when a record is
+        read or the segment is synchronised; an index entry written out before its record is complete is
+        removed when the segment is recovered.
+
+        :param payload: The encoded record;
+        :param flags: The record flags, (see SegmentStore.FLAG_COMPRESSED);
+        :param priority_indicator: The priority indicator as two ASCII characters;
+        :return: The number of the record within the segment;
+        """
+        self.data_file.write(SegmentStore.RECORD_HEADER.pack(len(payload), zlib.crc32(payload), flags,
+                                                             priority_indicator))
+        self.data_file.write(payload)
+        self.index_file.write(SegmentStore.INDEX_ENTRY.pack(self.data_size))
+        self.unflushed = True
+        self.unsynced = True
+        self.data_size += SegmentStore.RECORD_HEADER.size + len(payload)
+        self.record_count += 1
+        return self.record_count - 1
+
+    def read(self, record_number):
+        # type: (int) -> (bytes, int, bytes)
+        """Reads a record from the segment through the memory maps.
+
+        :param record_number: The number of the record within the segment;
+        :return: A tuple containing the encoded record, the record flags and the priority indicator;
+        """
+        if self.unflushed:
+            self.flush()
+        index_end = (record_number + 1) * SegmentStore.INDEX_ENTRY.size
+        if self.index_map is None or len(self.index_map) < index_end:
+            self.index_map = self.remap(self.index_map, self.index_path)
+        offset = SegmentStore.INDEX_ENTRY.unpack_from(self.index_map, index_end - SegmentStore.INDEX_ENTRY.size)[0]
+        if self.data_map is None or len(self.data_map) < offset + SegmentStore.RECORD_HEADER.size:
+            self.data_map = self.remap(self.data_map, self.data_path)
+        length, _, flags, priority_indicator = SegmentStore.RECORD_HEADER.unpack_from(self.data_map, offset)
+        payload_offset = offset + SegmentStore.RECORD_HEADER.size
+        if len(self.data_map) < payload_offset + length:
+            self.data_map = self.remap(self.data_map, self.data_path)
+        return self.data_map[payload_offset:payload_offset + length], flags, priority_indicator
+
+    @staticmethod
+    def remap(file_map, file_path):
+        # type: (mmap.mmap | None, str) -> mmap.mmap
+        """Replaces the memory map of a file with one covering the whole file as it is now.
+
+        :param file_map: The current memory map of the file, None if not mapped;
+        :param file_path: The path to the file;
+        :return: The new memory map;
+        """
+        if file_map is not None:
+            file_map.close()
+        with open(file_path, "rb") as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def is_mapped(self):
+        # type: () -> bool
+        """Checks if the segment files are mapped, (each memory map holds a file descriptor).
+
+        :return: True if either file is mapped, False otherwise;
+        """
+        return self.data_map is not None or self.index_map is not None
+
+    def unmap(self):
+        # type: () -> None
+        """Closes the memory maps, the files are mapped again when a record is next read.
+
+        :return: None
+        """
+        for file_map in [self.data_map, self.index_map]:
+            if file_map is not None:
+                file_map.close()
+        self.data_map = None
+        self.index_map = None
+
+    def flush(self):
+        # type: () -> None
+        """Writes the records appended to the segment files.
+
+        :return: None
+        """
+        self.data_file.flush()
+        self.index_file.flush()
+        self.unflushed = False
+
+    def sync(self):
+        # type: () -> None
+        """Forces the segment files to be written to the storage device, if they have changed.
+
+        :return: None
+        """
+        if not self.unsynced:
+            return
+        self.flush()
+        os.fsync(self.data_file.fileno())
+        os.fsync(self.index_file.fileno())
+        self.unsynced = False
+
+    def close_for_appending(self):
+        # type: () -> None
+        """Forces the segment files to the storage device and closes them; records can still be read.
+
+        :return: None
+        """
+        if self.data_file is None:
+            return
+        self.sync()
+        self.data_file.close()
+        self.index_file.close()
+        self.data_file = None
+        self.index_file = None
+
+    def close(self):
+        # type: () -> None
+        """Closes the memory maps and the segment files.
+
+        :return: None
+        """
+        self.unmap()
+        if self.data_file is not None:
+            self.data_file.close()
+            self.index_file.close()
+        self.data_file = None
+        self.index_file = None
+
+    def get_data_size(self):
+        # type: () -> int
+        """Gets the size of the data file.
+
+        :return: The size in bytes;
+        """
+        return self.data_size
+
+    def get_record_count(self):
+        # type: () -> int
+        """Gets the number of records in the segment.
+
+        :return: The number of records;
+        """
+        return self.record_count
+
+
+class SegmentStore:
+    """This class is a message store holding parsed messages in a small number of large, append only,
+    segment files rather than one XML file per message; it is an alternative to storing messages in the
+    'Inbox' of the applications working directory where the number of files becomes a problem, (e.g.
+    several hundred thousand messages a day).
+
+    Each message is stored as its FlightPlanRecord XML in a length prefixed record with a CRC-32 checksum
+    and the message priority indicator; the XML can be compressed with zlib, which makes the store about
+    five times smaller at the cost of most of the time taken to append and read a record. The records
+    are numbered from zero in the order they are appended, the number of a record never changes. Each
+    segment has an index file with the offset of each of its records, records are read through memory
+    maps of the segment and index files so a record is read in constant time without searching. When a
+    segment reaches the segment size a new segment is started. A record can be exported as a message XML
+    file in the working directory at any time; the XML is identical to that written by
+    'FlightPlanRecord.as_xml()'.
+
+    Appended records are buffered until a record is read or 'sync()' is called, which forces them to the
+    storage device; a segment is also forced to the storage device when a new segment is started. Only
+    the last segment is kept open for appending and at most MAPPED_SEGMENTS earlier segments are kept
+    mapped for reading, so the number of file descriptors used does not grow with the store. A segment
+    left incomplete by a crash is repaired when the store is opened. This class is not thread safe, it is
+    used from a single thread."""
+
+    DEFAULT_SEGMENT_SIZE: int = 64 * 1024 * 1024
+    """The default size at which a new segment is started, in bytes"""
+
+    RECORD_HEADER: struct.Struct = struct.Struct("<IIB2s")
+    """The header of each record; the length of the encoded XML, its CRC-32, the record flags and the
+    priority indicator"""
+
+    INDEX_ENTRY: struct.Struct = struct.Struct("<Q")
+    """An index entry, the offset of a record in the segment data file"""
+
+    FLAG_COMPRESSED: int = 0x01
+    """The record flag set if the XML is compressed with zlib"""
+
+    MAPPED_SEGMENTS: int = 8
+    """The maximum number of segments, other than the last, kept mapped for reading"""
+
+    COMPRESSION_LEVEL: int = 1
+    """The zlib compression level, the fastest level compresses message XML about five fold"""
+
+    directory_path: str = ""
+    """The directory holding the segment files"""
+
+    segment_size: int = DEFAULT_SEGMENT_SIZE
+    """The size at which a new segment is started"""
+
+    compress: bool = False
+    """True if the records appended are compressed"""
+
+    segments: [Segment] = []
+    """The segments in the order they were created, the last one is appended to"""
+
+    first_record_numbers: [int] = []
+    """The store record number of the first record in each segment"""
+
+    mapped_segments: [Segment] = []
+    """The segments other than the last that are mapped for reading, the most recently read last"""
+
+    directory_unsynced: bool = False
+    """True if segment files have been created since the directory was last forced to the storage device"""
+
+    def __init__(self, directory_path, segment_size=DEFAULT_SEGMENT_SIZE, compress=False):
+        # type: (str, int, bool) -> None
+        """Opens the store in a directory, the directory is created if it does not exist.
+
+        :param directory_path: The directory holding the segment files;
+        :param segment_size: The size at which a new segment is started, in bytes;
+        :param compress: True to compress the records appended; records already in the store are read
+               whether they are compressed or not;
+        :raises OSError: If the store cannot be opened;
+        """
+        self.directory_path = directory_path
+        self.segment_size = segment_size
+        self.compress = compress
+        os.makedirs(directory_path, exist_ok=True)
+        numbers = sorted(int(name[8:14]) for name in os.listdir(directory_path)
+                         if name.startswith("segment-") and name.endswith(".dat") and name[8:14].isdigit())
+        self.segments = []
+        self.first_record_numbers = []
+        self.mapped_segments = []
+        self.directory_unsynced = len(numbers) == 0
+        for number in numbers if len(numbers) > 0 else [1]:
+            self.add_segment(number)
+
+    def add_segment(self, number):
+        # type: (int) -> None
+        """Opens a segment and adds it to the end of the store; the previous last segment is forced to the
+        storage device and closed for appending.
+
+        :param number: The segment number;
+        :return: None
+        """
+        if len(self.segments) > 0:
+            self.segments[-1].close_for_appending()
+        self.first_record_numbers.append(self.get_record_count())
+        self.segments.append(Segment(self.directory_path, number))
+
+    def append(self, flight_plan_record):
+        # type: (FlightPlanRecord) -> int
+        """Appends a parsed message to the store.
+
+        :param flight_plan_record: The parsed message;
+        :return: The record number of the message;
+        """
+        priority_indicator = flight_plan_record.get_icao_field(FieldIdentifiers.PRIORITY_INDICATOR)
+        return self.append_xml(flight_plan_record.as_xml(),
+                               "" if priority_indicator is None else priority_indicator.get_field_text())
+
+    def append_xml(self, xml_text, priority_indicator):
+        # type: (str, str) -> int
+        """Appends a message given as its XML to the store.
+
+        :param xml_text: The message XML as written by 'FlightPlanRecord.as_xml()';
+        :param priority_indicator: The message priority indicator, empty if the message has no header;
+        :return: The record number of the message;
+        """
+        segment = self.segments[-1]
+        if segment.get_data_size() >= self.segment_size:
+            self.add_segment(segment.number + 1)
+            self.directory_unsynced = True
+            segment = self.segments[-1]
+        payload = xml_text.encode()
+        flags = 0
+        if self.compress:
+            payload = zlib.compress(payload, self.COMPRESSION_LEVEL)
+            flags |= self.FLAG_COMPRESSED
+        segment.append(payload, flags, priority_indicator.encode("ascii", "replace")[:2].ljust(2))
+        return self.get_record_count() - 1
+
+    def locate(self, record_number):
+        # type: (int) -> (Segment, int)
+        """Finds the segment holding a record.
+
+        :param record_number: The record number;
+        :return: A tuple containing the segment and the number of the record within the segment;
+        :raises IndexError: If there is no such record;
+        """
+        if record_number < 0 or record_number >= self.get_record_count():
+            raise IndexError("No record " + str(record_number) + " in the message store")
+        segment_index = bisect.bisect_right(self.first_record_numbers, record_number) - 1
+        segment = self.segments[segment_index]
+        if segment_index < len(self.segments) - 1:
+            # Keep the most recently read earlier segments mapped, unmapping the least recently read
+            if segment in self.mapped_segments:
+                self.mapped_segments.remove(segment)
+            self.mapped_segments.append(segment)
+            while len(self.mapped_segments) > self.MAPPED_SEGMENTS:
+                self.mapped_segments.pop(0).unmap()
+        return segment, record_number - self.first_record_numbers[segment_index]
+
+    def read_xml(self, record_number):
+        # type: (int) -> str
+        """Reads a message as its XML.
+
+        :param record_number: The record number;
+        :return: The message XML, as written by 'FlightPlanRecord.as_xml()';
+        :raises IndexError: If there is no such record;
+        """
+        segment, segment_record_number = self.locate(record_number)
+        payload, flags, _ = segment.read(segment_record_number)
+        if flags & self.FLAG_COMPRESSED:
+            return zlib.decompress(payload).decode()
+        return payload.decode()
+
+    def get_priority_indicator(self, record_number):
+        # type: (int) -> str
+        """Gets the priority indicator of a message without reading the message.
+
+        :param record_number: The record number;
+        :return: The priority indicator, empty if the message has no header;
+        :raises IndexError: If there is no such record;
+        """
+        segment, segment_record_number = self.locate(record_number)
+        return segment.read(segment_record_number)[2].decode("ascii").strip()
+
+    def export(self, record_number, working_directory_path):
+        # type: (int, str) -> str
+        """Exports a message as a message XML file in the 'Inbox' of the applications working directory,
+        or the subdirectory for the message priority indicator, (see WriteXml.write_received_message()).
+
+        :param record_number: The record number;
+        :param working_directory_path: The absolute path to the applications working directory;
+        :return: The path to the file written;
+        :raises IndexError: If there is no such record;
+        :raises OSError: If the file cannot be written;
+        """
+        return WriteXml.write_received_message(self.read_xml(record_number), working_directory_path,
+                                               self.get_priority_indicator(record_number),
+                                               "store-" + str(record_number))
+
+    def get_record_count(self):
+        # type: () -> int
+        """Gets the number of messages in the store.
+
+        :return: The number of messages;
+        """
+        if len(self.segments) == 0:
+            return 0
+        return self.first_record_numbers[-1] + self.segments[-1].get_record_count()
+
+    def get_segment_count(self):
+        # type: () -> int
+        """Gets the number of segments in the store.
+
+        :return: The number of segments;
+        """
+        return len(self.segments)
+
+    def sync(self):
+        # type: () -> None
+        """Forces the messages appended to be written to the storage device.
+
+        :return: None
+        """
+        for segment in self.segments:
+            segment.sync()
+        if self.directory_unsynced:
+            WriteXml.sync_directory(self.directory_path)
+            self.directory_unsynced = False
+
+    def close(self):
+        # type: () -> None
+        """Closes the store.
+
+        :return: None
+        """
+        for segment in self.segments:
+            segment.close()
+        self.segments = []
+        self.first_record_numbers = []
+        self.mapped_segments = []
@@ -1,13 +1,16 @@
 import os
+import threading
 from idlelib.tooltip import Hovertip
 from tkinter import Tk, Frame, N, W, S, E, Button, Y, NORMAL, DISABLED
-from tkinter.messagebox import askyesno
+from tkinter.messagebox import askyesno, showerror, showinfo
+from tkinter.simpledialog import askstring
 from tkinter.ttk import Separator, Treeview
 
 from PIL.ImageTk import PhotoImage
 
 from AFTN_Terminal.About import About
 from AFTN_Terminal.ErsListFrame import ErsListFrame
+from AFTN_Terminal.MessageSearch import MessageSearch
 from AFTN_Terminal.MessageTextEditorFrame import MessageTextEditorFrame
 from AFTN_Terminal.ReadXml import ReadXml
 from Configuration.EnumerationConstants import MessageTitles
@@ -49,6 +52,9 @@ class ToolBar(Frame):
     tree_view: Treeview = None
     """Handle to the Treeview widget displaying messages in the main application window"""
 
+    message_search: MessageSearch = None
+    """The search index of the working directory used to search for messages"""
+
     def __init__(self, parent, working_directory_path):
         # type: (Tk, str) -> None
         """This constructor builds the toolbar frame and populates it with buttons to provide access
@@ -108,7 +114,7 @@ class ToolBar(Frame):
         separator = Separator(self, orient='vertical')
         separator.pack(side='left', pady=3, padx=3, fill=Y)
 
-        find_button = Button(self, image=self.find_icon)  # , command=.about)
+        find_button = Button(self, image=self.find_icon, command=self.search_messages)
         find_button.pack(side="left", anchor=N, padx=2, pady=2)
         Hovertip(find_button, "Search Messages...", 300)
 
@@ -142,8 +148,8 @@ class ToolBar(Frame):
                           "Are you sure you want to delete the Message:" + os.linesep
                           + self.selected_path, parent=self)
         if answer:
-            # Delete the node from the tree
-            self.tree_view.delete(self.tree_view.selection()[0])
+            # Delete the entry from the list
+            self.tree_view.delete_list_entry(self.selected_path)
 
     def display_ers(self):
         # type: () -> None
@@ -174,6 +180,28 @@ class ToolBar(Frame):
         """
         MessageTextEditorFrame(self.parent, True, MessageTitles.FPL, "", "", self.working_directory_path)
 
+    def search_messages(self):
+        # type: () -> None
+        """This method prompts for a search query, (see MessageSearch.parse_query()), and displays the
+        messages found in the message list of the main application window.
+
+        :return: None
+        """
+        query = askstring("Search Messages",
+                          "Enter the fields to search for, e.g. 'FPL DLH4AB 221117', 'PT/BIBAX', 'REG/DABCD'" +
+                          os.linesep + "or 'ERROR/' followed by words in the error text", parent=self)
+        if query is None or len(query.strip()) == 0:
+            return
+        try:
+            file_paths = self.message_search.search(MessageSearch.parse_query(query))
+        except ValueError as e:
+            showerror("Search Messages", str(e), parent=self)
+            return
+        if len(file_paths) == 0:
+            showinfo("Search Messages", "No messages found for '" + query + "'", parent=self)
+            return
+        self.tree_view.update_list_entries(file_paths)
+
     def set_message_buttons_state(self, state):
         # type (bool) -> None
         """This method sets the enabled/disabled state of the buttons dealing with messages; if a message
@@ -222,3 +250,14 @@ class ToolBar(Frame):
         :return: None
         """
         self.tree_view = tree_view
+
+    def set_message_search(self, message_search):
+        # type: (MessageSearch) -> None
+        """Set the search index used to search for messages; the index is brought up to date with the
+        message files in the working directory on a background thread.
+
+        :param message_search: The search index of the working directory;
+        :return: None
+        """
+        self.message_search = message_search
+        threading.Thread(target=message_search.update, name="Message Search Update", daemon=True).start()
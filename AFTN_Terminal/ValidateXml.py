@@ -0,0 +1,268 @@
+import os
+import re
+import xml.etree.ElementTree as Et
+
+
+class SchemaType:
+    """This class is a compiled XML schema type; it describes the attributes, child elements and text
+    content allowed for an element. Simple types (e.g. 'xs:string') are represented as a type without
+    attributes or child elements."""
+
+    attributes: {str: (re.Pattern | None, bool)} = {}
+    """A dictionary of the allowed attributes indexed by attribute name; each entry contains a compiled
+    regular expression the attribute value must match (None for any value) and a flag set to True if
+    the attribute is required."""
+
+    children: [(str, str, int, int | None)] = []
+    """The sequence of child elements, each entry contains the element name, type name, minimum and
+    maximum number of occurrences (None if unbounded)."""
+
+    text: re.Pattern | None | bool = None
+    """A compiled regular expression the element text must match, None if any text is allowed or
+    False if no text is allowed, (element only content)."""
+
+    def __init__(self, text):
+        # type: (re.Pattern | None | bool) -> None
+        """Constructor for a type without attributes and child elements.
+
+        :param text: A compiled regular expression the element text must match, None if any text is
+               allowed or False if no text is allowed;
+        """
+        self.attributes = {}
+        self.children = []
+        self.text = text
+
+
+class ValidateXml:
+    """This class validates XML files against an XML schema, (XSD). The schema is compiled once when
+    this class is instantiated, XML files are then validated incrementally as they are parsed, elements
+    are discarded as soon as they have been validated so that the memory used is independent of the
+    size of the XML file.
+
+    Only the subset of the XML schema language used by the application's 'FlightPlanRecord.xsd' is
+    supported; top level element declarations, named complex types with a sequence of named elements,
+    simple content extending a built-in type, attributes and the built-in types 'xs:string',
+    'xs:integer' and 'xs:float'. A ValueError is raised if the schema contains anything else.
+    """
+
+    XS: str = "{http://www.w3.org/2001/XMLSchema}"
+    """The XML schema namespace as used by ElementTree in element tags"""
+
+    SIMPLE_TYPES: {str: re.Pattern | None} = {
+        "xs:string": None,
+        "xs:integer": re.compile("[+-]?[0-9]+"),
+        "xs:float": re.compile("[+-]?([0-9]+(\\.[0-9]*)?|\\.[0-9]+)([eE][+-]?[0-9]+)?|[+-]?INF|NaN"),
+    }
+    """The built-in simple types supported with the regular expressions their values must match"""
+
+    DEFAULT_SCHEMA_PATH: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                            "XML", "FlightPlanRecord.xsd")
+    """The absolute path to the flight plan record schema supplied with the application"""
+
+    MAXIMUM_ERRORS: int = 10
+    """The maximum number of errors reported for a single XML file"""
+
+    root_elements: {str: str} = {}
+    """The top level elements declared in the schema indexed by element name, the values are type names"""
+
+    types: {str: SchemaType} = {}
+    """The compiled types indexed by type name"""
+
+    def __init__(self, schema_file_path=DEFAULT_SCHEMA_PATH):
+        # type: (str) -> None
+        """Reads and compiles an XML schema.
+
+        :param schema_file_path: The path to the XML schema file, defaults to the flight plan record schema;
+        """
+        self.root_elements = {}
+        self.types = {}
+        for name, simple_type in self.SIMPLE_TYPES.items():
+            self.types[name] = SchemaType(simple_type)
+
+        for node in Et.parse(schema_file_path).getroot():
+            match node.tag:
+                case tag if tag == self.XS + "element":
+                    self.root_elements[node.attrib["name"]] = node.attrib["type"]
+                case tag if tag == self.XS + "complexType":
+                    self.types[node.attrib["name"]] = self.compile_complex_type(node)
+                case _:
+                    raise ValueError("Unsupported schema construct '" + node.tag + "'")
+
+        # Check all the referenced types are defined
+        type_names = list(self.root_elements.values())
+        for schema_type in self.types.values():
+            type_names = type_names + [child[1] for child in schema_type.children]
+        for type_name in type_names:
+            if type_name not in self.types:
+                raise ValueError("Undefined schema type '" + type_name + "'")
+
+    def compile_attribute(self, schema_type, node):
+        # type: (SchemaType, Et.Element) -> None
+        """Compiles an attribute declaration and adds it to a compiled type.
+
+        :param schema_type: The compiled type the attribute is added to;
+        :param node: The 'xs:attribute' schema node;
+        :return: None
+        """
+        attribute_type = node.attrib.get("type", "xs:string")
+        if attribute_type not in self.SIMPLE_TYPES:
+            raise ValueError("Unsupported attribute type '" + attribute_type + "'")
+        schema_type.attributes[node.attrib["name"]] = \
+            (self.SIMPLE_TYPES[attribute_type], node.attrib.get("use", "optional") == "required")
+
+    def compile_complex_type(self, node):
+        # type: (Et.Element) -> SchemaType
+        """Compiles a named complex type.
+
+        :param node: The 'xs:complexType' schema node;
+        :return: The compiled type;
+        """
+        schema_type = SchemaType(None if node.attrib.get("mixed", "false") == "true" else False)
+        for child in node:
+            match child.tag:
+                case tag if tag == self.XS + "sequence":
+                    for element in child:
+                        if element.tag != self.XS + "element":
+                            raise ValueError("Unsupported schema construct '" + element.tag + "'")
+                        max_occurs = element.attrib.get("maxOccurs", "1")
+                        schema_type.children.append((element.attrib["name"],
+                                                     element.attrib["type"],
+                                                     int(element.attrib.get("minOccurs", "1")),
+                                                     None if max_occurs == "unbounded" else int(max_occurs)))
+                case tag if tag == self.XS + "simpleContent":
+                    extension = child.find(self.XS + "extension")
+                    if extension is None or extension.attrib["base"] not in self.SIMPLE_TYPES:
+                        raise ValueError("Unsupported simple content in type '" + node.attrib["name"] + "'")
+                    schema_type.text = self.SIMPLE_TYPES[extension.attrib["base"]]
+                    for attribute in extension:
+                        self.compile_attribute(schema_type, attribute)
+                case tag if tag == self.XS + "attribute":
+                    self.compile_attribute(schema_type, child)
+                case _:
+                    raise ValueError("Unsupported schema construct '" + child.tag + "'")
+        return schema_type
+
+    def validate(self, xml_file_path):
+        # type: (str) -> [str]
+        """Validates an XML file against the schema compiled by this class. The file is parsed
+        incrementally, each element is validated and discarded when its end tag is read.
+
+        :param xml_file_path: The path to the XML file being validated;
+        :return: A list of strings describing the reasons the file does not conform to the schema,
+                 (at most MAXIMUM_ERRORS), an empty list if the file conforms;
+        """
+        errors = []
+        # Each stack entry is a list containing the element, its compiled type (None if unknown), its
+        # path, the index of the current child element in the sequence and the occurrences of that element
+        stack = []
+        try:
+            for event, element in Et.iterparse(xml_file_path, events=("start", "end")):
+                if event == "start":
+                    stack.append(self.validate_start(stack, element, errors))
+                else:
+                    self.validate_end(stack.pop(), errors)
+                    # Discard the element, it has been validated
+                    element.clear()
+                    if len(stack) > 0:
+                        del stack[-1][0][-1]
+                if len(errors) >= self.MAXIMUM_ERRORS:
+                    break
+        except Et.ParseError as e:
+            errors.append("XML is not well-formed: " + str(e))
+        except OSError as e:
+            errors.append("Unable to read the file: " + str(e))
+        return errors[0:self.MAXIMUM_ERRORS]
+
+    def validate_end(self, entry, errors):
+        # type: ([], [str]) -> None
+        """Validates an element when its end tag has been read, the element text and any missing child
+        elements are checked.
+
+        :param entry: The stack entry for the element;
+        :param errors: A list that any errors found are appended to;
+        :return: None
+        """
+        element, schema_type, path, index, occurrences = entry
+        if schema_type is None:
+            return
+
+        # Check all the required child elements have been found
+        for name, _, min_occurs, _ in schema_type.children[index:]:
+            if occurrences < min_occurs:
+                errors.append(path + ": missing element '" + name + "'")
+            occurrences = 0
+
+        text = "" if element.text is None else element.text.strip()
+        if schema_type.text is False:
+            if len(text) > 0:
+                errors.append(path + ": text is not allowed '" + text[0:40] + "'")
+        elif schema_type.text is not None and schema_type.text.fullmatch(text) is None:
+            errors.append(path + ": invalid value '" + text[0:40] + "'")
+
+    def validate_start(self, stack, element, errors):
+        # type: ([], Et.Element, [str]) -> []
+        """Validates an element when its start tag has been read, the position of the element in its
+        parent's sequence of child elements and the element attributes are checked.
+
+        :param stack: The stack of the parent element entries;
+        :param element: The element being validated;
+        :param errors: A list that any errors found are appended to;
+        :return: The stack entry for the element;
+        """
+        schema_type = None
+        if len(stack) == 0:
+            path = element.tag
+            if element.tag in self.root_elements:
+                schema_type = self.types[self.root_elements[element.tag]]
+            else:
+                errors.append(path + ": unexpected root element")
+        else:
+            parent = stack[-1]
+            path = parent[2] + "/" + element.tag
+            if parent[1] is not None:
+                schema_type = self.validate_position(parent, element, path, errors)
+
+        if schema_type is not None:
+            for name, value in element.attrib.items():
+                if name not in schema_type.attributes:
+                    errors.append(path + ": unexpected attribute '" + name + "'")
+                elif schema_type.attributes[name][0] is not None and \
+                        schema_type.attributes[name][0].fullmatch(value.strip()) is None:
+                    errors.append(path + ": invalid value '" + value[0:40] + "' for attribute '" + name + "'")
+            for name, (_, required) in schema_type.attributes.items():
+                if required and name not in element.attrib:
+                    errors.append(path + ": missing attribute '" + name + "'")
+
+        return [element, schema_type, path, 0, 0]
+
+    def validate_position(self, parent, element, path, errors):
+        # type: ([], Et.Element, str, [str]) -> SchemaType | None
+        """Checks an element is allowed at its position in the parent element's sequence of child elements
+        and advances the parent's position in the sequence.
+
+        :param parent: The stack entry of the parent element;
+        :param element: The element being validated;
+        :param path: The path of the element being validated;
+        :param errors: A list that any errors found are appended to;
+        :return: The compiled type of the element or None if the element is not allowed;
+        """
+        children = parent[1].children
+        index = parent[3]
+        occurrences = parent[4]
+        while index < len(children):
+            name, type_name, _, max_occurs = children[index]
+            if name == element.tag and (max_occurs is None or occurrences < max_occurs):
+                # Report any required elements skipped over and advance the parent's position
+                for skipped_name, _, min_occurs, _ in children[parent[3]:index]:
+                    if parent[4] < min_occurs:
+                        errors.append(parent[2] + ": missing element '" + skipped_name +
+                                      "' before '" + element.tag + "'")
+                    parent[4] = 0
+                parent[3] = index
+                parent[4] = occurrences + 1
+                return self.types[type_name]
+            index += 1
+            occurrences = 0
+        # The element is not allowed here, the parent's position is left unchanged
+        errors.append(path + ": unexpected element")
+        return None
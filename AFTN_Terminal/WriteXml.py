@@ -1,12 +1,40 @@
+import itertools
 import os
 from datetime import datetime
-from tkinter import messagebox
 
 
 class WriteXml:
     """This class writes XML content to an existing ATS XML message file or creates a new
     XML file if a new message is being created. New messages are written to a file in the
-    'outbox' directory."""
+    'outbox' directory.
+
+    Message files are never written in place; the XML is written to a temporary file in the same
+    directory that is forced to the storage device and then takes the place of the message file, so a
+    message file always holds either the previous or the new content in full. A new message file is
+    created with a hard link to the temporary file so an existing file is never overwritten. Several
+    messages can be written with a single commit cycle using a WriteBatch."""
+
+    TEMPORARY_PREFIX: str = ".message-"
+    """The start of the name of a temporary file holding a message being written"""
+
+    TEMPORARY_SUFFIX: str = ".tmp"
+    """The end of the name of a temporary file holding a message being written"""
+
+    name_counter: itertools.count = itertools.count(1)
+    """Numbers the message names formed by this process so that names formed at the same time differ"""
+
+    @staticmethod
+    def show_error(title, message):
+        # type: (str, str) -> None
+        """This method displays an error message box; Tkinter is imported when a message box is shown, so
+        that the methods writing received messages can be used on a headless server without Tkinter.
+
+        :param title: The title of the message box;
+        :param message: The error message;
+        :return: None
+        """
+        from tkinter import messagebox
+        messagebox.showerror(title=title, message=message)
 
     @staticmethod
     def update_existing_message(message_file_path, text_to_write):
@@ -23,25 +51,26 @@ class WriteXml:
         """
         # Check if the file exists
         if not os.path.exists(message_file_path):
-            messagebox.showerror(
+            WriteXml.show_error(
                 title="Write Message Error - 1",
                 message="The Message File located in does not exist..." + os.linesep +
                         message_file_path + os.linesep +
                         "Cannot write and save the message update")
             return
 
-        # Open the file containing the message being displayed/edited
-        file_handle = os.open(message_file_path, os.O_RDWR | os.O_TRUNC)
-
-        # Write the updated xml string
-        os.write(file_handle, text_to_write.encode())
-
-        # Close the file
-        os.close(file_handle)
+        # Replace the file containing the message being displayed/edited
+        try:
+            WriteXml.write_file(message_file_path, text_to_write, False)
+        except OSError as e:
+            WriteXml.show_error(
+                title="Write Message Error - 2",
+                message="The Message File located in could not be written..." + os.linesep +
+                        message_file_path + os.linesep + str(e) + os.linesep +
+                        "The message file has not been changed")
 
     @staticmethod
     def write_new_message(text_to_write, working_directory_path):
-        # type: (str, str) -> None
+        # type: (str, str) -> str | None
         """This method writes an ATS message to a new XML message file, i.e. a new file is being
         created. The text being written must be in the application XML file format as obtained from
         parsing a message. The message parser creates a FlightPLanRecord instance; this class contains a
@@ -49,18 +78,254 @@ class WriteXml:
 
         :param working_directory_path: An absolute path to the message XML file being created;
         :param text_to_write: The text to write to the XML file;
-        :return: None
+        :return: The path of the file written, None if the file could not be written;
         """
         # Put together a complete file path for the new file
         file_path = \
-            working_directory_path + os.sep + "Outbox" + os.sep + "message-" + \
-            datetime.now().strftime('%Y%m%d-%H:%M:%s') + ".xml"
+            working_directory_path + os.sep + "Outbox" + os.sep + "message-" + WriteXml.get_unique_name() + ".xml"
+
+        # Create the new file
+        try:
+            return WriteXml.write_file(file_path, text_to_write, True)
+        except OSError as e:
+            WriteXml.show_error(
+                title="Write Message Error - 3",
+                message="The Message File could not be created..." + os.linesep +
+                        file_path + os.linesep + str(e) + os.linesep +
+                        "Cannot save the new message")
+            return None
+
+    @staticmethod
+    def write_received_message(text_to_write, working_directory_path, priority_indicator, message_name, batch=None):
+        # type: (str, str, str, str, WriteBatch | None) -> str
+        """This method writes an ATS message received on the AFTN network interface to a new XML message
+        file in the 'Inbox' directory, or its subdirectory for the messages priority indicator if the
+        priority indicator is known. The text being written must be in the application XML file format
+        as obtained from parsing a message.
+
+        This method does not display any dialogues and can be called on any thread; errors are raised
+        as an OSError, including an existing file with the same name. If a batch is given the file is
+        only created when the batch is committed.
+
+        :param text_to_write: The text to write to the XML file;
+        :param working_directory_path: An absolute path to the applications working directory;
+        :param priority_indicator: The priority indicator of the message, (e.g. 'FF'), an empty string if
+               the priority indicator is not known;
+        :param message_name: A name unique to the message from which the file name is formed;
+        :param batch: The batch the message is added to, None to write the message file now;
+        :return: The path of the file written, or to be written when the batch is committed;
+        """
+        directory_path = working_directory_path + os.sep + "Inbox"
+        if priority_indicator in ["DD", "FF", "GG", "KK", "SS"]:
+            directory_path = directory_path + os.sep + priority_indicator
+        file_path = directory_path + os.sep + "message-" + message_name + ".xml"
+
+        # Create the file, failing rather than overwriting an existing file
+        if batch is not None:
+            batch.add(file_path, text_to_write, True)
+            return file_path
+        return WriteXml.write_file(file_path, text_to_write, True)
+
+    @staticmethod
+    def get_unique_name():
+        # type: () -> str
+        """This method forms a name for a new message file from the current time, the process ID and a
+        counter, so names formed at the same time by this or another process differ.
+
+        :return: A name from which a message file name can be formed;
+        """
+        return datetime.now().strftime('%Y%m%d-%H%M%S-%f') + "-" + str(os.getpid()) + "-" + \
+            str(next(WriteXml.name_counter))
+
+    @staticmethod
+    def write_file(file_path, text_to_write, exclusive):
+        # type: (str, str, bool) -> str
+        """This method writes a file atomically and durably; the text is written to a temporary file
+        that is forced to the storage device before it takes the place of the file, the directory is
+        then forced to the storage device so the change of name survives a crash.
+
+        :param file_path: The path of the file to write;
+        :param text_to_write: The text to write to the file;
+        :param exclusive: True to fail if the file exists, False to replace an existing file;
+        :return: The path of the file written;
+        :raises OSError: If the file cannot be written, the file is then unchanged;
+        """
+        WriteXml.commit_file(WriteXml.write_temporary_file(file_path, text_to_write, True), file_path, exclusive)
+        WriteXml.sync_directory(os.path.dirname(file_path))
+        return file_path
+
+    @staticmethod
+    def write_temporary_file(file_path, text_to_write, sync):
+        # type: (str, str, bool) -> str
+        """This method writes text to a new temporary file in the directory of a file.
+
+        :param file_path: The path of the file the temporary file will take the place of;
+        :param text_to_write: The text to write to the temporary file;
+        :param sync: True to force the temporary file to the storage device;
+        :return: The path of the temporary file;
+        :raises OSError: If the temporary file cannot be written, it is then removed;
+        """
+        temporary_path = os.path.join(os.path.dirname(file_path), WriteXml.TEMPORARY_PREFIX +
+                                      WriteXml.get_unique_name() + WriteXml.TEMPORARY_SUFFIX)
+        file_handle = os.open(temporary_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        try:
+            with open(file_handle, "w", encoding="utf-8") as temporary_file:
+                temporary_file.write(text_to_write)
+                if sync:
+                    temporary_file.flush()
+                    os.fsync(temporary_file.fileno())
+        except OSError:
+            WriteXml.remove_temporary_file(temporary_path)
+            raise
+        return temporary_path
+
+    @staticmethod
+    def commit_file(temporary_path, file_path, exclusive):
+        # type: (str, str, bool) -> None
+        """This method gives a temporary file the name of the file it is written for, the temporary file
+        is removed whether this succeeds or not.
+
+        :param temporary_path: The path of the temporary file;
+        :param file_path: The path of the file;
+        :param exclusive: True to fail if the file exists, False to replace an existing file;
+        :return: None
+        :raises OSError: If the file cannot be given its name, (e.g. FileExistsError);
+        """
+        try:
+            if exclusive:
+                os.link(temporary_path, file_path)
+            else:
+                os.replace(temporary_path, file_path)
+        finally:
+            WriteXml.remove_temporary_file(temporary_path)
+
+    @staticmethod
+    def remove_temporary_file(temporary_path):
+        # type: (str) -> None
+        """This method removes a temporary file if it still exists.
+
+        :param temporary_path: The path of the temporary file;
+        :return: None
+        """
+        try:
+            os.remove(temporary_path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def sync_directory(directory_path):
+        # type: (str) -> None
+        """This method forces the names in a directory to the storage device; directories cannot be
+        synchronised on Windows, where this method does nothing.
+
+        :param directory_path: The path of the directory;
+        :return: None
+        :raises OSError: If the directory cannot be synchronised;
+        """
+        if os.name != "posix":
+            return
+        directory_handle = os.open(directory_path, os.O_RDONLY)
+        try:
+            os.fsync(directory_handle)
+        finally:
+            os.close(directory_handle)
+
+    @staticmethod
+    def is_temporary_file(path):
+        # type: (str) -> bool
+        """This method checks if a path is a temporary file holding a message being written.
+
+        :param path: A file path;
+        :return: True if the path is a temporary file, False otherwise;
+        """
+        name = os.path.basename(path)
+        return name.startswith(WriteXml.TEMPORARY_PREFIX) and name.endswith(WriteXml.TEMPORARY_SUFFIX)
+
+
+class WriteBatch:
+    """This class writes a number of message files with a single commit cycle, (a group commit). The
+    messages are written to temporary files as they are added to the batch; when the batch is committed
+    all the temporary files are forced to the storage device, then given the names of the message files
+    and finally each directory is forced to the storage device once. Writing a burst of messages in a
+    batch keeps each message file complete and durable while the number of directory synchronisations
+    no longer grows with the number of messages.
 
-        # Open the file containing the message being displayed/edited
-        file_handle = os.open(file_path, os.O_CREAT | os.O_RDWR | os.O_TRUNC)
+    The message files appear when the batch is committed, in the order the messages were added. This
+    class is not thread safe."""
 
-        # Write the updated xml string
-        os.write(file_handle, text_to_write.encode())
+    pending: [(str, str, bool)] = []
+    """The messages added and not yet committed, each a tuple containing the path of the temporary file,
+    the path of the message file and True if the message file must not already exist"""
 
-        # Close the file
-        os.close(file_handle)
+    committed: [str] = []
+    """The paths of the message files created or replaced by the last commit"""
+
+    def __init__(self):
+        # type: () -> None
+        """Creates an empty batch."""
+        self.pending = []
+        self.committed = []
+
+    def add(self, file_path, text_to_write, exclusive):
+        # type: (str, str, bool) -> None
+        """Adds a message file to the batch.
+
+        :param file_path: The path of the message file;
+        :param text_to_write: The text to write to the message file;
+        :param exclusive: True to fail if the file exists, False to replace an existing file;
+        :return: None
+        :raises OSError: If the message cannot be written to a temporary file;
+        """
+        self.pending.append((WriteXml.write_temporary_file(file_path, text_to_write, False), file_path, exclusive))
+
+    def commit(self):
+        # type: () -> [str]
+        """Forces the messages added to the storage device and gives them the names of their message
+        files. If a message file cannot be given its name the messages after it are discarded and the
+        error is raised; the message files committed before the error are available from
+        'get_committed()'.
+
+        :return: The paths of the message files committed, in the order they were added;
+        :raises OSError: If the messages cannot be committed;
+        """
+        self.committed = []
+        try:
+            for temporary_path, _, _ in self.pending:
+                with open(temporary_path, "rb") as temporary_file:
+                    os.fsync(temporary_file.fileno())
+            while len(self.pending) > 0:
+                temporary_path, file_path, exclusive = self.pending[0]
+                self.pending.pop(0)
+                WriteXml.commit_file(temporary_path, file_path, exclusive)
+                self.committed.append(file_path)
+        finally:
+            self.abort()
+            for directory_path in sorted(set(os.path.dirname(file_path) for file_path in self.committed)):
+                WriteXml.sync_directory(directory_path)
+        return self.committed
+
+    def abort(self):
+        # type: () -> None
+        """Discards the messages added and not yet committed.
+
+        :return: None
+        """
+        for temporary_path, _, _ in self.pending:
+            WriteXml.remove_temporary_file(temporary_path)
+        self.pending = []
+
+    def get_pending_count(self):
+        # type: () -> int
+        """Gets the number of messages added and not yet committed.
+
+        :return: The number of messages waiting to be committed;
+        """
+        return len(self.pending)
+
+    def get_committed(self):
+        # type: () -> [str]
+        """Gets the paths of the message files created or replaced by the last commit.
+
+        :return: The paths of the message files committed, in the order they were added;
+        """
+        return self.committed
@@ -0,0 +1,57 @@
+from Configuration.EnumerationConstants import FieldIdentifiers, SubFieldIdentifiers
+
+
+class CompoundFieldKeywords:
+    """This class describes the keywords that identify the subfields of the compound fields 18, 19 and 22.
+
+    The compound fields contain 'n' occurrences of named subfields, (e.g. 'RMK/' in field 18, 'R/' in
+    field 19 or '9/' in field 22). The keywords are derived from the names of the SubFieldIdentifiers
+    enumeration values for each compound field; e.g. SubFieldIdentifiers.F18rmk has the keyword 'RMK'.
+
+    The keywords are stored in a dictionary for each compound field; the key is the keyword as it
+    appears in a message and the value is the SubFieldIdentifiers enumeration value for the subfield.
+    The dictionaries are built once when this class is instantiated so that checking a keyword while
+    parsing a message is a single dictionary lookup."""
+
+    field_keywords = {}
+    """A dictionary containing a dictionary of the subfield keywords for each compound field,
+    the key is an enumeration value from the FieldIdentifiers class"""
+
+    def __init__(self):
+        # type: () -> None
+        self.field_keywords = {
+            FieldIdentifiers.F18: {},
+            FieldIdentifiers.F19: {},
+            FieldIdentifiers.F22: {},
+        }
+        # The first matching enumeration value is used if more than one has the same keyword
+        for keyword in SubFieldIdentifiers:
+            if SubFieldIdentifiers.F17c < keyword < SubFieldIdentifiers.F19a:
+                self.field_keywords[FieldIdentifiers.F18].setdefault(keyword.name[3:].upper(), keyword)
+            elif SubFieldIdentifiers.F18typ < keyword < SubFieldIdentifiers.F20a:
+                if 0 < len(keyword.name[3:]) < 2:
+                    self.field_keywords[FieldIdentifiers.F19].setdefault(keyword.name[3:].upper(), keyword)
+            elif SubFieldIdentifiers.F21f < keyword < SubFieldIdentifiers.F80a:
+                if len(keyword.name[5:]) < 3:
+                    self.field_keywords[FieldIdentifiers.F22].setdefault(keyword.name[5:].upper(), keyword)
+
+    def get_keywords(self, field_id):
+        # type: (FieldIdentifiers) -> {str: SubFieldIdentifiers}
+        """This method returns the subfield keywords for a compound field.
+
+        :param field_id: An enumeration value from the FieldIdentifiers class, F18, F19 or F22;
+        :return: A dictionary of SubFieldIdentifiers enumeration values indexed by keyword, an empty
+                 dictionary if the field is not a compound field;
+        """
+        return self.field_keywords.get(field_id, {})
+
+    def get_subfield_id(self, field_id, candidate_keyword):
+        # type: (FieldIdentifiers, str) -> SubFieldIdentifiers
+        """This method returns the subfield identifier for a keyword in a compound field.
+
+        :param field_id: An enumeration value from the FieldIdentifiers class, F18, F19 or F22;
+        :param candidate_keyword: The keyword being looked up, (e.g. 'RMK');
+        :return: The SubFieldIdentifiers enumeration value for the keyword or SubFieldIdentifiers.ANYTHING
+                 if the keyword is not a subfield of the field;
+        """
+        return self.get_keywords(field_id).get(candidate_keyword, SubFieldIdentifiers.ANYTHING)
@@ -99,6 +99,7 @@ class FieldIdentifiers(IntEnum):
     ORIGINATOR = auto()
     ADDRESS = auto()
     ADADDRESS = auto()
+    TRANSMISSION_ID = auto()
     F3 = auto()
     F5 = auto()
     F7 = auto()
@@ -152,6 +153,8 @@ class SubFieldIdentifiers(IntEnum):
     ADADDRESS6 = auto()
     ADADDRESS7 = auto()
     ADADDRESS8 = auto()
+    TRANSMISSION_ID_CHANNEL = auto()
+    TRANSMISSION_ID_SEQUENCE = auto()
     F3a = auto()
     F3b1 = auto()
     F3b2 = auto()
@@ -319,6 +322,16 @@ class AdjacentUnits(IntEnum):
         return AdjacentUnits.DEFAULT
 
 
+class SequenceStatus(IntEnum):
+    """Enumeration returned by the AFTN channel sequence tracker for each transmission identification
+    received; indicates how the channel sequence number relates to the numbers already received."""
+    FIRST = 0
+    IN_ORDER = auto()
+    GAP = auto()
+    LATE = auto()
+    DUPLICATE = auto()
+
+
 class ErrorId(IntEnum):
     """Enumeration used to index error messages used by the system. The error text is defined
     in the ErrorMessages class using a dictionary, the enumerations in this class are used as keys
@@ -365,6 +378,12 @@ class ErrorId(IntEnum):
     AD_ADDRESSEE_SYNTAX = auto()
     AD_ADDRESSEE_TOO_MANY_FIELDS = auto()
 
+    # Errors relating to the header field Transmission Identification
+    TRANSMISSION_ID_MISSING = auto()
+    TRANSMISSION_ID_CHANNEL_SYNTAX = auto()
+    TRANSMISSION_ID_SEQUENCE_SYNTAX = auto()
+    TRANSMISSION_ID_TOO_MANY_FIELDS = auto()
+
     # Errors relating to Field 3
     F3_TITLE_MISSING = auto()
     F3_TITLE_SYNTAX = auto()
@@ -60,6 +60,14 @@ class ErrorMessages:
                                          "of '!'",
             ErrorId.AD_ADDRESSEE_TOO_MANY_FIELDS: "Remove the extra field(s) '!' in the additional addressee field",
 
+            # Errors relating to the header field Transmission Identification
+            ErrorId.TRANSMISSION_ID_MISSING: "The transmission identification is missing, expecting a 3 letter "
+                                             "channel designator followed by a 3 digit sequence number",
+            ErrorId.TRANSMISSION_ID_CHANNEL_SYNTAX: "Expecting a 3 letter channel designator instead of '!'",
+            ErrorId.TRANSMISSION_ID_SEQUENCE_SYNTAX: "Expecting a 3 digit channel sequence number instead of '!'",
+            ErrorId.TRANSMISSION_ID_TOO_MANY_FIELDS: "Remove the extra field(s) '!' in the transmission "
+                                                     "identification",
+
             # Errors relating to Field 3
             ErrorId.F3_TITLE_MISSING: "No ATS message title identified in this message",
             ErrorId.F3_TITLE_SYNTAX: "Message title '!' unrecognized, cannot process this message",
@@ -138,6 +138,10 @@ class SubFieldDescriptions:
         #   Indicates if a field is compulsory, (True indicates it is))
         self.subfield_description = {
             # Message header subfields
+            SubFieldIdentifiers.TRANSMISSION_ID_CHANNEL: SubFieldDescription(
+                SubFieldIdentifiers.TRANSMISSION_ID_CHANNEL, 3, 3, "[A-Z]{3}", True),
+            SubFieldIdentifiers.TRANSMISSION_ID_SEQUENCE: SubFieldDescription(
+                SubFieldIdentifiers.TRANSMISSION_ID_SEQUENCE, 3, 3, "[0-9]{3}", True),
             SubFieldIdentifiers.PRIORITY_INDICATOR: SubFieldDescription(
                 SubFieldIdentifiers.PRIORITY_INDICATOR, 2, 2, self.priority, True),
             SubFieldIdentifiers.FILING_TIME: SubFieldDescription(
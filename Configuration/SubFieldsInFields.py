@@ -26,6 +26,13 @@ class SubFieldsInFields:
         # type: () -> None
         self.field_content_description = {
             # Message Header fields
+            FieldIdentifiers.TRANSMISSION_ID: [[SubFieldIdentifiers.TRANSMISSION_ID_CHANNEL,
+                                                SubFieldIdentifiers.TRANSMISSION_ID_SEQUENCE],
+                                               [ErrorId.TRANSMISSION_ID_CHANNEL_SYNTAX,
+                                                ErrorId.TRANSMISSION_ID_SEQUENCE_SYNTAX,
+                                                ErrorId.TRANSMISSION_ID_TOO_MANY_FIELDS,
+                                                ErrorId.FLD_MORE_SUBFIELDS_EXPECTED,
+                                                ErrorId.TRANSMISSION_ID_MISSING]],
             FieldIdentifiers.PRIORITY_INDICATOR: [[SubFieldIdentifiers.PRIORITY_INDICATOR],
                                                   [ErrorId.PRIORITY_SYNTAX, ErrorId.PRIORITY_TOO_MANY_FIELDS,
                                                    ErrorId.FLD_MORE_SUBFIELDS_EXPECTED, ErrorId.PRIORITY_MISSING]],
@@ -15,67 +15,73 @@ class ExtractedRouteRecord:
     The class members store comprehensive information that together represent a comprehensive
     data set for subsequent route processing."""
 
-    string: str = ""
+    __slots__ = ("string", "start_index", "end_index", "base_type", "sub_type", "altitude", "altitude_si",
+                 "speed", "speed_si", "break_text", "flight_rules", "error_text", "stay_time", "altitude_cruise_to",
+                 "altitude_cruise_to_si", "latitude", "longitude", "bearing", "distance", "lat_long_valid")
+    """The members are stored in slots rather than a dictionary per instance, a route has a record for every
+    element and large numbers of parsed messages may be held in memory"""
+
+    string: str
     """A string representing a route element such as a point, route, STAR, SID etc."""
 
-    start_index: int = 0
+    start_index: int
     """The start index of a route element's location into the original field 15 source text"""
 
-    end_index: int = 0
+    end_index: int
     """The end index of a route element's location into the original field 15 source text"""
 
-    base_type: TokenBaseType = 0
+    base_type: TokenBaseType
     """Contains one of the element base type definitions (Point, Connector, Modifier
     etc.) as defined in the 'F15TokenSyntaxDescriptions.TokenBaseType' class."""
 
-    sub_type: TokenSubType = 0
+    sub_type: TokenSubType
     """Contains one of the element subtype definitions (TASRFL, MACHVFR, Point,
     Aerodrome etc.) as defined in the 'F15TokenSyntaxDescriptions.TokenSubType' class."""
 
-    altitude: str = ""
+    altitude: str
     """The altitude as extracted from a field 15 altitude element"""
 
-    altitude_si: float = 0.0
+    altitude_si: float
     """The altitude converted into SI units in meters"""
 
-    speed: str = ""
+    speed: str
     """The speed as extracted from a field 15 altitude element"""
 
-    speed_si: float = 0.0
+    speed_si: float
     """The speed converted into SI units in meters / second"""
 
-    break_text: str = ""
+    break_text: str
     """Free text as entered after the VFR element or other break elements
     defined by EURO-CONTROL IFPS"""
 
-    flight_rules: str = ""
+    flight_rules: str
     """Flight rules at given route elements"""
 
-    error_text: str = ""
+    error_text: str
     """Error reported for this token / record (if an error is reported)"""
 
-    stay_time: int = 0
+    stay_time: int
     """Stay time in minutes assigned at a point record"""
 
-    altitude_cruise_to: str = ""
+    altitude_cruise_to: str
     """Target altitude to cruise to for a cruise climb element"""
 
-    altitude_cruise_to_si: float = 0.0
+    altitude_cruise_to_si: float
     """Target altitude in SI units to cruise to for a cruise climb element"""
 
-    latitude: float = 0.0
+    latitude: float
     """Point latitude as a decimal degree"""
 
-    longitude: float = 0.0
+    longitude: float
     """Point longitude as a decimal degree"""
 
-    bearing: float = 0.0
+    bearing: float
     """Bearing in decimal degrees between two ERS point records"""
 
-    distance: float = 0.0
+    distance: float
     """Distance in meters between two ERS points"""
 
-    lat_long_valid: bool = False
+    lat_long_valid: bool
     """Indicates if a latitude and longitude are available for a point"""
 
     def __init__(self, string="", start_index=0, end_index=0, base_type=0, sub_type=0):
@@ -95,6 +101,21 @@ class ExtractedRouteRecord:
         self.end_index = end_index
         self.base_type = base_type
         self.sub_type = sub_type
+        self.altitude = ""
+        self.altitude_si = 0.0
+        self.speed = ""
+        self.speed_si = 0.0
+        self.break_text = ""
+        self.flight_rules = ""
+        self.error_text = ""
+        self.stay_time = 0
+        self.altitude_cruise_to = ""
+        self.altitude_cruise_to_si = 0.0
+        self.latitude = 0.0
+        self.longitude = 0.0
+        self.bearing = 0.0
+        self.distance = 0.0
+        self.lat_long_valid = False
 
     #
     def append_break_text(self, break_text):
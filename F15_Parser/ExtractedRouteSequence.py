@@ -1,3 +1,5 @@
+import copy
+import io
 import os
 
 from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
@@ -82,31 +84,25 @@ class ExtractedRouteSequence:
         """This method generates an XML string containing a complete ERS
         :return: A string in XML format;
         """
-
-        # Generate the XML for all ERS records
-        xml_string = "   <ers>" + os.linesep
-
-        # Add the derived rules
-        xml_string = xml_string + "      <derived_flight_rules>" + \
-                                  self.get_derived_flight_rules() + \
-                                  "</derived_flight_rules>" + os.linesep
-        if len(self.get_all_elements()) == 0:
-            xml_string = xml_string + "   </ers>"
-            return xml_string
-
-        for item in self.get_all_elements():
-            xml_string = xml_string + "   " + item.as_xml(False) + os.linesep
-
-        # If there are errors, add these as XML output
-        if self.get_number_of_errors() > 0:
-            xml_string = xml_string + "   <ers_errors>" + os.linesep
-            for item in self.get_all_errors():
-                xml_string = xml_string + "      " + item.as_xml(True) + "" + os.linesep
-            xml_string = xml_string + "   </ers_errors>" + os.linesep
-
-        xml_string = xml_string + "   </ers>"
-
-        return xml_string
+        xml_buffer = io.StringIO()
+        self.write_to(xml_buffer)
+        return xml_buffer.getvalue()
+
+    def copy(self, offset=0):
+        # type: (int) -> ExtractedRouteSequence
+        """Creates a copy of this extracted route sequence, the records are copied so that the copy can be
+        modified without changing this extracted route sequence.
+
+        :param offset: The number of characters added to the start and end index of every record;
+        :return: A new instance of ExtractedRouteSequence containing copies of the records;"""
+        ers = ExtractedRouteSequence()
+        ers.extracted_route_records = [copy.copy(record) for record in self.extracted_route_records]
+        ers.error_records = [copy.copy(record) for record in self.error_records]
+        ers.derived_flight_rules = self.derived_flight_rules
+        for record in ers.extracted_route_records + ers.error_records:
+            record.set_start_index(record.get_start_index() + offset)
+            record.set_end_index(record.get_end_index() + offset)
+        return ers
 
     def create_append_element(self, element_text, element_start_index, element_end_index,
                               element_base_type, element_sub_type):
@@ -199,6 +195,37 @@ class ExtractedRouteSequence:
                  instance of ExtractedRouteRecord;"""
         return self.get_element_at(self.get_number_of_elements() - 2)
 
+    def write_to(self, fp):
+        # type: (TextIO) -> None
+        """This method writes the XML for a complete ERS to a file like object, the output is identical to
+        the string returned by 'as_xml()'. The XML is written piecemeal, no intermediate string is built.
+
+        :param fp: A file like object with a 'write()' method accepting strings, e.g. an open text file
+                   or an io.StringIO;
+        :return: None
+        """
+        # Generate the XML for all ERS records
+        fp.write("   <ers>" + os.linesep)
+
+        # Add the derived rules
+        fp.write("      <derived_flight_rules>" + self.get_derived_flight_rules() +
+                 "</derived_flight_rules>" + os.linesep)
+        if len(self.get_all_elements()) == 0:
+            fp.write("   </ers>")
+            return
+
+        for item in self.get_all_elements():
+            fp.write("   " + item.as_xml(False) + os.linesep)
+
+        # If there are errors, add these as XML output
+        if self.get_number_of_errors() > 0:
+            fp.write("   <ers_errors>" + os.linesep)
+            for item in self.get_all_errors():
+                fp.write("      " + item.as_xml(True) + os.linesep)
+            fp.write("   </ers_errors>" + os.linesep)
+
+        fp.write("   </ers>")
+
     def set_derived_flight_rules(self, derived_flight_rules):
         # type: (str) -> None
         """Set the flight rules derived from F15 parsing;
@@ -36,7 +36,14 @@ class ParseF15:
     their associated point. A complete Extracted Route Sequence always starts and ends
     with the ADEP and ADES respectively, both are 'points'. The ERS contains all
     intermediate points connected with one of the connector types if specified in
-    ICAO field 15."""
+    ICAO field 15.
+
+    The parser is a state machine driven by 'run_state_machine()'. Each state is a
+    method taking the ERS, the tokens and the token to be processed; a state returns
+    the next state as a (method, token) tuple or None when it has nothing more to do.
+    A state that has to carry on once the states following it have finished pushes
+    its continuation onto the continuation stack. The Python call stack therefore
+    stays flat regardless of the number of elements in field 15."""
 
     DEFAULT_ALTITUDE = "F050"
     """The default speed used to assign a speed when a speed is not given, e.g. such as when a 
@@ -49,6 +56,13 @@ class ParseF15:
         - "O": "OAT" - Used to indicated Operational Air Traffic (OAT) section of a flight plan;
         - "S": "IFPS" - Used to indicate a 'break' in the IFR routing as determined by EUROCONTROL"""
 
+    F15TSD: F15TokenSyntaxDefinition = F15TokenSyntaxDefinition()
+    """The field 15 token syntax definitions, created once and shared by all parser instances"""
+
+    continuations: [] = None
+    """A stack of parser states, (method, token) tuples, that are resumed once the state machine
+    runs out of states to process; created for each field 15 being parsed by 'parse_f15()'."""
+
     def parse_f15(self, ers, tokens):
         # type: (ExtractedRouteSequence, Tokens) -> bool
         """Entry point for the field 15 parser. Field 15 must start with one of two
@@ -78,6 +92,7 @@ class ParseF15:
         # Loop over all the tokens and assign a tokens base and subtype; this identifies a token and is used
         # by the parser to ensure correct grammar and semantics.
         self.assign_syntax_descriptions(tokens)
+        self.continuations = []
 
         # Get the first field 15 token
         token = tokens.get_first_token()
@@ -91,16 +106,16 @@ class ParseF15:
         base_type = token.get_token_base_type()
         match base_type:
             case TokenBaseType.F15_SPEED_VFR:
-                self.assign_speed_vfr(ers, tokens, token)
+                self.run_state_machine(ers, tokens, (self.assign_speed_vfr, token))
                 ers.get_first_element().set_flight_rules(self.RULES["V"])
             case TokenBaseType.F15_SPEED_ALTITUDE:
-                self.assign_speed_altitude(ers, tokens, token)
+                self.run_state_machine(ers, tokens, (self.assign_speed_altitude, token))
                 if tokens.get_number_of_tokens() == 1:
                     # Only one token means field 15 has no further route description
-                    self.add_error_and_re_sync(ers, tokens, token, 49)
+                    self.run_state_machine(ers, tokens, self.add_error_and_re_sync(ers, tokens, token, 49))
             case _:
                 # Error, field 15 must start with a 'Speed/altitude' or 'Speed VFR' token
-                self.add_error_and_re_sync(ers, tokens, token, 1)
+                self.run_state_machine(ers, tokens, self.add_error_and_re_sync(ers, tokens, token, 1))
 
         # Add a dummy ADES
         ades = ers.add_dummy_ades()
@@ -128,10 +143,10 @@ class ParseF15:
         return ers.get_number_of_errors() == 0
 
     def add_error_and_re_sync(self, ers, tokens, token, error_number):
-        # type: (ExtractedRouteSequence, Tokens, Token, int) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token, int) -> tuple
         """This method adds an error record to the ERS that contains a field 15 element
         deemed erroneous by the parser. The parser continues to try and parse the
-        remainder of field 15 by calling ExtractedRouteRecord.re_sync_after_error().
+        remainder of field 15 in the state 're_sync_parser_after_error()'.
 
         :param ers: An instance of ExtractedRouteSequence class into which the erroneous token is being stored;
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
@@ -139,10 +154,10 @@ class ParseF15:
         :param token: The erroneous token;
         :param error_number: An integer value representing an index to an error message
                defined in the ErrorMessageDefinitions class.
-        :return: None
+        :return: The parser state 're_sync_parser_after_error()';
         """
         self.add_error_no_re_sync(ers, token, error_number)
-        self.re_sync_parser_after_error(ers, tokens)
+        return self.re_sync_parser_after_error, None
 
     @staticmethod
     def add_error_no_re_sync(ers, token, error_number):
@@ -452,7 +467,7 @@ class ParseF15:
         ex_route_rec.set_speed_si(int(speed + 0.5))
 
     def assign_speed_altitude(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes a speed / altitude element, (e.g. N0450F350). A speed / altitude element
         is always preceded by a point, hence the speed and altitude are applied to the preceding point
         which is the last ERS record.
@@ -466,7 +481,7 @@ class ParseF15:
                This structure contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: The speed / altitude token from which the speed and altitude will
                be extracted from;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         ex_route_rec = ers.get_last_element()
         if ex_route_rec is None:
@@ -501,14 +516,14 @@ class ParseF15:
         # element. Otherwise, we are processing an element after a SPEED / LEVEL
         # somewhere else in field 15.
         if ers.get_number_of_elements() == 1:
-            self.post_adep(ers, tokens, next_token)
+            return self.post_adep, next_token
         else:
             # Go to post point processing as a rule change to IFR is terminated
             # with a point
-            self.post_point(ers, tokens, next_token)
+            return self.post_point, next_token
 
     def assign_speed_altitude_altitude(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes the speed / altitude / altitude part of a cruise climb element.
         A speed / altitude / altitude element is always preceded by a point, hence the speed and altitude
         are applied to the preceding point which is the last ERS record.
@@ -520,7 +535,7 @@ class ParseF15:
                input to this parser.
         :param token: The speed / altitude token from which the speed and altitude will
                be extracted from;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         ex_route_rec = ers.get_last_element()
         if ex_route_rec is None:
@@ -576,10 +591,10 @@ class ParseF15:
         if next_token is None:
             return
 
-        self.post_point(ers, tokens, next_token)
+        return self.post_point, next_token
 
     def assign_speed_altitude_plus(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes the speed / altitude / plus part of a cruise climb element.
         A speed / altitude / plus element is always preceded by a point, hence the speed and altitude
         are applied to the preceding point which is the last ERS record.
@@ -591,7 +606,7 @@ class ParseF15:
                input to this parser.
         :param token: The speed / altitude token from which the speed and altitude will
                be extracted from;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         ex_route_rec = ers.get_last_element()
         if ex_route_rec is None:
@@ -629,10 +644,10 @@ class ParseF15:
         if next_token is None:
             return
 
-        self.post_point(ers, tokens, next_token)
+        return self.post_point, next_token
 
     def assign_speed_vfr(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method precess a speed / VFR element. The element preceding a SPEED/VFR token must be
         a point, hence we have to set the speed at the previous point and assign VFR rules at a new
         ERS record to store the rule change VFR record.
@@ -642,7 +657,7 @@ class ParseF15:
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: The speed / VFR token from which the speed will be extracted from;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         # Get the last ERS record which will be a point at which the VFR
         # rule change is taking place.
@@ -681,10 +696,10 @@ class ParseF15:
         token = tokens.get_next_token()
         if token is None:
             return
-        self.break_text_save(ers, tokens, token)
+        return self.break_text_save, token
 
     def break_end(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method is processing a 'break' end token, one of 'IFR', 'GAT' or 'IFPSTART'. A 'break' is
         considered to be a break in IFR routing, i.e. a change from IFR to VFR and back to IFR has a 'break'
         between two IFR sections. Any tokens appearing between the end of the first IFR section and the
@@ -702,7 +717,7 @@ class ParseF15:
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: The 'break' end token, ('IFR', 'GAT' or 'IFPSTART' token indicating the end of 'break';
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         # Get what should be a point following the IFR, GAT or IFPSTART element
         rule_change_point = tokens.peek_next_token(1)
@@ -721,8 +736,7 @@ class ParseF15:
             slash_token = tokens.peek_next_token(2)
             if slash_token is None:
                 # End of field 15, no further processing, rule change incomplete
-                self.add_error_and_re_sync(ers, tokens, rule_change_point, 22)
-                return
+                return self.add_error_and_re_sync(ers, tokens, rule_change_point, 22)
             if slash_token.get_token_base_type() != TokenBaseType.F15_SLASH:
                 # Not a slash, we can assume no rule change is taking place.
                 # We can bale out of rule change processing
@@ -732,32 +746,43 @@ class ParseF15:
             speed_level_token = tokens.peek_next_token(3)
             if speed_level_token is None:
                 # End of field 15, no further processing, rule change incomplete
-                self.add_error_and_re_sync(ers, tokens, rule_change_point, 22)
-                return
+                return self.add_error_and_re_sync(ers, tokens, rule_change_point, 22)
             if speed_level_token.get_token_base_type() != TokenBaseType.F15_SPEED_ALTITUDE and \
                     speed_level_token.get_token_base_type() != TokenBaseType.F15_SPEED_VFR:
                 # Not a SPEED / LEVEL, we can assume no rule change is taking place
                 # We can bale out of rule change processing, the tokens 'peeked' in
                 # this method will be saved as break text by the calling function.
-                self.add_error_and_re_sync(ers, tokens, rule_change_point, 22)
-                return
+                return self.add_error_and_re_sync(ers, tokens, rule_change_point, 22)
 
             # All tokens indicating a rule change are present and correct,
-            # action the rule change.
+            # action the rule change and process the next point once done.
+            self.continuations.append((self.break_end_point, token))
             if speed_level_token.get_token_base_type() == TokenBaseType.F15_SPEED_ALTITUDE:
-                self.v_to_i_rule_change(ers, tokens)
-            elif speed_level_token.get_token_base_type() == TokenBaseType.F15_SPEED_VFR:
-                self.v_to_i_to_v_rule_change(ers, tokens)
+                return self.v_to_i_rule_change, None
+            return self.v_to_i_to_v_rule_change, None
 
         # If we arrive here we are dealing with a rule change from OAT to GAT or
         # IFPSTOP to IFPSTART, hence we can process the point as any other point.
+        return self.break_end_point(ers, tokens, token)
+
+    def break_end_point(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
+        """This method moves to the point following a 'break' end once the rule change has been processed
+        by break_end().
+
+        :param ers: An ExtractedRouteSequence class instance;
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
+               contains a tokenized form of all field 15 tokens used as input to this parser.
+        :param token: The 'break' end token, ('IFR', 'GAT' or 'IFPSTART');
+        :return: The next parser state or None if there are no more tokens;
+        """
         next_token = tokens.get_next_token()
         if next_token is None:
             return
-        self.point(ers, tokens, next_token)
+        return self.point, next_token
 
     def break_end_error(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method reports an error if the end of a 'break' section does not match a 'break' start token.
         A 'break' is considered to be a break in IFR routing, i.e. a change from IFR to VFR and back to IFR
         has a 'break' between two IFR sections. Break sections are indicated by start/end matching pairs VFR/IFR,
@@ -769,18 +794,18 @@ class ParseF15:
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: The 'break' end token, ('IFR', 'GAT' or 'IFPSTART') token indicating the start of
                'break' section;
-        :return:
+        :return: The next parser state or None if there are no more tokens;
         """
         subtype = token.get_token_sub_type()
         if subtype is TokenSubType.F15_SB_IFR:
-            self.add_error_and_re_sync(ers, tokens, token, 6)
+            return self.add_error_and_re_sync(ers, tokens, token, 6)
         elif subtype is TokenSubType.F15_SB_GAT:
-            self.add_error_and_re_sync(ers, tokens, token, 7)
+            return self.add_error_and_re_sync(ers, tokens, token, 7)
         elif subtype is TokenSubType.F15_SB_IFPSTART:
-            self.add_error_and_re_sync(ers, tokens, token, 8)
+            return self.add_error_and_re_sync(ers, tokens, token, 8)
 
     def break_start(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method is processing the elements 'OAT', IFPSTOP', or 'VFR' all of which indicate the
         start of non-IFR routing, a 'break' section. A 'break' is considered to be a break in IFR routing,
         i.e. a change from IFR to VFR and back to IFR has a 'break' between two IFR sections. The ERS last
@@ -796,7 +821,7 @@ class ParseF15:
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: The 'break' start token, ('VFR', 'OAT' or 'IFPSTOP' token indicating
                the start of 'break' section;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         self.add_record(ers, token)
         ex_route_rec = ers.get_last_element()
@@ -814,12 +839,12 @@ class ParseF15:
             return
         base_type = next_token.get_token_base_type()
         if base_type is TokenBaseType.F15_TOO_LONG:
-            self.add_error_and_re_sync(ers, tokens, next_token, 4)
+            return self.add_error_and_re_sync(ers, tokens, next_token, 4)
         else:
-            self.break_text_save(ers, tokens, next_token)
+            return self.break_text_save, next_token
 
     def break_text_save(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method loops over elements saving them as 'break' text; break text follows the 'break'
         start tokens VFR, OAT or IFPSTOP. A 'break' is considered to be a break in IFR routing, i.e. a
         change from IFR to VFR and back to IFR has a 'break' between two IFR sections.
@@ -832,12 +857,26 @@ class ParseF15:
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: The 'break' text token being saved to the 'break' start token;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         base_type = token.get_token_base_type()
         if base_type is TokenBaseType.F15_TOO_LONG:
-            self.add_error_and_re_sync(ers, tokens, token, 4)
+            # The token is still saved as break text once the parser has re-synchronised
+            self.continuations.append((self.break_text_append, token))
+            return self.add_error_and_re_sync(ers, tokens, token, 4)
+        return self.break_text_append(ers, tokens, token)
 
+    def break_text_append(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
+        """This method appends a token to the 'break' text of the last ERS record and determines if
+        the token is a possible 'break' end, see break_text_save().
+
+        :param ers: An ExtractedRouteSequence class instance containing a 'break' start token in the last ERS record.
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
+               contains a tokenized form of all field 15 tokens used as input to this parser.
+        :param token: The 'break' text token being saved to the 'break' start token;
+        :return: The next parser state or None if there are no more tokens;
+        """
         # Save the token as break text
         last_ers = ers.get_last_element()
         last_ers.append_break_text(token.get_token_string())
@@ -850,22 +889,37 @@ class ParseF15:
         # section (i.e. for VFR -> IFR, for OAT -> GAT or for IFPSTOP -> IFPSTART)
         # processing is handed off to check if a valid rule change is in fact occurring.
         # Also have to check that the break end matches the break start type before
-        # jumping out to try and end the break section
+        # jumping out to try and end the break section. Saving break text resumes once
+        # processing of the possible break end has finished.
         if sub_type is TokenSubType.F15_SB_IFR and cur_break_type is self.RULES["V"]:
             # Possible change to IFR from VFR
-            self.break_end(ers, tokens, token)
+            self.continuations.append((self.break_text_next, token))
+            return self.break_end, token
         elif sub_type is TokenSubType.F15_SB_GAT and cur_break_type is self.RULES["O"]:
             # Possible change to GAT from OAT
-            self.break_end(ers, tokens, token)
+            self.continuations.append((self.break_text_next, token))
+            return self.break_end, token
         elif sub_type is TokenSubType.F15_SB_IFPSTART and cur_break_type is self.RULES["S"]:
             # Possible change to IFPSTOP from IFPSTART
-            self.break_end(ers, tokens, token)
+            self.continuations.append((self.break_text_next, token))
+            return self.break_end, token
+
+        return self.break_text_next(ers, tokens, token)
 
-        # Recurse with the next token
+    def break_text_next(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
+        """This method moves on to save the token following a 'break' text token as 'break' text.
+
+        :param ers: An ExtractedRouteSequence class instance containing a 'break' start token in the last ERS record.
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
+               contains a tokenized form of all field 15 tokens used as input to this parser.
+        :param token: The 'break' text token last saved;
+        :return: The next parser state or None if there are no more tokens;
+        """
         next_token = tokens.get_next_token()
         if next_token is None:
             return
-        self.break_text_save(ers, tokens, next_token)
+        return self.break_text_save, next_token
 
     @staticmethod
     def carry_speed_altitude_rules_forward(ers):
@@ -887,7 +941,7 @@ class ParseF15:
         current_ex_route_rec.set_flight_rules(previous_ex_route_rec.get_flight_rules())
 
     def cruise_climb_c(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes the 'C' token that indicates a cruise climb element may be present. If the
         token following the 'C' is a '/' then we assume a cruise climb token has been located, in such a
         case, the 'C' is not stored in the ERS. If the token following 'C' is not a '/' then the 'C' is
@@ -897,7 +951,7 @@ class ParseF15:
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure contains
                a tokenized form of all field 15 tokens used as input to this parser.
         :param token: The 'break' text token being saved to the 'break' start token;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         next_token = tokens.get_next_token()
         if next_token is None:
@@ -907,7 +961,7 @@ class ParseF15:
         base_type = next_token.get_token_base_type()
         match base_type:
             case TokenBaseType.F15_UNKNOWN:
-                self.add_error_and_re_sync(ers, tokens, next_token, 3)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 3)
             case TokenBaseType.F15_SLASH:
                 # '/' found next, assume cruise climb
                 # Next token should be a point
@@ -917,62 +971,61 @@ class ParseF15:
                     # No further tokens, Store the 'C' as a point
                     self.add_record(ers, token)
                     # Report error, only have C/, should be more
-                    self.add_error_and_re_sync(ers, tokens, slash_token, 52)
-                    return
+                    return self.add_error_and_re_sync(ers, tokens, slash_token, 52)
                 # Process the cruise climb point
-                self.cruise_climb_point(ers, tokens, next_token)
+                return self.cruise_climb_point, next_token
             case TokenBaseType.F15_BREAK_START:
                 self.add_record(ers, token)
-                self.break_start(ers, tokens, next_token)
+                return self.break_start, next_token
             case TokenBaseType.F15_SPEED_VFR | TokenBaseType.F15_SPEED_ALTITUDE:
-                self.add_error_and_re_sync(ers, tokens, next_token, 5)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 5)
             case TokenBaseType.F15_BREAK_END:
-                self.break_end_error(ers, tokens, next_token)
+                return self.break_end_error, next_token
             case TokenBaseType.F15_DCT:
                 self.add_record(ers, token)
-                self.dct(ers, tokens, next_token)
+                return self.dct, next_token
             case TokenBaseType.F15_STAY:
                 self.add_record(ers, token)
-                self.stay(ers, tokens, next_token)
+                return self.stay, next_token
             case TokenBaseType.F15_TRUNCATE:
                 self.add_record(ers, token)
-                self.truncate(ers, tokens)
+                return self.truncate, None
             case TokenBaseType.F15_C:
                 self.add_record(ers, token)
-                self.cruise_climb_c(ers, tokens, next_token)
+                return self.cruise_climb_c, next_token
             case TokenBaseType.F15_POINT:
                 self.add_record(ers, token)
-                self.point(ers, tokens, next_token)
+                return self.point, next_token
             case TokenBaseType.F15_ROUTE:
                 self.add_record(ers, token)
-                self.route(ers, tokens, next_token)
+                return self.route, next_token
             case TokenBaseType.F15_SID_STAR:
                 self.add_record(ers, token)
-                self.sid_star(ers, tokens, next_token)
+                return self.sid_star, next_token
             case TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE | TokenBaseType.F15_SPEED_ALTITUDE_PLUS:
-                self.add_error_and_re_sync(ers, tokens, next_token, 9)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 9)
             case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, next_token, 4)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 4)
             case TokenBaseType.F15_STAY_TIME:
-                self.add_error_and_re_sync(ers, tokens, next_token, 10)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 10)
             case TokenBaseType.F15_SID:
                 self.add_record(ers, token)
-                self.sid(ers, tokens, next_token)
+                return self.sid, next_token
             case TokenBaseType.F15_STAR:
                 self.add_record(ers, token)
-                self.star(ers, tokens, next_token)
+                return self.star, next_token
             case _:
-                self.add_error_and_re_sync(ers, tokens, token, 0)
+                return self.add_error_and_re_sync(ers, tokens, token, 0)
 
     def cruise_climb_point(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes the point in a cruise/climb element.
 
         :param ers: An ExtractedRouteSequence class instance containing an IFR routing element in the last ERS record.
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: The point in a cruise/climb element;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         # Save the cruise / climb point
         self.add_record(ers, token)
@@ -983,35 +1036,60 @@ class ParseF15:
         # Get the next token which should be a forward slash '/'
         next_token = tokens.get_next_token()
         if next_token is None:
-            self.add_error_and_re_sync(ers, tokens, token, 27)
-            return
+            return self.add_error_and_re_sync(ers, tokens, token, 27)
         base_type = next_token.get_token_base_type()
         if base_type is not TokenBaseType.F15_SLASH:
-            self.add_error_and_re_sync(ers, tokens, next_token, 26)
-
+            # Continue with the speed / altitude once the parser has re-synchronised
+            self.continuations.append((self.cruise_climb_speed_altitude, token))
+            return self.add_error_and_re_sync(ers, tokens, next_token, 26)
+        return self.cruise_climb_speed_altitude(ers, tokens, token)
+
+    def cruise_climb_speed_altitude(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
+        """This method processes the SPEED/ALTITUDE/ALTITUDE or SPEED/ALTITUDE/PLUS element following the
+        point and '/' in a cruise/climb element.
+
+        :param ers: An ExtractedRouteSequence class instance containing the cruise/climb point in the last
+               ERS record.
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
+               contains a tokenized form of all field 15 tokens used as input to this parser.
+        :param token: The point in a cruise/climb element;
+        :return: The next parser state or None if there are no more tokens;
+        """
         # Skip the forward slash and get the SPEED/ALTITUDE/ALTITUDE or
         # SPEED / ALTITUDE / PLUS token
         next_token = tokens.get_next_token()
         if next_token is None:
-            self.add_error_and_re_sync(ers, tokens, token, 28)
-            return
+            return self.add_error_and_re_sync(ers, tokens, token, 28)
         base_type = next_token.get_token_base_type()
 
-        # Apply the cruise climb speed and altitude values
+        # Apply the cruise climb speed and altitude values, the element following
+        # the cruise climb is processed once this is done
+        self.continuations.append((self.cruise_climb_next_point, token))
         if base_type is TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE:
-            self.assign_speed_altitude_altitude(ers, tokens, next_token)
+            return self.assign_speed_altitude_altitude, next_token
         elif base_type is TokenBaseType.F15_SPEED_ALTITUDE_PLUS:
-            self.assign_speed_altitude_plus(ers, tokens, next_token)
+            return self.assign_speed_altitude_plus, next_token
         else:
-            self.add_error_and_re_sync(ers, tokens, next_token, 29)
+            return self.add_error_and_re_sync(ers, tokens, next_token, 29)
+
+    def cruise_climb_next_point(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
+        """This method moves on to the point following a cruise/climb element.
 
+        :param ers: An ExtractedRouteSequence class instance;
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
+               contains a tokenized form of all field 15 tokens used as input to this parser.
+        :param token: The point in a cruise/climb element;
+        :return: The next parser state or None if there are no more tokens;
+        """
         next_token = tokens.get_next_token()
         if next_token is None:
             return
-        self.point(ers, tokens, next_token)
+        return self.point, next_token
 
     def dct(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes a DCT element.
 
         :param ers: An ExtractedRouteSequence class instance containing an IFR routing point element in the
@@ -1019,7 +1097,7 @@ class ParseF15:
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: The DCT element;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         self.add_record(ers, token)
         next_token = tokens.get_next_token()
@@ -1028,16 +1106,16 @@ class ParseF15:
         base_type = next_token.get_token_base_type()
         match base_type:
             case TokenBaseType.F15_TRUNCATE:
-                self.truncate(ers, tokens)
+                return self.truncate, None
             case TokenBaseType.F15_POINT:
-                self.point(ers, tokens, next_token)
+                return self.point, next_token
             case TokenBaseType.F15_C:
-                self.cruise_climb_c(ers, tokens, next_token)
+                return self.cruise_climb_c, next_token
             case _:
-                self.add_error_and_re_sync(ers, tokens, next_token, 21)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 21)
 
     def forward_slash(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes a '/' token; the '/' character is not stored in the ERS. The method looks
         for tokens following the '/' as there are only certain element types allowed to follow a '/', namely
         speed/vfr, speed/altitude, truncate indicator point or route. All other element types are incorrect
@@ -1047,25 +1125,24 @@ class ParseF15:
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure contains
                a tokenized form of all field 15 tokens used as input to this parser.
         :param token: The '/' token;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         # Don't save the '/' and get next token
         next_token = tokens.get_next_token()
         if next_token is None:
-            self.add_error_and_re_sync(ers, tokens, token, 20)
-            return
+            return self.add_error_and_re_sync(ers, tokens, token, 20)
         base_type = next_token.get_token_base_type()
         match base_type:
             case TokenBaseType.F15_UNKNOWN:
-                self.add_error_and_re_sync(ers, tokens, next_token, 3)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 3)
             case TokenBaseType.F15_SLASH:
-                self.add_error_and_re_sync(ers, tokens, next_token, 16)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 16)
             case TokenBaseType.F15_SPEED_VFR:
-                self.assign_speed_vfr(ers, tokens, next_token)
+                return self.assign_speed_vfr, next_token
             case TokenBaseType.F15_SPEED_ALTITUDE:
-                self.assign_speed_altitude(ers, tokens, next_token)
+                return self.assign_speed_altitude, next_token
             case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, next_token, 4)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 4)
             case _:
                 # TokenBaseType.F15_BREAK_START | TokenBaseType.F15_BREAK_END |
                 # TokenBaseType.F15_DCT | TokenBaseType.F15_STAY |
@@ -1074,10 +1151,10 @@ class ParseF15:
                 # TokenBaseType.F15_SID_STAR | TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE |
                 # TokenBaseType.F15_SPEED_ALTITUDE_PLUS | TokenBaseType.F15_STAY_TIME |
                 # TokenBaseType.F15_SID | TokenBaseType.F15_STAR
-                self.add_error_and_re_sync(ers, tokens, next_token, 50)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 50)
 
     def post_adep(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method determines the next node to move to after a speed/altitude has been applied to the
         first ERS record, the ADEP element.
 
@@ -1086,104 +1163,105 @@ class ParseF15:
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: The first token in the tokens list.
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         base_type = token.get_token_base_type()
         match base_type:
             case TokenBaseType.F15_UNKNOWN:
-                self.add_error_and_re_sync(ers, tokens, token, 3)
+                return self.add_error_and_re_sync(ers, tokens, token, 3)
             case TokenBaseType.F15_SLASH | TokenBaseType.F15_BREAK_START | \
                     TokenBaseType.F15_SPEED_VFR | TokenBaseType.F15_SPEED_ALTITUDE | \
                     TokenBaseType.F15_BREAK_END | TokenBaseType.F15_STAY | \
                     TokenBaseType.F15_C:
-                self.add_error_and_re_sync(ers, tokens, token, 23)
+                return self.add_error_and_re_sync(ers, tokens, token, 23)
             case TokenBaseType.F15_DCT:
-                self.dct(ers, tokens, token)
+                return self.dct, token
             case TokenBaseType.F15_TRUNCATE:
-                self.truncate(ers, tokens)
+                return self.truncate, None
             case TokenBaseType.F15_POINT:
-                self.point(ers, tokens, token)
+                return self.point, token
             case TokenBaseType.F15_ROUTE:
-                self.add_error_and_re_sync(ers, tokens, token, 24)
+                return self.add_error_and_re_sync(ers, tokens, token, 24)
             case TokenBaseType.F15_SID_STAR:
-                self.sid_star(ers, tokens, token)
+                return self.sid_star, token
             case TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE | TokenBaseType.F15_SPEED_ALTITUDE_PLUS:
-                self.add_error_and_re_sync(ers, tokens, token, 9)
+                return self.add_error_and_re_sync(ers, tokens, token, 9)
             case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, token, 4)
+                return self.add_error_and_re_sync(ers, tokens, token, 4)
             case TokenBaseType.F15_STAY_TIME:
-                self.add_error_and_re_sync(ers, tokens, token, 10)
+                return self.add_error_and_re_sync(ers, tokens, token, 10)
             case TokenBaseType.F15_SID:
-                self.sid(ers, tokens, token)
+                return self.sid, token
             case TokenBaseType.F15_STAR:
-                self.star(ers, tokens, token)
+                return self.star, token
             case _:
-                self.add_error_and_re_sync(ers, tokens, token, 0)
+                return self.add_error_and_re_sync(ers, tokens, token, 0)
 
     def post_point(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method determines the next node to move to following a point element.
 
         :param ers: An ExtractedRouteSequence class instance containing an IFR element record in the last ERS record.
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: A token being checked if it can follow an IFR point;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         base_type = token.get_token_base_type()
         match base_type:
             case TokenBaseType.F15_UNKNOWN:
-                self.add_error_and_re_sync(ers, tokens, token, 3)
+                return self.add_error_and_re_sync(ers, tokens, token, 3)
             case TokenBaseType.F15_SLASH:
-                self.forward_slash(ers, tokens, token)
+                return self.forward_slash, token
             case TokenBaseType.F15_BREAK_START:
-                self.break_start(ers, tokens, token)
+                return self.break_start, token
             case TokenBaseType.F15_SPEED_VFR | TokenBaseType.F15_SPEED_ALTITUDE:
-                self.add_error_and_re_sync(ers, tokens, token, 5)
+                return self.add_error_and_re_sync(ers, tokens, token, 5)
             case TokenBaseType.F15_BREAK_END:
-                self.break_end_error(ers, tokens, token)
+                return self.break_end_error, token
             case TokenBaseType.F15_DCT:
-                self.dct(ers, tokens, token)
+                return self.dct, token
             case TokenBaseType.F15_STAY:
-                self.stay(ers, tokens, token)
+                return self.stay, token
             case TokenBaseType.F15_TRUNCATE:
-                self.truncate(ers, tokens)
+                return self.truncate, None
             case TokenBaseType.F15_C:
-                self.cruise_climb_c(ers, tokens, token)
+                return self.cruise_climb_c, token
             case TokenBaseType.F15_POINT:
-                self.point(ers, tokens, token)
+                return self.point, token
             case TokenBaseType.F15_ROUTE:
                 last_ers_rec = ers.get_last_element()
                 sub_type = last_ers_rec.get_sub_type()
                 if sub_type == TokenSubType.F15_SB_PRP_BD or sub_type == TokenSubType.F15_SB_LL_DEG or \
                    sub_type == TokenSubType.F15_SB_LL_MIN or sub_type == TokenSubType.F15_SB_LLBD_DEG or \
                    sub_type == TokenSubType.F15_SB_LLBD_MIN:
-                    self.add_error_and_re_sync(ers, tokens, token, 47)
+                    return self.add_error_and_re_sync(ers, tokens, token, 47)
                 else:
-                    self.route(ers, tokens, token)
+                    return self.route, token
             case TokenBaseType.F15_SID_STAR:
-                self.sid_star(ers, tokens, token)
+                return self.sid_star, token
             case TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE | TokenBaseType.F15_SPEED_ALTITUDE_PLUS:
-                self.add_error_and_re_sync(ers, tokens, token, 9)
+                return self.add_error_and_re_sync(ers, tokens, token, 9)
             case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, token, 4)
+                return self.add_error_and_re_sync(ers, tokens, token, 4)
             case TokenBaseType.F15_STAY_TIME:
-                self.add_error_and_re_sync(ers, tokens, token, 10)
+                return self.add_error_and_re_sync(ers, tokens, token, 10)
             case TokenBaseType.F15_SID:
-                self.sid(ers, tokens, token)
+                return self.sid, token
             case TokenBaseType.F15_STAR:
-                self.star(ers, tokens, token)
+                return self.star, token
             case _:
-                self.add_error_and_re_sync(ers, tokens, token, 0)
+                return self.add_error_and_re_sync(ers, tokens, token, 0)
 
-    def post_sid(self, ers, tokens):
-        # type: (ExtractedRouteSequence, Tokens) -> None
+    def post_sid(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method determines the next node to move to following an SID element.
 
         :param ers: An ExtractedRouteSequence class instance containing an SID element record in the last ERS record.
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure contains
                a tokenized form of all field 15 tokens used as input to this parser.
-        :return: A token being checked if it can follow an SID element;
+        :param token: Not used, present as all parser states take the token being processed;
+        :return: The next parser state or None if there are no more tokens;
         """
         # Get the next token and determine the next node
         next_token = tokens.get_next_token()
@@ -1192,19 +1270,19 @@ class ParseF15:
         base_type = next_token.get_token_base_type()
         match base_type:
             case TokenBaseType.F15_TRUNCATE:
-                self.truncate(ers, tokens)
+                return self.truncate, None
             case TokenBaseType.F15_POINT:
-                self.point(ers, tokens, next_token)
+                return self.point, next_token
             case TokenBaseType.F15_ROUTE:
-                self.route(ers, tokens, next_token)
+                return self.route, next_token
             case TokenBaseType.F15_SID_STAR:
-                self.sid_star(ers, tokens, next_token)
+                return self.sid_star, next_token
             case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, next_token, 4)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 4)
             case TokenBaseType.F15_SID:
-                self.add_error_and_re_sync(ers, tokens, next_token, 32)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 32)
             case TokenBaseType.F15_STAR:
-                self.star(ers, tokens, next_token)
+                return self.star, next_token
             case _:
                 # TokenBaseType.F15_UNKNOWN | TokenBaseType.F15_SLASH |
                 # TokenBaseType.F15_BREAK_START | TokenBaseType.F15_SPEED_VFR |
@@ -1212,10 +1290,10 @@ class ParseF15:
                 # TokenBaseType.F15_DCT | TokenBaseType.F15_STAY |
                 # TokenBaseType.F15_C | TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE |
                 # TokenBaseType.F15_SPEED_ALTITUDE_PLUS | TokenBaseType.F15_STAY_TIME:
-                self.add_error_and_re_sync(ers, tokens, next_token, 31)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 31)
 
     def point(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes a point element. Points are always IFR elements, hence the rules are always
         set to IFR on point elements and stored in the ERS. The angle semantics for Latitude / Longitude and
         bearing distance points are checked with appropriate errors reported if semantic errors exist.
@@ -1224,7 +1302,7 @@ class ParseF15:
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: A point token being appended to the ERS;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         self.add_record(ers, token)
         ers.get_last_element().set_flight_rules(self.RULES["I"])
@@ -1238,7 +1316,7 @@ class ParseF15:
         if next_token is None:
             return
 
-        self.post_point(ers, tokens, next_token)
+        return self.post_point, next_token
 
     def resolve_real_bd_point(self, ers, ex_route_rec, bearing, distance):
         # type: (ExtractedRouteSequence, ExtractedRouteRecord, float, float) -> None
@@ -1258,8 +1336,8 @@ class ParseF15:
         ex_route_rec.set_longitude(result[1])
         self.assign_azimuth_distance_between_points(ers)
 
-    def re_sync_parser_after_error(self, ers, tokens):
-        # type: (ExtractedRouteSequence, Tokens) -> None
+    def re_sync_parser_after_error(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method attempts to re-synchronize the parser after an error is reported. This method is called
         whenever an error is reported / added by the 'self.add_error()' method. The next token is retrieved
         and based on its type, after which parsing continues based on the next tokens element type.
@@ -1268,7 +1346,8 @@ class ParseF15:
                the last ERS record.
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
-        :return: None
+        :param token: Not used, present as all parser states take the token being processed;
+        :return: The next parser state or None if there are no more tokens;
         """
         token = tokens.get_next_token()
         if token is None:
@@ -1276,68 +1355,67 @@ class ParseF15:
         base_type = token.get_token_base_type()
         match base_type:
             case TokenBaseType.F15_UNKNOWN:
-                self.add_error_and_re_sync(ers, tokens, token, 3)
+                return self.add_error_and_re_sync(ers, tokens, token, 3)
             case TokenBaseType.F15_SLASH:
                 # Skip the '/' token, only interested in what follows
                 next_token = tokens.get_next_token()
                 if next_token is None:
                     # Field 15 cannot end with a '/'
-                    self.add_error_and_re_sync(ers, tokens, token, 25)
-                    return
+                    return self.add_error_and_re_sync(ers, tokens, token, 25)
                 next_base_type = next_token.get_token_base_type()
                 match next_base_type:
                     case TokenBaseType.F15_SPEED_VFR:
-                        self.assign_speed_vfr(ers, tokens, next_token)
+                        return self.assign_speed_vfr, next_token
                     case TokenBaseType.F15_POINT:
-                        self.point(ers, tokens, next_token)
+                        return self.point, next_token
                     case TokenBaseType.F15_SPEED_ALTITUDE:
-                        self.assign_speed_altitude(ers, tokens, next_token)
+                        return self.assign_speed_altitude, next_token
                     case TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE:
-                        self.assign_speed_altitude_altitude(ers, tokens, next_token)
+                        return self.assign_speed_altitude_altitude, next_token
                     case TokenBaseType.F15_SPEED_ALTITUDE_PLUS:
-                        self.assign_speed_altitude_plus(ers, tokens, next_token)
+                        return self.assign_speed_altitude_plus, next_token
                     case _:
-                        self.add_error_and_re_sync(ers, tokens, next_token, 11)
+                        return self.add_error_and_re_sync(ers, tokens, next_token, 11)
             case TokenBaseType.F15_BREAK_START:
-                self.break_start(ers, tokens, token)
+                return self.break_start, token
             case TokenBaseType.F15_SPEED_VFR:
-                self.assign_speed_vfr(ers, tokens, token)
+                return self.assign_speed_vfr, token
             case TokenBaseType.F15_BREAK_END:
-                self.break_end(ers, tokens, token)
+                return self.break_end, token
             case TokenBaseType.F15_DCT:
-                self.dct(ers, tokens, token)
+                return self.dct, token
             case TokenBaseType.F15_STAY:
-                self.stay(ers, tokens, token)
+                return self.stay, token
             case TokenBaseType.F15_TRUNCATE:
-                self.truncate(ers, tokens)
+                return self.truncate, None
             case TokenBaseType.F15_C:
-                self.cruise_climb_c(ers, tokens, token)
+                return self.cruise_climb_c, token
             case TokenBaseType.F15_POINT:
-                self.point(ers, tokens, token)
+                return self.point, token
             case TokenBaseType.F15_ROUTE:
-                self.route(ers, tokens, token)
+                return self.route, token
             case TokenBaseType.F15_SID_STAR:
-                self.sid_star(ers, tokens, token)
+                return self.sid_star, token
             case TokenBaseType.F15_SPEED_ALTITUDE:
-                self.assign_speed_altitude(ers, tokens, token)
+                return self.assign_speed_altitude, token
             case TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE:
-                self.assign_speed_altitude_altitude(ers, tokens, token)
+                return self.assign_speed_altitude_altitude, token
             case TokenBaseType.F15_SPEED_ALTITUDE_PLUS:
-                self.assign_speed_altitude_plus(ers, tokens, token)
+                return self.assign_speed_altitude_plus, token
             case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, token, 4)
+                return self.add_error_and_re_sync(ers, tokens, token, 4)
             case TokenBaseType.F15_STAY_TIME:
-                self.add_error_and_re_sync(ers, tokens, token, 10)
+                return self.add_error_and_re_sync(ers, tokens, token, 10)
             case TokenBaseType.F15_SID:
-                self.sid(ers, tokens, token)
+                return self.sid, token
             case TokenBaseType.F15_STAR:
-                self.star(ers, tokens, token)
+                return self.star, token
             case _:
                 # In theory this should never happen
-                self.add_error_and_re_sync(ers, tokens, token, 0)
+                return self.add_error_and_re_sync(ers, tokens, token, 0)
 
     def route(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes an ATS route element. Routes are always IFR elements, hence the rules are
         always set to IFR on route elements and stored in the ERS.
 
@@ -1345,7 +1423,7 @@ class ParseF15:
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: An ATS route token being appended to the ERS;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         self.add_record(ers, token)
         ers.get_last_element().set_flight_rules(self.RULES["I"])
@@ -1355,47 +1433,70 @@ class ParseF15:
         base_type = next_token.get_token_base_type()
         match base_type:
             case TokenBaseType.F15_UNKNOWN:
-                self.add_error_and_re_sync(ers, tokens, next_token, 3)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 3)
             case TokenBaseType.F15_SLASH:
-                self.add_error_and_re_sync(ers, tokens, next_token, 12)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 12)
             case TokenBaseType.F15_BREAK_START:
-                self.add_error_and_re_sync(ers, tokens, next_token, 13)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 13)
             case TokenBaseType.F15_SPEED_VFR:
-                self.add_error_and_re_sync(ers, tokens, next_token, 13)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 13)
             case TokenBaseType.F15_SPEED_ALTITUDE:
-                self.add_error_and_re_sync(ers, tokens, next_token, 55)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 55)
             case TokenBaseType.F15_BREAK_END:
-                self.break_end_error(ers, tokens, next_token)
+                return self.break_end_error, next_token
             case TokenBaseType.F15_DCT:
-                self.add_error_and_re_sync(ers, tokens, next_token, 14)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 14)
             case TokenBaseType.F15_STAY:
-                self.add_error_and_re_sync(ers, tokens, next_token, 15)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 15)
             case TokenBaseType.F15_TRUNCATE:
-                self.truncate(ers, tokens)
+                return self.truncate, None
             case TokenBaseType.F15_C:
-                self.cruise_climb_c(ers, tokens, next_token)
+                return self.cruise_climb_c, next_token
             case TokenBaseType.F15_POINT:
                 # A Lat/Long point cannot follow an ATS route
                 sub_type = next_token.get_token_sub_type()
                 if sub_type == TokenSubType.F15_SB_PRP_BD or sub_type == TokenSubType.F15_SB_LL_DEG or \
                     sub_type == TokenSubType.F15_SB_LL_MIN or sub_type == TokenSubType.F15_SB_LLBD_DEG or \
                         sub_type == TokenSubType.F15_SB_LLBD_MIN:
-                    self.add_error_and_re_sync(ers, tokens, next_token, 48)
-                self.point(ers, tokens, next_token)
+                    # The point is still processed once the parser has re-synchronised
+                    self.continuations.append((self.point, next_token))
+                    return self.add_error_and_re_sync(ers, tokens, next_token, 48)
+                return self.point, next_token
             case TokenBaseType.F15_ROUTE:
-                self.add_error_and_re_sync(ers, tokens, next_token, 53)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 53)
             case TokenBaseType.F15_SID_STAR | TokenBaseType.F15_STAR:
-                self.add_error_and_re_sync(ers, tokens, next_token, 54)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 54)
             case TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE | TokenBaseType.F15_SPEED_ALTITUDE_PLUS:
-                self.add_error_and_re_sync(ers, tokens, next_token, 9)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 9)
             case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, next_token, 4)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 4)
             case TokenBaseType.F15_STAY_TIME:
-                self.add_error_and_re_sync(ers, tokens, next_token, 10)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 10)
             case TokenBaseType.F15_SID:
-                self.add_error_and_re_sync(ers, tokens, next_token, 30)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 30)
             case _:
-                self.add_error_and_re_sync(ers, tokens, next_token, 0)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 0)
+
+    def run_state_machine(self, ers, tokens, state):
+        # type: (ExtractedRouteSequence, Tokens, tuple | None) -> None
+        """This method drives the parser; it loops calling the current parser state, a (method, token)
+        tuple, with the token it is to process. Each state returns the state to move to next. When a
+        state returns None the most recently saved continuation is resumed; parsing is complete once
+        there is neither a next state nor a continuation left.
+
+        :param ers: An ExtractedRouteSequence class instance being populated by the parser;
+        :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
+               contains a tokenized form of all field 15 tokens used as input to this parser.
+        :param state: The first parser state;
+        :return: None
+        """
+        continuations = self.continuations
+        while True:
+            while state is not None:
+                state = state[0](ers, tokens, state[1])
+            if not continuations:
+                return
+            state = continuations.pop()
 
     @staticmethod
     def set_azimuth_and_distance(point_1, point_2):
@@ -1414,7 +1515,7 @@ class ParseF15:
         point_1.set_distance(azimuth_distance[1])
 
     def sid(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes an SID token that must be the token following the ADEP. Any other location
         in field 15 will result in an error.
 
@@ -1423,7 +1524,7 @@ class ParseF15:
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: An SID token being appended to the ERS;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         self.add_record(ers, token)
 
@@ -1436,12 +1537,12 @@ class ParseF15:
             else:
                 sid_rec.set_base_type(TokenBaseType.F15_SID)
                 sid_rec.set_sub_type(TokenSubType.F15_SB_SID)
-            self.post_sid(ers, tokens)
+            return self.post_sid, None
         else:
-            self.add_error_and_re_sync(ers, tokens, token, 30)
+            return self.add_error_and_re_sync(ers, tokens, token, 30)
 
     def sid_star(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes an element which matches the syntax for both a SID or STAR element; the
         syntax cannot be used to uniquely identify which element type it is. The exact type can only be
         determined by its position in field 15. The SID must be the first token in the list of tokens and
@@ -1453,7 +1554,7 @@ class ParseF15:
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: An SID or STAR token being appended to the ERS;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         ex_route_rec = self.add_record(ers, token)
 
@@ -1467,7 +1568,7 @@ class ParseF15:
                 ex_route_rec.set_base_type(TokenBaseType.F15_SID)
                 ex_route_rec.set_sub_type(TokenSubType.F15_SB_SID)
             # Figure out which node to go to next
-            self.post_sid(ers, tokens)
+            return self.post_sid, None
         elif tokens.peek_next_token(1) is None:
             # No more tokens left so this must be the last token that
             # implies this is a STAR
@@ -1478,10 +1579,10 @@ class ParseF15:
                 ex_route_rec.set_base_type(TokenBaseType.F15_STAR)
                 ex_route_rec.set_sub_type(TokenSubType.F15_SB_STAR)
         else:
-            self.add_error_and_re_sync(ers, tokens, tokens.peek_next_token(1), 34)
+            return self.add_error_and_re_sync(ers, tokens, tokens.peek_next_token(1), 34)
 
     def star(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes a STAR token that must be the last token in the list of tokens. Any other
         location in field 15 will result in an error.
 
@@ -1491,7 +1592,7 @@ class ParseF15:
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: A STAR token being appended to the ERS;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         ex_route_rec = self.add_record(ers, token)
 
@@ -1506,10 +1607,10 @@ class ParseF15:
                 ex_route_rec.set_base_type(TokenBaseType.F15_STAR)
                 ex_route_rec.set_sub_type(TokenSubType.F15_SB_STAR)
         else:
-            self.add_error_and_re_sync(ers, tokens, tokens.peek_next_token(1), 34)
+            return self.add_error_and_re_sync(ers, tokens, tokens.peek_next_token(1), 34)
 
     def stay(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes a STAY token that indicates a 'stay' time at an IFR point preceding the
         STAY token. The method checks the correct token sequence, i.e. Stay -> '/' -> HHMM. Errors are
         reported if the sequence is incorrect.
@@ -1518,38 +1619,34 @@ class ParseF15:
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: A STAY token being appended to the ERS;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         # The STAY token does not have to be stored,
         # skip it and get what should be a forward slash
         next_token = tokens.get_next_token()
         if next_token is None:
-            self.add_error_and_re_sync(ers, tokens, token, 35)
-            return
+            return self.add_error_and_re_sync(ers, tokens, token, 35)
 
         # The next token must be a forward slash
         if next_token.get_token_base_type() is not TokenBaseType.F15_SLASH:
-            self.add_error_and_re_sync(ers, tokens, next_token, 36)
-            return
+            return self.add_error_and_re_sync(ers, tokens, next_token, 36)
 
         # Skip the forward slash and get the HHMM token
         current_token = next_token
         next_token = tokens.get_next_token()
         if next_token is None:
-            self.add_error_and_re_sync(ers, tokens, current_token, 37)
-            return
+            return self.add_error_and_re_sync(ers, tokens, current_token, 37)
 
         # The next token must be a HHMM token
         current_token = next_token
         if next_token.get_token_base_type() is not TokenBaseType.F15_STAY_TIME:
-            self.add_error_and_re_sync(ers, tokens, current_token, 38)
-            return
+            return self.add_error_and_re_sync(ers, tokens, current_token, 38)
 
         # Process the HHMM token
-        self.stay_time(ers, tokens, next_token)
+        return self.stay_time, next_token
 
     def stay_time(self, ers, tokens, token):
-        # type: (ExtractedRouteSequence, Tokens, Token) -> None
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes a stay HHMM token that provides the duration at a 'stay' point. The method
         saves the HHMM token to the ERS and determines the next processing node after the HHMM TOKEN.
 
@@ -1558,7 +1655,7 @@ class ParseF15:
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
         :param token: A stay HHMM token being saved on the last ERS point record;
-        :return: None
+        :return: The next parser state or None if there are no more tokens;
         """
         # Save the HHMM token to the previous ERS element, which must be a point
         ers.get_last_element().set_stay_time(token.get_token_string())
@@ -1572,38 +1669,38 @@ class ParseF15:
         base_type = next_token.get_token_base_type()
         match base_type:
             case TokenBaseType.F15_UNKNOWN:
-                self.add_error_and_re_sync(ers, tokens, next_token, 3)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 3)
             case TokenBaseType.F15_BREAK_START:
-                self.break_start(ers, tokens, next_token)
+                return self.break_start, next_token
             case TokenBaseType.F15_BREAK_END:
-                self.break_end_error(ers, tokens, next_token)
+                return self.break_end_error, next_token
             case TokenBaseType.F15_DCT:
-                self.dct(ers, tokens, next_token)
+                return self.dct, next_token
             case TokenBaseType.F15_TRUNCATE:
-                self.truncate(ers, tokens)
+                return self.truncate, None
             case TokenBaseType.F15_C:
-                self.cruise_climb_c(ers, tokens, next_token)
+                return self.cruise_climb_c, next_token
             case TokenBaseType.F15_POINT:
-                self.point(ers, tokens, next_token)
+                return self.point, next_token
             case TokenBaseType.F15_ROUTE:
-                self.route(ers, tokens, next_token)
+                return self.route, next_token
             case TokenBaseType.F15_SID_STAR:
-                self.sid_star(ers, tokens, next_token)
+                return self.sid_star, next_token
             case TokenBaseType.F15_TOO_LONG:
-                self.add_error_and_re_sync(ers, tokens, next_token, 4)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 4)
             case TokenBaseType.F15_SID:
-                self.sid(ers, tokens, next_token)
+                return self.sid, next_token
             case TokenBaseType.F15_STAR:
-                self.star(ers, tokens, next_token)
+                return self.star, next_token
             case _:
                 # TokenBaseType.F15_SLASH | TokenBaseType.F15_SPEED_VFR |
                 # TokenBaseType.F15_SPEED_ALTITUDE | TokenBaseType.F15_STAY |
                 # TokenBaseType.F15_SPEED_ALTITUDE_ALTITUDE | TokenBaseType.F15_SPEED_ALTITUDE_PLUS |
                 # TokenBaseType.F15_STAY_TIME
-                self.add_error_and_re_sync(ers, tokens, next_token, 39)
+                return self.add_error_and_re_sync(ers, tokens, next_token, 39)
 
-    def truncate(self, ers, tokens):
-        # type: (ExtractedRouteSequence, Tokens) -> None
+    def truncate(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes the 'T' truncate field 15 token. The 'T' character indicates that the
         field 15 has been truncated. No elements should occur after this element. The 'T' is not saved
         to the ERS. If there are any other tokens following the 'T' an error is reported.
@@ -1612,15 +1709,16 @@ class ParseF15:
                irrespective of its type.
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
-        :return: A token being processed to determine if field 15 is being correctly truncated;
+        :param token: Not used, present as all parser states take the token being processed;
+        :return: The next parser state or None if there are no more tokens;
         """
         next_token = tokens.get_next_token()
         if next_token is None:
             return
-        self.add_error_and_re_sync(ers, tokens, next_token, 19)
+        return self.add_error_and_re_sync(ers, tokens, next_token, 19)
 
-    def v_to_i_rule_change(self, ers, tokens):
-        # type: (ExtractedRouteSequence, Tokens) -> None
+    def v_to_i_rule_change(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method executes a rule change from VFR to IFR. To complete this rule change there has to be
         a point, a slash '/' and a SPEED/LEVEL following the IFR rule change element. The method break_end()
         performs a look-ahead from the IFR token to ensure these tokens are present and then calls this method.
@@ -1632,7 +1730,8 @@ class ParseF15:
                onto which all and any break text are copied.
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
-        :return: None
+        :param token: Not used, present as all parser states take the token being processed;
+        :return: The next parser state or None if there are no more tokens;
         """
         # Get the point for the rule change
         token = tokens.get_next_token()
@@ -1652,10 +1751,10 @@ class ParseF15:
 
         # Now comes the SPEED/ALTITUDE token
         token = tokens.get_next_token()
-        self.assign_speed_altitude(ers, tokens, token)
+        return self.assign_speed_altitude, token
 
-    def v_to_i_to_v_rule_change(self, ers, tokens):
-        # type: (ExtractedRouteSequence, Tokens) -> None
+    def v_to_i_to_v_rule_change(self, ers, tokens, token):
+        # type: (ExtractedRouteSequence, Tokens, Token) -> tuple | None
         """This method processes a rule change from VFR to IFR occurs but the IFR point changes back to VFR,
         i.e. a single point IFR section. This method executes a rule change from VFR to IFR and back to VFR.
         To complete this rule change there has to be a point, a slash '/' and a SPEED/VFR following the IFR
@@ -1669,7 +1768,8 @@ class ParseF15:
                onto which all and any break text are copied.
         :param tokens: A list of tokens extracted from field 15 used as input to the parser. This structure
                contains a tokenized form of all field 15 tokens used as input to this parser.
-        :return: None
+        :param token: Not used, present as all parser states take the token being processed;
+        :return: The next parser state or None if there are no more tokens;
         """
         # Get the point for the rule change
         token = tokens.get_next_token()
@@ -1684,7 +1784,7 @@ class ParseF15:
 
         # Now comes the SPEED/VFR token
         token = tokens.get_next_token()
-        self.assign_speed_vfr(ers, tokens, token)
+        return self.assign_speed_vfr, token
 
     @staticmethod
     def assign_syntax_descriptions(tokens):
@@ -1695,10 +1795,9 @@ class ParseF15:
         :param tokens: The tokens being looped over having their base and subtypes assigned;
         :return: None
         """
-        f15tsa = F15TokenSyntaxDefinition()
         for token in tokens.get_tokens():
             token_string = token.get_token_string()
-            result = f15tsa.get_token_type(token_string)
+            result = ParseF15.F15TSD.get_token_type(token_string)
             token.set_token_base_type(result[F15TokenSyntaxDefinition.TOKEN_BASE_IDENTIFIER_IDX])
             token.set_token_sub_type(result[F15TokenSyntaxDefinition.TOKEN_SUBTYPE_IDENTIFIER_IDX])
             if len(token_string) > F15TokenSyntaxDefinition.MAX_TOKEN_LENGTH:
@@ -1,4 +1,5 @@
 from enum import auto, IntEnum
+import functools
 import re
 
 
@@ -379,6 +380,41 @@ class F15TokenSyntaxDefinition:
         ["K[0-9]{4}M[0-9]{4}PLUS", TokenBaseType.F15_SPEED_ALTITUDE_PLUS, TokenSubType.F15_SB_SPEED_ALTITUDE_KM_P]
     ])
 
+    F15_SB_UNKNOWN_TOKEN: [str, TokenBaseType, TokenSubType] = \
+        ["", TokenBaseType.F15_UNKNOWN, TokenSubType.F15_SB_UNKNOWN]
+    """The record returned for a token that does not match any of the syntax definitions"""
+
+    F15_SB_PATTERN: re.Pattern = re.compile(
+        "|".join("(?P<T" + str(idx) + ">" + item[0] + ")" for idx, item in enumerate(F15_SB_CONFIGURATION)))
+    """All the regular expressions in F15_SB_CONFIGURATION compiled into a single alternation. Each
+    alternative is a named group 'T<index>' where <index> is the index of the syntax definition in
+    F15_SB_CONFIGURATION; the regular expression engine tries the alternatives in list order so the
+    first definition matching a token is the one found, the same as scanning the list one by one."""
+
+    F15_SB_GROUP_INDEX: {str: int} = {"T" + str(idx): idx for idx in range(len(F15_SB_CONFIGURATION))}
+    """Maps the named group of an alternative in F15_SB_PATTERN to its index in F15_SB_CONFIGURATION"""
+
+    TOKEN_TYPE_CACHE_SIZE: int = 4096
+    """Maximum number of token strings whose syntax definition is cached by 'classify_token()'"""
+
+    @staticmethod
+    @functools.lru_cache(maxsize=TOKEN_TYPE_CACHE_SIZE)
+    def classify_token(token_string):
+        # type: (str) -> [str, TokenBaseType, TokenSubType]
+        """Matches a token against all the token syntax definitions in one pass of the precompiled
+        F15_SB_PATTERN regular expression. Results are cached, field 15 routes repeat the same points,
+        routes and speed/altitude elements many times over so most lookups never reach the regular
+        expression engine. The cache and compiled pattern are shared by all class instances.
+        :param token_string: The string being analysed to which a base and subtype will be assigned;
+        :return: A list containing a single 'record' from the F15_SB_CONFIGURATION base and subtype definitions
+                 or F15_SB_UNKNOWN_TOKEN if the token does not match any definition.
+        """
+        match = F15TokenSyntaxDefinition.F15_SB_PATTERN.fullmatch(token_string)
+        if match is None:
+            return F15TokenSyntaxDefinition.F15_SB_UNKNOWN_TOKEN
+        return F15TokenSyntaxDefinition.F15_SB_CONFIGURATION[
+            F15TokenSyntaxDefinition.F15_SB_GROUP_INDEX[match.lastgroup]]
+
     def get_token_type(self, token_string=""):
         # type: (str) -> [str, TokenBaseType, TokenSubType]
         """Gets and returns a record from all token descriptions for a given token passed in as the
@@ -391,10 +427,7 @@ class F15TokenSyntaxDefinition:
                is a field 15 element such as a point, or route element etc.
         :return: A list containing a single 'record' from the F15_SB_CONFIGURATION base and subtype definitions.
         """
-        for item in self.F15_SB_CONFIGURATION:
-            if re.fullmatch(item[self.TOKEN_REGEXP_IDX], token_string):
-                return item
-        return ["", TokenBaseType.F15_UNKNOWN, TokenSubType.F15_SB_UNKNOWN]
+        return self.classify_token(token_string)
 
     def print_descriptions(self):
         # type: () -> None
@@ -22,6 +22,8 @@ FlightPlanRecord -+-->  FieldRecord -+--> [SubFieldRecord, ...]
    inherit from the SubFieldRecord class.
 4. Note that the subfields are in a list; this covers the case for some field 18 subfields
    such as the RMK and STS subfields that can occur more than once in field 18."""
+import io
+import json
 import os
 
 from Configuration.EnumerationConstants import MessageTypes, FieldIdentifiers, SubFieldIdentifiers, AdjacentUnits, \
@@ -43,13 +45,15 @@ class SubFieldRecord:
     There are no 'setter' methods in this class as the constructor initialises all members on class
     instantiation making this class effectively 'read' only."""
 
-    field_text: str = ""
+    __slots__ = ("field_text", "start_index", "end_index")
+
+    field_text: str
     """A string that is the subfield, i.e. 'LOWL', '0234' etc."""
 
-    start_index: int = 0
+    start_index: int
     """An integer representing the zero based index for the start of the subfield in the original message string."""
 
-    end_index: int = 0
+    end_index: int
     """An integer representing the zero based index for the end of the subfield in the original message string."""
 
     def __init__(self, field_text, start_index, end_index):
@@ -114,7 +118,9 @@ class FieldRecord(SubFieldRecord):
 
     There is a single 'add' method to add subfields to this class."""
 
-    subfields: (SubFieldIdentifiers, [SubFieldRecord]) = {}
+    __slots__ = ("subfields",)
+
+    subfields: (SubFieldIdentifiers, [SubFieldRecord])
     """A dictionary containing a list of ICAO subfields extracted from a message. The 
     subfields are stored as a list because some ICAO subfields may occur more than once,
     (e.g. the STS and RMK subfields can occur ore than once in a message). The key to
@@ -196,20 +202,28 @@ class FieldRecord(SubFieldRecord):
         """This method returns an XML representation of the contents of this class.
 
         :return: An XML representation of the contents of this class as a string"""
+        xml_buffer = io.StringIO()
+        self.write_field_to(xml_buffer, field_id)
+        return xml_buffer.getvalue()
 
-        # Build the subfield elements first if any are present
-        subfield_xml = ""
-        if len(self.subfields) > 0:
-            for subfield_id, subfield in self.subfields.items():
-                if len(subfield) > 0:
-                    for sf in subfield:
-                        subfield_xml = subfield_xml + sf.subfield_as_xml(subfield_id) + os.linesep
+    def write_field_to(self, fp, field_id):
+        # type: (TextIO, FieldIdentifiers) -> None
+        """This method writes an XML representation of the contents of this class to a file like object,
+        the output is identical to the string returned by 'field_as_xml()'.
 
-        return "      <field_record id=\"" + field_id.name + \
-               "\" start_index=\"" + str(self.get_start_index()) + \
-               "\" end_index=\"" + str(self.get_end_index()) + "\">" + self.get_field_text() + os.linesep + \
-               subfield_xml + \
-               "      </field_record>"
+        :param fp: A file like object with a 'write()' method accepting strings;
+        :param field_id: The ICAO field identifier of this field;
+        :return: None"""
+        fp.write("      <field_record id=\"" + field_id.name +
+                 "\" start_index=\"" + str(self.get_start_index()) +
+                 "\" end_index=\"" + str(self.get_end_index()) + "\">" + self.get_field_text() + os.linesep)
+
+        # Write the subfield elements if any are present
+        for subfield_id, subfield in self.subfields.items():
+            for sf in subfield:
+                fp.write(sf.subfield_as_xml(subfield_id) + os.linesep)
+
+        fp.write("      </field_record>")
 
 
 class ErrorRecord(SubFieldRecord):
@@ -219,7 +233,9 @@ class ErrorRecord(SubFieldRecord):
     Zero or more of these records may be included in a flight plan record.
      This class subclasses the FieldRecord class."""
 
-    error_message: str = ""
+    __slots__ = ("error_message",)
+
+    error_message: str
     """Contains the error message associated with the erroneous token."""
 
     def __init__(self, erroneous_field_text, error_message, start_index, end_index):
@@ -371,43 +387,54 @@ class FlightPlanRecord:
         """This method returns an XML representation of the flight plan record.
 
         :return: An XML representation of the flight plan record as an XML string"""
+        xml_buffer = io.StringIO()
+        self.write_to(xml_buffer)
+        return xml_buffer.getvalue()
 
-        # Build the records as an XML
-        field_string = ""
-        if len(self.icao_fields) > 0:
-            field_string = "   <icao_fields>" + os.linesep
-            for field_id, record in self.icao_fields.items():
-                field_string = field_string + record.field_as_xml(field_id) + os.linesep
-            field_string = field_string + "   </icao_fields>" + os.linesep
-
-        error_string = ""
-        if len(self.erroneous_fields) > 0:
-            error_string = "   <icao_field_errors>" + os.linesep
-            for error_record in self.erroneous_fields:
-                error_string = error_string + error_record.field_error_as_xml() + os.linesep
-            error_string = error_string + "   </icao_field_errors>" + os.linesep
-
-        if self.get_extracted_route() is None:
-            ers = ""
-        else:
-            ers = self.get_extracted_route().as_xml()
-
-        return "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\" ?>" + os.linesep + \
-               "<flight_plan_record>" + os.linesep + \
-               "   <derived_flight_rules>" + self.get_derived_flight_rules().name + "</derived_flight_rules>" + \
-               os.linesep + \
-               "   <message_type>" + self.get_message_type().name + "</message_type>" + os.linesep + \
-               "   <original_message>" + self.get_message_complete() + "</original_message>" + os.linesep + \
-               "   <message_header>" + self.get_message_header() + "</message_header>" + os.linesep + \
-               "   <message_body>" + self.get_message_body() + "</message_body>" + os.linesep + \
-               "   <adjacent_unit_sender>" + self.get_sender_adjacent_unit_name().name + \
-               "</adjacent_unit_sender>" + os.linesep + \
-               "   <adjacent_unit_receiver>" + self.get_receiver_adjacent_unit_name().name + \
-               "</adjacent_unit_receiver>" + os.linesep + \
-               field_string + \
-               error_string + \
-               ers + \
-               os.linesep + "</flight_plan_record>"
+    def as_json(self):
+        # type: () -> str
+        """This method returns a compact JSON representation of the flight plan record on a single line,
+        suitable for writing flight plan records as JSON lines. The JSON contains the same information as
+        the XML returned by 'as_xml()' except for the SI unit values and break text of the extracted route.
+
+        :return: A JSON representation of the flight plan record as a string without line breaks"""
+        icao_fields = {}
+        for field_id, record in self.icao_fields.items():
+            subfields = {}
+            for subfield_id, subfield in record.get_subfield_dictionary().items():
+                subfields[subfield_id.name] = [
+                    [sf.get_field_text(), sf.get_start_index(), sf.get_end_index()] for sf in subfield]
+            icao_fields[field_id.name] = {
+                "text": record.get_field_text(),
+                "start_index": record.get_start_index(),
+                "end_index": record.get_end_index(),
+                "subfields": subfields}
+
+        ers = []
+        if self.get_extracted_route() is not None:
+            for item in self.get_extracted_route().get_all_elements():
+                ers.append({
+                    "name": item.get_name(),
+                    "start_index": item.get_start_index(),
+                    "end_index": item.get_end_index(),
+                    "speed": item.get_speed(),
+                    "altitude": item.get_altitude(),
+                    "flight_rules": item.get_flight_rules(),
+                    "latitude": round(item.get_latitude(), 2),
+                    "longitude": round(item.get_longitude(), 2)})
+
+        return json.dumps({
+            "derived_flight_rules": self.get_derived_flight_rules().name,
+            "message_type": self.get_message_type().name,
+            "message_title": self.get_message_title().name,
+            "original_message": self.get_message_complete(),
+            "message_header": self.get_message_header(),
+            "message_body": self.get_message_body(),
+            "adjacent_unit_sender": self.get_sender_adjacent_unit_name().name,
+            "adjacent_unit_receiver": self.get_receiver_adjacent_unit_name().name,
+            "icao_fields": icao_fields,
+            "errors": self.get_all_errors(),
+            "ers": ers}, separators=(",", ":"))
 
     def errors_detected(self):
         # type: () -> bool
@@ -510,6 +537,14 @@ class FlightPlanRecord:
             return None
         return self.icao_fields[field_id]
 
+    def get_icao_fields(self):
+        # type: () -> {FieldIdentifiers: FieldRecord}
+        """Gets all the ICAO fields in this flight plan record in the order they were added
+
+            :return: A dictionary of FieldRecord instances indexed with enumeration values from the
+                     EnumerationConstants.FieldIdentifiers class"""
+        return self.icao_fields
+
     def get_icao_subfield(self, field_id, subfield_id):
         # type: (FieldIdentifiers, SubFieldIdentifiers) -> SubFieldRecord | None
         """Gets an ICAO subfield from this flight plan record
@@ -648,3 +683,47 @@ class FlightPlanRecord:
                 EnumerationConstants.AdjacentUnits
             :return: None"""
         self.sender_adjacent_unit_name = sender_adjacent_unit_name
+
+    def write_to(self, fp):
+        # type: (TextIO) -> None
+        """This method writes an XML representation of the flight plan record to a file like object,
+        the output is identical to the string returned by 'as_xml()'. The XML is written piecemeal so
+        that a flight plan record can be written straight to disk without building the complete
+        XML document in memory.
+
+        :param fp: A file like object with a 'write()' method accepting strings, e.g. an open text file
+                   or an io.StringIO;
+        :return: None"""
+        fp.write("<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\" ?>" + os.linesep +
+                 "<flight_plan_record>" + os.linesep +
+                 "   <derived_flight_rules>" + self.get_derived_flight_rules().name + "</derived_flight_rules>" +
+                 os.linesep +
+                 "   <message_type>" + self.get_message_type().name + "</message_type>" + os.linesep)
+        fp.write("   <original_message>" + self.get_message_complete() + "</original_message>" + os.linesep)
+        fp.write("   <message_header>" + self.get_message_header() + "</message_header>" + os.linesep)
+        fp.write("   <message_body>" + self.get_message_body() + "</message_body>" + os.linesep)
+        fp.write("   <adjacent_unit_sender>" + self.get_sender_adjacent_unit_name().name +
+                 "</adjacent_unit_sender>" + os.linesep +
+                 "   <adjacent_unit_receiver>" + self.get_receiver_adjacent_unit_name().name +
+                 "</adjacent_unit_receiver>" + os.linesep)
+
+        # Write the fields
+        if len(self.icao_fields) > 0:
+            fp.write("   <icao_fields>" + os.linesep)
+            for field_id, record in self.icao_fields.items():
+                record.write_field_to(fp, field_id)
+                fp.write(os.linesep)
+            fp.write("   </icao_fields>" + os.linesep)
+
+        # Write the errors
+        if len(self.erroneous_fields) > 0:
+            fp.write("   <icao_field_errors>" + os.linesep)
+            for error_record in self.erroneous_fields:
+                fp.write(error_record.field_error_as_xml() + os.linesep)
+            fp.write("   </icao_field_errors>" + os.linesep)
+
+        # Write the extracted route
+        if self.get_extracted_route() is not None:
+            self.get_extracted_route().write_to(fp)
+
+        fp.write(os.linesep + "</flight_plan_record>")
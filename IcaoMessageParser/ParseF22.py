@@ -77,8 +77,8 @@ class ParseF22(ParseFieldsCommon):
                 # Error, field number cannot be determined as it precedes the field, e.g 9/B737/M,
                 # If the '/' is missing, then we cannot determine what the field number is.
                 self.add_error(token.get_token_string(),
-                               token.get_token_start_index() + start_offset_index,
-                               token.get_token_end_index() + start_offset_index,
+                               token.get_token_start_index(),
+                               token.get_token_end_index(),
                                ErrorId.F22_NO_F22_KEYWORDS_FOUND)
             else:
                 # We found a slash, what precedes it must be the field number as a string
@@ -90,16 +90,16 @@ class ParseF22(ParseFieldsCommon):
                 if subfield_id == SubFieldIdentifiers.ANYTHING:
                     # Field number is not one of those defined
                     self.add_error(token.get_token_string(),
-                                   token.get_token_start_index() + start_offset_index,
-                                   token.get_token_end_index() + start_offset_index,
+                                   token.get_token_start_index(),
+                                   token.get_token_end_index(),
                                    ErrorId.F22_UNRECOGNISED_KEYWORD)
                 else:
                     # Check if there is any data following the '/'
                     if len(token.get_token_string()[slash_index + 1:]) < 1:
                         # No data following the '/'
                         self.add_error(token.get_token_string(),
-                                       token.get_token_start_index() + start_offset_index + slash_index,
-                                       token.get_token_end_index() + start_offset_index,
+                                       token.get_token_start_index() + slash_index,
+                                       token.get_token_end_index(),
                                        ErrorId.F22_UNRECOGNISED_DATA)
                     else:
                         # Success! Save the subfield!
@@ -188,8 +188,8 @@ class ParseF22(ParseFieldsCommon):
                 # and an error will be reported.
                 if len(subfield_list) > 1:
                     self.add_error(subfield_key.name[5:] + "/" + subfield_list[1].get_field_text(),
-                                   subfield_list[1].get_start_index() + start_offset_index,
-                                   subfield_list[1].get_end_index() + start_offset_index,
+                                   subfield_list[1].get_start_index() - start_offset_index,
+                                   subfield_list[1].get_end_index() - start_offset_index,
                                    ErrorId.F22_FIELD_DUPLICATED)
 
                 # Loop over the list of subfields and parse the field;
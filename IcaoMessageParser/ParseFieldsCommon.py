@@ -1,5 +1,6 @@
 import re
 
+from Configuration.CompoundFieldKeywords import CompoundFieldKeywords
 from Configuration.ErrorMessages import ErrorMessages
 from IcaoMessageParser.Utils import Utils
 from Tokenizer.Token import Token
@@ -37,6 +38,10 @@ class ParseFieldsCommon:
     for each field.
     """
 
+    COMPOUND_FIELD_KEYWORDS: CompoundFieldKeywords = CompoundFieldKeywords()
+    """Configuration data containing the subfield keywords of the compound fields 18, 19 and 22, built
+    once and shared by all the field parsers"""
+
     tokens: Tokens = None
     """Tokens extracted from the ICAO field being parsed"""
 
@@ -273,29 +278,12 @@ class ParseFieldsCommon:
         the enumeration value matching RALT or returns SubFieldIdentifiers.ANYTHING if no match is found).
         This method is used when parsing the compound fields 18, 19 and 22; these fields contain
         named subfields. This method is used to check if a named subfield exists, if not
-        an error is reported by the parser.
+        an error is reported by the parser. The keyword is looked up in the dictionaries built once by
+        the CompoundFieldKeywords configuration class.
             :param field_id: An enumeration value from FieldIdentifiers identifying a field
             :param candidate_keyword: A string containing the subfield name being searched.
         :return: An enumeration value from the SubFieldIdentifiers class for a subfield name/identifier"""
-        if field_id == FieldIdentifiers.F18:
-            for keyword in SubFieldIdentifiers:
-                if SubFieldIdentifiers.F17c < keyword < SubFieldIdentifiers.F19a:
-                    if keyword.name[3:].upper() == candidate_keyword:
-                        return keyword
-        elif field_id == FieldIdentifiers.F19:
-            for keyword in SubFieldIdentifiers:
-                if SubFieldIdentifiers.F18typ < keyword < SubFieldIdentifiers.F20a:
-                    if 0 < len(keyword.name[3:]) < 2:
-                        if keyword.name[3:].upper() == candidate_keyword:
-                            return keyword
-        elif field_id == FieldIdentifiers.F22:
-            for keyword in SubFieldIdentifiers:
-                if SubFieldIdentifiers.F21f < keyword < SubFieldIdentifiers.F80a:
-                    if len(keyword.name[5:]) < 3:
-                        #  print(keyword.name[3:])
-                        if keyword.name[5:].upper() == candidate_keyword:
-                            return keyword
-        return SubFieldIdentifiers.ANYTHING
+        return ParseFieldsCommon.COMPOUND_FIELD_KEYWORDS.get_subfield_id(field_id, candidate_keyword)
 
     def no_tokens(self):
         # type: () -> bool
@@ -1,4 +1,7 @@
+import os
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 
 from Configuration.EnumerationConstants import MessageTypes, MessageTitles, AdjacentUnits, ErrorId, FieldIdentifiers, \
     SubFieldIdentifiers, FlightRules
@@ -15,7 +18,9 @@ from IcaoMessageParser.ParseFieldsCommon import ParseFieldsCommon
 from IcaoMessageParser.ParseFilingTime import ParseFilingTime
 from IcaoMessageParser.ParseOriginator import ParseOriginator
 from IcaoMessageParser.ParsePriorityIndicator import ParsePriorityIndicator
+from IcaoMessageParser.ParseTransmissionId import ParseTransmissionId
 from IcaoMessageParser.Utils import Utils
+from Tokenizer.Token import Token
 from Tokenizer.Tokenize import Tokenize, Tokens
 
 
@@ -40,8 +45,23 @@ class ParseMessage:
     This class is thread safe and can be used simultaneously on multiple threads. This class includes
     the message field list definitions (the configuration data for the parser) by instantiating the
     MessageDescriptions class and assigning this the MCD member of this class.
+
+    Large volumes of messages can be parsed with 'parse_many()', this distributes the messages in chunks
+    over a pool of worker processes. The configuration data are class members and are therefore loaded
+    once per worker process, not once per message or chunk.
     """
 
+    DEFAULT_CHUNK_SIZE: int = 64
+    """The default number of messages sent to a worker process in one go by 'parse_many()'"""
+
+    CHUNKS_IN_FLIGHT_PER_WORKER: int = 2
+    """The number of chunks queued per worker process by 'parse_many()'; limits the memory used when
+    parsing a large (or unbounded) iterable of messages while keeping all the workers busy."""
+
+    PARSER_FAILURE: str = "Unable to parse the message, the parser failed: "
+    """The start of the error text of the erroneous field added by 'parse_chunk()' to the flight plan record
+    of a message the parser raised an exception on; the exception follows"""
+
     MINIMUM_HEADER_LENGTH: int = 20
     """Minimum length of header text, anything less than this is considered junk and added to the message body."""
 
@@ -49,6 +69,11 @@ class ParseMessage:
     """Minimum message length under which a message is considered junk, no attempt will be made to parse it 
     further. The shortest message is a LAM, LAML/E012E/L001 -> 15 characters minimum."""
 
+    TRANSMISSION_ID_LINE: re.Pattern = re.compile("[ \t]*([A-Z]{3}[0-9]{3})(?:[ \t][^\r\n]*)?[\r\n]")
+    """Regular expression matching the transmission identification line that may precede the priority
+    indicator on an AFTN circuit; a channel designator and channel sequence number, optionally followed by
+    additional service information that is ignored. Group 1 is the transmission identification."""
+
     FIM: FieldsInMessage = FieldsInMessage()
     """Configuration data defining the fields in a message for all message titles"""
 
@@ -559,6 +584,7 @@ class ParseMessage:
         # type: (FlightPlanRecord) -> bool
         """This method parses an ATS header and saves the fields to the FPR. The header parsing assumes
         correct message semantics, that is the fields are expected in the following order:
+            - <Transmission Identification> (optional, on a line of its own)
             - <Priority Indicator>
             - <One or more Addressees>
             - <Filing Time> <Originator>
@@ -577,9 +603,22 @@ class ParseMessage:
         tokenize.tokenize()
         tokens: Tokens = tokenize.get_tokens()
 
+        # A transmission identification is only present on messages received from an AFTN circuit,
+        # the tokens on its line are not part of the remaining header fields
+        header_start_index = 0
+        transmission_id = self.TRANSMISSION_ID_LINE.match(flight_plan_record.get_message_header())
+        if transmission_id is not None:
+            flight_plan_record.add_icao_field(FieldIdentifiers.TRANSMISSION_ID,
+                                              transmission_id.group(1),
+                                              transmission_id.start(1),
+                                              transmission_id.end(1))
+            ParseTransmissionId(flight_plan_record, self.SFIF, self.SFD).parse_field()
+            header_start_index = transmission_id.end()
+
         # Return if there is nothing in the header
-        if tokens.get_number_of_tokens() < 1:
-            return True
+        header_tokens = [token for token in tokens.get_tokens() if token.get_token_start_index() >= header_start_index]
+        if len(header_tokens) < 1:
+            return not flight_plan_record.errors_detected()
 
         # Some kind of header is present and ready for parsing, create empty fields in the FPR
         flight_plan_record.add_icao_field(FieldIdentifiers.PRIORITY_INDICATOR, "", 0, 0)
@@ -596,7 +635,7 @@ class ParseMessage:
         next_field: int = 0
         additional_addressee_available = False
         # Loop over the header fields
-        for token in tokens.get_tokens():
+        for token in header_tokens:
             if next_field == 0:  # Process priority indicator
 
                 # Save the Priority Indicator
@@ -713,16 +752,7 @@ class ParseMessage:
         if tokens.get_number_of_tokens() < md.get_number_of_fields_in_message():
             # There are fewer fields to parse than fields defined for this message
             for token in tokens.get_tokens():
-                # Save the field to be parsed to the flight plan
-                flight_plan_record.add_icao_field(
-                    field_identifiers[idx],
-                    token.get_token_string(),
-                    token.get_token_start_index() + len(flight_plan_record.get_message_header()),
-                    token.get_token_end_index() + len(flight_plan_record.get_message_header()))
-                # Get the appropriate field parser
-                fp = field_parsers[idx](flight_plan_record, self.SFIF, self.SFD)
-                # Parse the field
-                fp.parse_field()
+                self.parse_icao_field(flight_plan_record, field_identifiers[idx], field_parsers[idx], token)
                 idx += 1
 
             # Check if fewer fields to parse is allowed, some messages have optional fields
@@ -769,27 +799,150 @@ class ParseMessage:
                 tokens.remove_tokens_from_end_of_list(f22_index)
 
             for field_parser in field_parsers:
-                # Save the field to be parsed to the flight plan
-                flight_plan_record.add_icao_field(
-                    field_identifiers[idx],
-                    tokens.get_token_at(idx).get_token_string(),
-                    tokens.get_token_at(idx).get_token_start_index() + len(flight_plan_record.get_message_header()),
-                    tokens.get_token_at(idx).get_token_end_index() + len(flight_plan_record.get_message_header()))
-                # Get the appropriate field parser
-                fp = field_parser(flight_plan_record, self.SFIF, self.SFD)
-                # Parse the field
-                fp.parse_field()
+                self.parse_icao_field(flight_plan_record, field_identifiers[idx], field_parser, tokens.get_token_at(idx))
                 idx += 1
 
             # Check if we have more fields to parse than defined for this message
             if tokens.get_number_of_tokens() > md.get_number_of_fields_in_message():
                 Utils.add_error(flight_plan_record, tokens.get_token_at(idx).get_token_string(),
-                                tokens.get_token_at(idx).get_token_start_index(),
-                                tokens.get_token_at(idx).get_token_end_index(), self.EM,
+                                tokens.get_token_at(idx).get_token_start_index() +
+                                len(flight_plan_record.get_message_header()),
+                                tokens.get_token_at(idx).get_token_end_index() +
+                                len(flight_plan_record.get_message_header()), self.EM,
                                 ErrorId.MSG_TOO_MANY_FIELDS)
 
         return flight_plan_record.errors_detected()
 
+    @staticmethod
+    def parse_chunk(messages):
+        # type: ([str]) -> [FlightPlanRecord]
+        """Parses a list of messages, this is the unit of work executed by the worker processes
+        used by 'parse_many()'. If the parser raises an exception on a message, the message is returned
+        in a flight plan record containing only an erroneous field, (see 'is_parser_failure()'), and the
+        remaining messages are parsed.
+
+        :param messages: A list of messages (strings) with or without header;
+        :return: A list of FlightPlanRecord, one for each message in the same order as the messages;
+        """
+        parser = ParseMessage()
+        flight_plan_records = []
+        for message in messages:
+            flight_plan_record = FlightPlanRecord()
+            try:
+                parser.parse_message(flight_plan_record, message)
+            except Exception as e:
+                flight_plan_record = ParseMessage.get_parser_failure(message, e)
+            flight_plan_records.append(flight_plan_record)
+        return flight_plan_records
+
+    @staticmethod
+    def get_parser_failure(message, exception):
+        # type: (str, Exception) -> FlightPlanRecord
+        """Creates the flight plan record returned for a message the parser raised an exception on, the
+        record contains the message and the exception as its only erroneous field.
+
+        :param message: The message;
+        :param exception: The exception raised by the parser;
+        :return: The flight plan record;
+        """
+        flight_plan_record = FlightPlanRecord()
+        flight_plan_record.add_erroneous_field(message, ParseMessage.PARSER_FAILURE + repr(exception), 0,
+                                               len(message))
+        return flight_plan_record
+
+    @staticmethod
+    def is_parser_failure(flight_plan_record):
+        # type: (FlightPlanRecord) -> bool
+        """Checks if a flight plan record returned by 'parse_chunk()' or 'parse_many()' is for a message the
+        parser raised an exception on; the record contains the message and the exception as its only
+        erroneous field.
+
+        :param flight_plan_record: The flight plan record;
+        :return: True if the parser failed on the message, False otherwise;
+        """
+        erroneous_fields = flight_plan_record.get_erroneous_fields()
+        return len(erroneous_fields) == 1 and \
+            erroneous_fields[0].get_error_message().startswith(ParseMessage.PARSER_FAILURE)
+
+    def parse_icao_field(self, flight_plan_record, field_identifier, field_parser, token):
+        # type: (FlightPlanRecord, FieldIdentifiers, type, Token) -> None
+        """This method saves a field tokenized from the message body to the flight plan record and parses
+        it with its field parser.
+
+        :param flight_plan_record: The Flight Plan Record the field and the results of parsing it are
+               written to;
+        :param field_identifier: The ICAO field identifier of the field;
+        :param field_parser: The field parser class for the field, a subclass of ParseFieldsCommon;
+        :param token: The token containing the field, its indices are relative to the start of the
+               message body;
+        :return: None
+        """
+        # Save the field to be parsed to the flight plan
+        flight_plan_record.add_icao_field(
+            field_identifier,
+            token.get_token_string(),
+            token.get_token_start_index() + len(flight_plan_record.get_message_header()),
+            token.get_token_end_index() + len(flight_plan_record.get_message_header()))
+        # Get the appropriate field parser and parse the field
+        field_parser(flight_plan_record, self.SFIF, self.SFD).parse_field()
+
+    def parse_many(self, messages, workers=None, chunksize=DEFAULT_CHUNK_SIZE, ordered=True):
+        # type: (Iterable[str], int | None, int, bool) -> Iterator[(int, FlightPlanRecord)]
+        """This method parses a sequence of messages using a pool of worker processes, each message is
+        parsed into its own FlightPlanRecord exactly as 'parse_message()' would. The messages are read
+        lazily from the iterable and sent to the workers in chunks; only a limited number of chunks are
+        outstanding at any one time so the iterable can be arbitrarily large.
+
+        The results are yielded as tuples containing the zero based index of the message in the iterable
+        and the FlightPlanRecord populated by the parser. The index makes it possible to correlate the
+        results with the input when they are returned in the order they are completed.
+
+        :param messages: An iterable of messages (strings) with or without header;
+        :param workers: The number of worker processes, defaults to the number of CPUs; if one (or less)
+               the messages are parsed in the calling process;
+        :param chunksize: The number of messages sent to a worker in one go;
+        :param ordered: True to yield the results in the same order as the messages, False to yield
+               the results in the order they are completed;
+        :return: A generator yielding a tuple of the message index and the FlightPlanRecord for each message;
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        chunks = self.split_into_chunks(messages, max(1, chunksize))
+
+        if workers <= 1:
+            for start_index, chunk in chunks:
+                yield from enumerate(self.parse_chunk(chunk), start_index)
+            return
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        max_in_flight = workers * self.CHUNKS_IN_FLIGHT_PER_WORKER
+        try:
+            if ordered:
+                pending = deque()
+                for start_index, chunk in chunks:
+                    pending.append((start_index, executor.submit(ParseMessage.parse_chunk, chunk)))
+                    if len(pending) >= max_in_flight:
+                        start_index, future = pending.popleft()
+                        yield from enumerate(future.result(), start_index)
+                while pending:
+                    start_index, future = pending.popleft()
+                    yield from enumerate(future.result(), start_index)
+            else:
+                pending = {}
+                for start_index, chunk in chunks:
+                    pending[executor.submit(ParseMessage.parse_chunk, chunk)] = start_index
+                    if len(pending) >= max_in_flight:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield from enumerate(future.result(), pending.pop(future))
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from enumerate(future.result(), pending.pop(future))
+        finally:
+            # Cancel outstanding work if the caller stops consuming the results early
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def parse_message(self, flight_plan_record, message):
         # type: (FlightPlanRecord, str | None) -> bool
         """This method is the entry point for message parsing; the method takes an instance of FlightPlanRecord
@@ -817,16 +970,27 @@ class ParseMessage:
         if not self.set_message_type(flight_plan_record):
             return False
 
-        # Call the appropriate parser
+        # Call the appropriate parsers
+        self.parse_message_header(flight_plan_record)
+        return self.parse_message_body(flight_plan_record)
+
+    def parse_message_body(self, flight_plan_record):
+        # type: (FlightPlanRecord) -> bool
+        """This method parses the message body once the message header has been parsed. The fields are
+        parsed by the parser for the message type followed by the consistency checks. The results do not
+        depend on the message header other than through its length, all indices are relative to the start
+        of the complete message.
+
+        :param flight_plan_record: The Flight Plan Record containing the message to parse, the message type
+               must have been set;
+        :return: False if errors are detected, True otherwise;
+        """
         match flight_plan_record.get_message_type():
             case MessageTypes.ADEXP:
-                self.parse_ats_header(flight_plan_record)
                 return self.parse_adexp(flight_plan_record)
             case MessageTypes.ATS:
-                self.parse_ats_header(flight_plan_record)
                 self.parse_ats(flight_plan_record)
             case MessageTypes.OLDI:
-                self.parse_oldi_header(flight_plan_record)
                 self.parse_oldi(flight_plan_record)
             case MessageTypes.UNKNOWN:
                 return False
@@ -839,6 +1003,20 @@ class ParseMessage:
 
         return not (flight_plan_record.errors_detected() or len(flight_plan_record.get_erroneous_fields()))
 
+    def parse_message_header(self, flight_plan_record):
+        # type: (FlightPlanRecord) -> None
+        """This method parses the message header with the header parser for the message type.
+
+        :param flight_plan_record: The Flight Plan Record containing the message to parse, the message type
+               must have been set;
+        :return: None
+        """
+        match flight_plan_record.get_message_type():
+            case MessageTypes.ADEXP | MessageTypes.ATS:
+                self.parse_ats_header(flight_plan_record)
+            case MessageTypes.OLDI:
+                self.parse_oldi_header(flight_plan_record)
+
     # TODO This method may be removed if there are no application level headers, (I don't believe there are)
     @staticmethod
     def parse_oldi_header(flight_plan_record):
@@ -981,6 +1159,27 @@ class ParseMessage:
             flight_plan_record.set_message_type(MessageTypes.UNKNOWN)
             return False
 
+    @staticmethod
+    def split_into_chunks(messages, chunksize):
+        # type: (Iterable[str], int) -> Iterator[(int, [str])]
+        """Splits an iterable of messages into lists of at most 'chunksize' messages; the iterable is
+        consumed lazily.
+
+        :param messages: An iterable of messages (strings);
+        :param chunksize: The maximum number of messages in a chunk;
+        :return: A generator yielding a tuple of the index of the first message in the chunk and the chunk;
+        """
+        start_index = 0
+        chunk = []
+        for message in messages:
+            chunk.append(message)
+            if len(chunk) == chunksize:
+                yield start_index, chunk
+                start_index = start_index + chunksize
+                chunk = []
+        if len(chunk) > 0:
+            yield start_index, chunk
+
     @staticmethod
     def tokenize_message(flight_plan_record, whitespace):
         # type: (FlightPlanRecord, str) -> Tokens
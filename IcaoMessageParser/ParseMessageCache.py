@@ -0,0 +1,214 @@
+from collections import OrderedDict
+
+from Configuration.EnumerationConstants import FieldIdentifiers
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord, SubFieldRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class ParseMessageCache:
+    """This class is a bounded, least recently used cache of parse results placed in front of the message
+    parser. AFTN traffic contains many duplicate messages, (retransmissions, the same message received
+    with different headers or validated again in the editor); a duplicate is parsed by copying the
+    results of the first message instead of running the complete parser again.
+
+    The cache is keyed by the message body, only the message header is parsed for a message found in
+    the cache. The parse results of a message body do not depend on the message header other than
+    through its length; the indices of the fields, subfields, errors and extracted route copied from the
+    cache are moved by the difference in header length. Records with a start and end index of zero have
+    no position in the message and are not moved.
+
+    The whitespace in the message body is part of the key; normalising it would change the field text
+    and the indices stored in the parse results.
+
+    Messages are only cached once their message type has been established, messages rejected before
+    that, (empty, too short or with an unknown title), are always parsed.
+
+    The flight plan records returned by this class are populated with copies of the cached records and
+    can be modified by the caller without affecting the cache. This class is not thread safe."""
+
+    DEFAULT_MAXIMUM_ENTRIES: int = 1000
+    """The default maximum number of message bodies held in the cache"""
+
+    HEADER_FIELDS: {FieldIdentifiers} = {FieldIdentifiers.PRIORITY_INDICATOR, FieldIdentifiers.ADDRESS,
+                                         FieldIdentifiers.FILING_TIME, FieldIdentifiers.ORIGINATOR,
+                                         FieldIdentifiers.ADADDRESS, FieldIdentifiers.TRANSMISSION_ID}
+    """The fields parsed from the message header, these are not cached"""
+
+    maximum_entries: int = DEFAULT_MAXIMUM_ENTRIES
+    """The maximum number of message bodies held in the cache"""
+
+    entries: OrderedDict = OrderedDict()
+    """The cached parse results indexed by message body, from the least to the most recently used. Each
+    entry is a tuple containing a flight plan record holding the results parsed from the message body
+    and the length of the message header the body was parsed with."""
+
+    parser: ParseMessage = None
+    """The message parser used to parse messages not found in the cache"""
+
+    hits: int = 0
+    """The number of messages found in the cache"""
+
+    misses: int = 0
+    """The number of messages not found in the cache and parsed"""
+
+    def __init__(self, maximum_entries=DEFAULT_MAXIMUM_ENTRIES):
+        # type: (int) -> None
+        """Creates an empty cache.
+
+        :param maximum_entries: The maximum number of message bodies held in the cache, the least recently
+               used entries are discarded when this is exceeded;
+        """
+        self.maximum_entries = maximum_entries
+        self.entries = OrderedDict()
+        self.parser = ParseMessage()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        # type: () -> None
+        """Removes all the entries from the cache and resets the statistics.
+
+        :return: None
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def copy_body_results(source, destination, first_error, offset):
+        # type: (FlightPlanRecord, FlightPlanRecord, int, int) -> None
+        """Copies the results parsed from a message body from one flight plan record to another, all the
+        records are copied and their indices moved.
+
+        :param source: The flight plan record the results are copied from;
+        :param destination: The flight plan record the results are copied to;
+        :param first_error: The index of the first error in the source's erroneous fields parsed from the
+               message body, errors before this were reported for the message header;
+        :param offset: The number of characters added to the start and end index of every record that
+               has a position in the message;
+        :return: None
+        """
+        ParseMessageCache.copy_records(source, destination, first_error, offset, offset)
+        destination.set_message_type(source.get_message_type())
+        destination.set_message_title(source.get_message_title())
+        destination.set_derived_flight_rules(source.get_derived_flight_rules())
+        destination.set_sender_adjacent_unit_name(source.get_sender_adjacent_unit_name())
+        destination.set_receiver_adjacent_unit_name(source.get_receiver_adjacent_unit_name())
+
+    @staticmethod
+    def copy_records(source, destination, first_error, offset, extracted_route_offset):
+        # type: (FlightPlanRecord, FlightPlanRecord, int, int, int) -> None
+        """Copies the fields, (excluding the header fields), errors, extracted route and field 22 flight plan
+        record from one flight plan record to another; all the records are copied and their indices moved.
+
+        :param source: The flight plan record the records are copied from;
+        :param destination: The flight plan record the records are copied to;
+        :param first_error: The index of the first of the source's erroneous fields that is copied;
+        :param offset: The number of characters added to the start and end index of every record that
+               has a position in the message;
+        :param extracted_route_offset: The number of characters added to the start and end index of the
+               extracted route records; the extracted route is relative to the start of field 15 until the
+               message has been parsed, (see ParseMessage.correct_ers_indices()), and is then moved with
+               the other records;
+        :return: None
+        """
+        for field_id, field in source.get_icao_fields().items():
+            if field_id in ParseMessageCache.HEADER_FIELDS:
+                continue
+            field_offset = 0 if field.get_start_index() == 0 and field.get_end_index() == 0 else offset
+            destination.add_icao_field(field_id, field.get_field_text(),
+                                       field.get_start_index() + field_offset, field.get_end_index() + field_offset)
+            destination_field = destination.get_icao_field(field_id)
+            for subfield_id, subfields in field.get_subfield_dictionary().items():
+                for subfield in subfields:
+                    subfield_offset = 0 if subfield.get_start_index() == 0 and subfield.get_end_index() == 0 \
+                        else offset
+                    destination_field.add_subfield(subfield_id, SubFieldRecord(
+                        subfield.get_field_text(), subfield.get_start_index() + subfield_offset,
+                        subfield.get_end_index() + subfield_offset))
+
+        for error in source.get_erroneous_fields()[first_error:]:
+            error_offset = 0 if error.get_start_index() == 0 and error.get_end_index() == 0 else offset
+            destination.add_erroneous_field(error.get_field_text(), error.get_error_message(),
+                                            error.get_start_index() + error_offset,
+                                            error.get_end_index() + error_offset)
+
+        if source.get_extracted_route() is not None:
+            destination.add_extracted_route(source.get_extracted_route().copy(extracted_route_offset))
+        if source.get_f22_flight_plan() is not None:
+            # The extracted route of a field 22 flight plan record remains relative to the start of field 15
+            f22_flight_plan = FlightPlanRecord()
+            ParseMessageCache.copy_records(source.get_f22_flight_plan(), f22_flight_plan, 0, offset, 0)
+            destination.set_f22_flight_plan(f22_flight_plan)
+
+    def get_hit_ratio(self):
+        # type: () -> float
+        """Gets the fraction of the messages looked up that were found in the cache.
+
+        :return: The hit ratio between 0.0 and 1.0, 0.0 if no messages have been looked up;
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def get_hits(self):
+        # type: () -> int
+        """Gets the number of messages found in the cache since it was created or cleared.
+
+        :return: The number of cache hits;
+        """
+        return self.hits
+
+    def get_misses(self):
+        # type: () -> int
+        """Gets the number of messages looked up and not found in the cache since it was created or cleared.
+
+        :return: The number of cache misses;
+        """
+        return self.misses
+
+    def get_number_of_entries(self):
+        # type: () -> int
+        """Gets the number of message bodies held in the cache.
+
+        :return: The number of cache entries;
+        """
+        return len(self.entries)
+
+    def parse_message(self, flight_plan_record, message):
+        # type: (FlightPlanRecord, str | None) -> bool
+        """This method parses a message exactly as ParseMessage.parse_message() does, the flight plan
+        record is populated from the cache if the message body has been parsed before.
+
+        :param flight_plan_record: A flight plan record into which all data extracted by the parser
+               (including errors) are written;
+        :param message: The message with or without header;
+        :return: False if errors are detected, True otherwise;
+        """
+        if not self.parser.is_message_valid(flight_plan_record, message):
+            return False
+        flight_plan_record.set_message_complete(message)
+        self.parser.set_message_body_and_header(flight_plan_record)
+        header_length = len(flight_plan_record.get_message_header())
+
+        entry = self.entries.get(flight_plan_record.get_message_body())
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(flight_plan_record.get_message_body())
+            cached_record, cached_header_length = entry
+            flight_plan_record.set_message_type(cached_record.get_message_type())
+            self.parser.parse_message_header(flight_plan_record)
+            self.copy_body_results(cached_record, flight_plan_record, 0, header_length - cached_header_length)
+            return not flight_plan_record.errors_detected()
+
+        self.misses += 1
+        if not self.parser.set_message_type(flight_plan_record):
+            return False
+        self.parser.parse_message_header(flight_plan_record)
+        first_error = len(flight_plan_record.get_erroneous_fields())
+        result = self.parser.parse_message_body(flight_plan_record)
+        cached_record = FlightPlanRecord()
+        self.copy_body_results(flight_plan_record, cached_record, first_error, 0)
+        self.entries[flight_plan_record.get_message_body()] = (cached_record, header_length)
+        if len(self.entries) > self.maximum_entries:
+            self.entries.popitem(last=False)
+        return result
@@ -0,0 +1,181 @@
+import os
+
+from Configuration.EnumerationConstants import FieldIdentifiers
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from IcaoMessageParser.ParseMessageCache import ParseMessageCache
+from Tokenizer.Token import Token
+
+
+class ParseMessageIncremental(ParseMessage):
+    """This class parses successive versions of a message being edited, (e.g. in the message editor),
+    re-parsing only the fields affected by an edit. The results of parsing each field are kept; when the
+    message is parsed again the edited text range is established by comparing the message with the
+    previous version, and the start and end indices of the fields in the previous flight plan record are
+    used to find the fields that do not overlap the edited range. The results for those fields, (the
+    field, its subfields, its errors and for field 15 the extracted route), are copied from the previous
+    parse and moved by the change in length of the text before them; the remaining fields are parsed.
+
+    The message header, the message title (field 3), the division of the body into fields and the
+    consistency checks are always processed as they are cheap compared to parsing the fields, in
+    particular the field 15 route extraction. If field 3 changes none of the previous results are used.
+
+    The flight plan record populated by this class is identical to one populated by
+    ParseMessage.parse_message() for the same message. This class is not thread safe."""
+
+    previous_message: str = ""
+    """The message parsed last, the message being parsed is compared to this to find the edited range"""
+
+    edited_range: (int, int, int) = (0, 0, 0)
+    """The range of text changed since the previous message; a tuple containing the zero based start
+    index and the end index of the range in the previous message and the change in length of the message"""
+
+    field_results: {FieldIdentifiers: (str, int, int, FlightPlanRecord, int)} = {}
+    """The results of parsing each field of the message parsed last indexed by field identifier. Each
+    entry contains the field text, its start and end index in the message, a flight plan record holding
+    the results of parsing the field and the start index of the field in that flight plan record."""
+
+    previous_field_results: {FieldIdentifiers: (str, int, int, FlightPlanRecord, int)} = {}
+    """The field results of the previous message, available while a message is being parsed"""
+
+    fields_parsed: int = 0
+    """The number of fields parsed since this class was created or cleared"""
+
+    fields_reused: int = 0
+    """The number of fields copied from a previous parse since this class was created or cleared"""
+
+    def __init__(self):
+        # type: () -> None
+        """Creates an incremental parser without any previous results."""
+        self.previous_message = ""
+        self.edited_range = (0, 0, 0)
+        self.field_results = {}
+        self.previous_field_results = {}
+        self.fields_parsed = 0
+        self.fields_reused = 0
+
+    def clear(self):
+        # type: () -> None
+        """Discards the previous results, (e.g. when a different message is loaded into the editor), and
+        resets the statistics.
+
+        :return: None
+        """
+        self.previous_message = ""
+        self.edited_range = (0, 0, 0)
+        self.field_results = {}
+        self.fields_parsed = 0
+        self.fields_reused = 0
+
+    def get_fields_parsed(self):
+        # type: () -> int
+        """Gets the number of fields parsed since this class was created or cleared.
+
+        :return: The number of fields parsed;
+        """
+        return self.fields_parsed
+
+    def get_fields_reused(self):
+        # type: () -> int
+        """Gets the number of fields copied from a previous parse since this class was created or cleared.
+
+        :return: The number of fields reused;
+        """
+        return self.fields_reused
+
+    def get_reusable_field(self, field_identifier, field_text, start_index):
+        # type: (FieldIdentifiers, str, int) -> (str, int, int, FlightPlanRecord, int) | None
+        """Gets the previous results for a field if the field is outside the edited range.
+
+        :param field_identifier: The ICAO field identifier of the field;
+        :param field_text: The field text in the message being parsed;
+        :param start_index: The start index of the field in the message being parsed;
+        :return: The previous field results or None if the field must be parsed;
+        """
+        previous = self.previous_field_results.get(field_identifier)
+        if previous is None:
+            return None
+        previous_text, previous_start_index, previous_end_index, _, _ = previous
+        edit_start_index, edit_end_index, length_change = self.edited_range
+        if previous_end_index <= edit_start_index:
+            expected_start_index = previous_start_index
+        elif previous_start_index >= edit_end_index:
+            expected_start_index = previous_start_index + length_change
+        else:
+            # The field overlaps the edited range
+            return None
+        if start_index != expected_start_index or field_text != previous_text:
+            return None
+        return previous
+
+    def parse_icao_field(self, flight_plan_record, field_identifier, field_parser, token):
+        # type: (FlightPlanRecord, FieldIdentifiers, type, Token) -> None
+        """This method saves a field to the flight plan record and either copies the results of parsing
+        it from the previous message, if the field was not edited, or parses it.
+
+        :param flight_plan_record: The Flight Plan Record the field and the results of parsing it are
+               written to;
+        :param field_identifier: The ICAO field identifier of the field;
+        :param field_parser: The field parser class for the field, a subclass of ParseFieldsCommon;
+        :param token: The token containing the field, its indices are relative to the start of the
+               message body;
+        :return: None
+        """
+        start_index = token.get_token_start_index() + len(flight_plan_record.get_message_header())
+        end_index = token.get_token_end_index() + len(flight_plan_record.get_message_header())
+        if field_identifier == FieldIdentifiers.F3:
+            # Field 3 sets the message title and adjacent units in the flight plan record, it is always
+            # parsed; the other fields depend on the title, if it has changed nothing can be reused
+            if token.get_token_string() != self.previous_field_results.get(field_identifier, ("",))[0]:
+                self.previous_field_results = {}
+            super().parse_icao_field(flight_plan_record, field_identifier, field_parser, token)
+            self.field_results[field_identifier] = (token.get_token_string(), start_index, end_index, None, 0)
+            self.fields_parsed += 1
+            return
+
+        previous = self.get_reusable_field(field_identifier, token.get_token_string(), start_index)
+        if previous is None:
+            # Parse the field on its own so that the results can be reused
+            results = FlightPlanRecord()
+            results.add_icao_field(field_identifier, token.get_token_string(), start_index, end_index)
+            field_parser(results, self.SFIF, self.SFD).parse_field()
+            results_start_index = start_index
+            self.fields_parsed += 1
+        else:
+            _, _, _, results, results_start_index = previous
+            self.fields_reused += 1
+        ParseMessageCache.copy_records(results, flight_plan_record, 0, start_index - results_start_index, 0)
+        self.field_results[field_identifier] = \
+            (token.get_token_string(), start_index, end_index, results, results_start_index)
+
+    def parse_message(self, flight_plan_record, message):
+        # type: (FlightPlanRecord, str | None) -> bool
+        """This method parses a message exactly as ParseMessage.parse_message() does, re-using the results
+        for the fields of the previous message that have not been edited.
+
+        :param flight_plan_record: A flight plan record into which all data extracted by the parser
+               (including errors) are written;
+        :param message: The message with or without header;
+        :return: False if errors are detected, True otherwise;
+        """
+        self.set_edited_range("" if message is None else message)
+        self.previous_field_results = self.field_results
+        self.field_results = {}
+        try:
+            return super().parse_message(flight_plan_record, message)
+        finally:
+            self.previous_message = "" if message is None else message
+            self.previous_field_results = {}
+
+    def set_edited_range(self, message):
+        # type: (str) -> None
+        """Establishes the range of text changed in the previous message to give this message.
+
+        :param message: The message being parsed;
+        :return: None
+        """
+        prefix_length = len(os.path.commonprefix([self.previous_message, message]))
+        suffix_length = len(os.path.commonprefix([self.previous_message[prefix_length:][::-1],
+                                                  message[prefix_length:][::-1]]))
+        self.edited_range = (prefix_length, len(self.previous_message) - suffix_length,
+                             len(message) - len(self.previous_message))
@@ -0,0 +1,73 @@
+class SplitMessages:
+    """This class splits a stream of text, such as an AFTN traffic log, into individual messages that can
+    be passed to the ICAO message parser. Two separation conventions are supported and can be mixed
+    in the same stream:
+        - Messages framed by the control characters SOH (start of heading) and ETX (end of text);
+          blank lines within a framed message do not separate messages;
+        - Messages separated by one or more blank lines.
+
+    The STX (start of text) control character is removed from the message text. The stream is read
+    one line at a time and only the message currently being assembled is held in memory, so the memory
+    used is independent of the size of the stream.
+    """
+
+    SOH: str = "\x01"
+    """The start of heading control character, marks the start of a message"""
+
+    STX: str = "\x02"
+    """The start of text control character, marks the end of the message heading"""
+
+    ETX: str = "\x03"
+    """The end of text control character, marks the end of a message"""
+
+    @staticmethod
+    def split(lines):
+        # type: (Iterable[str]) -> Iterator[str]
+        """This method is a generator that yields the messages found in an iterable of lines, e.g. an
+        open text file or 'sys.stdin'. Each message is stripped of leading and trailing whitespace;
+        empty messages are not returned.
+
+        :param lines: An iterable of lines of text, the lines may include their line terminators;
+        :return: A generator yielding each message as a string;
+        """
+        message = []
+        framed = False
+        for line in lines:
+            while True:
+                soh = line.find(SplitMessages.SOH)
+                etx = line.find(SplitMessages.ETX)
+                if soh >= 0 and (etx < 0 or soh < etx):
+                    # Start of a framed message, anything not terminated before it is a message as well
+                    message.append(line[:soh])
+                    yield from SplitMessages.assemble(message)
+                    message = []
+                    framed = True
+                    line = line[soh + 1:]
+                elif etx >= 0:
+                    message.append(line[:etx])
+                    yield from SplitMessages.assemble(message)
+                    message = []
+                    framed = False
+                    line = line[etx + 1:]
+                else:
+                    break
+
+            if not framed and line.strip() == "":
+                yield from SplitMessages.assemble(message)
+                message = []
+            else:
+                message.append(line)
+
+        yield from SplitMessages.assemble(message)
+
+    @staticmethod
+    def assemble(message):
+        # type: ([str]) -> Iterator[str]
+        """Joins the lines making up a message and yields the message if it is not empty.
+
+        :param message: The lines of text making up a message;
+        :return: A generator yielding the message if it is not empty;
+        """
+        text = "".join(message).replace(SplitMessages.STX, "").strip()
+        if len(text) > 0:
+            yield text
@@ -0,0 +1,116 @@
+"""Command line entry point that runs the AFTN over TCP/IP channel server; AFTN circuits connect to the
+server and the messages received are parsed and stored in the 'Inbox' of the applications working
+directory, where they are displayed by the AFTN Terminal Application. This entry point does not use
+Tkinter and can be run on a headless server, e.g.
+
+    python RunAftnChannel.py --port 5000 --workers 4 /path/to/AFTN-App-Working-Directory
+
+The server runs until interrupted (Ctrl-C); the throughput statistics of each circuit are written to
+standard error at the interval given by '--report' and when the server stops, together with the
+channel sequence number checks of each AFTN channel. With '--segment-store' the messages are appended
+to a SegmentStore rather than written to the Inbox one file per message. With '--search-index' the
+message files written are added to the MessageSearch index of the working directory as they arrive."""
+import argparse
+import asyncio
+import sys
+
+from AFTN_Interface.ChannelServer import ChannelServer
+
+
+def parse_arguments(arguments):
+    # type: ([str]) -> argparse.Namespace
+    """Parses the command line arguments.
+
+    :param arguments: The command line arguments excluding the program name;
+    :return: The parsed arguments;
+    """
+    parser = argparse.ArgumentParser(description="Run the AFTN channel server, messages received are parsed and "
+                                                 "stored in the Inbox of the working directory.")
+    parser.add_argument("working_directory", help="the AFTN Terminal Application working directory")
+    parser.add_argument("--host", default="127.0.0.1", help="the address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=0, help="the port to listen on (default: any free port)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of worker processes used for parsing (default: 1, parse on a thread)")
+    parser.add_argument("--queue-size", type=int, default=ChannelServer.DEFAULT_QUEUE_SIZE,
+                        help="maximum number of messages waiting to be parsed before reading from the circuits "
+                             "is suspended (default: " + str(ChannelServer.DEFAULT_QUEUE_SIZE) + ")")
+    parser.add_argument("--sequence-state", metavar="FILE",
+                        help="file the channel sequence numbers are saved to, so that gaps are detected across "
+                             "restarts (default: not saved)")
+    parser.add_argument("--segment-store", metavar="DIRECTORY",
+                        help="append the messages to a segment store in this directory instead of writing one "
+                             "file per message to the Inbox (default: write to the Inbox)")
+    parser.add_argument("--search-index", action="store_true",
+                        help="add the messages written to the Inbox to the search index of the working directory")
+    parser.add_argument("--report", type=float, default=60.0, metavar="SECONDS",
+                        help="interval at which the circuit statistics are reported (default: 60)")
+    return parser.parse_args(arguments)
+
+
+def report(server):
+    # type: (ChannelServer) -> None
+    """Writes the throughput statistics of each circuit to standard error.
+
+    :param server: The channel server;
+    :return: None
+    """
+    print("Queue depth " + str(server.get_queue_depth()) + ", maximum " + str(server.get_maximum_queue_depth()),
+          file=sys.stderr)
+    for circuit in server.get_circuits():
+        bytes_per_second, messages_per_second = circuit.get_throughput()
+        print("{0} {1}: {2} bytes, {3} messages received, {4} stored, {5} rejected, {6} discarded; "
+              "{7:.0f} bytes/s, {8:.1f} messages/s; back-pressure {9:.1f}s".format(
+                  circuit.get_name(), "connected" if circuit.is_connected() else "disconnected",
+                  circuit.get_bytes_received(), circuit.get_messages_received(), circuit.get_messages_stored(),
+                  circuit.get_messages_rejected(), circuit.get_frames_discarded(), bytes_per_second,
+                  messages_per_second, circuit.get_back_pressure_time()), file=sys.stderr)
+    for channel in server.get_sequence_tracker().get_channels():
+        print("Channel {0}: {1} received, next expected {2:03d}; {3} gaps, {4} missing {5}, {6} lost, "
+              "{7} out of order, {8} duplicates".format(
+                  channel.get_channel(), channel.get_received(), channel.get_next_expected(), channel.get_gaps(),
+                  channel.get_missing_outstanding(), channel.get_missing_numbers(), channel.get_lost(),
+                  channel.get_late(), channel.get_duplicates()), file=sys.stderr)
+
+
+async def run(args):
+    # type: (argparse.Namespace) -> None
+    """Runs the channel server until cancelled.
+
+    :param args: The parsed command line arguments;
+    :return: None
+    """
+    server = ChannelServer(args.working_directory, args.host, args.port, args.workers, args.queue_size,
+                           sequence_state_path=args.sequence_state, segment_store_path=args.segment_store,
+                           search_index=args.search_index)
+    await server.start()
+    print("AFTN channel server listening on " + args.host + ":" + str(server.get_port()), file=sys.stderr)
+    try:
+        while True:
+            await asyncio.sleep(args.report)
+            report(server)
+            await server.checkpoint_sequence_state()
+    finally:
+        await server.stop()
+        report(server)
+
+
+def main(arguments):
+    # type: ([str]) -> int
+    """Runs the channel server.
+
+    :param arguments: The command line arguments excluding the program name;
+    :return: The program exit status;
+    """
+    args = parse_arguments(arguments)
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+    except (OSError, ValueError) as e:
+        print("Unable to run the channel server: " + str(e), file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,124 @@
+"""Command line entry point that transmits the messages in the 'Outbox' of the applications working
+directory on an outbound AFTN channel, in priority order and at a limited rate. The channel is a TCP/IP
+connection to an AFTN peer, (e.g. a channel server started with RunAftnChannel.py), or a file standing
+in for the channel. This entry point does not use Tkinter and can be run on a headless server, e.g.
+
+    python RunAftnOutbound.py --host 10.0.0.1 --port 5000 /path/to/AFTN-App-Working-Directory
+    python RunAftnOutbound.py --output channel.cap --rate 0 /path/to/AFTN-App-Working-Directory
+
+The Outbox is scanned for new messages at the interval given by '--scan'; transmitted message files are
+moved to the 'Sent' subdirectory of the Outbox. The queue depth and the latency of each priority are
+written to standard error at the interval given by '--report' and when interrupted (Ctrl-C). If writing to
+the channel fails, (e.g. the peer closes the connection), the error is reported and the program exits with
+status 2; the messages not transmitted remain in the Outbox and are transmitted when the program is run again."""
+import argparse
+import asyncio
+import sys
+import time
+
+from AFTN_Interface.OutboundScheduler import OutboundScheduler, StreamSink, FileSink
+
+
+def parse_arguments(arguments):
+    # type: ([str]) -> argparse.Namespace
+    """Parses the command line arguments.
+
+    :param arguments: The command line arguments excluding the program name;
+    :return: The parsed arguments;
+    """
+    parser = argparse.ArgumentParser(description="Transmit the messages in the Outbox of the working directory "
+                                                 "in priority order on an AFTN channel.")
+    parser.add_argument("working_directory", help="the AFTN Terminal Application working directory")
+    channel = parser.add_mutually_exclusive_group(required=True)
+    channel.add_argument("--host", help="the address of the AFTN peer to connect to")
+    channel.add_argument("--output", metavar="FILE", help="write the channel data to a file instead of a peer")
+    parser.add_argument("--port", type=int, default=5000, help="the port of the AFTN peer (default: 5000)")
+    parser.add_argument("--rate", type=float, default=OutboundScheduler.DEFAULT_CHARACTERS_PER_SECOND,
+                        help="maximum characters per second, 0 for no limit (default: " +
+                             str(OutboundScheduler.DEFAULT_CHARACTERS_PER_SECOND) + ")")
+    parser.add_argument("--scan", type=float, default=5.0, metavar="SECONDS",
+                        help="interval at which the Outbox is scanned for new messages (default: 5)")
+    parser.add_argument("--report", type=float, default=60.0, metavar="SECONDS",
+                        help="interval at which the queue statistics are reported (default: 60)")
+    return parser.parse_args(arguments)
+
+
+def report(scheduler):
+    # type: (OutboundScheduler) -> None
+    """Writes the queue depth and the transmission metrics of each priority to standard error.
+
+    :param scheduler: The outbound scheduler;
+    :return: None
+    """
+    print("Queue depth " + str(scheduler.get_queue_depth()), file=sys.stderr)
+    for statistics in scheduler.get_all_statistics():
+        print("{0:2}: {1} queued, {2} transmitted, {3} characters, {4} pre-empted; latency average {5:.1f}s, "
+              "maximum {6:.1f}s".format(
+                  statistics.get_priority_indicator() or "--",
+                  scheduler.get_queue_depth(statistics.get_priority_indicator()),
+                  statistics.get_messages_transmitted(), statistics.get_characters_transmitted(),
+                  statistics.get_preemptions(), statistics.get_average_latency(),
+                  statistics.get_maximum_latency()), file=sys.stderr)
+
+
+async def transmit(args, scheduler):
+    # type: (argparse.Namespace, OutboundScheduler) -> None
+    """Scans the Outbox and transmits the messages until cancelled, or until writing to the channel fails.
+
+    :param args: The parsed command line arguments;
+    :param scheduler: The outbound scheduler;
+    :return: None
+    """
+    scheduler.start()
+    report_time = time.monotonic() + args.report
+    try:
+        while True:
+            scheduler.load_outbox(args.working_directory)
+            await asyncio.wait({scheduler.transmitter}, timeout=args.scan)
+            scheduler.check_transmitter()
+            if time.monotonic() >= report_time:
+                report(scheduler)
+                report_time = time.monotonic() + args.report
+    finally:
+        await scheduler.stop()
+        report(scheduler)
+
+
+async def run(args):
+    # type: (argparse.Namespace) -> None
+    """Connects to the channel and transmits the messages until cancelled.
+
+    :param args: The parsed command line arguments;
+    :return: None
+    """
+    if args.output is not None:
+        with open(args.output, "ab") as output:
+            await transmit(args, OutboundScheduler(FileSink(output), args.rate))
+        return
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    try:
+        await transmit(args, OutboundScheduler(StreamSink(writer), args.rate))
+    finally:
+        writer.close()
+
+
+def main(arguments):
+    # type: ([str]) -> int
+    """Transmits the messages in the Outbox.
+
+    :param arguments: The command line arguments excluding the program name;
+    :return: The program exit status;
+    """
+    args = parse_arguments(arguments)
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print("Unable to transmit on the channel: " + str(e), file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,164 @@
+"""Command line entry point that parses a file (or standard input) containing raw AFTN/ATS messages and
+writes the parsed flight plan records to standard output, either as XML or as JSON lines. This entry
+point does not use Tkinter and can be run on a headless server, e.g.
+
+    python RunAftnParser.py --format json traffic.log > traffic.jsonl
+    cat traffic.log | python RunAftnParser.py --workers 4 > traffic.xml
+    python RunAftnParser.py --cache 1000 traffic.log > traffic.xml
+    python RunAftnParser.py --channel --format json channel.cap > traffic.jsonl
+
+Messages are split from the input on SOH/ETX framing characters or blank lines; the input is read and
+the output written as a stream so the memory used does not depend on the size of the input. A raw
+capture of AFTN channel data is read with '--channel', messages are then framed by SOH/STX/ETX or the
+ITA-2 signals ZCZC/NNNN and anything outside a frame is discarded. Traffic with
+many duplicate messages can be parsed through a cache of parse results with '--cache', the cache hit and
+miss statistics are written to standard error. A message the parser fails on is reported on standard error
+and parsing continues with the next message."""
+import argparse
+import os
+import sys
+
+from AFTN_Interface.AftnFramer import AftnFramer
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from IcaoMessageParser.ParseMessageCache import ParseMessageCache
+from IcaoMessageParser.SplitMessages import SplitMessages
+
+
+def parse_arguments(arguments):
+    # type: ([str]) -> argparse.Namespace
+    """Parses the command line arguments.
+
+    :param arguments: The command line arguments excluding the program name;
+    :return: The parsed arguments;
+    """
+    parser = argparse.ArgumentParser(description="Parse raw AFTN/ATS messages and write the flight plan "
+                                                 "records as XML or JSON lines to standard output.")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="file containing the messages, '-' (the default) reads standard input")
+    parser.add_argument("--format", choices=["xml", "json"], default="xml",
+                        help="output format, one XML document or one JSON line per message (default: xml)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of worker processes used for parsing (default: 1, parse in this process)")
+    parser.add_argument("--chunksize", type=int, default=ParseMessage.DEFAULT_CHUNK_SIZE,
+                        help="number of messages sent to a worker process in one go (default: " +
+                             str(ParseMessage.DEFAULT_CHUNK_SIZE) + ")")
+    parser.add_argument("--cache", type=int, default=0, metavar="ENTRIES",
+                        help="cache the parse results of up to ENTRIES message bodies so that duplicate messages "
+                             "are not parsed again, requires '--workers 1' (default: 0, no cache)")
+    parser.add_argument("--channel", action="store_true",
+                        help="the input is a raw capture of AFTN channel data, messages are framed by SOH/STX/ETX "
+                             "or ZCZC/NNNN and data outside a frame is discarded")
+    args = parser.parse_args(arguments)
+    if args.cache > 0 and args.workers > 1:
+        parser.error("--cache requires --workers 1")
+    return args
+
+
+def parse_cached(messages, cache):
+    # type: (Iterable[str], ParseMessageCache) -> Iterator[(int, FlightPlanRecord)]
+    """Parses a sequence of messages in this process through a cache of parse results.
+
+    :param messages: An iterable of messages (strings) with or without header;
+    :param cache: The cache the messages are parsed with;
+    :return: A generator yielding a tuple of the message index and the FlightPlanRecord for each message,
+             as ParseMessage.parse_many() does, including the records of messages the parser failed on;
+    """
+    for index, message in enumerate(messages):
+        flight_plan_record = FlightPlanRecord()
+        try:
+            cache.parse_message(flight_plan_record, message)
+        except Exception as e:
+            flight_plan_record = ParseMessage.get_parser_failure(message, e)
+        yield index, flight_plan_record
+
+
+def write_records(lines, output, output_format, workers, chunksize, cache=None):
+    # type: (Iterable[str], TextIO, str, int, int, ParseMessageCache | None) -> int
+    """Splits the lines into messages, parses each message and writes the resulting flight plan records
+    to the output in the order the messages were read.
+
+    :param lines: An iterable of lines of text containing the messages;
+    :param output: The text stream the flight plan records are written to;
+    :param output_format: Either 'xml' or 'json';
+    :param workers: The number of worker processes used for parsing;
+    :param chunksize: The number of messages sent to a worker process in one go;
+    :param cache: A cache of parse results the messages are parsed with in this process, None to parse
+           every message with 'workers' processes;
+    :return: The number of messages parsed;
+    """
+    return write_messages(SplitMessages.split(lines), output, output_format, workers, chunksize, cache)
+
+
+def write_messages(messages, output, output_format, workers, chunksize, cache=None):
+    # type: (Iterable[str], TextIO, str, int, int, ParseMessageCache | None) -> int
+    """Parses each message and writes the resulting flight plan records to the output in the order
+    the messages were read. A message the parser fails on is reported on standard error, its flight plan
+    record, (see ParseMessage.get_parser_failure()), is written and parsing continues.
+
+    :param messages: An iterable of messages (strings) with or without header;
+    :param output: The text stream the flight plan records are written to;
+    :param output_format: Either 'xml' or 'json';
+    :param workers: The number of worker processes used for parsing;
+    :param chunksize: The number of messages sent to a worker process in one go;
+    :param cache: A cache of parse results the messages are parsed with in this process, None to parse
+           every message with 'workers' processes;
+    :return: The number of messages parsed;
+    """
+    number_of_messages = 0
+    if cache is None:
+        results = ParseMessage().parse_many(messages, workers, chunksize)
+    else:
+        results = parse_cached(messages, cache)
+    for index, flight_plan_record in results:
+        if ParseMessage.is_parser_failure(flight_plan_record):
+            error = flight_plan_record.get_erroneous_fields()[0]
+            print("Unable to parse message " + str(index + 1) + ": " +
+                  error.get_error_message()[len(ParseMessage.PARSER_FAILURE):] + "\n" +
+                  repr(error.get_field_text()[:200]), file=sys.stderr)
+        match output_format:
+            case "json":
+                output.write(flight_plan_record.as_json() + "\n")
+            case _:
+                output.write(flight_plan_record.as_xml() + os.linesep)
+        number_of_messages += 1
+    return number_of_messages
+
+
+def main(arguments):
+    # type: ([str]) -> int
+    """Runs the command line parser.
+
+    :param arguments: The command line arguments excluding the program name;
+    :return: The program exit status;
+    """
+    args = parse_arguments(arguments)
+    cache = ParseMessageCache(args.cache) if args.cache > 0 else None
+    try:
+        if args.channel:
+            with open(args.input, "rb") if args.input != "-" else sys.stdin.buffer as stream:
+                write_messages(AftnFramer().read_messages(stream), sys.stdout, args.format, args.workers,
+                               args.chunksize, cache)
+        elif args.input == "-":
+            # Keep the line terminators as they are, AFTN lines end with CR CR LF
+            sys.stdin.reconfigure(newline="\n")
+            write_records(sys.stdin, sys.stdout, args.format, args.workers, args.chunksize, cache)
+        else:
+            with open(args.input, "r", encoding="utf-8", errors="replace", newline="\n") as lines:
+                write_records(lines, sys.stdout, args.format, args.workers, args.chunksize, cache)
+        sys.stdout.flush()
+        if cache is not None:
+            print("Parse cache: " + str(cache.get_hits()) + " hits, " + str(cache.get_misses()) + " misses, " +
+                  "hit ratio {0:.1%}".format(cache.get_hit_ratio()), file=sys.stderr)
+    except BrokenPipeError:
+        # The reader went away (e.g. output piped into 'head'), stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except OSError as e:
+        print("Unable to parse '" + args.input + "': " + str(e), file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
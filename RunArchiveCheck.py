@@ -0,0 +1,75 @@
+"""Command line entry point that checks all the message XML files in a working directory conform to the
+flight plan record XML schema, e.g.
+
+    python RunArchiveCheck.py --report check-report.tsv /path/to/AFTN-App-Working-Directory
+
+The files that do not conform are listed on standard output with the reasons; the result for every file
+is written to the report file. If the check is interrupted, running the same command again resumes the
+check after the last file in the report; use '--restart' to discard the report and start again."""
+import argparse
+import os
+import sys
+
+from AFTN_Terminal.CheckArchive import CheckArchive
+from AFTN_Terminal.ValidateXml import ValidateXml
+
+
+def parse_arguments(arguments):
+    # type: ([str]) -> argparse.Namespace
+    """Parses the command line arguments.
+
+    :param arguments: The command line arguments excluding the program name;
+    :return: The parsed arguments;
+    """
+    parser = argparse.ArgumentParser(description="Check the message XML files in a working directory conform "
+                                                 "to the flight plan record XML schema.")
+    parser.add_argument("working_directory", help="the directory to check, including all its subdirectories")
+    parser.add_argument("--report", default="archive-check-report.tsv",
+                        help="report file, one line per file checked (default: archive-check-report.tsv)")
+    parser.add_argument("--schema", default=ValidateXml.DEFAULT_SCHEMA_PATH,
+                        help="XML schema file (default: the flight plan record schema)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("--chunksize", type=int, default=CheckArchive.DEFAULT_CHUNK_SIZE,
+                        help="number of files sent to a worker process in one go (default: " +
+                             str(CheckArchive.DEFAULT_CHUNK_SIZE) + ")")
+    parser.add_argument("--restart", action="store_true",
+                        help="discard an existing report and check all the files again")
+    return parser.parse_args(arguments)
+
+
+def main(arguments):
+    # type: ([str]) -> int
+    """Runs the archive check.
+
+    :param arguments: The command line arguments excluding the program name;
+    :return: The program exit status, 0 if all files conform, 1 if any do not, 2 on error;
+    """
+    args = parse_arguments(arguments)
+    if not os.path.isdir(args.working_directory):
+        print("'" + args.working_directory + "' is not a directory", file=sys.stderr)
+        return 2
+    if args.restart and os.path.exists(args.report):
+        os.remove(args.report)
+
+    try:
+        check_archive = CheckArchive(args.working_directory, args.report, args.schema)
+        if check_archive.files_checked > 0:
+            print("Resuming after " + str(check_archive.files_checked) + " files already in '" + args.report + "'")
+        for path, reasons in check_archive.check(args.workers, args.chunksize):
+            if len(reasons) > 0:
+                print(path + os.linesep + "".join("    " + reason + os.linesep for reason in reasons), end="")
+    except (OSError, ValueError) as e:
+        print("Unable to check '" + args.working_directory + "': " + str(e), file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        print("Interrupted, run again to resume the check", file=sys.stderr)
+        return 2
+
+    print("Checked " + str(check_archive.files_checked) + " files, " + str(check_archive.files_invalid) +
+          " do not conform to the schema")
+    return 0 if check_archive.files_invalid == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
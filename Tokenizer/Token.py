@@ -14,35 +14,46 @@ class Token:
         - Token Base Type - Derived from a tokens' syntax as defined in the
           'F15TokenSyntaxDescriptions.TokenBaseType' class.
         - Token Subtype - Derived from a tokens syntax as defined in the
-          'F15TokenSyntaxDescriptions.TokenSubType' class."""
+          'F15TokenSyntaxDescriptions.TokenSubType' class.
+    A token created by the tokenizer stores its start and end index into the string it was extracted
+    from; the token text is sliced from the source string when it is first requested."""
 
-    token_string: str = ""
-    """# A string representing a token"""
+    __slots__ = ("token_string", "source_string", "token_start_index", "token_end_index", "token_base_type",
+                 "token_sub_type")
 
-    token_start_index: int = 0
+    token_string: str | None
+    """# A string representing a token, None until sliced from the source string"""
+
+    source_string: str | None
+    """The string the token was extracted from, None if the token text was given explicitly"""
+
+    token_start_index: int
     """The start index of a token into the string from which a token was extracted"""
 
-    token_end_index: int = 0
+    token_end_index: int
     """The end index of a token into the string from which a token was extracted"""
 
-    token_base_type: TokenBaseType = 0
+    token_base_type: TokenBaseType
     """Contains one of the token base type definitions (Point, Connector, Modifier
     # etc.) as defined in the 'F15TokenSyntaxDescriptions.TokenBaseType' class."""
 
-    token_sub_type: TokenSubType = 0
+    token_sub_type: TokenSubType
     """Contains one of the token subtype definitions (TASRFL, MACHVFR, Point,
     # Aerodrome etc.) as defined in the 'F15TokenDescriptions.TokenSubType' class."""
 
-    def __init__(self, token_string="", token_start_index=0, token_end_index=0):
-        # type: (str, int, int) -> None
+    def __init__(self, token_string="", token_start_index=0, token_end_index=0, source_string=None):
+        # type: (str, int, int, str | None) -> None
         """Creates a token with its text, start and end index. The base and subtype
         members are initialised as 'unknown'.
 
-            :param token_string: The text that is the token;
+            :param token_string: The text that is the token, ignored if 'source_string' is given;
             :param token_start_index: The zero based start index of the token text's position in the original string;
             :param token_end_index: The zero based end index of the token text's position in the original string;
+            :param source_string: The original string, if given, the token text is sliced from it when first
+                   requested;
             :return: None"""
-        self.token_string = token_string
+        self.token_string = token_string if source_string is None else None
+        self.source_string = source_string
         self.token_start_index = token_start_index
         self.token_end_index = token_end_index
         self.token_base_type = TokenBaseType.F15_UNKNOWN
@@ -61,6 +72,8 @@ class Token:
         """This method gets a token's string.
 
             :return: The text that stored in this token instance;"""
+        if self.token_string is None:
+            self.token_string = self.source_string[self.token_start_index:self.token_end_index]
         return self.token_string
 
     # Sets a tokens start index
@@ -70,6 +83,8 @@ class Token:
         string it was extracted from.
 
             :return: None"""
+        # The token text no longer depends on the indices once they are changed
+        self.get_token_string()
         self.token_start_index = token_start_index
 
     # Gets a tokens start index
@@ -89,6 +104,8 @@ class Token:
         string it was extracted from.
 
             :return: None"""
+        # The token text no longer depends on the indices once they are changed
+        self.get_token_string()
         self.token_end_index = token_end_index
 
     # Gets a tokens end index
@@ -1,3 +1,5 @@
+import re
+
 from Tokenizer.Tokens import Tokens
 
 
@@ -6,7 +8,14 @@ class Tokenize:
     whitespace characters, storing each token along with its location where it was
     found in the input string (a tokens start and end index in the source string). The
     individual tokens along with their associated attributes are stored in a 'Tokens'
-    class instance. """
+    class instance.
+
+    The tokens are found by a regular expression compiled for the whitespace characters, (cached for
+    each set of whitespace characters) in a single pass over the input string; the tokens are stored
+    as their position in the input string until they are retrieved. """
+
+    TOKEN_PATTERNS: {str: re.Pattern} = {}
+    """The compiled regular expressions matching the tokens, indexed by the whitespace characters"""
 
     string_to_tokenize: str = ""
     """The input string containing the tokens to be extracted"""
@@ -35,21 +44,29 @@ class Tokenize:
 
             :return: None"""
         self.tokens = Tokens()
-        idx = 0
-        token_text = ""
-        for item in self.string_to_tokenize:
-            if item in self.whitespace:
-                if len(token_text) > 0:
-                    self.__save_token(token_text, idx)
-                if item in "/":
-                    # We have to save the forward slash token
-                    self.__save_token(item, idx+1)
-                token_text = ""
+        self.tokens.append_token_spans(
+            self.string_to_tokenize,
+            [match.span() for match in self.get_token_pattern(self.whitespace).finditer(self.string_to_tokenize)])
+
+    @staticmethod
+    def get_token_pattern(whitespace):
+        # type: (str) -> re.Pattern
+        """Gets the regular expression that matches the tokens for a whitespace character set; a token is
+        a sequence of characters that are not whitespace or a single forward slash if the forward slash is
+        a whitespace character.
+
+            :param whitespace: The string containing characters considered as whitespace when tokenizing;
+            :return: The compiled regular expression;"""
+        pattern = Tokenize.TOKEN_PATTERNS.get(whitespace)
+        if pattern is None:
+            if len(whitespace) == 0:
+                pattern = re.compile(".+", re.DOTALL)
+            elif "/" in whitespace:
+                pattern = re.compile("[^" + re.escape(whitespace) + "]+|/")
             else:
-                token_text = token_text + item
-            idx = idx + 1
-
-        self.__save_token(token_text, idx)
+                pattern = re.compile("[^" + re.escape(whitespace) + "]+")
+            Tokenize.TOKEN_PATTERNS[whitespace] = pattern
+        return pattern
 
     def set_string_to_tokenize(self, string_to_tokenize=""):
         # type: (str) -> None
@@ -92,14 +109,3 @@ class Tokenize:
 
             :return: A list containing zero or more Token classes"""
         return self.tokens
-
-    def __save_token(self, token_text, idx):
-        # type: (str, int) -> None
-        """Save a token to a local token attribute.
-
-            :param token_text: Saves the token_text to a token at index idx;
-            :param idx: The index identifying a token in the list of tokens;
-            :return: None"""
-        if len(token_text) > 0:
-            self.tokens.create_append_token(
-                token_text, idx - len(token_text), idx)
@@ -5,10 +5,19 @@ class Tokens:
     """This class contains a list of tokens where each token represents a string of
     # characters tokenized from a string by the Tokenizer class.
     # Refer to the Token class for details about a Token's content.
-    # This class provides methods to append and retrieve tokens to / from this class."""
+    # This class provides methods to append and retrieve tokens to / from this class.
+    # Tokens created by the tokenizer are stored as their start and end index into the source string;
+    # the Token instance is only created when the token is retrieved."""
 
-    tokens: [Token] = None
-    """A list of tokens as the Token class"""
+    tokens: [Token | tuple] = None
+    """A list of tokens as the Token class; or, for a token that has not been retrieved yet, a tuple
+    containing the token's start and end index in 'source_string'"""
+
+    source_string: str = ""
+    """The string the tokens stored as start and end indices were extracted from"""
+
+    spans_pending: bool = False
+    """True if the list of tokens may contain tokens stored as start and end indices"""
 
     current_token: int = 0
     """Keeps track of the current tokens index when calling get_next_token()
@@ -21,6 +30,8 @@ class Tokens:
             :return: None"""
         self.current_token = 0
         self.tokens = []
+        self.source_string = ""
+        self.spans_pending = False
 
     def get_number_of_tokens(self):
         # type: () -> int
@@ -58,11 +69,30 @@ class Tokens:
             :return: None"""
         self.append_token(Token(token_text, token_start_index, token_end_index))
 
+    def append_token_spans(self, source_string, token_spans):
+        # type: (str, [(int, int)]) -> None
+        """This method appends tokens to this class instance given as their position in a source string;
+        the Token instances are created, and their text sliced from the source string, when the tokens
+        are retrieved.
+
+            :param source_string: The string the tokens were extracted from; all the tokens appended
+                                  this way must be from the same string;
+            :param token_spans: A tuple with the zero based start and end index of each token in the
+                                source string;
+            :return: None"""
+        self.source_string = source_string
+        self.tokens.extend(token_spans)
+        self.spans_pending = len(self.tokens) > 0
+
     def get_tokens(self):
         # type: () -> [Token]
         """This method gets the list of tokens
 
             :return: The list of token stored in this class;"""
+        if self.spans_pending:
+            self.spans_pending = False
+            self.tokens = [Token("", token[0], token[1], self.source_string) if token.__class__ is tuple else token
+                           for token in self.tokens]
         return self.tokens
 
     def get_token_at(self, index):
@@ -74,7 +104,11 @@ class Tokens:
                     'index' or None if the index is out of range;"""
         if index < 0 or index >= len(self.tokens):
             return None
-        return self.tokens[index]
+        token = self.tokens[index]
+        if token.__class__ is tuple:
+            token = Token("", token[0], token[1], self.source_string)
+            self.tokens[index] = token
+        return token
 
     def get_first_token(self):
         # type: () -> Token
@@ -164,5 +198,5 @@ class Tokens:
               "{0:>6}".format("Index") +
               "{0:>5}".format("Type") +
               "{0:>5}".format("Type"))
-        for item in self.tokens:
+        for item in self.get_tokens():
             item.print_token()
@@ -0,0 +1,103 @@
+import io
+import unittest
+
+from AFTN_Interface.AftnFramer import AftnFramer
+from Configuration.EnumerationConstants import MessageTitles
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class AftnFramerTests(unittest.TestCase):
+    HEADING = "FF ABCDEFGH\r\r\n241309 IJKLMNOP\r\r\n"
+
+    FPL = "(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 PNT 23N123W-LOWW0200-0)"
+
+    ARR = "(ARR-TEST14-LOWW0800-LOWW0200-SOME AIRPORT)"
+
+    # IA-5 and ITA-2 frames with idle characters between them
+    CHANNEL_DATA = b"\x16\x16\x01" + HEADING.encode() + b"\x02" + FPL.encode() + b"\r\n\x0b\x03\x16\x16" + \
+        b"ZCZC " + HEADING.encode() + ARR.encode() + b"\r\n\n\n\n\n\n\nNNNN\r\n" + \
+        b"\x01\x02" + ARR.encode() + b"\x03"
+
+    MESSAGES = [HEADING + FPL, HEADING + ARR, ARR]
+
+    # The number of messages framed in one stream
+    BENCHMARK_MESSAGES = 20000
+
+    @staticmethod
+    def feed(framer, data, read_size):
+        # type: (AftnFramer, bytes, int) -> [str]
+        messages = []
+        for index in range(0, len(data), read_size):
+            messages.extend(framer.feed(data[index:index + read_size]))
+        return messages
+
+    def test_frames(self):
+        self.assertEqual(self.MESSAGES, self.feed(AftnFramer(), self.CHANNEL_DATA, len(self.CHANNEL_DATA)))
+
+    def test_frames_split_over_reads(self):
+        # Every split of the data over two reads, then a character at a time
+        for split_index in range(len(self.CHANNEL_DATA) + 1):
+            framer = AftnFramer()
+            messages = framer.feed(self.CHANNEL_DATA[:split_index]) + framer.feed(self.CHANNEL_DATA[split_index:])
+            self.assertEqual(self.MESSAGES, messages, split_index)
+        framer = AftnFramer()
+        self.assertEqual(self.MESSAGES, self.feed(framer, self.CHANNEL_DATA, 1))
+        self.assertEqual(3, framer.get_frames())
+
+    def test_interrupted_and_discarded_frames(self):
+        framer = AftnFramer(100)
+        # An IA-5 frame interrupted by the next SOH and an ITA-2 frame interrupted by the next ZCZC
+        self.assertEqual(["(CNL-TEST06", self.ARR, "(CNL-TEST07", self.ARR],
+                         framer.feed(b"\x01(CNL-TEST06\x01" + self.ARR.encode() + b"\x03"
+                                     b"ZCZC (CNL-TEST07 ZCZC " + self.ARR.encode() + b" NNNN"))
+        # ZCZC and NNNN are text in an IA-5 frame, ETX and NNNN outside a frame are discarded
+        self.assertEqual(["ZCZC (CNL-TEST08-LOWW-EDDF-0) NNNN"],
+                         framer.feed(b"\x03NNNN\x01ZCZC (CNL-TEST08-LOWW-EDDF-0) NNNN\x03"))
+        # A frame exceeding the maximum length is discarded, framing resumes at the next frame
+        self.assertEqual([], framer.feed(b"\x01" + b"A" * 200))
+        self.assertEqual([self.ARR], framer.feed(b"\x03\x01" + self.ARR.encode() + b"\x03"))
+        self.assertEqual((6, 1), (framer.get_frames(), framer.get_frames_discarded()))
+        # Empty frames are not returned, an unterminated frame is not returned until terminated
+        self.assertEqual([], framer.feed(b"\x01\x02\x03ZCZC\r\nNNNN\x01(CNL"))
+        self.assertEqual(["(CNL-TEST09)"], framer.feed(b"-TEST09)\x03"))
+        # A frame exceeding the maximum length is discarded whether or not it is complete in one read
+        for read_size in [1, 50, 100, 502]:
+            framer = AftnFramer(100)
+            self.assertEqual([], self.feed(framer, b"\x01" + b"A" * 500 + b"\x03", read_size), read_size)
+            self.assertEqual((0, 1), (framer.get_frames(), framer.get_frames_discarded()), read_size)
+        # A frame of exactly the maximum length is kept
+        framer = AftnFramer(100)
+        self.assertEqual(["A" * 99], framer.feed(b"\x01" + b"A" * 99 + b"\x03"))
+
+    def test_discarded_frames_split_over_reads(self):
+        # The rest of a discarded frame is skipped up to its end, signals within it do not start a frame
+        for data, expected in [
+                (b"\x01" + b"A" * 40 + b" ZCZC JUNK NNNN\x03", []),
+                (b"\x01" + b"A" * 40 + b" ZCZC JUNK NNNN\x03\x01(CNL-TEST09)\x03", ["(CNL-TEST09)"]),
+                (b"\x01" + b"A" * 40 + b"\x01(CNL-TEST09)\x03", ["(CNL-TEST09)"]),
+                (b"ZCZC " + b"A" * 40 + b"\x03 NNNN ZCZC (CNL-TEST09) NNNN", ["(CNL-TEST09)"]),
+                (b"ZCZC " + b"A" * 40 + b" ZCZC (CNL-TEST09) NNNN", ["(CNL-TEST09)"])]:
+            for read_size in range(1, len(data) + 1):
+                framer = AftnFramer(30)
+                self.assertEqual(expected, self.feed(framer, data, read_size), (data, read_size))
+                self.assertEqual(1, framer.get_frames_discarded(), (data, read_size))
+
+    def test_parse_frames(self):
+        results = []
+        for message in AftnFramer().read_messages(io.BytesIO(self.CHANNEL_DATA), 16):
+            flight_plan_record = FlightPlanRecord()
+            ParseMessage().parse_message(flight_plan_record, message)
+            results.append((flight_plan_record.get_message_title(), flight_plan_record.get_message_header()))
+        self.assertEqual([(MessageTitles.FPL, self.HEADING), (MessageTitles.ARR, self.HEADING),
+                          (MessageTitles.ARR, "")], results)
+
+    def test_many_frames(self):
+        data = self.CHANNEL_DATA * (self.BENCHMARK_MESSAGES // len(self.MESSAGES))
+        framer = AftnFramer()
+        self.assertEqual(self.MESSAGES * (self.BENCHMARK_MESSAGES // len(self.MESSAGES)),
+                         self.feed(framer, data, 65536))
+
+
+if __name__ == '__main__':
+    unittest.main()
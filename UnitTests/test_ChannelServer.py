@@ -0,0 +1,151 @@
+import asyncio
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from AFTN_Interface.ChannelServer import ChannelServer
+from AFTN_Terminal.ReadXml import ReadXml
+
+
+class ChannelServerTests(unittest.IsolatedAsyncioTestCase):
+    FPL = "(FPL-TEST{0:02d}-IS-B737/M-S/C-LOWW0800-N0450F350 PNT 23N123W-LOWW0200-0)"
+
+    def setUp(self):
+        self.working_directory = tempfile.TemporaryDirectory()
+        for directory in ["Inbox", os.path.join("Inbox", "FF"), os.path.join("Inbox", "GG")]:
+            os.mkdir(os.path.join(self.working_directory.name, directory))
+
+    def tearDown(self):
+        self.working_directory.cleanup()
+
+    def list_inbox(self, directory):
+        # type: (str) -> [str]
+        path = os.path.join(self.working_directory.name, "Inbox", directory)
+        return sorted(name for name in os.listdir(path) if name.endswith(".xml"))
+
+    @staticmethod
+    async def send(port, data, write_size):
+        # type: (int, bytes, int) -> None
+        # A stand-in AFTN peer; connects to the server on the loopback interface, sends the data in
+        # pieces and disconnects
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for index in range(0, len(data), write_size):
+            writer.write(data[index:index + write_size])
+            await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_circuits(self):
+        server = ChannelServer(self.working_directory.name)
+        await server.start()
+        try:
+            # Each circuit sends ten messages, an IA-5 circuit with priority FF, an ITA-2 circuit with
+            # priority GG and an IA-5 circuit sending messages without a heading. The IA-5 circuit sends
+            # channel sequence number 005 after 006
+            ia5 = b"".join(b"\x01ABC" + "{0:03d}".format(number).encode() +
+                           b"\r\nFF ABCDEFGH\r\r\n241309 IJKLMNOP\r\r\n\x02" + self.FPL.format(idx).encode() +
+                           b"\x03" for idx, number in enumerate([1, 2, 3, 4, 6, 5, 7, 8, 9, 10]))
+            ita2 = b"".join(b"ZCZC GG ABCDEFGH\r\r\n241309 IJKLMNOP\r\r\n" + self.FPL.format(idx).encode() +
+                            b"\r\n\n\n\n\n\n\nNNNN" for idx in range(10, 20))
+            no_heading = b"".join(b"\x01" + self.FPL.format(idx).encode() + b"\x03" for idx in range(20, 30))
+            await asyncio.gather(self.send(server.get_port(), ia5, 7), self.send(server.get_port(), ita2, 100),
+                                 self.send(server.get_port(), no_heading, len(no_heading)))
+            # The messages may still be parsed once the peers have disconnected
+            while sum(circuit.get_messages_received() for circuit in server.get_circuits()) < 30:
+                await asyncio.sleep(0.01)
+            await server.wait_until_stored()
+        finally:
+            await server.stop()
+
+        self.assertEqual([10, 10, 10], [len(self.list_inbox(directory)) for directory in ["FF", "GG", ""]])
+        callsigns = [ReadXml(os.path.join(self.working_directory.name, "Inbox", "GG", name)).get_f7()
+                     for name in self.list_inbox("GG")]
+        self.assertEqual(["TEST" + str(idx) for idx in range(10, 20)], sorted(callsigns))
+
+        circuits = sorted(server.get_circuits(), key=lambda circuit: circuit.get_bytes_received())
+        self.assertEqual(sorted([len(ia5), len(ita2), len(no_heading)]),
+                         [circuit.get_bytes_received() for circuit in circuits])
+        for circuit in circuits:
+            self.assertEqual((10, 10, False), (circuit.get_messages_received(), circuit.get_messages_stored(),
+                                               circuit.is_connected()))
+            self.assertGreater(circuit.get_throughput()[1], 0.0)
+
+        channel = server.get_sequence_tracker().get_channel("ABC")
+        self.assertEqual((10, 11, 1, 1, 0), (channel.get_received(), channel.get_next_expected(), channel.get_gaps(),
+                                             channel.get_late(), channel.get_missing_outstanding()))
+
+    async def test_back_pressure(self):
+        server = ChannelServer(self.working_directory.name, queue_size=2, chunksize=1)
+        await server.start()
+        try:
+            data = b"".join(b"\x01FF ABCDEFGH\r\r\n241309 IJKLMNOP\r\r\n\x02" + self.FPL.format(idx).encode() +
+                            b"\x03" for idx in range(50))
+            await self.send(server.get_port(), data, len(data))
+            while server.get_circuits()[0].is_connected() or server.get_queue_depth() > 0:
+                await asyncio.sleep(0.01)
+            await server.wait_until_stored()
+        finally:
+            await server.stop()
+
+        # Reading waited for the parser rather than queueing all the messages received
+        circuit = server.get_circuits()[0]
+        self.assertEqual(50, len(self.list_inbox("FF")))
+        self.assertEqual((50, 50), (circuit.get_messages_received(), circuit.get_messages_stored()))
+        self.assertLessEqual(server.get_maximum_queue_depth(), 2)
+        self.assertGreater(circuit.get_back_pressure_time(), 0.0)
+
+    async def test_sequence_state(self):
+        # The channel sequence state is saved while the server is running and when it stops
+        state_path = os.path.join(self.working_directory.name, "sequence.json")
+        server = ChannelServer(self.working_directory.name, sequence_state_path=state_path)
+        await server.start()
+        try:
+            data = b"\x01ABC001\r\n\x02" + self.FPL.format(1).encode() + b"\x03"
+            await self.send(server.get_port(), data, len(data))
+            while server.get_sequence_tracker().get_channel("ABC") is None:
+                await asyncio.sleep(0.01)
+            await server.checkpoint_sequence_state()
+            with open(state_path) as state_file:
+                self.assertEqual(2, json.load(state_file)["channels"]["ABC"]["next_expected"])
+        finally:
+            await server.stop()
+        self.assertEqual(2, ChannelServer(self.working_directory.name, sequence_state_path=state_path)
+                         .get_sequence_tracker().get_channel("ABC").get_next_expected())
+
+    async def test_malformed_message(self):
+        # Messages the parser cannot parse are rejected, the good messages received after them, including
+        # those parsed in the same chunk, are still stored
+        server = ChannelServer(self.working_directory.name)
+        await server.start()
+        malformed = b"\x01\x02FF EGLLZTZX\r\n121212 EGLLZTZX\r\n(\x03"
+        good = b"".join(b"\x01" + self.FPL.format(idx).encode() + b"\x03" for idx in range(3))
+        try:
+            with contextlib.redirect_stderr(io.StringIO()) as errors:
+                await self.send(server.get_port(), malformed, len(malformed))
+                await self.send(server.get_port(), malformed, len(malformed))
+                await self.send(server.get_port(), malformed + good, 1000)
+                while sum(circuit.get_messages_received() for circuit in server.get_circuits()) < 6:
+                    await asyncio.sleep(0.01)
+                await asyncio.wait_for(server.wait_until_stored(), 10)
+        finally:
+            await server.stop()
+
+        self.assertEqual(3, len(self.list_inbox("")))
+        self.assertEqual((6, 3, 3), (sum(circuit.get_messages_received() for circuit in server.get_circuits()),
+                                     sum(circuit.get_messages_stored() for circuit in server.get_circuits()),
+                                     sum(circuit.get_messages_rejected() for circuit in server.get_circuits())))
+        self.assertIn("Unable to parse a message", errors.getvalue())
+
+    def test_headless_import(self):
+        # The entry point runs on a headless server, it can be imported without Tkinter
+        subprocess.run([sys.executable, "-c", "import sys; sys.modules['tkinter'] = None; import RunAftnChannel"], check=True,
+                       cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+
+from AFTN_Terminal.CheckArchive import CheckArchive
+from AFTN_Terminal.ValidateXml import ValidateXml
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class CheckArchiveTests(unittest.TestCase):
+    messages = [
+        "FF ABCDEFGH\n241309 IJKLMNOP\n(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 PNT 23N123W-EDDF0200-0)",
+        "(FPL-TEST02-VG-C172/L-S/C-EGLL0800-N0100VFR DCT 5230N00130E DCT ABC * X-EGKK0100-0)",
+        "(ARR-TEST14-LOWW0800-LOWW0200-SOME AIRPORT)",
+        "(CNL-TEST06-LOWW-EDDF-0)",
+    ]
+
+    working_directory: tempfile.TemporaryDirectory = None
+
+    def setUp(self) -> None:
+        self.working_directory = tempfile.TemporaryDirectory()
+        self.report = os.path.join(self.working_directory.name, "report.tsv")
+        self.archive = os.path.join(self.working_directory.name, "archive")
+        pm = ParseMessage()
+        for folder in ["Inbox", "Outbox", os.path.join("Inbox", "FF")]:
+            os.makedirs(os.path.join(self.archive, folder))
+            for idx in range(25):
+                fpr = FlightPlanRecord()
+                pm.parse_message(fpr, self.messages[idx % len(self.messages)])
+                with open(os.path.join(self.archive, folder, "message-" + str(idx) + ".xml"), "w") as fp:
+                    fpr.write_to(fp)
+        self.write_file(os.path.join("Inbox", "FF", "truncated.xml"), 0.5)
+        with open(os.path.join(self.archive, "Outbox", "not-a-message.txt"), "w") as fp:
+            fp.write("Ignored")
+
+    def tearDown(self) -> None:
+        self.working_directory.cleanup()
+
+    def write_file(self, file_name, fraction):
+        # type: (str, float) -> str
+        # Writes a flight plan record truncated to a fraction of its length
+        fpr = FlightPlanRecord()
+        ParseMessage().parse_message(fpr, self.messages[0])
+        xml = fpr.as_xml()
+        path = os.path.join(self.archive, file_name)
+        with open(path, "w") as fp:
+            fp.write(xml[0:int(len(xml) * fraction)])
+        return path
+
+    def read_report(self):
+        # type: () -> str
+        with open(self.report) as fp:
+            return fp.read()
+
+    def test_validate(self):
+        validate_xml = ValidateXml()
+        self.assertEqual([], validate_xml.validate(self.write_file("complete.xml", 1)))
+        self.assertEqual(["XML is not well-formed: no element found: line 1, column 0"],
+                         validate_xml.validate(self.write_file("empty.xml", 0)))
+        path = self.write_file("changed.xml", 1)
+        with open(path) as fp:
+            xml = fp.read()
+        with open(path, "w") as fp:
+            fp.write(xml.replace("<message_type>ATS</message_type>", "").replace(" end_index=\"2\"", "", 1)
+                     .replace("distance=\"", "distance=\"X", 1).replace("<ers>", "<ers>TEXT"))
+        self.assertEqual(["flight_plan_record: missing element 'message_type' before 'original_message'",
+                          "flight_plan_record/icao_fields/field_record: missing attribute 'end_index'",
+                          "flight_plan_record/ers/ers_record: invalid value 'X0.00' for attribute 'distance'",
+                          "flight_plan_record/ers: text is not allowed 'TEXT'"], validate_xml.validate(path))
+        with open(path, "w") as fp:
+            fp.write(xml.replace("<ers>", "<unknown><ers/></unknown><ers>").replace("</ers>", "").replace(
+                "</flight_plan_record>", "<ers_record/></ers></flight_plan_record>"))
+        self.assertEqual(["flight_plan_record/unknown: unexpected element",
+                          "flight_plan_record/ers/ers_record: missing attribute 'start_index'"],
+                         validate_xml.validate(path)[0:2])
+        with open(path, "w") as fp:
+            fp.write(xml.replace("<message_type>ATS</message_type>", "<message_type>ATS</message_type>" * 2))
+        self.assertEqual(["flight_plan_record/message_type: unexpected element"], validate_xml.validate(path))
+
+    def test_check(self):
+        check_archive = CheckArchive(self.archive, self.report)
+        results = list(check_archive.check(workers=2, chunksize=7))
+        self.assertEqual(76, len(results))
+        self.assertEqual(76, check_archive.files_checked)
+        self.assertEqual(1, check_archive.files_invalid)
+        # The files are checked in sorted order, directories and files alike
+        self.assertEqual(os.path.join(self.archive, "Inbox", "FF", "message-0.xml"), results[0][0])
+        self.assertEqual(os.path.join(self.archive, "Inbox", "FF", "truncated.xml"), results[25][0])
+        self.assertEqual(1, len(results[25][1]))
+        self.assertEqual(os.path.join(self.archive, "Outbox", "message-9.xml"), results[-1][0])
+        self.assertEqual(76, len(self.read_report().splitlines()))
+
+    def test_resume(self):
+        CheckArchive(self.archive, self.report).check(workers=1)
+        list(CheckArchive(self.archive, self.report).check(workers=1))
+        complete_report = self.read_report()
+        os.remove(self.report)
+
+        # Interrupt the check part way through and leave an incomplete line in the report
+        results = CheckArchive(self.archive, self.report).check(workers=1, chunksize=10)
+        for _ in range(30):
+            next(results)
+        results.close()
+        with open(self.report, "a") as fp:
+            fp.write("OK\t" + self.archive)
+
+        check_archive = CheckArchive(self.archive, self.report)
+        self.assertEqual(30, check_archive.files_checked)
+        self.assertEqual(1, check_archive.files_invalid)
+        self.assertEqual(46, len(list(check_archive.check(workers=2, chunksize=4))))
+        self.assertEqual(complete_report, self.read_report())
+
+
+if __name__ == '__main__':
+    unittest.main()
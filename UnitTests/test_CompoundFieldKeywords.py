@@ -0,0 +1,72 @@
+import unittest
+
+from Configuration.CompoundFieldKeywords import CompoundFieldKeywords
+from Configuration.EnumerationConstants import FieldIdentifiers, SubFieldIdentifiers
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseFieldsCommon import ParseFieldsCommon
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+def search_keyword(field_id, candidate_keyword):
+    # type: (FieldIdentifiers, str) -> SubFieldIdentifiers
+    # The keyword search over the SubFieldIdentifiers enumeration replaced by CompoundFieldKeywords
+    if field_id == FieldIdentifiers.F18:
+        for keyword in SubFieldIdentifiers:
+            if SubFieldIdentifiers.F17c < keyword < SubFieldIdentifiers.F19a:
+                if keyword.name[3:].upper() == candidate_keyword:
+                    return keyword
+    elif field_id == FieldIdentifiers.F19:
+        for keyword in SubFieldIdentifiers:
+            if SubFieldIdentifiers.F18typ < keyword < SubFieldIdentifiers.F20a:
+                if 0 < len(keyword.name[3:]) < 2:
+                    if keyword.name[3:].upper() == candidate_keyword:
+                        return keyword
+    elif field_id == FieldIdentifiers.F22:
+        for keyword in SubFieldIdentifiers:
+            if SubFieldIdentifiers.F21f < keyword < SubFieldIdentifiers.F80a:
+                if len(keyword.name[5:]) < 3:
+                    if keyword.name[5:].upper() == candidate_keyword:
+                        return keyword
+    return SubFieldIdentifiers.ANYTHING
+
+
+class CompoundFieldKeywordsTests(unittest.TestCase):
+    # An FPL with a busy field 18
+    F18_HEAVY_FPL = "(FPL-TEST01-IS-B738/M-DE2E3FGHIJ1RSWY/LB1D1-EGLL0800-N0450F350 DCT BPK UN57 POL-EDDF0200 " \
+                    "EDDK-PBN/A1B1C1D1L1O1S2 NAV/GPSRNAV COM/TCAS DAT/CPDLCX SUR/RSP180 DEP/5130N00030W " \
+                    "DEST/EDDF DOF/240315 REG/GABCD EET/EDVV0035 SEL/ABCD TYP/B738 CODE/F0A1B2C DLE/BPK0010 " \
+                    "OPR/TESTAIR ORGN/EGLLZPZX PER/C ALTN/EDDK RALT/EGKK TALT/EGSS RIF/DCT EDDK RMK/TCAS " \
+                    "STS/HOSP RVR/200 EUR/PROTECTED-E/0400 P/123 R/VE S/M J/L D/2 8 C YELLOW A/BLUE)"
+
+    def test_same_as_search(self):
+        compound_field_keywords = CompoundFieldKeywords()
+        candidates = ["", "RMK", "rmk", "X", "9", "81", "ANYTHING", "RMK/"]
+        for keyword in SubFieldIdentifiers:
+            candidates = candidates + [keyword.name, keyword.name[3:], keyword.name[3:].upper(),
+                                       keyword.name[5:], keyword.name[5:].upper()]
+        for field_id in FieldIdentifiers:
+            for candidate in candidates:
+                self.assertIs(search_keyword(field_id, candidate),
+                              compound_field_keywords.get_subfield_id(field_id, candidate), candidate)
+                self.assertIs(search_keyword(field_id, candidate),
+                              ParseFieldsCommon.is_compound_field_keyword(field_id, candidate), candidate)
+        self.assertIs(SubFieldIdentifiers.F18rmk, compound_field_keywords.get_subfield_id(FieldIdentifiers.F18, "RMK"))
+        self.assertIs(SubFieldIdentifiers.F19r, compound_field_keywords.get_subfield_id(FieldIdentifiers.F19, "R"))
+        self.assertIs(SubFieldIdentifiers.F22_f9, compound_field_keywords.get_subfield_id(FieldIdentifiers.F22, "9"))
+
+    def test_f18_heavy(self):
+        pm = ParseMessage()
+        fpr = FlightPlanRecord()
+        pm.parse_message(fpr, self.F18_HEAVY_FPL)
+        self.assertFalse(fpr.errors_detected(), fpr.get_all_errors())
+
+        # The keyword lookups made parsing the message give the same result as the enumeration search
+        for token in self.F18_HEAVY_FPL.split(" "):
+            if "/" in token:
+                candidate = token.split("/")[0]
+                self.assertIs(search_keyword(FieldIdentifiers.F18, candidate),
+                              ParseFieldsCommon.is_compound_field_keyword(FieldIdentifiers.F18, candidate), candidate)
+
+
+if __name__ == '__main__':
+    unittest.main()
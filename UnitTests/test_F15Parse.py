@@ -0,0 +1,78 @@
+import sys
+import time
+import unittest
+
+from F15_Parser.ExtractedRouteSequence import ExtractedRouteSequence
+from F15_Parser.F15Parse import ParseF15
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from Tokenizer.Tokenize import Tokenize
+
+
+class ParseF15StressTests(unittest.TestCase):
+    # Number of elements in the field 15 routes used by the stress tests
+    ROUTE_ELEMENTS = 5000
+
+    def parse_route(self, route):
+        # type: (str) -> ExtractedRouteSequence
+        tokenize = Tokenize()
+        tokenize.set_string_to_tokenize(route)
+        tokenize.set_whitespace(" /\n\t\r")
+        tokenize.tokenize()
+        ers = ExtractedRouteSequence()
+        start = time.perf_counter()
+        ParseF15().parse_f15(ers, tokenize.get_tokens())
+        print("\nParsed " + str(ers.get_number_of_elements()) + " ERS elements in " +
+              "{0:.3f}s".format(time.perf_counter() - start))
+        return ers
+
+    def test_long_route_points_and_routes(self):
+        route = "N0450F350 ABC " + " ".join(
+            ["DCT", "UL1"][idx % 2] + " P" + chr(ord("A") + idx % 26) + chr(ord("A") + (idx // 26) % 26)
+            for idx in range(self.ROUTE_ELEMENTS // 2))
+        ers = self.parse_route(route)
+        self.assertEqual(0, ers.get_number_of_errors())
+        self.assertEqual(self.ROUTE_ELEMENTS + 3, ers.get_number_of_elements())
+        self.assertEqual("IFR", ers.get_last_element().get_flight_rules())
+
+    def test_long_route_lat_long_points(self):
+        route = "M082F350 " + " ".join(
+            "{0:02d}{1:02d}N{2:03d}{3:02d}W".format(40 + idx % 40, idx % 60, idx % 180, (idx * 7) % 60)
+            for idx in range(self.ROUTE_ELEMENTS))
+        ers = self.parse_route(route)
+        self.assertEqual(0, ers.get_number_of_errors())
+        self.assertEqual(self.ROUTE_ELEMENTS + 2, ers.get_number_of_elements())
+        self.assertTrue(ers.get_element_at(1).get_distance() > 0)
+
+    def test_long_route_rule_changes_and_cruise_climbs(self):
+        # Each group is 10 field 15 elements long
+        route = "N0450F350 ABC " + " ".join(
+            "VFR SOME BREAK TEXT IFR DEF/N0450F350 C/GHI/M082F350F390 DCT JKL"
+            for _ in range(self.ROUTE_ELEMENTS // 10))
+        ers = self.parse_route(route)
+        self.assertEqual(0, ers.get_number_of_errors())
+        self.assertEqual("SOME BREAK TEXT IFR", ers.get_element_at(2).get_break_text().strip())
+        # ADEP, ABC, ADES plus VFR, DEF, GHI, DCT and JKL for each group
+        self.assertEqual(3 + (self.ROUTE_ELEMENTS // 10) * 5, ers.get_number_of_elements())
+        self.assertEqual("M082", ers.get_element_at(ers.get_number_of_elements() - 4).get_speed())
+
+    def test_long_route_with_errors(self):
+        # Every other element is erroneous, the parser re-synchronises after each error
+        route = "N0450F350 " + " ".join("ABC *" for _ in range(self.ROUTE_ELEMENTS // 2))
+        ers = self.parse_route(route)
+        self.assertEqual(self.ROUTE_ELEMENTS // 2, ers.get_number_of_errors())
+        self.assertEqual(self.ROUTE_ELEMENTS // 2 + 2, ers.get_number_of_elements())
+
+    def test_long_route_message(self):
+        # The parser must not depend on the recursion limit
+        self.assertLessEqual(sys.getrecursionlimit(), 1000)
+        route = " ".join("{0:02d}N{1:03d}W".format(40 + idx % 40, idx % 180) for idx in range(self.ROUTE_ELEMENTS))
+        fpr = FlightPlanRecord()
+        ParseMessage().parse_message(fpr, "(FPL-TEST01-IS-B738/M-S/C-LOWW0800-N0450F350 " + route +
+                                     "-EDDF0100-0)")
+        self.assertFalse(fpr.errors_detected())
+        self.assertEqual(self.ROUTE_ELEMENTS + 2, fpr.get_extracted_route().get_number_of_elements())
+
+
+if __name__ == '__main__':
+    unittest.main()
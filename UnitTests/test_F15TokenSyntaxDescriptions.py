@@ -0,0 +1,67 @@
+import re
+import unittest
+
+from F15_Parser.F15TokenSyntaxDescriptions import F15TokenSyntaxDefinition, TokenBaseType, TokenSubType
+
+
+class F15TokenSyntaxDescriptionsTests(unittest.TestCase):
+    # A corpus of field 15 routes used to compare the token classification results
+    routes = [
+        "N0450F350 PNT 23N123W BBB B9 AAA STAY1/ 1234",
+        "N0450VFR THIS IS BREAK TEXT IFR NNN/N0450F350 PNT 23N123W BBB B9 AAA STAY1/ 1234",
+        "N0350F250 ABC 23N123W BBB/N0450F350 B9 AAA CCC DDD/N0100F200 EEE FFF STAR1S",
+        "N0450F350 AAA C54 GGG PNT 23N123W BBB B9 AAA 24N020W 24N030W 24N040W",
+        "N0460F370 DOGAL3A DOGAL NATB 54N040W 54N050W CARPE N328A BOS",
+        "M084F350 5530N02000W 5530N03000W 5430N04000W 5230N05000W LOMSI DCT NEEKO",
+        "N0455F390 MOGAS UL619 TORNO/M082F390 UL610 BIBAX DCT 52N020W 52N030W 51N040W 50N050W",
+        "K0800S1130 OAT DCT GAT KOK UN869 REDFA/N0450F350F390 C/TOSIN/M082F390PLUS",
+        "N0450F350 SID AAA B9 DDD A4 SUGOL1A IFPSTOP PNT123045 IFPSTART ABC T",
+        "N0100VFR DCT 5230N00130E090025 VFR IFR ABCD12 ABC123 AB12C A123BC",
+    ]
+
+    @staticmethod
+    def linear_scan(token_string):
+        # type: (str) -> [str, TokenBaseType, TokenSubType]
+        for item in F15TokenSyntaxDefinition.F15_SB_CONFIGURATION:
+            if re.fullmatch(item[F15TokenSyntaxDefinition.TOKEN_REGEXP_IDX], token_string):
+                return item
+        return ["", TokenBaseType.F15_UNKNOWN, TokenSubType.F15_SB_UNKNOWN]
+
+    def get_corpus_tokens(self):
+        # type: () -> [str]
+        tokens = []
+        for route in self.routes:
+            tokens = tokens + re.split("[ /]+", route) + ["/"]
+        return tokens
+
+    def test_classify_same_as_linear_scan(self):
+        f15tsd = F15TokenSyntaxDefinition()
+        tokens = self.get_corpus_tokens() + ["", "XYZ1234567", "N0450A0450S1130", "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+                                             "2400", "2359", "NATZ9", "PTSX", "K0800F350A100", "52N020W"]
+        for token_string in tokens:
+            self.assertEqual(self.linear_scan(token_string), f15tsd.get_token_type(token_string), token_string)
+
+    def test_classify_every_syntax_definition(self):
+        # Each definition must be found for a token it matches unless an earlier definition also matches
+        f15tsd = F15TokenSyntaxDefinition()
+        for token_string in ["/", "VFR", "M082VFR", "N0450VFR", "K0800VFR", "IFR", "DCT", "OAT", "GAT", "IFPSTOP",
+                             "IFPSTART", "STAY1", "1234", "T", "C", "SID", "STAR", "NATA", "NATA1", "PTS1", "PTSA",
+                             "AB", "ABCD", "ABCDE", "ABC123456", "52N020W", "5230N02030W", "52N020W123456",
+                             "5230N02030W123456", "UL1", "A12B", "A12", "ABC123", "ABC12", "AB1C", "AB12", "ABCD12",
+                             "AB12C", "ABC1D", "ABCDE12", "ABCD1E", "ABCDE12F", "M082F350", "K0800M0840",
+                             "N0450F350F390", "K0800F350A100", "N0450A045PLUS", "K0800M0840PLUS"]:
+            result = f15tsd.get_token_type(token_string)
+            self.assertEqual(self.linear_scan(token_string), result, token_string)
+            self.assertNotEqual(TokenBaseType.F15_UNKNOWN, result[F15TokenSyntaxDefinition.TOKEN_BASE_IDENTIFIER_IDX])
+
+    def test_classify_cached(self):
+        # Classifying the corpus again, from the cache, gives the same results as the linear scan
+        tokens = self.get_corpus_tokens()
+        f15tsd = F15TokenSyntaxDefinition()
+        for _ in range(2):
+            self.assertEqual([self.linear_scan(token_string) for token_string in tokens],
+                             [f15tsd.get_token_type(token_string) for token_string in tokens])
+
+
+if __name__ == '__main__':
+    unittest.main()
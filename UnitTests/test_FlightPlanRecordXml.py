@@ -0,0 +1,101 @@
+import io
+import os
+import tempfile
+import timeit
+import unittest
+
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class FlightPlanRecordXmlTests(unittest.TestCase):
+
+    @staticmethod
+    def parse_route(number_of_points):
+        # type: (int) -> FlightPlanRecord
+        route = " ".join("{0:02d}N{1:03d}W".format(40 + idx % 40, idx % 180) for idx in range(number_of_points))
+        fpr = FlightPlanRecord()
+        ParseMessage().parse_message(fpr, "FF ABCDEFGH\n241309 IJKLMNOP\n(FPL-TEST01-IS-B738/M-SDGR/C-LOWW0800"
+                                          "-N0450F350 " + route + " * X-EDDF0100-PBN/B1 RMK/ONE STS/HOSP RMK/TWO)")
+        return fpr
+
+    @staticmethod
+    def concatenate_xml(fpr):
+        # type: (FlightPlanRecord) -> str
+        # Reference implementation building the XML by string concatenation
+        field_string = ""
+        if len(fpr.icao_fields) > 0:
+            field_string = "   <icao_fields>" + os.linesep
+            for field_id, record in fpr.icao_fields.items():
+                subfield_xml = ""
+                for subfield_id, subfield in record.get_subfield_dictionary().items():
+                    for sf in subfield:
+                        subfield_xml = subfield_xml + sf.subfield_as_xml(subfield_id) + os.linesep
+                field_string = field_string + "      <field_record id=\"" + field_id.name + \
+                    "\" start_index=\"" + str(record.get_start_index()) + \
+                    "\" end_index=\"" + str(record.get_end_index()) + "\">" + record.get_field_text() + \
+                    os.linesep + subfield_xml + "      </field_record>" + os.linesep
+            field_string = field_string + "   </icao_fields>" + os.linesep
+
+        error_string = ""
+        if len(fpr.erroneous_fields) > 0:
+            error_string = "   <icao_field_errors>" + os.linesep
+            for error_record in fpr.erroneous_fields:
+                error_string = error_string + error_record.field_error_as_xml() + os.linesep
+            error_string = error_string + "   </icao_field_errors>" + os.linesep
+
+        ers = ""
+        if fpr.get_extracted_route() is not None:
+            ers = "   <ers>" + os.linesep + "      <derived_flight_rules>" + \
+                  fpr.get_extracted_route().get_derived_flight_rules() + "</derived_flight_rules>" + os.linesep
+            for item in fpr.get_extracted_route().get_all_elements():
+                ers = ers + "   " + item.as_xml(False) + os.linesep
+            if fpr.get_extracted_route().get_number_of_errors() > 0:
+                ers = ers + "   <ers_errors>" + os.linesep
+                for item in fpr.get_extracted_route().get_all_errors():
+                    ers = ers + "      " + item.as_xml(True) + "" + os.linesep
+                ers = ers + "   </ers_errors>" + os.linesep
+            ers = ers + "   </ers>"
+
+        return "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\" ?>" + os.linesep + \
+               "<flight_plan_record>" + os.linesep + \
+               "   <derived_flight_rules>" + fpr.get_derived_flight_rules().name + "</derived_flight_rules>" + \
+               os.linesep + \
+               "   <message_type>" + fpr.get_message_type().name + "</message_type>" + os.linesep + \
+               "   <original_message>" + fpr.get_message_complete() + "</original_message>" + os.linesep + \
+               "   <message_header>" + fpr.get_message_header() + "</message_header>" + os.linesep + \
+               "   <message_body>" + fpr.get_message_body() + "</message_body>" + os.linesep + \
+               "   <adjacent_unit_sender>" + fpr.get_sender_adjacent_unit_name().name + \
+               "</adjacent_unit_sender>" + os.linesep + \
+               "   <adjacent_unit_receiver>" + fpr.get_receiver_adjacent_unit_name().name + \
+               "</adjacent_unit_receiver>" + os.linesep + \
+               field_string + error_string + ers + os.linesep + "</flight_plan_record>"
+
+    def test_as_xml_same_as_concatenation(self):
+        for number_of_points in [0, 1, 10, 100]:
+            fpr = self.parse_route(number_of_points)
+            self.assertTrue(fpr.errors_detected() or number_of_points == 0)
+            self.assertEqual(self.concatenate_xml(fpr), fpr.as_xml())
+
+    def test_write_to_file(self):
+        fpr = self.parse_route(100)
+        with tempfile.TemporaryFile("w+b") as fp:
+            with io.TextIOWrapper(fp, encoding="utf-8", newline="") as text_fp:
+                fpr.write_to(text_fp)
+                text_fp.flush()
+                fp.seek(0)
+                self.assertEqual(fpr.as_xml().encode("utf-8"), fp.read())
+
+    def test_as_xml_benchmark(self):
+        for number_of_points in [10, 100, 1000]:
+            fpr = self.parse_route(number_of_points)
+            repeat = max(1, 1000 // number_of_points)
+            concatenate_time = timeit.timeit(lambda: self.concatenate_xml(fpr), number=repeat) / repeat
+            stream_time = timeit.timeit(lambda: fpr.write_to(io.StringIO()), number=repeat) / repeat
+            print("\nXML for a route of " + str(number_of_points) + " points; concatenation " +
+                  "{0:.3f}ms, streaming {1:.3f}ms ({2:.1f}x)".format(concatenate_time * 1000, stream_time * 1000,
+                                                                    concatenate_time / stream_time))
+
+
+if __name__ == '__main__':
+    unittest.main()
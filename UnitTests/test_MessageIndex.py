@@ -0,0 +1,133 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from AFTN_Terminal.MessageIndex import MessageIndex
+from AFTN_Terminal.ReadXml import ReadXml
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class CountingMessageIndex(MessageIndex):
+    # Counts the number of message files read to build the index
+    files_read = 0
+
+    def read_summary(self, file_path):
+        self.files_read += 1
+        return MessageIndex.read_summary(file_path)
+
+
+class MessageIndexTests(unittest.TestCase):
+    # The number of messages written to the test folder
+    NUMBER_OF_MESSAGES = 500
+
+    working_directory: tempfile.TemporaryDirectory = None
+
+    def setUp(self) -> None:
+        self.working_directory = tempfile.TemporaryDirectory()
+        self.inbox = os.path.join(self.working_directory.name, "Inbox")
+        os.mkdir(self.inbox)
+        os.mkdir(os.path.join(self.inbox, "FF"))
+        pm = ParseMessage()
+        for idx in range(self.NUMBER_OF_MESSAGES):
+            fpr = FlightPlanRecord()
+            pm.parse_message(fpr, "FF ABCDEFGH\n241309 IJKLMNOP\n(FPL-TEST" + str(idx) +
+                             "-IS-B737/M-S/C-LOWW0800-N0450F350 PNT 23N123W-EDDF0200-0)")
+            self.write_message(idx, fpr)
+
+    def tearDown(self) -> None:
+        self.working_directory.cleanup()
+
+    def write_message(self, idx, fpr):
+        # type: (int, FlightPlanRecord) -> None
+        with open(os.path.join(self.inbox, "message-" + str(idx) + ".xml"), "w") as fp:
+            fpr.write_to(fp)
+
+    def get_file_paths(self):
+        # type: () -> [str]
+        return [os.path.join(self.inbox, item) for item in sorted(os.listdir(self.inbox))]
+
+    def test_summaries_same_as_read_xml(self):
+        file_paths = self.get_file_paths()
+        summaries = MessageIndex(self.working_directory.name).get_summaries(file_paths)
+        # The 'FF' directory is skipped
+        self.assertEqual(self.NUMBER_OF_MESSAGES, len(summaries))
+        for summary in summaries:
+            rx = ReadXml(summary[-1])
+            self.assertEqual([rx.get_priority_indicator(), rx.get_filing_time(), rx.get_f3a(), rx.get_f7a(),
+                              rx.get_f9b(), rx.get_f9c(), rx.get_f13a(), rx.get_f13b(), rx.get_f16a(),
+                              rx.get_f15(), summary[-1]], summary)
+
+    def test_only_changed_files_are_read(self):
+        file_paths = self.get_file_paths()
+        index = CountingMessageIndex(self.working_directory.name)
+        start = time.perf_counter()
+        summaries = index.get_summaries(file_paths)
+        cold_time = time.perf_counter() - start
+        self.assertEqual(self.NUMBER_OF_MESSAGES, index.files_read)
+
+        index.files_read = 0
+        start = time.perf_counter()
+        self.assertEqual(summaries, index.get_summaries(file_paths))
+        warm_time = time.perf_counter() - start
+        self.assertEqual(0, index.files_read)
+        print("\nListed " + str(self.NUMBER_OF_MESSAGES) + " messages; reading the XML files " +
+              "{0:.3f}s, from the index {1:.3f}s ({2:.1f}x)".format(cold_time, warm_time, cold_time / warm_time))
+
+        # Change one message, delete another
+        fpr = FlightPlanRecord()
+        ParseMessage().parse_message(fpr, "(FPL-CHANGED-IS-B738/M-S/C-EGLL0800-N0450F350 PNT-EDDF0200-0)")
+        self.write_message(3, fpr)
+        os.remove(file_paths[4])
+        summaries = index.get_summaries(self.get_file_paths())
+        self.assertEqual(1, index.files_read)
+        self.assertEqual(self.NUMBER_OF_MESSAGES - 1, len(summaries))
+        self.assertIn(["", "", "FPL", "CHANGED", "B738", "M", "EGLL", "0800", "EDDF", "N0450F350 PNT",
+                       os.path.join(self.inbox, "message-3.xml")], summaries)
+        self.assertEqual(self.NUMBER_OF_MESSAGES - 1,
+                         index.connection.execute("SELECT COUNT(*) FROM messages").fetchone()[0])
+        index.close()
+
+        # The index persists in the working directory
+        index = CountingMessageIndex(self.working_directory.name)
+        self.assertEqual(summaries, index.get_summaries(self.get_file_paths()))
+        self.assertEqual(0, index.files_read)
+        index.close()
+
+    def test_indexed_summaries(self):
+        index = CountingMessageIndex(self.working_directory.name)
+        self.assertEqual([], index.get_indexed_summaries(self.inbox))
+        # The folder is listed without the subdirectories, index files and messages being written
+        open(os.path.join(self.inbox, ".message-1.tmp"), "w").close()
+        file_paths = MessageIndex.list_folder(self.inbox)
+        self.assertEqual([path for path in self.get_file_paths() if path.endswith(".xml")], file_paths)
+        summaries = index.get_summaries(file_paths)
+
+        # The summaries stored are read without reading or checking the files
+        os.remove(file_paths[0])
+        index.files_read = 0
+        self.assertEqual(sorted(summaries, key=lambda summary: summary[-1]), index.get_indexed_summaries(self.inbox))
+        self.assertEqual(0, index.files_read)
+        self.assertEqual(self.NUMBER_OF_MESSAGES - 1, len(index.get_summaries(MessageIndex.list_folder(self.inbox))))
+        self.assertEqual(self.NUMBER_OF_MESSAGES - 1, len(index.get_indexed_summaries(self.inbox)))
+
+        # The index can be used from another thread
+        results = []
+        thread = threading.Thread(target=lambda: results.append(index.get_summaries(file_paths[1:])))
+        thread.start()
+        thread.join()
+        self.assertEqual([self.NUMBER_OF_MESSAGES - 1], [len(result) for result in results])
+        index.close()
+
+    def test_index_file(self):
+        MessageIndex(self.working_directory.name).close()
+        self.assertTrue(os.path.exists(MessageIndex.get_index_file_path(self.working_directory.name)))
+        self.assertTrue(MessageIndex.is_index_file(MessageIndex.get_index_file_path(self.working_directory.name)))
+        self.assertTrue(MessageIndex.is_index_file("/tmp/" + MessageIndex.INDEX_FILE_NAME + "-wal"))
+        self.assertFalse(MessageIndex.is_index_file(os.path.join(self.inbox, "message-1.xml")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+
+from AFTN_Terminal.MessageIndex import MessageIndex
+from AFTN_Terminal.MessageSearch import MessageSearch
+from AFTN_Terminal.WriteXml import WriteXml
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class MessageSearchTests(unittest.TestCase):
+    MESSAGES = ["FF ABCDEFGH\n241309 IJKLMNOP\n(FPL-DLH4AB-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 BIBAX"
+                "-EDDF0200-DOF/221117 REG/DABCD)",
+                "FF ABCDEFGH\n241310 IJKLMNOP\n(FPL-DLH4AB-IS-B737/M-S/C-LOWW0900-N0450F350 PNT B9 KOK"
+                "-EDDF0200-DOF/221118 REG/DABCD)",
+                "(CNL-DLH4AB-LOWW0800-EDDF-DOF/221117)",
+                "(CHG-AUA123-EGLL0800-LOWW-DOF/221117-8/IG)",
+                "(FPL-AUA123-IS-B737/M-S/C-EGLL0800-N0450F350 BIBAX XXXXXXXX-LOWW0200-0)"]
+
+    # The number of messages indexed to check the searches use the indexes
+    MANY_MESSAGES = 20000
+
+    working_directory: tempfile.TemporaryDirectory = None
+
+    def setUp(self) -> None:
+        self.working_directory = tempfile.TemporaryDirectory()
+        self.inbox = os.path.join(self.working_directory.name, "Inbox")
+        os.makedirs(os.path.join(self.inbox, "FF"))
+        self.file_paths = []
+        self.records = []
+        for idx, message in enumerate(self.MESSAGES):
+            flight_plan_record = FlightPlanRecord()
+            ParseMessage().parse_message(flight_plan_record, message)
+            priority_indicator = "FF" if message.startswith("FF") else ""
+            self.file_paths.append(WriteXml.write_received_message(
+                flight_plan_record.as_xml(), self.working_directory.name, priority_indicator, str(idx)))
+            self.records.append(flight_plan_record)
+
+    def tearDown(self) -> None:
+        self.working_directory.cleanup()
+
+    def find(self, message_search, query):
+        return sorted(self.file_paths.index(file_path)
+                      for file_path in message_search.search(MessageSearch.parse_query(query)))
+
+    def test_parse_query(self):
+        self.assertEqual({"title": "FPL", "callsign": "DLH4AB", "dof": "221117"},
+                         MessageSearch.parse_query("FPL DLH4AB 221117"))
+        self.assertEqual({"point": "BIBAX", "eobt": "0800", "registration": "DABCD"},
+                         MessageSearch.parse_query("PT/BIBAX 0800 reg/DABCD"))
+        self.assertEqual({"ades": "EDDF", "error_text": "unknown aerodrome"},
+                         MessageSearch.parse_query("ADES/EDDF ERROR/unknown aerodrome"))
+        self.assertRaises(ValueError, MessageSearch.parse_query, "XYZ/1")
+        self.assertRaises(ValueError, MessageSearch.parse_query, "FPL ERROR/")
+        self.assertRaises(ValueError, MessageSearch.parse_query, "PT/ DLH4AB")
+
+    def test_search(self):
+        message_search = MessageSearch(self.working_directory.name)
+        self.assertEqual(5, message_search.update())
+        self.assertEqual(0, message_search.update())
+        self.assertEqual([0], self.find(message_search, "FPL DLH4AB 221117"))
+        self.assertEqual([0, 2], self.find(message_search, "DLH4AB DOF/221117"))
+        self.assertEqual([0, 4], self.find(message_search, "PT/BIBAX"))
+        self.assertEqual([0, 1], self.find(message_search, "REG/DABCD"))
+        self.assertEqual([3, 4], self.find(message_search, "ADES/LOWW"))
+        self.assertEqual([4], self.find(message_search, "ERROR/xxxxxxxx"))
+        self.assertEqual([], self.find(message_search, "PT/ADEP"))
+        self.assertRaises(ValueError, message_search.search, {})
+        self.assertRaises(ValueError, message_search.search, {"error_text": " "})
+        self.assertRaises(ValueError, message_search.search, {"callsign": ""})
+        self.assertEqual([], self.find(message_search, "ERROR/-"))
+
+        # The entries formed from a parsed message and from its message file are the same
+        self.assertEqual([MessageSearch.read_entry(file_path) for file_path in self.file_paths],
+                         [MessageSearch.get_record_entry(flight_plan_record) for flight_plan_record in self.records])
+
+        # Deleted and changed files are found by an update, the index is kept in the working directory
+        os.remove(self.file_paths[0])
+        WriteXml.update_existing_message(self.file_paths[1], self.records[0].as_xml())
+        self.assertEqual(1, message_search.update())
+        message_search.close()
+        message_search = MessageSearch(self.working_directory.name)
+        self.assertEqual([1], self.find(message_search, "FPL DLH4AB 221117"))
+        self.assertEqual(4, message_search.get_message_count())
+        self.assertTrue(MessageIndex.is_index_file(os.path.join(self.working_directory.name,
+                                                                MessageSearch.SEARCH_FILE_NAME)))
+        message_search.close()
+
+    def test_add_records(self):
+        message_search = MessageSearch(None)
+        message_search.add_records(self.file_paths[:2], self.records[:2])
+        message_search.add_file(self.file_paths[4])
+        self.assertEqual([0, 4], self.find(message_search, "PT/BIBAX"))
+        message_search.remove_file(self.file_paths[0])
+        self.assertEqual([4], self.find(message_search, "PT/BIBAX"))
+        self.assertEqual(0, message_search.update())
+        message_search.close()
+
+    def test_many_messages(self):
+        message_search = MessageSearch(None)
+        entry = MessageSearch.get_record_entry(self.records[0])
+        message_search.store_entries([
+            (os.path.join(self.inbox, "message-" + str(idx) + ".xml"), idx, 1000,
+             ("FPL", "TEST" + str(idx % 5000)) + entry[2:7] + (entry[7] + ["P" + str(idx % 1000)], ""))
+            for idx in range(self.MANY_MESSAGES)])
+        queries = ["FPL TEST42 221117", "PT/P42", "PT/P42 DOF/221117", "REG/DABCD"]
+        found = [message_search.search(MessageSearch.parse_query(query)) for query in queries]
+        self.assertEqual([4, 20, 20, MessageSearch.DEFAULT_LIMIT], [len(file_paths) for file_paths in found])
+        # The messages are found through an index, not by reading every message
+        for query in queries:
+            sql, parameters = message_search.get_query(MessageSearch.parse_query(query))
+            plan = [row[-1] for row in message_search.connection.execute("EXPLAIN QUERY PLAN " + sql, parameters)]
+            self.assertFalse(any(step.startswith("SCAN messages") for step in plan), (query, plan))
+        message_search.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import time
+import unittest
+
+from AFTN_Terminal.MessageSummaryTable import MessageSummaryTable
+
+
+class MessageSummaryTableTests(unittest.TestCase):
+    # The number of messages in the large folder test
+    NUMBER_OF_MESSAGES = 100000
+
+    @staticmethod
+    def make_summaries(number_of_messages):
+        # type: (int) -> [[str]]
+        return [["FF", str(241300 + idx % 60), "FPL", "TEST" + str(idx), "B737", "M", "LOWW", "0800",
+                 "EDDF" if idx % 2 == 0 else "EGLL", "N0450F350 PNT", "/tmp/message-" + str(idx) + ".xml"]
+                for idx in range(number_of_messages)]
+
+    def test_window(self):
+        table = MessageSummaryTable(self.make_summaries(25))
+        self.assertEqual(25, len(table))
+        self.assertEqual(0, table.get_first_row(-3, 10))
+        self.assertEqual(7, table.get_first_row(7, 10))
+        self.assertEqual(15, table.get_first_row(20, 10))
+        self.assertEqual(0, MessageSummaryTable(self.make_summaries(5)).get_first_row(3, 10))
+        self.assertEqual(("FF", "241307", "FPL", "TEST7"), table.get_rows(7, 12)[0][0:4])
+        self.assertEqual(12, len(table.get_rows(7, 12)))
+        self.assertEqual(3, len(table.get_rows(22, 12)))
+        self.assertEqual((0.0, 1.0), MessageSummaryTable(self.make_summaries(5)).get_fractions(0, 10))
+        self.assertEqual((0.2, 0.6), table.get_fractions(5, 10))
+        self.assertEqual(10, table.get_first_row_at(0.4, 10))
+        self.assertEqual(15, table.get_first_row_at(1.0, 10))
+
+    def test_sort_and_remove(self):
+        table = MessageSummaryTable(self.make_summaries(6))
+        table.sort(8)
+        self.assertEqual(["TEST0", "TEST2", "TEST4", "TEST1", "TEST3", "TEST5"], [row[3] for row in table.rows])
+        # Sorting by the same column reverses the order, the sort is stable
+        table.sort(8)
+        self.assertEqual(["TEST1", "TEST3", "TEST5", "TEST0", "TEST2", "TEST4"], [row[3] for row in table.rows])
+        table.sort(3)
+        self.assertFalse(table.sort_descending)
+        self.assertEqual("TEST0", table.rows[0][3])
+
+        self.assertTrue(table.remove_path("/tmp/message-0.xml"))
+        self.assertFalse(table.remove_path("/tmp/message-0.xml"))
+        self.assertEqual(5, len(table))
+        self.assertEqual("TEST1", table.rows[0][3])
+
+        # Replaced rows keep the sort order
+        table.sort(8)
+        table.sort(8)
+        table.set_rows(self.make_summaries(4))
+        self.assertEqual(["TEST1", "TEST3", "TEST0", "TEST2"], [row[3] for row in table.rows])
+        self.assertTrue(table.sort_descending)
+
+    def test_large_folder(self):
+        summaries = self.make_summaries(self.NUMBER_OF_MESSAGES)
+        start = time.perf_counter()
+        table = MessageSummaryTable(summaries)
+        first_page = table.get_rows(0, 32)
+        build_time = time.perf_counter() - start
+        start = time.perf_counter()
+        table.sort(3)
+        table.sort(3)
+        sort_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for first_row in range(0, self.NUMBER_OF_MESSAGES, 1000):
+            self.assertEqual(32, len(table.get_rows(table.get_first_row(first_row, 30), 32)))
+        scroll_time = time.perf_counter() - start
+        self.assertEqual(32, len(first_page))
+        self.assertEqual("TEST99999", table.rows[0][3])
+        print("\n" + str(self.NUMBER_OF_MESSAGES) + " messages; table {0:.3f}s, sort twice {1:.3f}s, "
+              "100 scroll positions {2:.4f}s".format(build_time, sort_time, scroll_time))
+
+
+if __name__ == '__main__':
+    unittest.main()
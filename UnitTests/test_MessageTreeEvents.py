@@ -0,0 +1,144 @@
+import os
+import tempfile
+import unittest
+
+try:
+    from tkinter import Tk, TclError
+    from watchdog.events import DirModifiedEvent, FileCreatedEvent, FileDeletedEvent, FileMovedEvent
+    from AFTN_Terminal.MessageTree import MessageTree, TreeviewFileSystemEventHandler
+    from AFTN_Terminal.MessageSearch import MessageSearch
+    from AFTN_Terminal.WriteXml import WriteXml
+    from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+    from IcaoMessageParser.ParseMessage import ParseMessage
+except ImportError:
+    # The GUI dependencies (Pillow, watchdog) are not installed
+    MessageTree = None
+
+ICON_ROOT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Icons")
+
+
+if MessageTree is not None:
+    class TestMessageTree(MessageTree):
+        # Find the icons independently of the current working directory
+        icon_root_path16 = os.path.join(ICON_ROOT_PATH, "Icon16") + os.sep
+        icon_root_path24 = os.path.join(ICON_ROOT_PATH, "Icon24") + os.sep
+
+
+class MessageTreeEventTests(unittest.TestCase):
+    # The number of file system events replayed, half create and half delete events, each followed by a
+    # modified event for the directory as reported by the OS
+    NUMBER_OF_EVENTS = 10000
+
+    root = None
+    tree = None
+    working_directory: tempfile.TemporaryDirectory = None
+
+    def setUp(self) -> None:
+        if MessageTree is None:
+            self.skipTest("Pillow and watchdog are needed to test the message tree")
+        try:
+            self.root = Tk()
+        except TclError:
+            self.skipTest("A display is needed to test the message tree")
+        self.root.withdraw()
+        self.working_directory = tempfile.TemporaryDirectory()
+        self.inbox = os.path.join(self.working_directory.name, "Inbox")
+        os.makedirs(os.path.join(self.inbox, "FF"))
+        os.mkdir(os.path.join(self.working_directory.name, "Outbox"))
+        self.tree = TestMessageTree(self.root, self.working_directory.name)
+
+    def tearDown(self) -> None:
+        self.tree.file_change_listener_thread.join()
+        self.root.destroy()
+        self.working_directory.cleanup()
+
+    def test_replay_events(self):
+        # Open the 'Inbox' node so that it is listed
+        inbox_node = self.tree.get_tree_node(self.inbox)
+        self.tree.focus(inbox_node)
+        self.tree.on_open_node(None)
+        self.assertTrue(self.tree.is_listed(inbox_node))
+        self.assertEqual(1, len(self.tree.get_children(inbox_node)))
+        initial_tree_nodes = dict(self.tree.tree_nodes)
+
+        # The nodes are found through the index of the nodes by path, the tree is never walked from its root
+        walked = []
+        get_children = self.tree.get_children
+
+        def record_get_children(item=None):
+            if item is None or item == "" or item == self.tree.root_tree_node:
+                walked.append(item)
+            return get_children() if item is None else get_children(item)
+
+        self.tree.get_children = record_get_children
+
+        handler = TreeviewFileSystemEventHandler(self.tree)
+        paths = [os.path.join(self.inbox, "message-" + str(idx) + ".xml") for idx in range(self.NUMBER_OF_EVENTS // 2)]
+        for idx, path in enumerate(paths):
+            handler.on_created(FileCreatedEvent(path))
+            handler.on_modified(DirModifiedEvent(self.inbox))
+            self.assertEqual(len(initial_tree_nodes) + idx + 1, len(self.tree.tree_nodes))
+
+        self.assertEqual(len(initial_tree_nodes) + len(paths), len(self.tree.tree_nodes))
+        for path in paths:
+            node = self.tree.get_tree_node(path)
+            self.assertEqual(path, self.tree.item(node)['values'][0])
+            self.assertEqual(inbox_node, self.tree.parent(node))
+        # A node is only added once, the nodes of a directory are not rebuilt when it is modified
+        tree_nodes = dict(self.tree.tree_nodes)
+        handler.on_created(FileCreatedEvent(paths[0]))
+        handler.on_modified(DirModifiedEvent(self.inbox))
+        self.assertEqual(len(paths) + 1, len(self.tree.get_children(inbox_node)))
+        self.assertEqual(tree_nodes, self.tree.tree_nodes)
+
+        # A file moved outside the application, (e.g. using 'mv'), moves its node
+        moved_path = os.path.join(self.inbox, "moved.xml")
+        handler.on_moved(FileMovedEvent(paths[0], moved_path))
+        self.assertEqual("", self.tree.get_tree_node(paths[0]))
+        self.assertEqual(inbox_node, self.tree.parent(self.tree.get_tree_node(moved_path)))
+        handler.on_moved(FileMovedEvent(moved_path, paths[0]))
+        self.assertEqual(len(paths) + 1, len(self.tree.get_children(inbox_node)))
+
+        for idx, path in enumerate(reversed(paths)):
+            handler.on_deleted(FileDeletedEvent(path))
+            handler.on_modified(DirModifiedEvent(self.inbox))
+            self.assertEqual(len(initial_tree_nodes) + len(paths) - idx - 1, len(self.tree.tree_nodes))
+        self.assertEqual(initial_tree_nodes, self.tree.tree_nodes)
+        self.assertEqual([], walked)
+        self.assertEqual(1, len(self.tree.get_children(inbox_node)))
+
+        # Deleting a directory removes the nodes below it as well
+        handler.on_deleted(FileDeletedEvent(self.inbox))
+        self.assertEqual("", self.tree.get_tree_node(os.path.join(self.inbox, "FF")))
+
+    def test_moved_search(self):
+        def as_xml(message):
+            flight_plan_record = FlightPlanRecord()
+            ParseMessage().parse_message(flight_plan_record, message)
+            return flight_plan_record.as_xml()
+
+        message_search = MessageSearch(None)
+        self.tree.set_message_search(message_search)
+        handler = TreeviewFileSystemEventHandler(self.tree)
+        path = WriteXml.write_received_message(as_xml("(CNL-TEST01-LOWW0800-EDDF-DOF/221124)"),
+                                               self.working_directory.name, "", "1")
+        handler.on_created(FileCreatedEvent(path))
+        self.assertEqual([path], message_search.search(MessageSearch.parse_query("TEST01")))
+
+        # A message file moved, (e.g. by drag and drop), is found at its new path only
+        moved_path = os.path.join(self.inbox, "FF", "message-1.xml")
+        os.rename(path, moved_path)
+        handler.on_moved(FileMovedEvent(path, moved_path))
+        self.assertEqual([moved_path], message_search.search(MessageSearch.parse_query("TEST01")))
+
+        # A message file replaced when an edited message is applied is indexed again
+        WriteXml.update_existing_message(moved_path, as_xml("(CNL-TEST02-LOWW0800-EDDF-DOF/221124)"))
+        handler.on_moved(FileMovedEvent(os.path.join(self.inbox, "FF", WriteXml.TEMPORARY_PREFIX + "1" +
+                                                     WriteXml.TEMPORARY_SUFFIX), moved_path))
+        self.assertEqual([], message_search.search(MessageSearch.parse_query("TEST01")))
+        self.assertEqual([moved_path], message_search.search(MessageSearch.parse_query("TEST02")))
+        message_search.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import time
+import unittest
+
+from AFTN_Terminal.MessageValidationThread import MessageValidationThread
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class MessageValidationThreadTests(unittest.TestCase):
+    FPL = "(FPL-TEST01-IS-B738/M-S/C-EGLL0800-N0450F350 " + \
+          " ".join("{0:02d}{1:02d}N{2:03d}{3:02d}W".format(50 + idx % 9, idx % 60, 10 + idx, (idx * 7) % 60)
+                   for idx in range(60)) + "-KJFK0700-RMK/)"
+
+    REMARK = "REMARK TYPED ONE CHARACTER AT A TIME"
+
+    # The maximum time in seconds to wait for a result
+    TIMEOUT = 30.0
+
+    def setUp(self):
+        self.thread = MessageValidationThread()
+        self.thread.start()
+
+    def tearDown(self):
+        self.thread.stop()
+        self.thread.join(self.TIMEOUT)
+
+    def wait_for_result(self, generation):
+        # type: (int) -> [(int, FlightPlanRecord)]
+        # Read the results until the result for 'generation' arrives
+        results = []
+        deadline = time.monotonic() + self.TIMEOUT
+        while time.monotonic() < deadline:
+            result = self.thread.get_result()
+            if result is None:
+                time.sleep(0.001)
+                continue
+            results.append(result)
+            if result[0] == generation:
+                return results
+        self.fail("No result for generation " + str(generation))
+
+    def test_latest_request_validated(self):
+        messages = [self.FPL[:-1] + self.REMARK[0:idx] + ")" for idx in range(len(self.REMARK) + 1)]
+        for generation, message in enumerate(messages, 1):
+            self.thread.request_validation(generation, message)
+        results = self.wait_for_result(len(messages))
+
+        # Results are never out of order and the last result is for the latest request
+        generations = [generation for generation, _ in results]
+        self.assertEqual(sorted(set(generations)), generations)
+        self.assertEqual(len(messages), generations[-1])
+
+        fpr = FlightPlanRecord()
+        ParseMessage().parse_message(fpr, messages[-1])
+        self.assertEqual(fpr.as_xml(), results[-1][1].as_xml())
+        self.assertEqual(fpr.get_all_errors(), results[-1][1].get_all_errors())
+        self.assertIsNone(self.thread.get_result())
+
+    def test_errors(self):
+        self.thread.request_validation(1, self.FPL.replace("-IS-", "-QS-").replace("RMK/", "RMK/NONE"))
+        _, fpr = self.wait_for_result(1)[-1]
+        self.assertEqual(2, len(fpr.get_all_errors()))
+        self.assertEqual([12, 13], fpr.get_all_errors()[0][1:])
+
+    def test_parser_failure(self):
+        # A message the parser fails on returns a result holding the failure, the thread keeps running
+        self.thread.request_validation(1, "FF EGLLZTZX\n121212 EGLLZTZX\n(")
+        _, fpr = self.wait_for_result(1)[-1]
+        self.assertEqual(1, len(fpr.get_all_errors()))
+        self.assertIn("the parser failed", fpr.get_all_errors()[0][0])
+        self.thread.request_validation(2, self.FPL)
+        _, fpr = self.wait_for_result(2)[-1]
+        expected_fpr = FlightPlanRecord()
+        ParseMessage().parse_message(expected_fpr, self.FPL)
+        self.assertEqual(expected_fpr.get_all_errors(), fpr.get_all_errors())
+        self.assertTrue(self.thread.is_alive())
+
+    def test_stop(self):
+        self.thread.stop()
+        self.thread.join(self.TIMEOUT)
+        self.assertFalse(self.thread.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,11 @@
 import os
+import tempfile
 import unittest
 
 from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
 from IcaoMessageParser.ParseMessage import ParseMessage
 from AFTN_Terminal.ReadXml import ReadXml
+from Configuration.EnumerationConstants import FieldIdentifiers, SubFieldIdentifiers
 
 
 class ParseMessageTests(unittest.TestCase):
@@ -407,6 +409,55 @@ class ParseMessageTests(unittest.TestCase):
                          "-RMK/REMARK 1 STS/STS 1 RMK/REMARK 2)",
                          rx.build_message())
 
+    def test_read_xml_09(self):
+        # Messages of several titles written to a temporary file and read back
+        messages = ["SS ABCDEFGH" + os.linesep + "241309 IJKLMNOP" + os.linesep +
+                    "(ALR-INCERFA/LOWWZQZX/OVERDUE" + os.linesep + "-TEST01-IS" + os.linesep +
+                    "-B737/M-S/C" + os.linesep + "-LOWW0800" + os.linesep + "-N0450F350 DCT" + os.linesep +
+                    "-EDDF0200" + os.linesep + "-0" + os.linesep + "-E/0300" + os.linesep +
+                    "-REPORT RADIO)",
+                    "(CNL-TEST01-LOWW0800-EDDF-DOF/221124)"]
+        for message in messages:
+            self.fpr = FlightPlanRecord()
+            self.pm.parse_message(self.fpr, message)
+            with tempfile.TemporaryDirectory() as directory:
+                file_path = os.path.join(directory, "message.xml")
+                with open(file_path, "w") as file:
+                    file.write(self.fpr.as_xml())
+                rx = ReadXml(file_path)
+            self.assertEqual(message, rx.build_message())
+            self.assertEqual("TEST01", rx.get_f7())
+            self.assertEqual("LOWW", rx.get_subfield_fx(FieldIdentifiers.F13, SubFieldIdentifiers.F13a))
+            self.assertEqual("", rx.get_fx(FieldIdentifiers.F22))
+            self.assertEqual("", rx.get_subfield_fx(FieldIdentifiers.F22, SubFieldIdentifiers.F13a))
+
+    def test_read_xml_10(self):
+        # A flight plan with a long route, the extracted route is most of the file
+        route = " ".join("{0:02d}N{1:03d}W".format(10 + idx % 50, 100 + idx % 60) for idx in range(300))
+        self.pm.parse_message(self.fpr, "FF ABCDEFGH" + os.linesep + "241309 IJKLMNOP" + os.linesep +
+                              "(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 " + route + "-EDDF0200-0)")
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "message.xml")
+            with open(file_path, "w") as file:
+                file.write(self.fpr.as_xml())
+            rx = ReadXml(file_path)
+            summary = ReadXml(file_path, summary_only=True)
+            self.assertTrue(summary.is_message_ok())
+            for getter in ["get_priority_indicator", "get_filing_time", "get_f3a", "get_f7a", "get_f9b",
+                           "get_f13a", "get_f13b", "get_f15", "get_f16a", "build_message"]:
+                self.assertEqual(getattr(rx, getter)(), getattr(summary, getter)(), getter)
+            # The extracted route is not read
+            self.assertGreater(len(rx.get_ers_records()), 300)
+            self.assertEqual([], summary.get_ers_records())
+
+        # Files that are not message files
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "message.xml")
+            for text in ["<flight_plan_record><icao_fields>", "<other><icao_fields></icao_fields></other>"]:
+                with open(file_path, "w") as file:
+                    file.write(text)
+                self.assertFalse(ReadXml(file_path, summary_only=True).is_message_ok())
+
 
 if __name__ == '__main__':
     unittest.main()
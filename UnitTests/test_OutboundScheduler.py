@@ -0,0 +1,204 @@
+import asyncio
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+from AFTN_Interface.AftnFramer import AftnFramer
+from AFTN_Interface.OutboundScheduler import OutboundScheduler, FileSink
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class FakeClock:
+    # A clock advanced only by the delays the scheduler requests, the delays are recorded
+    def __init__(self):
+        self.now = 1000.0
+        self.delays = []
+
+    def monotonic(self):
+        # type: () -> float
+        return self.now
+
+    async def sleep(self, delay):
+        # type: (float) -> None
+        self.delays.append(delay)
+        self.now += delay
+        await asyncio.sleep(0)
+
+
+class RecordingSink(FileSink):
+    # Records the size of each write, calls 'on_write' with the number of writes after each write
+    def __init__(self, file, on_write=None):
+        super().__init__(file)
+        self.sizes = []
+        self.on_write = on_write
+
+    async def write(self, data):
+        # type: (bytes) -> None
+        await super().write(data)
+        self.sizes.append(len(data))
+        if self.on_write is not None:
+            self.on_write(len(self.sizes))
+
+
+class OutboundSchedulerTests(unittest.IsolatedAsyncioTestCase):
+    HEADING = "{0} ABCDEFGH\n{1} IJKLMNOP\n"
+
+    CNL = "(CNL-TEST{0:02d}-LOWW0800-EDDF-DOF/221124)"
+
+    def queue(self, scheduler, priority_indicator, filing_time, number, text=""):
+        # type: (OutboundScheduler, str, str, int, str) -> None
+        scheduler.queue_message(self.HEADING.format(priority_indicator, filing_time) + self.CNL.format(number) +
+                                text, priority_indicator, filing_time)
+
+    @staticmethod
+    def callsigns(output):
+        # type: (io.BytesIO) -> [str]
+        messages = AftnFramer().feed(output.getvalue())
+        return [message[message.find("(CNL-") + 5:message.find("(CNL-") + 11] for message in messages]
+
+    def test_filing_time(self):
+        now = datetime(2022, 3, 1, 10, 0, tzinfo=timezone.utc)
+        self.assertEqual(datetime(2022, 3, 1, 9, 30, tzinfo=timezone.utc),
+                         OutboundScheduler.get_filing_time("010930", now))
+        # Filed at the end of the previous month, (February 2022 has 28 days)
+        self.assertEqual(datetime(2022, 2, 28, 23, 59, tzinfo=timezone.utc),
+                         OutboundScheduler.get_filing_time("282359", now))
+        self.assertEqual(datetime(2022, 1, 30, 12, 0, tzinfo=timezone.utc),
+                         OutboundScheduler.get_filing_time("301200", now))
+        self.assertIsNone(OutboundScheduler.get_filing_time("3012", now))
+
+    async def test_priority_order(self):
+        output = io.BytesIO()
+        scheduler = OutboundScheduler(FileSink(output), 0)
+        for priority_indicator, filing_time, number in [("KK", "241300", 1), ("GG", "241300", 2),
+                                                        ("FF", "241310", 3), ("FF", "241309", 4),
+                                                        ("DD", "241300", 5), ("SS", "241300", 6),
+                                                        ("FF", "241309", 7)]:
+            self.queue(scheduler, priority_indicator, filing_time, number)
+        scheduler.queue_message(self.CNL.format(8), "")
+        self.assertEqual((8, 3), (scheduler.get_queue_depth(), scheduler.get_queue_depth("FF")))
+        scheduler.start()
+        await scheduler.wait_until_transmitted()
+        await scheduler.stop()
+
+        self.assertEqual(["TEST06", "TEST05", "TEST04", "TEST07", "TEST03", "TEST02", "TEST01", "TEST08"],
+                         self.callsigns(output))
+        self.assertEqual([1, 1, 3, 1, 1, 1], [statistics.get_messages_transmitted()
+                                              for statistics in scheduler.get_all_statistics()])
+
+        # The messages transmitted can be parsed
+        messages = AftnFramer().feed(output.getvalue())
+        flight_plan_record = FlightPlanRecord()
+        ParseMessage().parse_message(flight_plan_record, messages[0])
+        self.assertFalse(flight_plan_record.errors_detected())
+
+    def assert_paced(self, clock, sink, characters_per_second):
+        # type: (FakeClock, RecordingSink, float) -> None
+        # The first block is written immediately, each following block waits for the previous one to be sent
+        self.assertEqual(len(sink.sizes) - 1, len(clock.delays))
+        for delay, size in zip(clock.delays, sink.sizes):
+            self.assertAlmostEqual(size / characters_per_second, delay)
+
+    async def test_preemption(self):
+        output = io.BytesIO()
+        clock = FakeClock()
+        # The distress message is queued while the second block of the bulk message is being transmitted
+        sink = RecordingSink(output, lambda writes: writes == 2 and self.queue(scheduler, "SS", "241301", 3))
+        scheduler = OutboundScheduler(sink, 6400, clock.monotonic, clock.sleep)
+        self.queue(scheduler, "GG", "241300", 1, "-RMK/" + "BULK " * 400)
+        self.queue(scheduler, "KK", "241300", 2)
+        scheduler.start()
+        await scheduler.wait_until_transmitted()
+        await scheduler.stop()
+        self.assert_paced(clock, sink, 6400)
+
+        # The bulk message is cancelled and transmitted again after the distress message
+        messages = AftnFramer().feed(output.getvalue())
+        self.assertEqual(4, len(messages))
+        self.assertTrue(messages[0].endswith("QTA QTA"))
+        self.assertEqual(["TEST01", "TEST03", "TEST01", "TEST02"], self.callsigns(output))
+        gg_statistics = scheduler.get_statistics("GG")
+        self.assertEqual((1, 1), (gg_statistics.get_messages_transmitted(), gg_statistics.get_preemptions()))
+        self.assertLess(scheduler.get_statistics("SS").get_maximum_latency(),
+                        gg_statistics.get_maximum_latency())
+
+    async def test_outbox(self):
+        with tempfile.TemporaryDirectory() as working_directory:
+            os.mkdir(os.path.join(working_directory, "Outbox"))
+            for number, priority_indicator in [(1, "GG"), (2, "DD")]:
+                flight_plan_record = FlightPlanRecord()
+                ParseMessage().parse_message(flight_plan_record, self.HEADING.format(
+                    priority_indicator, "241300") + self.CNL.format(number))
+                with open(os.path.join(working_directory, "Outbox", "message-" + str(number) + ".xml"), "w") as f:
+                    f.write(flight_plan_record.as_xml())
+            # A file that is not a valid message file is reported once and not read again until it changes
+            malformed_path = os.path.join(working_directory, "Outbox", "message-3.xml")
+            with open(malformed_path, "w") as f:
+                f.write("<flight_plan_record>")
+
+            output = io.BytesIO()
+            clock = FakeClock()
+            sink = RecordingSink(output)
+            scheduler = OutboundScheduler(sink, 2000, clock.monotonic, clock.sleep)
+            with contextlib.redirect_stderr(io.StringIO()) as errors:
+                self.assertEqual(2, scheduler.load_outbox(working_directory))
+                # Files already queued are not queued again
+                self.assertEqual(0, scheduler.load_outbox(working_directory))
+            self.assertEqual(1, errors.getvalue().count(malformed_path))
+            self.assertIn(malformed_path, scheduler.rejected_files)
+            scheduler.start()
+            await scheduler.wait_until_transmitted()
+            await scheduler.stop()
+
+            self.assertEqual(["TEST02", "TEST01"], self.callsigns(output))
+            self.assertEqual(["message-1.xml", "message-2.xml"],
+                             sorted(os.listdir(os.path.join(working_directory, "Outbox", "Sent"))))
+            # The transmission is paced to the rate limit
+            self.assertLess(1, len(sink.sizes))
+            self.assert_paced(clock, sink, 2000)
+
+    async def test_sink_error(self):
+        class FailingSink:
+            async def write(self, data):
+                raise ConnectionResetError("Connection reset by peer")
+
+        with tempfile.TemporaryDirectory() as working_directory:
+            os.mkdir(os.path.join(working_directory, "Outbox"))
+            flight_plan_record = FlightPlanRecord()
+            ParseMessage().parse_message(flight_plan_record, self.HEADING.format("FF", "241300") + self.CNL.format(1))
+            with open(os.path.join(working_directory, "Outbox", "message-1.xml"), "w") as f:
+                f.write(flight_plan_record.as_xml())
+
+            # The error ends the transmission, the message remains queued and its file is not queued twice
+            scheduler = OutboundScheduler(FailingSink(), 0)
+            self.assertEqual(1, scheduler.load_outbox(working_directory))
+            scheduler.start()
+            with self.assertRaises(ConnectionResetError):
+                await scheduler.wait_until_transmitted()
+            self.assertEqual(1, scheduler.get_queue_depth())
+            self.assertEqual(0, scheduler.load_outbox(working_directory))
+            await scheduler.stop()
+
+            # The message is transmitted once the channel is available again
+            output = io.BytesIO()
+            scheduler.sink = FileSink(output)
+            scheduler.start()
+            await scheduler.wait_until_transmitted()
+            await scheduler.stop()
+            self.assertEqual(["TEST01"], self.callsigns(output))
+            self.assertEqual(["message-1.xml"], os.listdir(os.path.join(working_directory, "Outbox", "Sent")))
+
+    def test_headless_import(self):
+        # The entry point runs on a headless server, it can be imported without Tkinter
+        subprocess.run([sys.executable, "-c", "import sys; sys.modules['tkinter'] = None; import RunAftnOutbound"], check=True,
+                       cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+if __name__ == '__main__':
+    unittest.main()
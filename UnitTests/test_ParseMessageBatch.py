@@ -0,0 +1,87 @@
+import pickle
+import unittest
+
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class ParseMessageBatchTests(unittest.TestCase):
+    # A small traffic sample, repeated to form a batch; includes messages with errors
+    messages = [
+        "FF ABCDEFGH\n241309 IJKLMNOP\n(FPL-TEST01-IS-B737/M-S/C-LOWW0800"
+        "-N0450F350 PNT44444 23N123W BBB B9 AAA STAY1/ 1234-LOWW0200-RMK/REMARK 1 STS/STS 1 RMK/REMARK 2)",
+        "(FPL-TEST02-VG-C172/L-S/C-EGLL0800-N0100VFR DCT 5230N00130E DCT ABC-EGKK0100-0)",
+        "(FPL-TEST03-IS-B738/M-SDGR/C-EDDF0800-M082F350 5530N02000W 5430N04000W 5230N05000W-KJFK0700"
+        "-PBN/B1 DOF/241012)",
+        "(ARR-TEST14-LOWW0800-LOWW0200-SOME AIRPORT)",
+        "(CHG-TEST05-LOWW-EDDF-DOF/241012-15/N0450F370 DCT ABC UL1 DEF)",
+        "(CNL-TEST06-LOWW-EDDF-0)",
+        "JUNK",
+        "",
+    ]
+
+    # The number of times the traffic sample is repeated
+    BATCH_REPEAT = 100
+
+    def get_batch(self):
+        # type: () -> [str]
+        return self.messages * self.BATCH_REPEAT
+
+    @staticmethod
+    def parse_serial(messages):
+        # type: ([str]) -> [str]
+        pm = ParseMessage()
+        results = []
+        for message in messages:
+            fpr = FlightPlanRecord()
+            pm.parse_message(fpr, message)
+            results.append(fpr.as_xml())
+        return results
+
+    def test_parse_many_ordered(self):
+        batch = self.get_batch()
+        results = list(ParseMessage().parse_many(batch, workers=2, chunksize=50))
+        self.assertEqual(list(range(len(batch))), [index for index, _ in results])
+        self.assertEqual(self.parse_serial(batch), [fpr.as_xml() for _, fpr in results])
+
+    def test_parse_many_as_completed(self):
+        batch = self.get_batch()
+        results = dict(ParseMessage().parse_many(iter(batch), workers=3, chunksize=7, ordered=False))
+        self.assertEqual(len(batch), len(results))
+        self.assertEqual(self.parse_serial(batch), [results[index].as_xml() for index in range(len(batch))])
+
+    def test_parse_many_in_process(self):
+        batch = self.messages
+        results = list(ParseMessage().parse_many(batch, workers=1, chunksize=3))
+        self.assertEqual(self.parse_serial(batch), [fpr.as_xml() for _, fpr in results])
+
+    def test_parse_many_stop_early(self):
+        results = ParseMessage().parse_many(self.get_batch(), workers=2, chunksize=10)
+        self.assertEqual(0, next(results)[0])
+        results.close()
+
+    def test_parser_failure(self):
+        # The parser raises an exception on the first message, the messages after it are still parsed
+        batch = ["(CHG-TEST05-LOWW-EDDF-DOF/241012-15/N0450F370 DCT ABC UL1 DEF-18/REG/DABC STS//OSP-9/B738/M)"] + \
+            self.messages
+        for workers in [1, 2]:
+            results = [fpr for _, fpr in ParseMessage().parse_many(batch, workers=workers, chunksize=3)]
+            self.assertEqual(len(batch), len(results))
+            self.assertTrue(ParseMessage.is_parser_failure(results[0]))
+            self.assertEqual(batch[0], results[0].get_erroneous_fields()[0].get_field_text())
+            self.assertEqual(self.parse_serial(self.messages), [fpr.as_xml() for fpr in results[1:]])
+            self.assertFalse(any(ParseMessage.is_parser_failure(fpr) for fpr in results[1:]))
+
+    def test_flight_plan_record_pickles(self):
+        for message in self.messages:
+            fpr = FlightPlanRecord()
+            ParseMessage().parse_message(fpr, message)
+            copy = pickle.loads(pickle.dumps(fpr))
+            self.assertEqual(fpr.as_xml(), copy.as_xml())
+            if fpr.get_extracted_route() is not None:
+                self.assertEqual(fpr.get_extracted_route().get_number_of_elements(),
+                                 copy.get_extracted_route().get_number_of_elements())
+
+
+if __name__ == '__main__':
+    unittest.main()
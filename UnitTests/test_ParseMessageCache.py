@@ -0,0 +1,88 @@
+import unittest
+
+from Configuration.EnumerationConstants import FieldIdentifiers, SubFieldIdentifiers
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord, SubFieldRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from IcaoMessageParser.ParseMessageCache import ParseMessageCache
+
+
+class ParseMessageCacheTests(unittest.TestCase):
+    # Message bodies, with and without errors
+    bodies = [
+        "(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 PNT44444 23N123W BBB B9 AAA STAY1/ 1234-LOWW0200"
+        "-RMK/REMARK 1 STS/STS 1 RMK/REMARK 2)",
+        "(FPL-TEST02-VG-C172/L-S/C-EGLL0800-N0100VFR DCT 5230N00130E DCT ABC-EGKK0100-0)",
+        "(FPL-TEST03-IS-B738/M-SDGR/C-EDDF0800-M082F350 5530N02000W 5430N04000W 5230N05000W-KJFK0700"
+        "-PBN/B1 DOF/241012)",
+        "(ARR-TEST14-LOWW0800-LOWW0200-SOME AIRPORT)",
+        "(CHG-TEST05-LOWW-EDDF-DOF/241012-15/N0450F370 DCT ABC UL1 DEF)",
+        "(CNL-TEST06-LOWW-EDDF-0)",
+        "(FPL-TEST07-IS-B737/M-S/C-LOWW0800-N0450F350 DCT-EDDF0200-0-EXTRA)",
+        "(XYZ-TEST08)",
+    ]
+
+    # Headers of different lengths, including one with errors and none at all
+    headers = [
+        "",
+        "FF ABCDEFGH\n241309 IJKLMNOP\n",
+        "GG ABCDEFGH QRSTUVWX YZABCDEF\n241310 IJKLMNOP\nABCDEFGH\n",
+        "ZZ ABC\n241311 IJKLMNOP\n",
+    ]
+
+    # The number of times the duplicate traffic is replayed
+    TRAFFIC_REPEAT = 3
+
+    @staticmethod
+    def parse(parser, message):
+        # type: (ParseMessage | ParseMessageCache, str) -> (bool, str, [str])
+        fpr = FlightPlanRecord()
+        result = parser.parse_message(fpr, message)
+        return result, fpr.as_xml(), [(error.get_field_text(), error.get_start_index(), error.get_end_index())
+                                      for error in fpr.get_erroneous_fields()]
+
+    def test_same_results(self):
+        cache = ParseMessageCache()
+        for body in self.bodies:
+            for header in self.headers:
+                self.assertEqual(self.parse(ParseMessage(), header + body), self.parse(cache, header + body))
+        # The title of the last body is unknown, these are not cached
+        self.assertEqual(len(self.bodies) - 1, cache.get_number_of_entries())
+        self.assertEqual((len(self.bodies) - 1) * (len(self.headers) - 1), cache.get_hits())
+        self.assertEqual(len(self.bodies) - 1 + len(self.headers), cache.get_misses())
+
+    def test_copies(self):
+        cache = ParseMessageCache()
+        fpr = FlightPlanRecord()
+        cache.parse_message(fpr, self.bodies[1])
+        fpr.get_icao_field(FieldIdentifiers.F7).add_subfield(SubFieldIdentifiers.F7a,
+                                                             SubFieldRecord("CHANGED", 0, 7))
+        fpr.get_extracted_route().get_first_element().set_start_index(1000)
+        fpr.add_erroneous_field("Changed", "Changed", 0, 7)
+        self.assertEqual(self.parse(ParseMessage(), self.bodies[1]), self.parse(cache, self.bodies[1]))
+        self.assertEqual(1, cache.get_hits())
+
+    def test_least_recently_used(self):
+        cache = ParseMessageCache(2)
+        for body in [self.bodies[0], self.bodies[1], self.bodies[0], self.bodies[2], self.bodies[0], self.bodies[1]]:
+            cache.parse_message(FlightPlanRecord(), body)
+        # The second body was discarded when the third was added
+        self.assertEqual((2, 4), (cache.get_hits(), cache.get_misses()))
+        self.assertEqual(2, cache.get_number_of_entries())
+        self.assertAlmostEqual(2 / 6, cache.get_hit_ratio())
+        cache.clear()
+        self.assertEqual((0, 0, 0.0, 0), (cache.get_hits(), cache.get_misses(), cache.get_hit_ratio(),
+                                          cache.get_number_of_entries()))
+
+    def test_duplicate_traffic(self):
+        # Every message is received with each header, (e.g. retransmitted or addressed to several units)
+        traffic = [header + body for body in self.bodies for header in self.headers] * self.TRAFFIC_REPEAT
+        cache = ParseMessageCache()
+        for message in traffic:
+            self.assertEqual(self.parse(ParseMessage(), message), self.parse(cache, message))
+        # Only the first message with each body is parsed, the messages with an unknown title are never cached
+        misses = len(self.bodies) - 1 + len(self.headers) * self.TRAFFIC_REPEAT
+        self.assertEqual((len(traffic) - misses, misses), (cache.get_hits(), cache.get_misses()))
+
+
+if __name__ == '__main__':
+    unittest.main()
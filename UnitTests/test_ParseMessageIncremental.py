@@ -0,0 +1,72 @@
+import unittest
+
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from IcaoMessageParser.ParseMessageIncremental import ParseMessageIncremental
+
+
+class ParseMessageIncrementalTests(unittest.TestCase):
+    FPL = "FF EDDFZQZX\n241309 EGLLZPZX\n(FPL-TEST01-IS-B738/M-DE2E3FGHIJ1RSWY/LB1D1-EGLL0800-N0450F350 " + \
+          " ".join("{0:02d}{1:02d}N{2:03d}{3:02d}W".format(50 + idx % 9, idx % 60, 10 + idx, (idx * 7) % 60)
+                   for idx in range(60)) + \
+          "-KJFK0700 KBOS-PBN/A1B1C1D1L1O1S2 DOF/241012 RMK/)"
+
+    CHG = "(CHG-TEST13-LOWW0800-LOWW0200-DOF/221010-9/B737/M-13/AAA0912-15/N0450F350 BBB)"
+
+    REMARK = "REMARK TYPED ONE CHARACTER AT A TIME"
+
+    @staticmethod
+    def parse(parser, message):
+        # type: (ParseMessage, str) -> (bool, str, [str])
+        fpr = FlightPlanRecord()
+        result = parser.parse_message(fpr, message)
+        f22_flight_plan = "" if fpr.get_f22_flight_plan() is None else fpr.get_f22_flight_plan().as_xml()
+        return result, fpr.as_xml(), f22_flight_plan, [(error.get_field_text(), error.get_start_index(),
+                                                        error.get_end_index()) for error in fpr.get_erroneous_fields()]
+
+    def get_typed_remark(self):
+        # type: () -> [str]
+        # The message after each character of a remark is typed
+        return [self.FPL[:-1] + self.REMARK[0:idx] + ")" for idx in range(len(self.REMARK) + 1)]
+
+    def test_same_results(self):
+        edits = [self.FPL,
+                 self.FPL.replace("N0450F350", "N0450F370"),
+                 self.FPL.replace("EDDFZQZX", "EDDFZQZX EDDMZQZX"),
+                 self.FPL.replace("-IS-", "-IX-"),
+                 self.FPL.replace("-IS-", "-IX-").replace("RMK/", "RMK/A"),
+                 self.FPL.replace("(FPL-", "(CHG-"),
+                 self.FPL.replace("-EGLL0800", ""),
+                 self.FPL.replace("DOF/241012", "DOF/241012-EXTRA"),
+                 self.CHG,
+                 self.CHG.replace("AAA0912", "LOWW0912"),
+                 self.CHG.replace("BBB", "BBB CCC"),
+                 "FF ABCDEFGH\n191916 IJKLMNOP\n" + self.CHG.replace("-13/", "-13Z/"),
+                 "FF ABCDEFGH\n191916 IJKLMNOP\n" + self.CHG.replace("-13/", "-13Z/").replace("TEST13", "TEST139"),
+                 "",
+                 self.FPL]
+        parser = ParseMessageIncremental()
+        for message in edits:
+            self.assertEqual(self.parse(ParseMessage(), message), self.parse(parser, message))
+
+    def test_reuse(self):
+        parser = ParseMessageIncremental()
+        for message in self.get_typed_remark():
+            self.assertEqual(self.parse(ParseMessage(), message), self.parse(parser, message))
+        # Field 3 and field 18 are parsed for each character, the other seven fields are copied
+        self.assertEqual(7 * len(self.REMARK), parser.get_fields_reused())
+        self.assertEqual(9 + 2 * len(self.REMARK), parser.get_fields_parsed())
+
+        # An edit in field 13 moves the fields after it, only fields 3 and 13 are parsed
+        message = self.get_typed_remark()[-1].replace("EGLL0800", " EGLL0800")
+        fpr = FlightPlanRecord()
+        parser.parse_message(fpr, message)
+        self.assertEqual(7 * len(self.REMARK) + 7, parser.get_fields_reused())
+        self.assertEqual(self.parse(ParseMessage(), message)[1], fpr.as_xml())
+
+        parser.clear()
+        self.assertEqual((0, 0), (parser.get_fields_parsed(), parser.get_fields_reused()))
+
+
+if __name__ == '__main__':
+    unittest.main()
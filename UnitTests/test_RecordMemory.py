@@ -0,0 +1,89 @@
+import gc
+import tracemalloc
+import unittest
+
+from F15_Parser.ExtractedRouteRecord import ExtractedRouteRecord
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord, SubFieldRecord, FieldRecord, ErrorRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+from Tokenizer.Token import Token
+
+
+class DictRecord:
+    # A record storing its members in a dictionary per instance as the record classes did before using slots
+    def __init__(self, record):
+        # type: (object) -> None
+        for cls in type(record).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                setattr(self, name, getattr(record, name))
+
+
+def get_records(flight_plan_record):
+    # type: (FlightPlanRecord) -> [object]
+    # All the field, subfield, error and extracted route records in a flight plan record
+    records = list(flight_plan_record.get_erroneous_fields())
+    for field in flight_plan_record.icao_fields.values():
+        records.append(field)
+        for subfields in field.get_subfield_dictionary().values():
+            records.extend(subfields)
+    if flight_plan_record.get_extracted_route() is not None:
+        records.extend(flight_plan_record.get_extracted_route().get_all_elements())
+    return records
+
+
+def measure(function):
+    # type: (callable) -> (int, object)
+    # The number of bytes still allocated once 'function' returns and the value it returns
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = function()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - before, result
+    finally:
+        tracemalloc.stop()
+
+
+class RecordMemoryTests(unittest.TestCase):
+    FPL = "(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 PNT 23N123W DCT 4530N01030E UL851 ABC/N0460F370 " \
+          "DCT 4600N01100E-EDDF0200 EDDM-PBN/A1B1 DOF/240101 RMK/NONE)"
+
+    NUMBER_OF_MESSAGES = 200
+
+    def parse_messages(self):
+        # type: () -> [FlightPlanRecord]
+        parse_message = ParseMessage()
+        flight_plan_records = []
+        for _ in range(self.NUMBER_OF_MESSAGES):
+            flight_plan_record = FlightPlanRecord()
+            parse_message.parse_message(flight_plan_record, self.FPL)
+            flight_plan_records.append(flight_plan_record)
+        return flight_plan_records
+
+    def test_no_instance_dictionary(self):
+        for record in [Token("ABC", 0, 3), SubFieldRecord("ABC", 0, 3), FieldRecord("ABC", 0, 3),
+                       ErrorRecord("ABC", "Error", 0, 3), ExtractedRouteRecord("ABC", 0, 3)]:
+            self.assertFalse(hasattr(record, "__dict__"), type(record).__name__)
+            with self.assertRaises(AttributeError):
+                record.unknown_member = 0
+        # Members without a constructor argument are initialised to their defaults
+        record = ExtractedRouteRecord()
+        self.assertEqual(("", 0.0, 0, False), (record.get_altitude(), record.get_latitude(),
+                                               record.get_stay_time(), record.is_lat_long_valid()))
+
+    def test_memory(self):
+        flight_plan_bytes, flight_plan_records = measure(self.parse_messages)
+        records = [record for flight_plan_record in flight_plan_records for record in get_records(flight_plan_record)]
+        slotted_bytes = sum(record.__sizeof__() for record in records)
+        dict_bytes, dict_records = measure(lambda: [DictRecord(record) for record in records])
+        dict_bytes -= measure(lambda: [None] * len(records))[0]
+        print("\nRecords per FPL {0}; bytes per FPL {1}; record bytes per FPL with slots {2}, with a dictionary "
+              "per record {3}".format(len(records) // self.NUMBER_OF_MESSAGES,
+                                      flight_plan_bytes // self.NUMBER_OF_MESSAGES,
+                                      slotted_bytes // self.NUMBER_OF_MESSAGES,
+                                      dict_bytes // self.NUMBER_OF_MESSAGES))
+        self.assertLess(slotted_bytes * 2, dict_bytes)
+
+
+if __name__ == '__main__':
+    unittest.main()
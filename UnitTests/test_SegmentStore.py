@@ -0,0 +1,123 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from AFTN_Terminal.SegmentStore import SegmentStore
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class SegmentStoreTests(unittest.TestCase):
+    MESSAGES = ["FF ABCDEFGH\n241309 IJKLMNOP\n(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 PNT B9 BIBAX"
+                "-EDDF0200-DOF/221124 REG/DABCD)",
+                "GG ABCDEFGH\n241310 IJKLMNOP\n(CNL-TEST01-LOWW0800-EDDF-DOF/221124)",
+                "(CHG-TEST02-EGLL0800-EGAA-0-8/IG)",
+                "(FPL-TEST03-IS-B737/M-S/C-LOWW0800-N0450F350 PNT XXX-EDDF0200-0)"]
+    MANY_RECORDS = 500
+
+    def setUp(self):
+        self.records = []
+        for message in self.MESSAGES:
+            flight_plan_record = FlightPlanRecord()
+            ParseMessage().parse_message(flight_plan_record, message)
+            self.records.append(flight_plan_record)
+
+    def test_append_and_read(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store_path = os.path.join(directory, "Store")
+            store = SegmentStore(store_path, segment_size=1000)
+            for flight_plan_record in self.records * 3:
+                store.append(flight_plan_record)
+            self.assertEqual(12, store.get_record_count())
+            self.assertGreater(store.get_segment_count(), 1)
+            self.assertEqual(self.records[1].as_xml(), store.read_xml(5))
+            self.assertEqual(["FF", "GG", "", ""], [store.get_priority_indicator(n) for n in range(4)])
+            self.assertRaises(IndexError, store.read_xml, 12)
+            store.close()
+
+            # Compressed and uncompressed records can be mixed in a store
+            store = SegmentStore(store_path, segment_size=1000, compress=True)
+            store.append(self.records[2])
+            store.close()
+            store = SegmentStore(store_path)
+            self.assertEqual([flight_plan_record.as_xml() for flight_plan_record in self.records * 3 +
+                              [self.records[2]]], [store.read_xml(n) for n in range(store.get_record_count())])
+
+            # Export as a message file in the working directory
+            os.makedirs(os.path.join(directory, "Inbox", "FF"))
+            file_path = store.export(4, directory)
+            self.assertEqual(os.path.join(directory, "Inbox", "FF", "message-store-4.xml"), file_path)
+            with open(file_path, "r", encoding="utf-8") as file:
+                self.assertEqual(self.records[0].as_xml(), file.read())
+            store.close()
+
+    def test_recover(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = SegmentStore(directory)
+            for flight_plan_record in self.records:
+                store.append(flight_plan_record)
+            store.close()
+            data_path = os.path.join(directory, "segment-000001.dat")
+            index_path = os.path.join(directory, "segment-000001.idx")
+
+            # A crash after writing a record but not its index entry, part way through the next record
+            os.truncate(index_path, os.path.getsize(index_path) - SegmentStore.INDEX_ENTRY.size)
+            with open(data_path, "ab") as data_file:
+                data_file.write(SegmentStore.RECORD_HEADER.pack(100, 0, 0, b"FF") + b"<flight")
+            store = SegmentStore(directory)
+            self.assertEqual(4, store.get_record_count())
+            self.assertEqual(self.records[3].as_xml(), store.read_xml(3))
+            store.close()
+
+            # A crash after writing an index entry but not all of its record
+            os.truncate(data_path, os.path.getsize(data_path) - 10)
+            store = SegmentStore(directory)
+            self.assertEqual(3, store.get_record_count())
+            self.assertEqual(3, store.append(self.records[3]))
+            self.assertEqual(self.records[3].as_xml(), store.read_xml(3))
+            store.close()
+
+    def test_sync(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # Records synchronised before the process ends abruptly are kept, including those in the
+            # segments completed before the last
+            script = ("import os, sys\n"
+                      "from AFTN_Terminal.SegmentStore import SegmentStore\n"
+                      "store = SegmentStore(sys.argv[1], segment_size=10000)\n"
+                      "for idx in range(30):\n"
+                      "    store.append_xml(\"<flight_plan_record>\" + \"x\" * 1000 + \"</flight_plan_record>\",\n"
+                      "                     \"FF\")\n"
+                      "store.sync()\n"
+                      "os._exit(0)\n")
+            subprocess.run([sys.executable, "-c", script, directory], check=True,
+                           cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            store = SegmentStore(directory, segment_size=10000)
+            self.assertEqual(30, store.get_record_count())
+            self.assertGreater(store.get_segment_count(), 2)
+
+            # Only the last segment is kept open, earlier segments are unmapped once no longer read
+            for record_number in range(store.get_record_count()):
+                store.read_xml(record_number)
+            self.assertEqual(store.get_segment_count() - 1, len(store.mapped_segments))
+            self.assertTrue(all(segment.data_file is None for segment in store.segments[:-1]))
+            store.MAPPED_SEGMENTS = 1
+            store.read_xml(0)
+            self.assertEqual(1, sum(segment.is_mapped() for segment in store.segments[:-1]))
+            store.close()
+
+    def test_many_records(self):
+        xml_texts = [flight_plan_record.as_xml() for flight_plan_record in self.records]
+        xml_texts = (xml_texts * (self.MANY_RECORDS // len(xml_texts) + 1))[:self.MANY_RECORDS]
+        with tempfile.TemporaryDirectory() as directory:
+            store = SegmentStore(directory)
+            for xml_text in xml_texts:
+                store.append_xml(xml_text, "")
+            store.sync()
+            self.assertEqual(xml_texts, [store.read_xml(record_number) for record_number in range(len(xml_texts))])
+            store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
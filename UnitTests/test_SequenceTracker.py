@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+
+from AFTN_Interface.SequenceTracker import SequenceTracker
+from Configuration.EnumerationConstants import FieldIdentifiers, SubFieldIdentifiers, SequenceStatus
+from IcaoMessageParser.FlightPlanRecord import FlightPlanRecord
+from IcaoMessageParser.ParseMessage import ParseMessage
+
+
+class SequenceTrackerTests(unittest.TestCase):
+    MESSAGE = "{0}\r\nFF ABCDEFGH\r\r\n241309 IJKLMNOP\r\r\n(CNL-TEST01-LOWW0800-EDDF-DOF/221124)"
+
+    def test_parse_transmission_id(self):
+        flight_plan_record = FlightPlanRecord()
+        ParseMessage().parse_message(flight_plan_record, self.MESSAGE.format("ABC123 241309"))
+        self.assertFalse(flight_plan_record.errors_detected())
+        field = flight_plan_record.get_icao_field(FieldIdentifiers.TRANSMISSION_ID)
+        self.assertEqual(("ABC123", 0, 6), (field.get_field_text(), field.get_start_index(), field.get_end_index()))
+        self.assertEqual("123", flight_plan_record.get_icao_subfield(
+            FieldIdentifiers.TRANSMISSION_ID, SubFieldIdentifiers.TRANSMISSION_ID_SEQUENCE).get_field_text())
+        self.assertEqual("FF", flight_plan_record.get_icao_field(
+            FieldIdentifiers.PRIORITY_INDICATOR).get_field_text())
+
+        # A header without a transmission identification
+        flight_plan_record = FlightPlanRecord()
+        ParseMessage().parse_message(flight_plan_record, self.MESSAGE.format("")[2:])
+        self.assertFalse(flight_plan_record.errors_detected())
+        self.assertIsNone(flight_plan_record.get_icao_field(FieldIdentifiers.TRANSMISSION_ID))
+
+    def test_sequence(self):
+        tracker = SequenceTracker(window=10)
+        statuses = [tracker.track("ABC", number) for number in [998, 999, 0, 3, 1, 1, 6, 2, 999]]
+        self.assertEqual([SequenceStatus.FIRST, SequenceStatus.IN_ORDER, SequenceStatus.IN_ORDER,
+                          SequenceStatus.GAP, SequenceStatus.LATE, SequenceStatus.DUPLICATE, SequenceStatus.GAP,
+                          SequenceStatus.LATE, SequenceStatus.DUPLICATE], statuses)
+        channel = tracker.get_channel("ABC")
+        self.assertEqual([4, 5], channel.get_missing_numbers())
+        self.assertEqual((7, 2, 2, 0, 2, 2), (channel.get_next_expected(), channel.get_gaps(),
+                                              channel.get_missing_outstanding(), channel.get_lost(),
+                                              channel.get_late(), channel.get_duplicates()))
+
+        # Missing numbers falling out of the window are lost, a late arrival is then a duplicate
+        for number in range(7, 20):
+            tracker.track("ABC", number)
+        self.assertEqual((0, 2), (channel.get_missing_outstanding(), channel.get_lost()))
+        self.assertEqual(SequenceStatus.DUPLICATE, tracker.track("ABC", 4))
+
+        # Channels are tracked independently
+        self.assertEqual(SequenceStatus.FIRST, tracker.track("XYZ", 4))
+        tracker.reset_channel("ABC")
+        self.assertEqual(SequenceStatus.FIRST, tracker.track("ABC", 1))
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            state_path = os.path.join(directory, "sequence.json")
+            tracker = SequenceTracker(state_path)
+            for number in [1, 2, 5, 9]:
+                tracker.track("ABC", number)
+            tracker.track("XYZ", 500)
+            tracker.save()
+
+            tracker = SequenceTracker(state_path)
+            self.assertEqual([3, 4, 6, 7, 8], tracker.get_channel("ABC").get_missing_numbers())
+            self.assertEqual(5, tracker.get_missing_outstanding())
+            self.assertEqual(SequenceStatus.LATE, tracker.track("ABC", 7))
+            self.assertEqual(SequenceStatus.IN_ORDER, tracker.track("XYZ", 501))
+
+            with open(state_path, "w") as state_file:
+                state_file.write("{}")
+            self.assertRaises(ValueError, SequenceTracker, state_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
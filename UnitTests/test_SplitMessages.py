@@ -0,0 +1,62 @@
+import contextlib
+import io
+import json
+import unittest
+
+import RunAftnParser
+from IcaoMessageParser.ParseMessageCache import ParseMessageCache
+from IcaoMessageParser.SplitMessages import SplitMessages
+
+
+class SplitMessagesTests(unittest.TestCase):
+
+    def split(self, text):
+        # type: (str) -> [str]
+        return list(SplitMessages.split(io.StringIO(text, newline="\n")))
+
+    def test_split_blank_lines(self):
+        self.assertEqual(["FF ABCDEFGH\r\r\n241309 IJKLMNOP\r\r\n(CNL-TEST06-LOWW-EDDF-0)",
+                          "(ARR-TEST14-LOWW0800-LOWW0200-SOME AIRPORT)"],
+                         self.split("\r\r\nFF ABCDEFGH\r\r\n241309 IJKLMNOP\r\r\n(CNL-TEST06-LOWW-EDDF-0)\r\r\n"
+                                    "\r\r\n  \r\r\n(ARR-TEST14-LOWW0800-LOWW0200-SOME AIRPORT)"))
+
+    def test_split_soh_etx(self):
+        self.assertEqual(["FF ABCDEFGH\n\n(CNL-TEST06-LOWW-EDDF-0)",
+                          "(ARR-TEST14-LOWW0800-LOWW0200-SOME AIRPORT)",
+                          "(CNL-TEST07-LOWW-EDDF-0)"],
+                         self.split("\x01FF ABCDEFGH\n\n\x02(CNL-TEST06-LOWW-EDDF-0)\x03\x01"
+                                    "(ARR-TEST14-LOWW0800-LOWW0200-SOME AIRPORT)\x03\n\n(CNL-TEST07-LOWW-EDDF-0)\n"))
+
+    def test_split_unterminated(self):
+        self.assertEqual(["(CNL-TEST06", "(CNL-TEST07-LOWW-EDDF-0)"],
+                         self.split("(CNL-TEST06\x01(CNL-TEST07-LOWW-EDDF-0)"))
+        self.assertEqual([], self.split("\n\n\x01\x03\n"))
+
+    def test_write_records_json(self):
+        output = io.StringIO()
+        count = RunAftnParser.write_records(
+            io.StringIO("(FPL-TEST01-IS-B737/M-S/C-LOWW0800-N0450F350 PNT 23N123W-LOWW0200-0)\n\n"
+                        "(ARR-TEST14-LOWW0800-LOWW0200-SOME AIRPORT)\n"), output, "json", 1, 10)
+        self.assertEqual(2, count)
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(["FPL", "ARR"], [record["message_title"] for record in records])
+        self.assertEqual(["ADEP", "PNT", "23N123W", "ADES"], [item["name"] for item in records[0]["ers"]])
+        self.assertEqual("LOWW0800", records[0]["icao_fields"]["F13"]["text"])
+        self.assertEqual(0, len(records[0]["errors"]))
+        self.assertEqual(2, len(records[1]["errors"]))
+
+    def test_write_records_parser_failure(self):
+        # The parser raises an exception on the first message, it is reported and the next message is written
+        text = "(CHG-TEST05-LOWW-EDDF-DOF/241012-15/N0450F370 DCT ABC UL1 DEF-18/REG/DABC STS//OSP-9/B738/M)\n\n" \
+               "(ARR-TEST14-LOWW0800-LOWW0200-SOME AIRPORT)\n"
+        for workers, cache in [(1, None), (2, None), (1, ParseMessageCache(10))]:
+            output = io.StringIO()
+            with contextlib.redirect_stderr(io.StringIO()) as errors:
+                self.assertEqual(2, RunAftnParser.write_records(io.StringIO(text), output, "json", workers, 1, cache))
+            records = [json.loads(line) for line in output.getvalue().splitlines()]
+            self.assertEqual(["UNKNOWN", "ARR"], [record["message_title"] for record in records])
+            self.assertIn("Unable to parse message 1: IndexError", errors.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from Tokenizer.Tokenize import Tokenize
+from Tokenizer.Tokens import Tokens
+
+
+def tokenize_characters(string_to_tokenize, whitespace):
+    # type: (str, str) -> Tokens
+    # The character by character tokenizer replaced by the regular expression tokenizer
+    tokens = Tokens()
+    idx = 0
+    token_text = ""
+    for item in string_to_tokenize:
+        if item in whitespace:
+            if len(token_text) > 0:
+                tokens.create_append_token(token_text, idx - len(token_text), idx)
+            if item in "/":
+                tokens.create_append_token(item, idx, idx + 1)
+            token_text = ""
+        else:
+            token_text = token_text + item
+        idx = idx + 1
+    if len(token_text) > 0:
+        tokens.create_append_token(token_text, idx - len(token_text), idx)
+    return tokens
+
+
+def as_tuples(tokens):
+    # type: (Tokens) -> [(str, int, int)]
+    return [(token.get_token_string(), token.get_token_start_index(), token.get_token_end_index())
+            for token in tokens.get_tokens()]
+
+
+class TokenizeTests(unittest.TestCase):
+    # A typical FPL
+    FPL = "FF EDDFZQZX\r\n241309 EGLLZPZX\r\n(FPL-DLH123-IS\n-A320/M-SDE2E3FGIJ1RWY/LB1\n-EDDF0800\n" \
+          "-N0450F350 ANEKI1L ANEKI Y163 NATOR/N0448F360 UN850 TRA/N0450F370 UZ613 ELB DCT 5130N00030W " \
+          "UL612 SUNIR\n-EGLL0155 EGKK\n-PBN/A1B1C1D1L1O1S2 NAV/RNVD1E2A1 DOF/240315 REG/DAIZC " \
+          "EET/LSAS0015 LFFF0040 EGTT0120 SEL/ABCD CODE/3C4A5B RMK/TCAS\n-E/0230 P/TBN R/VE S/M J/L)"
+
+    # The whitespace character sets used by the parsers
+    WHITESPACE = [" \n\t\r", " /\n\t\r", " /n/t/r", "-", "", "/", " ^]\\-"]
+
+    def assert_same_tokens(self, string_to_tokenize, whitespace):
+        # type: (str, str) -> None
+        tokenize = Tokenize()
+        tokenize.set_string_to_tokenize(string_to_tokenize)
+        tokenize.set_whitespace(whitespace)
+        tokenize.tokenize()
+        self.assertEqual(as_tuples(tokenize_characters(string_to_tokenize, whitespace)),
+                         as_tuples(tokenize.get_tokens()), repr(whitespace))
+
+    def test_same_tokens(self):
+        for whitespace in self.WHITESPACE:
+            for string_to_tokenize in [self.FPL, "", " ", "/", "//A//", "A", " A B ", "\nA\n", "A^B]C\\D-E",
+                                       self.FPL[10:70], self.FPL.replace(" ", "  ")]:
+                self.assert_same_tokens(string_to_tokenize, whitespace)
+
+    def test_token_string(self):
+        tokenize = Tokenize()
+        tokenize.set_string_to_tokenize("AB/CDE")
+        tokenize.set_whitespace("/")
+        tokenize.tokenize()
+        token = tokenize.get_tokens().get_last_token()
+        self.assertEqual(3, tokenize.get_tokens().get_number_of_tokens())
+        # Changing the indices does not change the token text
+        token.set_token_start_index(4)
+        self.assertEqual("CDE", token.get_token_string())
+        token.set_token_string("XY")
+        self.assertEqual("XY", token.get_token_string())
+        self.assertEqual("AB", tokenize.get_tokens().get_first_token().get_token_string())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+
+from AFTN_Terminal.WriteXml import WriteXml, WriteBatch
+
+
+class WriteXmlTests(unittest.TestCase):
+    XML = "<?xml version=\"1.0\" ?><flight_plan_record>{0}</flight_plan_record>"
+
+    def setUp(self):
+        self.working_directory = tempfile.TemporaryDirectory()
+        self.inbox = os.path.join(self.working_directory.name, "Inbox")
+        self.outbox = os.path.join(self.working_directory.name, "Outbox")
+        os.makedirs(os.path.join(self.inbox, "FF"))
+        os.makedirs(self.outbox)
+
+    def tearDown(self):
+        self.working_directory.cleanup()
+
+    def read_file(self, file_path):
+        with open(file_path, "r", encoding="utf-8") as file:
+            return file.read()
+
+    def test_write_message(self):
+        # New messages written in quick succession are given different names
+        file_paths = [WriteXml.write_new_message(self.XML.format(n), self.working_directory.name) for n in range(3)]
+        self.assertEqual(3, len(set(file_paths)))
+        self.assertEqual(sorted(os.path.basename(file_path) for file_path in file_paths),
+                         sorted(os.listdir(self.outbox)))
+        self.assertEqual(self.XML.format(2), self.read_file(file_paths[2]))
+
+        # An update replaces the content of the message file
+        WriteXml.update_existing_message(file_paths[0], self.XML.format("updated"))
+        self.assertEqual(self.XML.format("updated"), self.read_file(file_paths[0]))
+        self.assertEqual(3, len(os.listdir(self.outbox)))
+
+        # A received message never overwrites an existing file
+        file_path = WriteXml.write_received_message(self.XML.format(1), self.working_directory.name, "FF", "1")
+        self.assertEqual(os.path.join(self.inbox, "FF", "message-1.xml"), file_path)
+        self.assertRaises(FileExistsError, WriteXml.write_received_message, self.XML.format(2),
+                          self.working_directory.name, "FF", "1")
+        self.assertEqual(self.XML.format(1), self.read_file(file_path))
+        self.assertEqual(["message-1.xml"], os.listdir(os.path.join(self.inbox, "FF")))
+
+    def test_batch(self):
+        batch = WriteBatch()
+        file_paths = [WriteXml.write_received_message(self.XML.format(n), self.working_directory.name, "", str(n),
+                                                      batch) for n in range(3)]
+        self.assertEqual(3, batch.get_pending_count())
+        self.assertFalse(any(os.path.exists(file_path) for file_path in file_paths))
+        self.assertTrue(all(WriteXml.is_temporary_file(name) for name in os.listdir(self.inbox) if name != "FF"))
+        self.assertEqual(file_paths, batch.commit())
+        self.assertEqual(0, batch.get_pending_count())
+        self.assertEqual([self.XML.format(n) for n in range(3)], [self.read_file(path) for path in file_paths])
+
+        # The messages after a message that cannot be committed are discarded
+        for name in ["3", "1", "4"]:
+            WriteXml.write_received_message(self.XML.format(name), self.working_directory.name, "", name, batch)
+        self.assertRaises(FileExistsError, batch.commit)
+        self.assertEqual([os.path.join(self.inbox, "message-3.xml")], batch.get_committed())
+        self.assertEqual(self.XML.format(1), self.read_file(file_paths[1]))
+        self.assertEqual(["FF", "message-0.xml", "message-1.xml", "message-2.xml", "message-3.xml"],
+                         sorted(os.listdir(self.inbox)))
+
+
+if __name__ == '__main__':
+    unittest.main()